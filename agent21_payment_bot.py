@@ -16,6 +16,8 @@ from flask import Flask, request, jsonify
 import sqlite3
 import threading
 from dotenv import load_dotenv
+from job_search import SEARCH_COMMANDS, handle_search_command
+from subscriber_prefs import PREFERENCE_COMMANDS, handle_preference_command
 
 load_dotenv()
 
@@ -172,6 +174,16 @@ Created: {created_at}
     
     await update.message.reply_text(status_msg, parse_mode='Markdown')
 
+async def preferences_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """Handle /prefs, /levels, /categories, /keywords, /salary and /resetprefs"""
+    reply = handle_preference_command(update.effective_chat.id, update.message.text)
+    await update.message.reply_text(reply, parse_mode='Markdown')
+
+async def search_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """Handle /jobs and /category from the local job index"""
+    reply = handle_search_command(update.message.text)
+    await update.message.reply_text(reply, parse_mode='Markdown', disable_web_page_preview=True)
+
 # Flask Webhook for SMS
 app = Flask(__name__)
 bot = Bot(token=BOT_TOKEN)
@@ -259,6 +271,8 @@ def run_telegram_bot():
     application.add_handler(CommandHandler("start", start_command))
     application.add_handler(CommandHandler("join", join_command))
     application.add_handler(CommandHandler("status", status_command))
+    application.add_handler(CommandHandler(list(PREFERENCE_COMMANDS), preferences_command))
+    application.add_handler(CommandHandler(list(SEARCH_COMMANDS), search_command))
     
     # Start bot
     application.run_polling()
@@ -0,0 +1,378 @@
+#!/usr/bin/env python3
+"""
+ATS Connectors for Agent-21 Scout
+Generic connectors for the public job board APIs of the common applicant
+tracking systems (Greenhouse, Lever, Ashby, Workable). Companies are
+configured in ats_companies.json, one line each, and every configured
+company is registered as a network job source at its place in merge order.
+Boards are streamed page by page through the per-run snapshots, so a
+category stops reading once it has enough matches, and incremental runs
+skip postings whose updated_at hasn't changed since they were delivered
+"""
+
+import json
+import os
+from abc import ABC, abstractmethod
+import sqlite3
+import threading
+import time
+from collections import namedtuple
+from datetime import datetime
+from pathlib import Path
+
+from job_dedup import DEDUP_TTL_DAYS
+from source_hashes import INCREMENTAL_ENABLED
+from source_registry import BOARD_REFRESH, NETWORK, SOURCES
+
+# ATS defaults (override via environment)
+ATS_COMPANIES_PATH = Path(os.getenv("SCOUT_ATS_COMPANIES", Path(__file__).parent / "ats_companies.json"))
+ATS_STATE_DB = Path(os.getenv("SCOUT_ATS_STATE_DB", Path(__file__).parent / ".scout_cache" / "ats_postings.db"))
+ATS_MAX_JOBS = int(os.getenv("SCOUT_ATS_MAX_JOBS", "5"))     # Matches per company and category
+ATS_MAX_PAGES = int(os.getenv("SCOUT_ATS_MAX_PAGES", "20"))  # Pages read per board and category
+
+REMOTE_WORDS = ("remote", "anywhere", "worldwide", "global", "distributed")
+
+# One parsed posting: `job` is the dict handed to the rest of the pipeline
+Posting = namedtuple("Posting", "id updated_at remote job")
+
+
+def _timestamp(value):
+    """Epoch seconds from an ISO 8601 string or epoch milliseconds (0 when missing)"""
+    if isinstance(value, (int, float)):
+        return value / 1000
+    if not value:
+        return 0.0
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp()
+    except ValueError:
+        return 0.0
+
+
+def _mentions_remote(location):
+    return any(word in (location or "").lower() for word in REMOTE_WORDS)
+
+
+class Connector(ABC):
+    """One ATS's public board API: where its pages are and how to read them"""
+
+    name = None
+    host = None
+
+    @abstractmethod
+    def url(self, board):
+        """The board's first page URL"""
+
+    def first_params(self):
+        """Query parameters of the first page (None: plain URL)"""
+        return None
+
+    def next_params(self, params, page):
+        """Query parameters of the page after `page`, or None when it was the last"""
+        return None
+
+    def postings(self, data):
+        return data.get("jobs", []) if isinstance(data, dict) else []
+
+    @abstractmethod
+    def parse(self, raw, company):
+        """A Posting from one raw posting of the board, or None to drop it"""
+
+    def _job(self, company, title, location, url, salary=None):
+        return {
+            "title": title,
+            "company": company.name,
+            "location": company.location or location or "Remote",
+            "url": url,
+            "source": company.name,
+            "salary": salary or "Competitive",
+        }
+
+
+class GreenhouseConnector(Connector):
+    """boards-api.greenhouse.io: the whole board in one response"""
+
+    name = "greenhouse"
+    host = "boards-api.greenhouse.io"
+
+    def url(self, board):
+        return f"https://boards-api.greenhouse.io/v1/boards/{board}/jobs"
+
+    def parse(self, raw, company):
+        location = (raw.get("location") or {}).get("name", "")
+        url = raw.get("absolute_url") or f"https://boards.greenhouse.io/{company.board}/jobs/{raw.get('id', '')}"
+        return Posting(str(raw.get("id", "")), _timestamp(raw.get("updated_at")), _mentions_remote(location),
+                       self._job(company, raw.get("title", ""), location, url))
+
+
+class LeverConnector(Connector):
+    """api.lever.co: paged with skip/limit"""
+
+    name = "lever"
+    host = "api.lever.co"
+    page_size = 100
+
+    def url(self, board):
+        return f"https://api.lever.co/v0/postings/{board}"
+
+    def first_params(self):
+        return {"mode": "json", "skip": 0, "limit": self.page_size}
+
+    def next_params(self, params, page):
+        if len(page) < params["limit"]:
+            return None
+        return dict(params, skip=params["skip"] + params["limit"])
+
+    def postings(self, data):
+        return data if isinstance(data, list) else []
+
+    def parse(self, raw, company):
+        location = (raw.get("categories") or {}).get("location", "")
+        remote = raw.get("workplaceType") == "remote" or _mentions_remote(location)
+        salary = None
+        pay = raw.get("salaryRange") or {}
+        if pay.get("min") and pay.get("max"):
+            salary = f"{pay.get('currency', '')} {pay['min']:,.0f}-{pay['max']:,.0f}".strip()
+        url = raw.get("hostedUrl") or f"https://jobs.lever.co/{company.board}/{raw.get('id', '')}"
+        return Posting(str(raw.get("id", "")), _timestamp(raw.get("updatedAt") or raw.get("createdAt")), remote,
+                       self._job(company, raw.get("text", ""), location, url, salary))
+
+
+class AshbyConnector(Connector):
+    """api.ashbyhq.com posting API: the whole board in one response"""
+
+    name = "ashby"
+    host = "api.ashbyhq.com"
+
+    def url(self, board):
+        return f"https://api.ashbyhq.com/posting-api/job-board/{board}"
+
+    def first_params(self):
+        return {"includeCompensation": "true"}
+
+    def parse(self, raw, company):
+        if raw.get("isListed") is False:
+            return None
+        location = raw.get("location", "")
+        salary = (raw.get("compensation") or {}).get("compensationTierSummary")
+        url = raw.get("jobUrl") or f"https://jobs.ashbyhq.com/{company.board}/{raw.get('id', '')}"
+        return Posting(str(raw.get("id", "")), _timestamp(raw.get("updatedAt") or raw.get("publishedAt")),
+                       bool(raw.get("isRemote")) or _mentions_remote(location),
+                       self._job(company, raw.get("title", ""), location, url, salary))
+
+
+class WorkableConnector(Connector):
+    """apply.workable.com widget API: the whole board in one response"""
+
+    name = "workable"
+    host = "apply.workable.com"
+
+    def url(self, board):
+        return f"https://apply.workable.com/api/v1/widget/accounts/{board}"
+
+    def parse(self, raw, company):
+        location = ", ".join(part for part in (raw.get("city"), raw.get("country")) if part)
+        shortcode = raw.get("shortcode", "")
+        url = raw.get("url") or f"https://apply.workable.com/{company.board}/j/{shortcode}/"
+        return Posting(shortcode, _timestamp(raw.get("published_on") or raw.get("created_at")),
+                       bool(raw.get("telecommuting")) or _mentions_remote(location),
+                       self._job(company, raw.get("title", ""), location, url))
+
+
+CONNECTORS = {connector.name: connector for connector in
+              (GreenhouseConnector(), LeverConnector(), AshbyConnector(), WorkableConnector())}
+
+
+class Company:
+    """One company's board, as configured in ats_companies.json"""
+
+    def __init__(self, name, ats, board, location=None, remote_only=False, keywords=(), max_jobs=None,
+                 fallbacks=False, cost=3, enabled=True, after=None):
+        if ats not in CONNECTORS:
+            raise ValueError(f"Unknown ATS {ats!r} for {name!r} (expected one of {', '.join(CONNECTORS)})")
+        self.name = name                # Source, metrics and job "source"/"company" name
+        self.ats = ats
+        self.board = board              # The company's board token/slug on its ATS
+        self.location = location        # Shown for every posting (all-remote companies), else the posting's
+        self.remote_only = remote_only  # Keep only postings the ATS or their location marks as remote
+        self.keywords = tuple(keywords)  # Category keywords it serves (empty: every category)
+        self.max_jobs = ATS_MAX_JOBS if max_jobs is None else max_jobs
+        self.fallbacks = fallbacks      # Retries and curated fallback jobs, as the hand-written boards had
+        self.cost = cost
+        self.enabled = enabled
+        self.after = after              # Source it follows in merge order (default: after every other source)
+
+    @property
+    def connector(self):
+        return CONNECTORS[self.ats]
+
+
+def load_companies(path=None):
+    """{name: Company} from the companies file (empty when it is missing)"""
+    path = Path(path or ATS_COMPANIES_PATH)
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            entries = json.load(f)["companies"]
+    except FileNotFoundError:
+        print(f"[WARNING] No ATS companies file at {path}")
+        return {}
+    companies = {}
+    for entry in entries:
+        company = Company(**entry)
+        if company.name in companies:
+            raise ValueError(f"Company {company.name!r} is configured twice in {path}")
+        companies[company.name] = company
+    return companies
+
+
+class CompanySource:
+    """Registry function for one company's board: (scout, keywords) -> jobs"""
+
+    def __init__(self, name):
+        self.name = name
+
+    def __call__(self, scout, keywords):
+        return scout.ats.jobs_for(self.name, keywords, scout.snapshots)
+
+
+def register_companies(companies=None, registry=None):
+    """
+    Register every company as a network job source. Called by telegram_jobs
+    once the JobScout sources exist, so `after` can name them; companies
+    already registered (telegram_jobs run as __main__, then imported) are kept.
+    """
+    companies = COMPANIES if companies is None else companies
+    registry = SOURCES if registry is None else registry
+    for company in companies.values():
+        if company.name in registry and isinstance(registry.get(company.name).function, CompanySource):
+            continue
+        registry.register(company.name, CompanySource(company.name), after=company.after, kind=NETWORK,
+                          host=company.connector.host, label=company.name if company.fallbacks else None,
+                          cost=company.cost, refresh=BOARD_REFRESH, keywords=company.keywords,
+                          enabled=company.enabled)
+
+
+class AtsBoards:
+    """
+    Streams configured company boards for the scout. Postings returned on
+    incremental runs are recorded with their updated_at once delivered;
+    later incremental runs skip them until they are updated or the seen-jobs
+    TTL expires, so each category's few slots go to new postings.
+    """
+
+    def __init__(self, companies=None, path=None, incremental=None, ttl_days=None, max_pages=None):
+        self.companies = COMPANIES if companies is None else companies
+        self.path = Path(path or ATS_STATE_DB)
+        self.incremental = INCREMENTAL_ENABLED if incremental is None else incremental
+        self.ttl_days = DEDUP_TTL_DAYS if ttl_days is None else ttl_days
+        self.max_pages = ATS_MAX_PAGES if max_pages is None else max_pages
+        self._known = None   # (company, posting id) -> updated_at delivered, loaded once per run
+        self._pending = {}   # (company, posting id) -> updated_at returned this run
+        self._lock = threading.Lock()
+        self.skipped = 0     # Postings skipped as unchanged this run
+
+    def _connect(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.path)
+        conn.execute("""
+        CREATE TABLE IF NOT EXISTS ats_postings (
+            company TEXT NOT NULL,
+            posting_id TEXT NOT NULL,
+            updated_at REAL,
+            recorded_at REAL,
+            PRIMARY KEY (company, posting_id)
+        )
+        """)
+        return conn
+
+    def _cutoff(self):
+        return time.time() - self.ttl_days * 86400
+
+    def known(self):
+        """Delivered postings still within the TTL: {(company, posting id): updated_at}"""
+        with self._lock:
+            if self._known is None:
+                try:
+                    with self._connect() as conn:
+                        rows = conn.execute("""
+                        SELECT company, posting_id, updated_at FROM ats_postings WHERE recorded_at >= ?
+                        """, (self._cutoff(),))
+                        self._known = {(company, posting): updated for company, posting, updated in rows}
+                except sqlite3.Error as e:
+                    print(f"[WARNING] ATS posting store unavailable, reading full boards: {e}")
+                    self._known = {}
+            return self._known
+
+    def postings(self, company, snapshots):
+        """
+        Parsed postings of a company's board, one page at a time. Pages are
+        fetched through `snapshots`, so each is downloaded once per run
+        however many categories read it, and only as far as one reads.
+        """
+        connector = company.connector
+        url = connector.url(company.board)
+        params = connector.first_params()
+        for _ in range(self.max_pages):
+            data = snapshots.get_json(url, params=params)
+            if data is None:
+                return
+            page = connector.postings(data)
+            for raw in page:
+                posting = connector.parse(raw, company)
+                if posting is not None and (posting.remote or not company.remote_only):
+                    yield posting
+            params = connector.next_params(params, page)
+            if params is None:
+                return
+
+    def jobs_for(self, name, keywords, snapshots):
+        """Up to max_jobs postings of `name` whose title mentions one of the keywords"""
+        company = self.companies[name]
+        words = [keyword.lower() for keyword in keywords]
+        known = self.known() if self.incremental else {}
+        jobs = []
+        for posting in self.postings(company, snapshots):
+            title = posting.job["title"].lower()
+            if not any(word in title for word in words):
+                continue
+            delivered = known.get((name, posting.id))
+            if delivered is not None and delivered >= posting.updated_at:
+                with self._lock:
+                    self.skipped += 1
+                continue
+            jobs.append(dict(posting.job))
+            with self._lock:
+                self._pending[(name, posting.id)] = posting.updated_at
+            if len(jobs) >= company.max_jobs:
+                break
+        return jobs
+
+    def clear(self):
+        """Start a new run: reload the delivered postings, forget this run's"""
+        with self._lock:
+            self._known = None
+            self._pending = {}
+            self.skipped = 0
+
+    def commit(self, undelivered=()):
+        """Record this run's postings as delivered, except those of companies in `undelivered`"""
+        if not self.incremental:
+            return
+        now = time.time()
+        with self._lock:
+            rows = [(company, posting, updated, now) for (company, posting), updated in self._pending.items()
+                    if company not in undelivered]
+            self._pending = {}
+        try:
+            with self._connect() as conn:
+                conn.executemany("""
+                INSERT INTO ats_postings (company, posting_id, updated_at, recorded_at) VALUES (?, ?, ?, ?)
+                ON CONFLICT(company, posting_id) DO UPDATE SET updated_at = excluded.updated_at,
+                                                               recorded_at = excluded.recorded_at
+                """, rows)
+                conn.execute("DELETE FROM ats_postings WHERE recorded_at < ?", (self._cutoff(),))
+        except sqlite3.Error as e:
+            print(f"[WARNING] Could not record ATS postings: {e}")
+
+
+# Configured companies (registered as job sources by telegram_jobs)
+COMPANIES = load_companies()
@@ -40,8 +40,11 @@ class JobSourceAuditor:
             print(f"Testing {func_name}...", end=" ")
             start_time = time.time()
             
-            # Get the function from the scout object
-            func = getattr(self.scout, func_name)
+            # Get the function from the source registry or the scout object
+            if func_name in self.scout.registry:
+                func = self.scout.registry.get(func_name).bind(self.scout)
+            else:
+                func = getattr(self.scout, func_name)
             
             # Call the function
             jobs = func(*args, **kwargs)
@@ -112,61 +115,12 @@ class JobSourceAuditor:
         print(f"Started at: {datetime.now()}")
         print()
         
-        # List of all fetch functions to test
+        # Sources outside the registry, then every registered job source
         fetch_functions = [
-            # Core API functions
             ('fetch_remotive_jobs', 'remote'),
-            ('fetch_reliable_jobs', self.test_keywords),
-            ('fetch_wellfound_jobs', self.test_keywords),
-            ('fetch_nowhiteboard_jobs', self.test_keywords),
-            ('fetch_workingnomads_jobs', self.test_keywords),
-            ('fetch_amazon_jobs', self.test_keywords),
             ('fetch_amazon_aws_jobs',),
-            ('fetch_static_jobs', self.test_keywords),
-            ('fetch_flexjobs_api', self.test_keywords),
-            
-            # Company-specific functions
-            ('fetch_gitlab_jobs', self.test_keywords),
-            ('fetch_automattic_jobs', self.test_keywords),
-            ('fetch_zapier_jobs', self.test_keywords),
-            ('fetch_buffer_jobs', self.test_keywords),
-            ('fetch_doist_jobs', self.test_keywords),
-            ('fetch_remote_com_jobs', self.test_keywords),
-            ('fetch_deel_jobs', self.test_keywords),
-            ('fetch_andela_jobs', self.test_keywords),
-            ('fetch_crypto_jobs', self.test_keywords),
-            ('fetch_wikimedia_jobs', self.test_keywords),
-            
-            # Category-specific functions
-            ('fetch_customer_support_jobs', self.test_keywords),
-            ('fetch_operations_hr_jobs', self.test_keywords),
-            ('fetch_finance_jobs', self.test_keywords),
-            ('fetch_technical_writing_jobs', self.test_keywords),
-            
-            # Specialized platform functions
-            ('fetch_bpo_outsourcing_jobs', self.test_keywords),
-            ('fetch_ai_training_jobs', self.test_keywords),
-            ('fetch_freelance_gig_jobs', self.test_keywords),
-            ('fetch_va_support_jobs', self.test_keywords),
-            ('fetch_social_media_platform_jobs', self.test_keywords),
-            ('fetch_customer_support_platform_jobs', self.test_keywords),
-            ('fetch_ad_review_specialist_jobs', self.test_keywords),
-            ('fetch_data_labeling_specialist_jobs', self.test_keywords),
-            ('fetch_comprehensive_platform_jobs', self.test_keywords),
-            ('fetch_creator_economy_jobs', self.test_keywords),
-            ('fetch_gaming_platform_jobs', self.test_keywords),
-            ('fetch_chat_moderation_jobs', self.test_keywords),
-            ('fetch_social_platform_extended_jobs', self.test_keywords),
-            
-            # Sample and new category functions
-            ('fetch_sample_specialized_jobs', self.test_keywords),
-            ('fetch_sales_bizdev_jobs', self.test_keywords),
-            ('fetch_product_management_jobs', self.test_keywords),
-            ('fetch_ecommerce_jobs', self.test_keywords),
-            ('fetch_healthcare_remote_jobs', self.test_keywords),
-            ('fetch_translation_jobs', self.test_keywords),
-            ('fetch_research_survey_jobs', self.test_keywords),
         ]
+        fetch_functions += [(spec.name, self.test_keywords) for spec in self.scout.registry]
         
         # Test each function
         for func_info in fetch_functions:
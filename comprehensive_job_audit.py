@@ -24,6 +24,7 @@ telegram_bot.send_telegram_message = mock_send_telegram_message
 telegram_bot.send_job_summary = mock_send_job_summary
 
 from telegram_jobs import JobScout, CATEGORIES
+from source_registry import NETWORK
 
 class JobCategoryAuditor:
     def __init__(self):
@@ -37,20 +38,10 @@ class JobCategoryAuditor:
         print("🔍 Testing Individual API Endpoints")
         print("=" * 60)
         
-        api_tests = [
-            ("GitLab API", self.scout.fetch_gitlab_jobs, ["developer"]),
-            ("Automattic API", self.scout.fetch_automattic_jobs, ["developer"]),
-            ("Zapier API", self.scout.fetch_zapier_jobs, ["developer"]),
-            ("Buffer API", self.scout.fetch_buffer_jobs, ["developer"]),
-            ("Doist API", self.scout.fetch_doist_jobs, ["developer"]),
-            ("Remote.com API", self.scout.fetch_remote_com_jobs, ["developer"]),
-            ("Deel API", self.scout.fetch_deel_jobs, ["developer"]),
-            ("FlexJobs API", self.scout.fetch_flexjobs_api, ["developer"]),
-            ("Remotive API", self.scout.fetch_remotive_jobs, "developer"),
-            ("Wellfound API", self.scout.fetch_wellfound_jobs, ["developer"]),
-            ("NoWhiteboard API", self.scout.fetch_nowhiteboard_jobs, ["developer"]),
-            ("WorkingNomads API", self.scout.fetch_workingnomads_jobs, ["developer"]),
-        ]
+        # Every registered network source, plus Remotive (queried per category name)
+        api_tests = [(f"{spec.name} API", spec.bind(self.scout), ["developer"])
+                     for spec in self.scout.registry.of_kind(NETWORK)]
+        api_tests.append(("Remotive API", self.scout.fetch_remotive_jobs, "developer"))
         
         for api_name, api_function, test_keywords in api_tests:
             try:
@@ -91,57 +82,10 @@ class JobCategoryAuditor:
                 working_sources = 0
                 failed_sources = 0
                 
-                # Test major company APIs
-                company_apis = [
-                    ("GitLab", self.scout.fetch_gitlab_jobs),
-                    ("Automattic", self.scout.fetch_automattic_jobs),
-                    ("Zapier", self.scout.fetch_zapier_jobs),
-                    ("Buffer", self.scout.fetch_buffer_jobs),
-                    ("Doist", self.scout.fetch_doist_jobs),
-                    ("Remote.com", self.scout.fetch_remote_com_jobs),
-                    ("Deel", self.scout.fetch_deel_jobs),
-                ]
-                
-                for source_name, api_function in company_apis:
-                    try:
-                        jobs = api_function(keywords)
-                        job_count = len(jobs) if jobs else 0
-                        total_jobs += job_count
-                        
-                        if job_count > 0:
-                            working_sources += 1
-                        
-                    except Exception as e:
-                        failed_sources += 1
-                
-                # Test specialized job functions
-                specialized_functions = [
-                    ("Sales & BizDev", self.scout.fetch_sales_bizdev_jobs),
-                    ("Product Management", self.scout.fetch_product_management_jobs),
-                    ("Ecommerce", self.scout.fetch_ecommerce_jobs),
-                    ("Healthcare Remote", self.scout.fetch_healthcare_remote_jobs),
-                    ("Translation", self.scout.fetch_translation_jobs),
-                    ("Research & Surveys", self.scout.fetch_research_survey_jobs),
-                    ("Customer Support", self.scout.fetch_customer_support_jobs),
-                    ("Operations HR", self.scout.fetch_operations_hr_jobs),
-                    ("Finance", self.scout.fetch_finance_jobs),
-                    ("Technical Writing", self.scout.fetch_technical_writing_jobs),
-                    ("BPO Outsourcing", self.scout.fetch_bpo_outsourcing_jobs),
-                    ("AI Training", self.scout.fetch_ai_training_jobs),
-                    ("Freelance Gig", self.scout.fetch_freelance_gig_jobs),
-                    ("VA Support", self.scout.fetch_va_support_jobs),
-                    ("Creator Economy", self.scout.fetch_creator_economy_jobs),
-                    ("Gaming Platforms", self.scout.fetch_gaming_platform_jobs),
-                    ("Chat Moderation", self.scout.fetch_chat_moderation_jobs),
-                    ("Social Media Tasks", self.scout.fetch_social_media_tasks_jobs),
-                    ("Data Labeling", self.scout.fetch_data_labeling_specialist_jobs),
-                    ("Course Creator", self.scout.fetch_course_creator_jobs),
-                    ("Research Testing", self.scout.fetch_research_testing_jobs),
-                ]
-                
-                for source_name, func in specialized_functions:
+                # Every registered source this category queries in the daily run
+                for spec in self.scout.registry.for_keywords(keywords):
                     try:
-                        jobs = func(keywords)
+                        jobs = spec.bind(self.scout)(keywords)
                         job_count = len(jobs) if jobs else 0
                         total_jobs += job_count
                         
@@ -65,16 +65,15 @@ def audit_all_job_functions():
     print("🔗 COMPREHENSIVE JOB LINK AUDIT")
     print("=" * 60)
     
-    # Get all methods that start with 'fetch_'
-    fetch_methods = [method for method in dir(scout) if method.startswith('fetch_') and callable(getattr(scout, method))]
+    # Every registered job source (each takes a list of keywords)
+    sources = {spec.name: spec.bind(scout) for spec in scout.registry}
     
     all_issues = []
     total_jobs = 0
     jobs_with_issues = 0
     
-    for method_name in sorted(fetch_methods):
+    for method_name, method in sorted(sources.items()):
         try:
-            method = getattr(scout, method_name)
             jobs = method(test_keywords)
             
             print(f"\n📋 {method_name}: {len(jobs)} jobs")
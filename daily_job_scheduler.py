@@ -1,71 +1,356 @@
 #!/usr/bin/env python3
 """
 Daily Job Scheduler - Ensures reliable 6 AM job notifications
-This script provides multiple layers of reliability for daily job notifications
+This script provides multiple layers of reliability for daily job notifications.
+It runs as a long-lived daemon: JobScout is imported once and reused, so
+HTTP connection pools and caches stay warm between runs, and each schedule
+fires on a precise timer wakeup instead of minute polling
 """
 
+import io
 import os
+import re
 import sys
+import json
 import time
-import schedule
+import signal
 import threading
+from collections import deque
 from datetime import datetime, timedelta
 import subprocess
 import logging
+from logging.handlers import RotatingFileHandler
 from pathlib import Path
 
-# Setup logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('scheduler.log'),
-        logging.StreamHandler()
-    ]
-)
+# Scheduler defaults (override via environment)
+# Comma-separated "<mode>@<when>" entries. Modes: full (the daily digest),
+# incremental (only sources that changed), check (catch up a missed full run).
+# When: HH:MM daily, :MM hourly, <N>m or <N>s every N minutes/seconds.
+SCHEDULES = os.getenv("SCOUT_SCHEDULES", "full@06:00,check@06:05,check@06:15")
+RUN_MODE = os.getenv("SCOUT_SCHEDULER_MODE", "inprocess").strip().lower()  # or "subprocess"
+RUN_TIMEOUT = float(os.getenv("SCOUT_RUN_TIMEOUT", "600"))
+MAX_SLEEP = 3600  # Re-check the wall clock at least hourly (suspend, clock changes)
+
+# Log defaults (override via environment)
+LOG_MAX_BYTES = int(float(os.getenv("SCOUT_LOG_MAX_MB", "5")) * 1024 * 1024)
+LOG_BACKUPS = int(os.getenv("SCOUT_LOG_BACKUPS", "5"))
+RUN_LOG = os.getenv("SCOUT_RUN_LOG", "scout_runs.jsonl")  # Run output, one JSON object per line
+TAIL_LINES = 20  # Last output lines quoted when a child run fails or hangs
+
+MODES = ("full", "incremental", "check")
+
+# "[PROGRESS] 12/180 GitLab [tech]: 3 jobs in 0.4s", printed by FetchEngine as each source finishes
+PROGRESS_LINE = re.compile(r"^\[PROGRESS\] (\d+)/(\d+) (.+): (?:(\d+) jobs|failed) in ([\d.]+)s$")
+
+run_log = logging.getLogger("agent21.runs")  # Streamed run output and progress events
+run_log.propagate = False
+
+
+class JsonLineFormatter(logging.Formatter):
+    """One JSON object per record: time, level, message and the record's `fields`"""
+
+    def format(self, record):
+        entry = {"time": self.formatTime(record, "%Y-%m-%dT%H:%M:%S"), "level": record.levelname}
+        entry.update(getattr(record, "fields", {}))
+        entry["message"] = record.getMessage()
+        return json.dumps(entry, ensure_ascii=False)
+
+
+def setup_run_log(path=None, max_bytes=None, backups=None):
+    """Send streamed run output to a rotating JSON lines file"""
+    for handler in list(run_log.handlers):
+        run_log.removeHandler(handler)
+        handler.close()
+    handler = RotatingFileHandler(path or RUN_LOG, maxBytes=max_bytes or LOG_MAX_BYTES,
+                                  backupCount=LOG_BACKUPS if backups is None else backups, encoding="utf-8")
+    handler.setFormatter(JsonLineFormatter())
+    run_log.addHandler(handler)
+    run_log.setLevel(logging.INFO)
+
+
+class RunOutput(io.TextIOBase):
+    """
+    sys.stdout during an in-process run: each complete line is handed to
+    `on_line` (the run log) as it is printed, and still echoed to `echo`.
+    Partial lines are buffered per thread, so fetch workers printing at
+    the same time don't splice each other's lines.
+    """
+
+    def __init__(self, on_line, echo):
+        self.on_line = on_line
+        self.echo = echo
+        self._buffers = {}  # Thread ident -> unfinished line
+        self._lock = threading.Lock()
+
+    def writable(self):
+        return True
+
+    def write(self, text):
+        thread = threading.get_ident()
+        with self._lock:
+            *lines, self._buffers[thread] = (self._buffers.get(thread, "") + text).split("\n")
+        for line in lines:
+            self.on_line(line)
+        try:
+            self.echo.write(text)
+        except Exception:
+            pass  # A closed or broken console must not fail the run
+        return len(text)
+
+    def flush(self):
+        try:
+            self.echo.flush()
+        except Exception:
+            pass
+
+    def close_run(self):
+        """Log trailing lines that were printed without a newline"""
+        with self._lock:
+            lines = [line for line in self._buffers.values() if line]
+            self._buffers = {}
+        for line in lines:
+            self.on_line(line)
+
+
+def setup_logging():
+    """Log to a rotating scheduler.log and the console (only when running as the daemon)"""
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(levelname)s - %(message)s',
+        handlers=[
+            RotatingFileHandler('scheduler.log', maxBytes=LOG_MAX_BYTES, backupCount=LOG_BACKUPS,
+                                encoding="utf-8"),
+            logging.StreamHandler()
+        ]
+    )
+    setup_run_log()
+
+
+class ScheduleEntry:
+    """One recurring run, parsed from "<mode>@<when>" (see SCHEDULES)"""
+
+    def __init__(self, spec):
+        self.spec = spec.strip()
+        mode, _, when = self.spec.partition("@")
+        self.mode = mode.strip().lower()
+        when = when.strip().lower()
+        if self.mode not in MODES:
+            raise ValueError(f"Unknown run mode in schedule {spec!r} (use {', '.join(MODES)})")
+        self.hour = self.minute = self.interval = None
+        try:
+            if when.endswith(("m", "s")):
+                self.interval = timedelta(**{"minutes" if when.endswith("m") else "seconds": float(when[:-1])})
+                if self.interval.total_seconds() <= 0:
+                    raise ValueError
+            elif when.startswith(":"):
+                self.minute = int(when[1:])
+            else:
+                hour, minute = when.split(":")
+                self.hour, self.minute = int(hour), int(minute)
+                if not 0 <= self.hour < 24:
+                    raise ValueError
+            if self.minute is not None and not 0 <= self.minute < 60:
+                raise ValueError
+        except ValueError:
+            raise ValueError(f"Bad schedule time in {spec!r} (use HH:MM, :MM, <N>m or <N>s)") from None
+
+    def next_after(self, moment):
+        """The first time this entry fires strictly after `moment`"""
+        if self.interval is not None:
+            # Aligned to midnight, so "30m" fires at :00 and :30
+            midnight = moment.replace(hour=0, minute=0, second=0, microsecond=0)
+            steps = (moment - midnight) // self.interval + 1
+            return midnight + steps * self.interval
+        if self.hour is None:
+            candidate = moment.replace(minute=self.minute, second=0, microsecond=0)
+            step = timedelta(hours=1)
+        else:
+            candidate = moment.replace(hour=self.hour, minute=self.minute, second=0, microsecond=0)
+            step = timedelta(days=1)
+        return candidate if candidate > moment else candidate + step
+
+    def __repr__(self):
+        return f"ScheduleEntry({self.spec!r})"
+
+
+def parse_schedules(text):
+    """ScheduleEntry list from a SCOUT_SCHEDULES string"""
+    entries = [ScheduleEntry(spec) for spec in text.split(",") if spec.strip()]
+    if not entries:
+        raise ValueError("No schedules configured")
+    return entries
+
 
 class ReliableJobScheduler:
-    def __init__(self):
+    def __init__(self, schedules=None, run_mode=None, clock=datetime.now):
         self.script_dir = Path(__file__).parent.absolute()
         self.job_script = self.script_dir / "telegram_jobs.py"
         self.last_run_file = self.script_dir / "last_run.txt"
         self.running = True
+        self.schedules = parse_schedules(SCHEDULES if schedules is None else schedules)
+        self.run_mode = run_mode or RUN_MODE
+        self.clock = clock
+        self._wakeup = threading.Event()  # Set by stop() to end the wait immediately
+        self._scout = None                # Warm JobScout reused by in-process runs
+        self._run_thread = None
+    
+    def run_job_bot(self, mode="full"):
+        """Run the job bot (in this process, or as a child process) with error handling and logging"""
+        if self.run_mode == "subprocess":
+            return self.run_job_subprocess(mode)
+        return self.run_job_in_process(mode)
+    
+    def get_scout(self):
+        """The JobScout shared by every in-process run, imported and built once"""
+        if self._scout is None:
+            from telegram_jobs import JobScout
+            self._scout = JobScout()
+        return self._scout
+    
+    def run_job_in_process(self, mode="full"):
+        """
+        One scout run on the warm JobScout, in a worker thread so a run that
+        hangs past RUN_TIMEOUT is reported instead of blocking the scheduler.
+        Its output is streamed into the run log as it is printed, as for
+        subprocess runs. A thread can't be killed, so while a hung run is
+        still wedged, later fires run in a fresh (killable) process instead.
+        """
+        if self._run_thread is not None and self._run_thread.is_alive():
+            logging.warning(f"⏳ Previous in-process run still hung, running this {mode} run as a subprocess")
+            return self.run_job_subprocess(mode)
+        
+        logging.info(f"🚀 Starting {mode} job notification run...")
+        started = time.monotonic()
+        outcome = {}
+        run_id = datetime.now().strftime("%Y%m%d-%H%M%S")
+        tail = deque(maxlen=TAIL_LINES)
+        output = RunOutput(lambda line: self.log_line(line, "stdout", run_id, tail), sys.stdout)
+        
+        def run():
+            try:
+                scout = self.get_scout()
+                scout.reset_run(incremental=True if mode == "incremental" else None)
+                scout.run_daily_scout()
+                outcome["ok"] = True
+            except Exception as e:
+                outcome["error"] = e
+                self.log_line(f"{type(e).__name__}: {e}", "stderr", run_id, tail)
+            finally:
+                output.close_run()
+                if sys.stdout is output:
+                    sys.stdout = output.echo
         
-    def run_job_bot(self):
-        """Run the job bot with error handling and logging"""
+        sys.stdout = output
+        self._run_thread = threading.Thread(target=run, name=f"scout-{mode}-run", daemon=True)
+        self._run_thread.start()
+        self._run_thread.join(RUN_TIMEOUT)
+        
+        if self._run_thread.is_alive():
+            logging.error(f"⏰ Job bot still running after {RUN_TIMEOUT:.0f}s (run {run_id}); last output:\n"
+                          + "\n".join(tail))
+            self.send_fallback_notification()
+            return False
+        if "error" in outcome:
+            logging.error(f"💥 Unexpected error running job bot: {outcome['error']}")
+            self.send_fallback_notification()
+            return False
+        
+        logging.info(f"✅ Job bot completed successfully in {time.monotonic() - started:.1f}s "
+                     f"(output of run {run_id} in {RUN_LOG})")
+        if mode == "full":
+            self.record_run()
+        return True
+    
+    def record_run(self):
+        """Record a successful full run (used to detect missed days)"""
+        with open(self.last_run_file, 'w') as f:
+            f.write(datetime.now().isoformat())
+    
+    def run_job_subprocess(self, mode="full"):
+        """
+        Run the job bot in a fresh Python process (SCOUT_SCHEDULER_MODE=subprocess).
+        Its output is streamed line by line into the run log as it is
+        printed, so memory stays flat and a hung run shows how far it got.
+        """
         try:
-            logging.info("🚀 Starting daily job notification...")
+            logging.info(f"🚀 Starting {mode} job notification...")
             
             # Change to script directory
             os.chdir(self.script_dir)
+            env = dict(os.environ, PYTHONUNBUFFERED="1", PYTHONIOENCODING="utf-8")  # Lines arrive as printed
+            if mode == "incremental":
+                env["SCOUT_INCREMENTAL"] = "1"
             
             # Run the job bot
-            result = subprocess.run([
+            run_id = datetime.now().strftime("%Y%m%d-%H%M%S")
+            tail = deque(maxlen=TAIL_LINES)
+            process = subprocess.Popen([
                 sys.executable, str(self.job_script)
-            ], capture_output=True, text=True, timeout=600)  # 10 minute timeout
+            ], stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, encoding="utf-8",
+                errors="replace", bufsize=1, env=env)
+            readers = [
+                threading.Thread(target=self.stream_output, args=(pipe, name, run_id, tail), daemon=True)
+                for pipe, name in ((process.stdout, "stdout"), (process.stderr, "stderr"))
+            ]
+            for reader in readers:
+                reader.start()
+            
+            try:
+                returncode = process.wait(timeout=RUN_TIMEOUT)
+            except subprocess.TimeoutExpired:
+                process.kill()
+                process.wait()
+                for reader in readers:
+                    reader.join(5)
+                logging.error(f"⏰ Job bot timed out after {RUN_TIMEOUT:.0f}s (run {run_id}); last output:\n"
+                              + "\n".join(tail))
+                self.send_fallback_notification()
+                return False
+            for reader in readers:
+                reader.join()
             
-            if result.returncode == 0:
-                logging.info("✅ Job bot completed successfully")
-                logging.info(f"Output: {result.stdout}")
+            if returncode == 0:
+                logging.info(f"✅ Job bot completed successfully (output of run {run_id} in {RUN_LOG})")
                 
                 # Record successful run
-                with open(self.last_run_file, 'w') as f:
-                    f.write(datetime.now().isoformat())
+                if mode == "full":
+                    self.record_run()
+                return True
                     
             else:
-                logging.error(f"❌ Job bot failed with return code {result.returncode}")
-                logging.error(f"Error: {result.stderr}")
+                logging.error(f"❌ Job bot failed with return code {returncode}")
+                logging.error("Last output:\n" + "\n".join(tail))
                 
                 # Try fallback notification
                 self.send_fallback_notification()
-                
-        except subprocess.TimeoutExpired:
-            logging.error("⏰ Job bot timed out after 10 minutes")
-            self.send_fallback_notification()
             
         except Exception as e:
             logging.error(f"💥 Unexpected error running job bot: {e}")
             self.send_fallback_notification()
+        return False
+    
+    def stream_output(self, pipe, stream, run_id, tail):
+        """Log each line of a child's stdout/stderr as it arrives"""
+        with pipe:
+            for line in pipe:
+                self.log_line(line.rstrip("\r\n"), stream, run_id, tail)
+    
+    def log_line(self, line, stream, run_id, tail):
+        """Log one line of run output, plus a progress event when it reports a finished source"""
+        line = line.rstrip("\r")
+        tail.append(f"[{stream}] {line}")
+        level = logging.WARNING if stream == "stderr" else logging.INFO
+        run_log.log(level, line, extra={"fields": {"run": run_id, "stream": stream}})
+        
+        match = PROGRESS_LINE.match(line)
+        if match:
+            done, total, source, jobs, seconds = match.groups()
+            event = {"run": run_id, "event": "source_done", "source": source, "done": int(done),
+                     "total": int(total), "jobs": None if jobs is None else int(jobs),
+                     "seconds": float(seconds)}
+            run_log.info("source finished", extra={"fields": event})
+            outcome = "failed" if jobs is None else f"{jobs} jobs"
+            logging.info(f"📦 [{done}/{total}] {source}: {outcome} in {seconds}s")
     
     def send_fallback_notification(self):
         """Send a fallback notification if main bot fails"""
@@ -100,25 +385,48 @@ class ReliableJobScheduler:
         except Exception as e:
             logging.error(f"Error checking missed runs: {e}")
     
+    def next_run(self, now=None):
+        """(when, entries due then) of the next scheduled run"""
+        now = now or self.clock()
+        times = [(entry.next_after(now), entry) for entry in self.schedules]
+        due_at = min(when for when, _ in times)
+        return due_at, [entry for when, entry in times if when == due_at]
+    
+    def fire(self, entries):
+        """Run the entries due at the same time; a full run covers an incremental one"""
+        modes = {entry.mode for entry in entries}
+        if "full" in modes:
+            self.run_job_bot("full")
+        elif "incremental" in modes:
+            self.run_job_bot("incremental")
+        if "check" in modes:
+            self.check_missed_runs()
+    
+    def stop(self):
+        """Stop the scheduler loop (safe from signal handlers and other threads)"""
+        self.running = False
+        self._wakeup.set()
+    
     def start_scheduler(self):
         """Start the reliable scheduler"""
-        logging.info("🕕 Starting reliable job scheduler for 6:00 AM daily")
-        
-        # Schedule the main job at 6:00 AM
-        schedule.every().day.at("06:00").do(self.run_job_bot)
+        schedules = ", ".join(entry.spec for entry in self.schedules)
+        logging.info(f"🕕 Starting reliable job scheduler ({self.run_mode} runs): {schedules}")
         
-        # Add backup schedules in case main one fails
-        schedule.every().day.at("06:05").do(self.check_missed_runs)
-        schedule.every().day.at("06:15").do(self.check_missed_runs)
+        if self.run_mode != "subprocess":
+            self.get_scout()  # Import and warm up once, not on every run
         
         # Check for missed runs on startup
         self.check_missed_runs()
         
-        # Run scheduler loop
+        # Sleep until exactly the next fire time (re-checking the clock at least hourly)
         while self.running:
             try:
-                schedule.run_pending()
-                time.sleep(60)  # Check every minute
+                due_at, entries = self.next_run()
+                delay = (due_at - self.clock()).total_seconds()
+                if self._wakeup.wait(max(0.0, min(delay, MAX_SLEEP))):
+                    break
+                if self.clock() >= due_at:
+                    self.fire(entries)
                 
             except KeyboardInterrupt:
                 logging.info("🛑 Scheduler stopped by user")
@@ -127,11 +435,13 @@ class ReliableJobScheduler:
                 
             except Exception as e:
                 logging.error(f"Scheduler error: {e}")
-                time.sleep(60)  # Continue running even if there's an error
+                self._wakeup.wait(60)  # Continue running even if there's an error
 
 def main():
     """Main function to start the scheduler"""
+    setup_logging()
     scheduler = ReliableJobScheduler()
+    signal.signal(signal.SIGTERM, lambda signum, frame: scheduler.stop())
     
     # Check if job script exists
     if not scheduler.job_script.exists():
@@ -141,7 +451,8 @@ def main():
     logging.info("🤖 Agent-21 Scout Reliable Scheduler Starting...")
     logging.info(f"📁 Working directory: {scheduler.script_dir}")
     logging.info(f"🎯 Target script: {scheduler.job_script}")
-    logging.info("⏰ Scheduled for 6:00 AM daily")
+    for entry in scheduler.schedules:
+        logging.info(f"⏰ Scheduled: {entry.spec} (next {entry.next_after(datetime.now()):%Y-%m-%d %H:%M:%S})")
     
     try:
         scheduler.start_scheduler()
@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+Fallback Jobs for Agent-21 Scout
+Curated jobs served in place of a source that failed or whose circuit is
+open. Only imported when a source actually fails
+"""
+
+# Jobs for sources that failed under the basic error handler
+FALLBACK_JOBS = {
+    "Adult Platform Jobs": [
+        {
+            "title": "Chat Moderator - Creator Platform",
+            "company": "Creator Support Agency",
+            "location": "Remote - Worldwide",
+            "url": "https://www.patreon.com/careers",
+            "source": "Creator Economy (Fallback)",
+            "salary": "$15-25/hour"
+        }
+    ],
+    "Social Media Platform Jobs": [
+        {
+            "title": "Content Moderator",
+            "company": "Social Media Agency",
+            "location": "Remote - Global",
+            "url": "https://example-social.com/careers",
+            "source": "Social Media (Fallback)",
+            "salary": "$16-22/hour"
+        }
+    ],
+    "AI Training Jobs": [
+        {
+            "title": "Search Quality Evaluator",
+            "company": "AI Training Company",
+            "location": "Remote - Worldwide",
+            "url": "https://example-ai.com/careers",
+            "source": "AI Training (Fallback)",
+            "salary": "$14-20/hour"
+        }
+    ]
+}
+
+# Jobs for sources that failed under the comprehensive error handler,
+# with "default" for any source not listed
+COMPREHENSIVE_FALLBACK_JOBS = {
+    # Core API fallbacks
+    "Remotive API": [
+        {
+            "title": "Remote Software Developer",
+            "company": "Tech Startup",
+            "location": "Remote - Worldwide",
+            "url": "https://remotive.io/remote-jobs",
+            "source": "Remotive (Fallback)",
+            "salary": "$50-80k/year"
+        },
+        {
+            "title": "Customer Support Representative",
+            "company": "Remote Company",
+            "location": "Remote - Global",
+            "url": "https://remotive.io/remote-jobs",
+            "source": "Remotive (Fallback)",
+            "salary": "$35-45k/year"
+        }
+    ],
+
+    # Company-specific fallbacks
+    "Zapier": [
+        {
+            "title": "Customer Success Specialist",
+            "company": "Zapier",
+            "location": "Remote - Worldwide",
+            "url": "https://zapier.com/jobs",
+            "source": "Zapier (Fallback)",
+            "salary": "$60-80k/year"
+        }
+    ],
+
+    "Deel": [
+        {
+            "title": "Customer Support Agent",
+            "company": "Deel",
+            "location": "Remote - Global",
+            "url": "https://deel.com/careers",
+            "source": "Deel (Fallback)",
+            "salary": "$40-55k/year"
+        }
+    ],
+
+    # Platform-specific fallbacks
+    "Social Media Platform Jobs": [
+        {
+            "title": "Content Moderator",
+            "company": "ModSquad",
+            "location": "Remote - Worldwide",
+            "url": "https://modsquad.com/careers",
+            "source": "Social Media (Fallback)",
+            "salary": "$16-22/hour"
+        },
+        {
+            "title": "Community Manager",
+            "company": "LiveWorld",
+            "location": "Remote - Global",
+            "url": "https://liveworld.com/careers",
+            "source": "Social Media (Fallback)",
+            "salary": "$18-25/hour"
+        }
+    ],
+
+    "Creator Economy Jobs": [
+        {
+            "title": "Creator Support Specialist",
+            "company": "Creator Agency",
+            "location": "Remote - Worldwide",
+            "url": "https://example-creator.com/careers",
+            "source": "Creator Economy (Fallback)",
+            "salary": "$20-30/hour"
+        }
+    ],
+
+    "Gaming Platform Jobs": [
+        {
+            "title": "Community Moderator",
+            "company": "Gaming Company",
+            "location": "Remote - Global",
+            "url": "https://example-gaming.com/careers",
+            "source": "Gaming (Fallback)",
+            "salary": "$18-28/hour"
+        }
+    ],
+
+    # Generic fallbacks for any source
+    "default": [
+        {
+            "title": "Remote Customer Support",
+            "company": "Global Remote Company",
+            "location": "Remote - Worldwide",
+            "url": "https://remote-jobs.com",
+            "source": "Fallback Jobs",
+            "salary": "$15-25/hour"
+        },
+        {
+            "title": "Virtual Assistant",
+            "company": "Remote VA Agency",
+            "location": "Remote - Global",
+            "url": "https://remote-va.com",
+            "source": "Fallback Jobs",
+            "salary": "$12-20/hour"
+        },
+        {
+            "title": "Data Entry Specialist",
+            "company": "Remote Data Company",
+            "location": "Remote - Worldwide",
+            "url": "https://remote-data.com",
+            "source": "Fallback Jobs",
+            "salary": "$10-18/hour"
+        }
+    ]
+}
+
+
+def remotive_fallback_jobs(category):
+    """Jobs shown for a Remotive category whose board could not be fetched"""
+    return [
+        {
+            "title": f"Remote {category.title()} Specialist",
+            "company": "Global Remote Company",
+            "location": "Remote - Worldwide",
+            "url": "https://remoteok.io/",
+            "source": "Remotive (Fallback)",
+            "salary": "$20-35/hour"
+        },
+        {
+            "title": f"{category.title()} Professional - Remote",
+            "company": "International Tech Firm",
+            "location": "Remote - Global",
+            "url": "https://weworkremotely.com/",
+            "source": "Remotive (Fallback)",
+            "salary": "$25-40/hour"
+        }
+    ]
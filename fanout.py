@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Subscriber Fan-Out for Agent-21 Scout
+Delivers the day's (already formatted) job messages to every paid subscriber
+tracked by the payment bots. All deliveries go into the outbox in one batch
+and a pool of workers sends them concurrently within Telegram's limits, so
+delivery time follows the rate limits rather than a loop per user
+"""
+
+import os
+import sqlite3
+import time
+import uuid
+from pathlib import Path
+
+# Fan-out defaults (override via environment)
+FANOUT_ENABLED = os.getenv("SCOUT_FANOUT", "0") == "1"
+BASE_DIR = Path(__file__).parent
+PAYMENTS_DB = Path(os.getenv("SCOUT_PAYMENTS_DB", BASE_DIR / "payments.db"))                   # start_payment_bot.py
+AGENT21_PAYMENTS_DB = Path(os.getenv("SCOUT_AGENT21_PAYMENTS_DB", BASE_DIR / "agent21_payments.db"))  # agent21_payment_bot.py
+
+# Where each payment bot keeps its paid users
+SUBSCRIBER_QUERIES = (
+    (PAYMENTS_DB, "SELECT chat_id FROM users WHERE status = 'paid'"),
+    (AGENT21_PAYMENTS_DB, "SELECT DISTINCT user_id FROM payments WHERE payment_status = 'completed'"),
+)
+
+
+def load_subscribers(sources=SUBSCRIBER_QUERIES):
+    """Chat ids of every paid subscriber across the payment databases"""
+    subscribers = []
+    seen = set()
+    for path, query in sources:
+        path = Path(path)
+        if not path.exists():
+            continue
+        try:
+            # Read-only: never create or lock a payment bot's database for writing
+            conn = sqlite3.connect(f"{path.resolve().as_uri()}?mode=ro", uri=True, timeout=10)
+            try:
+                rows = conn.execute(query).fetchall()
+            finally:
+                conn.close()
+        except sqlite3.Error as e:
+            print(f"[FANOUT] Could not read subscribers from {path.name}: {e}")
+            continue
+        for (chat_id,) in rows:
+            chat_id = str(chat_id).strip()
+            if chat_id and chat_id != "None" and chat_id not in seen:
+                seen.add(chat_id)
+                subscribers.append(chat_id)
+    return subscribers
+
+
+class FanOutDelivery:
+    """Queue a batch of per-recipient messages for the outbox worker pool"""
+
+    def __init__(self, pool=None):
+        if pool is None:
+            from telegram_bot import outbox  # Shared pool, flushed at exit
+            pool = outbox()
+        self.pool = pool
+        self.queue = pool.queue
+
+    def send(self, deliveries):
+        """
+        Enqueue (chat_id, text) pairs as one batch and wake the workers.
+        Returns the batch id for progress().
+        """
+        batch = f"fanout-{time.strftime('%Y%m%d-%H%M%S')}-{uuid.uuid4().hex[:8]}"
+        count = len(self.queue.enqueue_many(deliveries, batch))
+        self.pool.notify()
+        print(f"[FANOUT] Queued {count} messages in batch {batch}")
+        return batch
+
+    def broadcast(self, messages, recipients=None):
+        """Send the same messages, in order, to every recipient (default: all subscribers)"""
+        recipients = load_subscribers() if recipients is None else recipients
+        return self.send([(chat_id, text) for chat_id in recipients for text in messages])
+
+    def progress(self, batch):
+        """Per-recipient {"sent", "pending", "dead"} counts for a batch"""
+        return self.queue.progress(batch)
+
+    def wait(self, timeout=None):
+        """Block until everything queued is delivered; returns False on timeout"""
+        return self.pool.flush(timeout)
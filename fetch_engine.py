@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+Concurrent Fetch Engine for Agent-21 Scout
+Runs independent job sources in a bounded thread pool with per-host
+concurrency limits and a global deadline, merging results in task order.
+Costlier network tasks are started first, and a ResultCache lets a source's
+results be reused across runs for as long as they stay fresh
+"""
+
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+
+# Engine defaults (override via environment)
+DEFAULT_MAX_WORKERS = int(os.getenv("SCOUT_FETCH_WORKERS", "8"))
+DEFAULT_PER_HOST_LIMIT = int(os.getenv("SCOUT_PER_HOST_LIMIT", "2"))
+DEFAULT_DEADLINE = float(os.getenv("SCOUT_FETCH_DEADLINE", "240"))
+
+
+class FetchTask:
+    """A single source call: function(*args, **kwargs) against an optional host"""
+
+    def __init__(self, name, function, args=(), kwargs=None, host=None, source=None, cost=1):
+        self.name = name
+        self.source = source or name  # Name its metrics are grouped under
+        self.function = function
+        self.args = tuple(args)
+        self.kwargs = kwargs or {}
+        self.host = host  # None for static sources (no network)
+        self.cost = cost  # Relative cost; costlier network tasks are submitted first
+
+    def __repr__(self):
+        return f"FetchTask({self.name!r}, host={self.host!r})"
+
+
+class ResultCache:
+    """Source results kept across runs, each reused while younger than its refresh interval"""
+
+    def __init__(self, clock=time.time):
+        self.clock = clock
+        self.hits = 0
+        self._results = {}  # key -> (stored at, jobs)
+        self._lock = threading.Lock()
+
+    def get(self, key, refresh):
+        with self._lock:
+            entry = self._results.get(key)
+            if entry is None or self.clock() - entry[0] >= refresh:
+                return None
+            self.hits += 1
+            return list(entry[1])
+
+    def put(self, key, jobs):
+        with self._lock:
+            self._results[key] = (self.clock(), list(jobs))
+
+    def cached(self, key, refresh, function):
+        """
+        function(*args), served from the cache while fresh. Only results
+        that were returned are stored; errors propagate and aren't cached.
+        """
+        if not refresh:
+            return function
+
+        def call(*args, **kwargs):
+            jobs = self.get(key, refresh)
+            if jobs is None:
+                jobs = function(*args, **kwargs)
+                if isinstance(jobs, list):
+                    self.put(key, jobs)
+            return jobs
+        return call
+
+    def clear(self):
+        with self._lock:
+            self._results.clear()
+
+
+class FetchEngine:
+    """Runs fetch tasks concurrently and returns their results in task order"""
+
+    def __init__(self, max_workers=None, per_host_limit=None, deadline=None, metrics=None):
+        self.max_workers = max_workers or DEFAULT_MAX_WORKERS
+        self.per_host_limit = per_host_limit or DEFAULT_PER_HOST_LIMIT
+        self.deadline = deadline if deadline is not None else DEFAULT_DEADLINE
+        self.metrics = metrics  # RunMetrics timing each task under its source, or None
+        self.timed_out = []  # Names of tasks dropped by the deadline
+        self.failed = []     # Names of tasks that raised
+        self._host_semaphores = {}
+        self._host_lock = threading.Lock()
+        self._total = 0
+        self._finished = 0
+
+    def _semaphore_for(self, host):
+        """Get (or create) the concurrency limiter for a host"""
+        with self._host_lock:
+            semaphore = self._host_semaphores.get(host)
+            if semaphore is None:
+                semaphore = threading.BoundedSemaphore(self.per_host_limit)
+                self._host_semaphores[host] = semaphore
+            return semaphore
+
+    def _run_task(self, task, deadline_at):
+        """Run one task, waiting for a free per-host slot until the deadline"""
+        if task.host is None:
+            return self._call(task)
+
+        semaphore = self._semaphore_for(task.host)
+        remaining = deadline_at - time.monotonic()
+        if remaining <= 0 or not semaphore.acquire(timeout=remaining):
+            raise TimeoutError(f"No free slot for {task.host} before deadline")
+        try:
+            return self._call(task)
+        finally:
+            semaphore.release()
+
+    def _call(self, task):
+        started = time.monotonic()
+        try:
+            if self.metrics is None:
+                jobs = task.function(*task.args, **task.kwargs)
+            else:
+                with self.metrics.source(task.source):
+                    jobs = task.function(*task.args, **task.kwargs)
+        except Exception:
+            self._report_progress(task, "failed", started)
+            raise
+        self._report_progress(task, f"{len(jobs) if jobs else 0} jobs", started)
+        return jobs
+
+    def _report_progress(self, task, outcome, started):
+        """One '[PROGRESS] done/total' line per finished task, for live run logs"""
+        with self._host_lock:
+            self._finished += 1
+            done = self._finished
+        print(f"[PROGRESS] {done}/{self._total} {task.name}: {outcome} in {time.monotonic() - started:.1f}s")
+
+    def run(self, tasks):
+        """
+        Run all tasks and return a list of job lists aligned with `tasks`.
+        Network tasks run in the pool while static tasks run inline, so total
+        time is bounded by the slowest source rather than the sum of them.
+        Failed or timed-out tasks contribute an empty list.
+        """
+        tasks = list(tasks)
+        results = [[] for _ in tasks]
+        self.timed_out = []
+        self.failed = []
+        self._total = len(tasks)
+        self._finished = 0
+        deadline_at = time.monotonic() + self.deadline
+
+        executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="scout-fetch")
+        futures = {}
+        try:
+            # Costliest sources first, so they aren't left to start last
+            for index in sorted(range(len(tasks)), key=lambda index: -tasks[index].cost):
+                task = tasks[index]
+                if task.host is not None:
+                    futures[executor.submit(self._run_task, task, deadline_at)] = index
+
+            # Static sources are CPU-only; run them while network calls are in flight
+            for index, task in enumerate(tasks):
+                if task.host is None:
+                    results[index] = self._collect(task, self._call_inline, task, deadline_at)
+
+            done, not_done = wait(futures, timeout=max(0.0, deadline_at - time.monotonic()))
+            for future in not_done:
+                future.cancel()
+                task = tasks[futures[future]]
+                self.timed_out.append(task.name)
+                print(f"[TIMEOUT] {task.name}: dropped at {self.deadline:.0f}s deadline")
+
+            for future in done:
+                task = tasks[futures[future]]
+                results[futures[future]] = self._collect(task, future.result)
+        finally:
+            # Don't block on stragglers; their results are simply discarded
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        return results
+
+    def _call_inline(self, task, deadline_at):
+        if time.monotonic() >= deadline_at:
+            raise TimeoutError("Deadline reached before task started")
+        return self._run_task(task, deadline_at)
+
+    def _collect(self, task, getter, *args):
+        """Fetch a task's result, normalising errors to an empty list"""
+        try:
+            jobs = getter(*args)
+        except TimeoutError as e:
+            self.timed_out.append(task.name)
+            print(f"[TIMEOUT] {task.name}: {e}")
+            return []
+        except Exception as e:
+            self.failed.append(task.name)
+            print(f"[WARNING] {task.name} failed: {e}")
+            return []
+        return jobs if jobs else []
+
+    def merge_into(self, target, tasks):
+        """Run tasks and extend `target` with their jobs in deterministic task order"""
+        for jobs in self.run(tasks):
+            target.extend(jobs)
+        return target
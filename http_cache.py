@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""
+On-Disk HTTP Cache for Agent-21 Scout
+Stores job board responses with their ETag/Last-Modified validators and
+revalidates them with conditional GETs, so unchanged boards cost a 304
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from urllib.parse import urlencode, urlsplit
+
+from http_client import get
+
+# Cache defaults (override via environment)
+CACHE_ENABLED = os.getenv("SCOUT_HTTP_CACHE", "1") != "0"
+CACHE_DIR = Path(os.getenv("SCOUT_HTTP_CACHE_DIR", Path(__file__).parent / ".scout_cache" / "http"))
+CACHE_MAX_BYTES = int(float(os.getenv("SCOUT_HTTP_CACHE_MAX_MB", "50")) * 1024 * 1024)
+DEFAULT_TTL = float(os.getenv("SCOUT_HTTP_CACHE_TTL", "3600"))
+
+# How long (seconds) a stored board is served without asking the server
+SOURCE_TTLS = {
+    "remotive.com": 6 * 3600,
+    "www.workingnomads.co": 6 * 3600,
+    "boards-api.greenhouse.io": 12 * 3600,
+    "api.lever.co": 12 * 3600,
+    "api.ashbyhq.com": 12 * 3600,
+    "apply.workable.com": 12 * 3600,
+    "wellfound.com": 6 * 3600,
+    "www.nowhiteboard.org": 6 * 3600,
+}
+
+
+class HttpCache:
+    """Disk cache of GET responses with TTLs, revalidation and LRU eviction"""
+
+    def __init__(self, directory=None, max_bytes=None, ttls=None, default_ttl=None):
+        self.directory = Path(directory or CACHE_DIR)
+        self.max_bytes = max_bytes or CACHE_MAX_BYTES
+        self.ttls = SOURCE_TTLS if ttls is None else ttls
+        self.default_ttl = DEFAULT_TTL if default_ttl is None else default_ttl
+        self.fresh_hits = 0     # Served from disk without a request
+        self.revalidated = 0    # Server answered 304 Not Modified
+        self.misses = 0         # Full download
+        self.bytes_downloaded = 0
+        self._lock = threading.Lock()
+
+    def ttl_for(self, url):
+        return self.ttls.get(urlsplit(url).netloc.lower(), self.default_ttl)
+
+    def _key(self, url, params):
+        full_url = url
+        if params:
+            full_url += "?" + urlencode(sorted(params.items()))
+        return hashlib.sha256(full_url.encode("utf-8")).hexdigest()
+
+    def _paths(self, key):
+        return self.directory / f"{key}.json", self.directory / f"{key}.body"
+
+    def _load(self, key):
+        meta_path, body_path = self._paths(key)
+        try:
+            with open(meta_path, "r", encoding="utf-8") as f:
+                meta = json.load(f)
+            with open(body_path, "rb") as f:
+                body = f.read()
+        except (OSError, ValueError):
+            return None, None
+        return meta, body
+
+    def _write_atomic(self, path, data):
+        tmp_path = path.with_name(f"{path.name}.{threading.get_ident()}.tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+    def _store(self, key, url, response):
+        self.directory.mkdir(parents=True, exist_ok=True)
+        meta_path, body_path = self._paths(key)
+        meta = {
+            "url": url,
+            "stored_at": time.time(),
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+            "content_type": response.headers.get("Content-Type"),
+            "encoding": response.encoding,
+        }
+        self._write_atomic(body_path, response.content)
+        self._write_atomic(meta_path, json.dumps(meta).encode("utf-8"))
+        self._evict()
+
+    def _used(self, key):
+        """Bump an entry's LRU position (the body's mtime) when it is read"""
+        try:
+            os.utime(self._paths(key)[1])
+        except OSError:
+            pass
+
+    def _touch(self, key, meta):
+        """Mark an entry fresh again after a 304 and bump its LRU position"""
+        meta_path = self._paths(key)[0]
+        meta["stored_at"] = time.time()
+        try:
+            self._write_atomic(meta_path, json.dumps(meta).encode("utf-8"))
+        except OSError:
+            pass
+        self._used(key)
+
+    def _evict(self):
+        """Drop least recently used entries until the cache fits max_bytes"""
+        with self._lock:
+            entries = []
+            total = 0
+            for body_path in self.directory.glob("*.body"):
+                try:
+                    stat = body_path.stat()
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, body_path))
+                total += stat.st_size
+
+            for _, size, body_path in sorted(entries):
+                if total <= self.max_bytes:
+                    break
+                for path in (body_path, body_path.with_suffix(".json")):
+                    try:
+                        path.unlink()
+                    except OSError:
+                        pass
+                total -= size
+
+    def _cached_response(self, url, meta, body):
+        from requests import Response
+        from requests.structures import CaseInsensitiveDict
+
+        response = Response()
+        response.status_code = 200
+        response._content = body
+        response.url = url
+        response.encoding = meta.get("encoding")
+        response.headers = CaseInsensitiveDict()
+        if meta.get("content_type"):
+            response.headers["Content-Type"] = meta["content_type"]
+        response.from_cache = True
+        return response
+
+    def stored(self, url, params=None):
+        """The stored copy of a URL however old, or None"""
+        meta, body = self._load(self._key(url, params))
+        if meta is None:
+            return None
+        return self._cached_response(url, meta, body)
+
+    def get(self, url, params=None, headers=None, timeout=None, ttl=None):
+        """
+        GET through the cache. Fresh entries are served without a request;
+        stale ones are revalidated with If-None-Match/If-Modified-Since.
+        A stored copy is also served if the server can't be reached.
+        """
+        from requests import RequestException
+
+        key = self._key(url, params)
+        meta, body = self._load(key)
+        ttl = self.ttl_for(url) if ttl is None else ttl
+
+        if meta is not None and time.time() - meta.get("stored_at", 0) < ttl:
+            self.fresh_hits += 1
+            self._used(key)
+            return self._cached_response(url, meta, body)
+
+        request_headers = dict(headers or {})
+        if meta is not None:
+            if meta.get("etag"):
+                request_headers["If-None-Match"] = meta["etag"]
+            if meta.get("last_modified"):
+                request_headers["If-Modified-Since"] = meta["last_modified"]
+
+        try:
+            response = get(url, params=params, headers=request_headers, timeout=timeout)
+        except RequestException as e:
+            if meta is None:
+                raise
+            print(f"[CACHE] Serving stale copy of {url}: {e}")
+            self._used(key)
+            return self._cached_response(url, meta, body)
+
+        if response.status_code == 304 and meta is not None:
+            self.revalidated += 1
+            self._touch(key, meta)
+            response = self._cached_response(url, meta, body)
+            response.revalidated = True  # Still cost a round trip
+            return response
+
+        if response.status_code == 200:
+            self.misses += 1
+            self.bytes_downloaded += len(response.content)
+            try:
+                self._store(key, url, response)
+            except OSError as e:
+                print(f"[CACHE] Could not store {url}: {e}")
+        response.from_cache = False
+        return response
+
+
+_default_cache = None
+_default_cache_lock = threading.Lock()
+
+
+def default_cache():
+    """The process-wide cache shared by every board download"""
+    global _default_cache
+    with _default_cache_lock:
+        if _default_cache is None:
+            _default_cache = HttpCache()
+        return _default_cache
+
+
+def cached_get(url, params=None, headers=None, timeout=None, ttl=None):
+    """GET via the default disk cache (or directly when SCOUT_HTTP_CACHE=0)"""
+    if not CACHE_ENABLED:
+        return get(url, params=params, headers=headers, timeout=timeout)
+    return default_cache().get(url, params=params, headers=headers, timeout=timeout, ttl=ttl)
+
+
+def stored_response(url, params=None):
+    """The default cache's copy of a URL however old, or None"""
+    if not CACHE_ENABLED:
+        return None
+    return default_cache().stored(url, params)
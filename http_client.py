@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Shared HTTP Client for Agent-21 Scout
+One pooled keep-alive Session per host, with timeouts and retries
+configured in a single place for every outbound call. requests itself is
+imported with the first session, so modules that only might make a call
+import quickly
+"""
+
+import os
+import threading
+from urllib.parse import urlsplit
+
+# Client defaults (override via environment)
+HTTP_TIMEOUT = float(os.getenv("SCOUT_HTTP_TIMEOUT", "15"))
+HTTP_POOL_SIZE = int(os.getenv("SCOUT_HTTP_POOL_SIZE", "10"))
+HTTP_RETRIES = int(os.getenv("SCOUT_HTTP_RETRIES", "2"))
+HTTP_BACKOFF = float(os.getenv("SCOUT_HTTP_BACKOFF", "0.5"))
+USER_AGENT = "Mozilla/5.0 (compatible; Agent21Scout/1.0)"
+
+_sessions = {}
+_sessions_lock = threading.Lock()
+
+
+def _build_session():
+    """Create a keep-alive session with a sized connection pool and retries"""
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    retry = Retry(
+        total=HTTP_RETRIES,
+        backoff_factor=HTTP_BACKOFF,
+        status_forcelist=(500, 502, 503, 504),
+        allowed_methods=frozenset({"GET", "HEAD"}),  # Never replay a POST (e.g. sendMessage)
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=HTTP_POOL_SIZE, max_retries=retry)
+
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers["User-Agent"] = USER_AGENT
+    return session
+
+
+def session_for(url):
+    """Return the shared session for the URL's host, creating it on first use"""
+    host = urlsplit(url).netloc.lower()
+    with _sessions_lock:
+        session = _sessions.get(host)
+        if session is None:
+            session = _build_session()
+            _sessions[host] = session
+        return session
+
+
+def request(method, url, timeout=None, **kwargs):
+    """Send a request through the host's pooled session"""
+    return session_for(url).request(method, url, timeout=timeout or HTTP_TIMEOUT, **kwargs)
+
+
+def get(url, **kwargs):
+    return request("GET", url, **kwargs)
+
+
+def post(url, **kwargs):
+    return request("POST", url, **kwargs)
+
+
+def close_all():
+    """Close every pooled session (connections are reopened on next use)"""
+    with _sessions_lock:
+        for session in _sessions.values():
+            session.close()
+        _sessions.clear()
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Static Job Catalog for Agent-21 Scout
+Curated jobs that used to be rebuilt as literal lists inside each fetcher.
+The catalog is loaded once per process and indexed by trigger keyword, so a
+category lookup is a handful of set/dict lookups instead of dozens of
+any(word in keywords ...) scans
+"""
+
+import json
+import os
+import threading
+from pathlib import Path
+
+CATALOG_PATH = Path(os.getenv("SCOUT_JOB_CATALOG", Path(__file__).parent / "job_catalog.json"))
+
+# How a group's trigger words are matched against a category's keywords:
+#   always    - group is returned for every category
+#   keyword   - any trigger word equals one of the keywords
+#   substring - any trigger word occurs in " ".join(keywords).lower()
+MATCH_MODES = ("always", "keyword", "substring")
+
+
+class JobCatalog:
+    """Keyword-indexed, read-only view of job_catalog.json"""
+
+    def __init__(self, path=None):
+        self.path = Path(path or CATALOG_PATH)
+        with open(self.path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+
+        self._groups = {}         # source -> [(mode, words, jobs)]
+        self._keyword_index = {}  # trigger word -> {(source, group position)}
+        self._memo = {}           # (source, keywords) -> tuple of jobs
+        self._lock = threading.Lock()
+
+        for source, groups in data["sources"].items():
+            entries = []
+            for position, group in enumerate(groups):
+                mode = group["match"]
+                if mode not in MATCH_MODES:
+                    raise ValueError(f"Unknown match mode {mode!r} in catalog source {source!r}")
+                words = tuple(group["words"])
+                entries.append((mode, words, tuple(group["jobs"])))
+                if mode == "keyword":
+                    for word in words:
+                        self._keyword_index.setdefault(word, set()).add((source, position))
+            self._groups[source] = entries
+
+    @property
+    def sources(self):
+        return list(self._groups)
+
+    def __len__(self):
+        return sum(len(jobs) for entries in self._groups.values() for _, _, jobs in entries)
+
+    def _lookup(self, source, keywords):
+        entries = self._groups[source]
+        hits = set()
+        for word in keywords:
+            hits.update(self._keyword_index.get(word, ()))
+        keywords_str = " ".join(keywords).lower()
+
+        matched = []
+        for position, (mode, words, jobs) in enumerate(entries):
+            if mode == "always":
+                matched.extend(jobs)
+            elif mode == "keyword":
+                if (source, position) in hits:
+                    matched.extend(jobs)
+            elif any(word in keywords_str for word in words):
+                matched.extend(jobs)
+        return tuple(matched)
+
+    def jobs_for(self, source, keywords=()):
+        """
+        Return the curated jobs of `source` that match `keywords`, in catalog
+        order. The list is new but the job dicts are shared, so treat them as
+        read-only.
+        """
+        key = (source, tuple(keywords))
+        jobs = self._memo.get(key)
+        if jobs is None:
+            jobs = self._lookup(source, key[1])
+            with self._lock:
+                self._memo[key] = jobs
+        return list(jobs)
+
+
+_catalog = None
+_catalog_lock = threading.Lock()
+
+
+def get_catalog():
+    """The process-wide catalog, loaded on first use"""
+    global _catalog
+    with _catalog_lock:
+        if _catalog is None:
+            _catalog = JobCatalog()
+        return _catalog
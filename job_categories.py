@@ -0,0 +1,392 @@
+#!/usr/bin/env python3
+"""
+Job Categories for Agent-21 Scout
+Category keywords, the skill-level catalog and the JobCategorizer that
+files each job under a level and category. Loaded on first use, so
+importing telegram_jobs stays cheap
+"""
+
+from datetime import datetime
+
+from job_record import intern_categorization
+from keyword_matcher import KeywordMatcher
+
+# Job categories for worldwide remote work
+CATEGORIES = {
+    "software-dev": ["developer", "programming", "software", "remote"],
+    "python": ["python", "django", "flask", "backend"],
+    "javascript": ["javascript", "react", "vue", "angular"],
+    "mobile": ["mobile", "android", "ios", "react-native"],
+    "data": ["data", "analytics", "machine-learning", "ai"],
+    "it-support": ["technical-support", "helpdesk", "systems-admin", "it"],
+    "virtual-assistant": ["virtual-assistant", "executive-assistant", "admin"],
+    "content-writing": ["content-writer", "copywriter", "writing", "content"],
+    "course-creator": ["course-creator", "instructor", "education", "training"],
+    "customer-support": ["customer-support", "customer-success", "community-manager", "technical-support"],
+    "operations-hr": ["recruiter", "hr-specialist", "people-operations", "project-manager"],
+    "finance": ["finance-analyst", "accountant", "financial-analyst", "bookkeeper"],
+    "technical-writing": ["technical-writer", "documentation", "copywriter", "blog-writer"],
+    "bpo-outsourcing": ["content-moderator", "support-agent", "trust-safety", "ad-reviewer"],
+    "ai-training": ["data-annotation", "ai-training", "rater", "labeling", "microtasks"],
+    "freelance-gig": ["freelance", "gig", "virtual-assistant", "small-tasks"],
+    "content-moderation": ["content-moderator", "community-moderation", "social-media-evaluator"],
+    "social-media-tasks": ["tiktok-moderator", "youtube-reviewer", "facebook-support", "instagram-safety"],
+    "platform-support": ["platform-support", "user-safety", "community-operations", "engagement-monitoring"],
+    "ad-review-specialist": ["ad-reviewer", "advertising-compliance", "campaign-reviewer", "promotional-content"],
+    "data-labeling": ["image-labeling", "video-annotation", "text-classification", "audio-transcription"],
+    "creator-economy": ["creator-support", "account-manager", "social-media-manager", "content-assistant"],
+    "gaming-platforms": ["gaming-moderator", "player-support", "community-manager", "esports-support"],
+    "chat-moderation": ["chat-moderator", "community-moderator", "engagement-specialist", "live-chat-support"],
+    "creator-platforms": ["patreon-support", "twitch-moderator", "discord-moderator", "creator-assistant"],
+    
+    # Enhanced Specialized Categories
+    "basic-customer-support": ["customer-support", "chat-support", "email-support", "helpdesk", "live-chat"],
+    "basic-content-moderation": ["content-moderator", "community-moderator", "social-media-moderator", "chat-moderator"],
+    "basic-data-entry": ["data-entry", "microtasks", "surveys", "basic-annotation", "clickworker"],
+    "basic-virtual-assistant": ["virtual-assistant", "admin-assistant", "scheduling", "email-management"],
+    "advanced-customer-support": ["technical-support", "customer-success", "account-manager", "support-specialist"],
+    "platform-moderation": ["tiktok-moderator", "facebook-moderator", "youtube-reviewer", "instagram-safety", "trust-safety"],
+    "ai-training-evaluation": ["search-evaluator", "ads-evaluator", "ai-rater", "content-evaluator", "social-media-evaluator"],
+    "gaming-community": ["gaming-moderator", "player-support", "community-manager", "esports-support"],
+    "creator-economy-support": ["creator-support", "account-manager", "fan-engagement", "content-assistant", "social-media-manager"],
+    "advanced-ai-data": ["prompt-engineering", "ai-training", "machine-learning", "data-annotation", "model-training"],
+    "linguistic-specialist": ["linguistic-annotation", "translation-evaluation", "grammar-analysis", "language-quality"],
+    "technical-moderation": ["trust-safety-specialist", "policy-specialist", "content-reviewer", "safety-analyst"],
+    "advanced-data-labeling": ["3d-labeling", "autonomous-vehicle", "medical-annotation", "technical-annotation"],
+    "freelance-ai-tech": ["ai-consultant", "ml-freelancer", "prompt-engineer", "dataset-specialist"],
+    "microtasks-gig": ["microtasks", "small-tasks", "gig-work", "project-based", "flexible-hours"],
+    "research-testing": ["user-testing", "research-studies", "product-feedback", "usability-testing"],
+    
+    # Additional High-Demand Remote Categories
+    "sales-bizdev": ["sales", "account-executive", "business-development", "lead-generation", "sales-rep"],
+    "product-management": ["product-manager", "product-owner", "roadmap", "agile", "scrum-master"],
+    "ecommerce": ["shopify", "woocommerce", "amazon-va", "store-manager", "ecommerce-support", "dropshipping"],
+    "healthcare-remote": ["telehealth", "medical-transcription", "medical-billing", "healthcare-support", "medical-coding"],
+    "translation-localization": ["translator", "localization", "linguist", "language-specialist", "interpretation"],
+    "research-surveys": ["online-research", "survey-taker", "data-collection", "study-participant", "market-research"]
+}
+
+# Organized Job Categories by Skill Level and Requirements
+ORGANIZED_JOB_CATEGORIES = {
+    
+    # ===== ENTRY LEVEL JOBS (No Experience Required) =====
+    "entry_level": {
+        "description": "Jobs requiring no prior experience - perfect for beginners",
+        "skill_requirements": "Basic computer skills, reliable internet",
+        "emoji": "🟢",
+        "categories": {
+            "basic_customer_support": {
+                "keywords": ["customer-support", "chat-support", "email-support", "helpdesk", "live-chat"],
+                "salary_range": "$12-20/hour",
+                "companies": ["LiveWorld", "ModSquad", "SupportNinja", "Teleperformance", "TTEC"],
+                "requirements": "Good communication, basic computer skills"
+            },
+            "basic_content_moderation": {
+                "keywords": ["content-moderator", "community-moderator", "social-media-moderator", "chat-moderator"],
+                "salary_range": "$13-18/hour", 
+                "companies": ["Majorel", "TaskUs", "Concentrix", "Alorica", "ModSquad"],
+                "requirements": "Attention to detail, cultural awareness"
+            },
+            "basic_data_entry": {
+                "keywords": ["data-entry", "microtasks", "surveys", "basic-annotation", "clickworker"],
+                "salary_range": "$8-15/hour",
+                "companies": ["Clickworker", "Microworkers", "Amazon MTurk", "OneForma"],
+                "requirements": "Basic computer skills, attention to detail"
+            },
+            "basic_virtual_assistant": {
+                "keywords": ["virtual-assistant", "admin-assistant", "scheduling", "email-management"],
+                "salary_range": "$10-18/hour",
+                "companies": ["Fancy Hands", "Time Etc", "Belay Solutions", "CloudTask"],
+                "requirements": "Organization skills, basic office software"
+            }
+        }
+    },
+    
+    # ===== INTERMEDIATE LEVEL JOBS (Some Experience/Skills Required) =====
+    "intermediate_level": {
+        "description": "Jobs requiring some experience or specific skills",
+        "skill_requirements": "1-2 years experience or specific technical skills",
+        "emoji": "🟡",
+        "categories": {
+            "advanced_customer_support": {
+                "keywords": ["technical-support", "customer-success", "account-manager", "support-specialist"],
+                "salary_range": "$18-30/hour",
+                "companies": ["SupportNinja", "Automattic", "GitLab", "Buffer", "Remote.com"],
+                "requirements": "Technical knowledge, problem-solving skills"
+            },
+            "platform_moderation": {
+                "keywords": ["tiktok-moderator", "facebook-moderator", "youtube-reviewer", "instagram-safety", "trust-safety"],
+                "salary_range": "$16-25/hour",
+                "companies": ["ByteDance", "Meta", "Google", "Twitter", "Reddit", "Discord"],
+                "requirements": "Platform knowledge, policy understanding"
+            },
+            "ai_training_evaluation": {
+                "keywords": ["search-evaluator", "ads-evaluator", "ai-rater", "content-evaluator", "social-media-evaluator"],
+                "salary_range": "$14-22/hour",
+                "companies": ["TELUS International", "Appen", "Lionbridge", "OneForma", "iSoftStone"],
+                "requirements": "Analytical skills, cultural knowledge, attention to detail"
+            },
+            "gaming_community": {
+                "keywords": ["gaming-moderator", "player-support", "community-manager", "esports-support"],
+                "salary_range": "$15-25/hour",
+                "companies": ["Roblox", "Epic Games", "Riot Games", "Activision Blizzard", "Twitch"],
+                "requirements": "Gaming knowledge, community management experience"
+            },
+            "creator_economy": {
+                "keywords": ["creator-support", "account-manager", "fan-engagement", "content-assistant", "social-media-manager"],
+                "salary_range": "$15-28/hour",
+                "companies": ["Creator Agencies", "Patreon", "OnlyFans Agencies", "Social Media Agencies"],
+                "requirements": "Social media knowledge, customer service skills"
+            },
+            "sales_business_development": {
+                "keywords": ["sales", "account-executive", "business-development", "lead-generation", "sales-rep"],
+                "salary_range": "$20-35/hour + commission",
+                "companies": ["HubSpot", "Salesforce", "Remote SaaS Companies", "Tech Startups"],
+                "requirements": "Sales experience, communication skills, CRM knowledge"
+            },
+            "product_management": {
+                "keywords": ["product-manager", "product-owner", "roadmap", "agile", "scrum-master"],
+                "salary_range": "$25-45/hour",
+                "companies": ["Tech Companies", "SaaS Platforms", "Remote Startups", "Digital Agencies"],
+                "requirements": "Product experience, agile methodology, stakeholder management"
+            },
+            "ecommerce_management": {
+                "keywords": ["shopify", "woocommerce", "amazon-va", "store-manager", "ecommerce-support", "dropshipping"],
+                "salary_range": "$15-30/hour",
+                "companies": ["Shopify Partners", "Amazon Agencies", "E-commerce Stores", "Digital Marketing Agencies"],
+                "requirements": "E-commerce platform knowledge, digital marketing basics"
+            }
+        }
+    },
+    
+    # ===== SPECIALIZED/EXPERT LEVEL JOBS (Advanced Skills Required) =====
+    "expert_level": {
+        "description": "Jobs requiring specialized skills or advanced experience",
+        "skill_requirements": "Advanced technical skills, specialized knowledge, or 3+ years experience",
+        "emoji": "🔴",
+        "categories": {
+            "advanced_ai_data": {
+                "keywords": ["prompt-engineering", "ai-training", "machine-learning", "data-annotation", "model-training"],
+                "salary_range": "$20-40/hour",
+                "companies": ["Scale AI", "Surge AI", "Outlier AI", "OpenAI Contractors", "Anthropic Contractors"],
+                "requirements": "AI/ML knowledge, programming skills, advanced analytical skills"
+            },
+            "linguistic_specialist": {
+                "keywords": ["linguistic-annotation", "translation-evaluation", "grammar-analysis", "language-quality"],
+                "salary_range": "$18-35/hour",
+                "companies": ["TELUS International", "Lionbridge", "iSoftStone", "Appen"],
+                "requirements": "Advanced language skills, linguistic education, cultural expertise"
+            },
+            "technical_moderation": {
+                "keywords": ["trust-safety-specialist", "policy-specialist", "content-reviewer", "safety-analyst"],
+                "salary_range": "$22-35/hour",
+                "companies": ["Meta", "Google", "Twitter", "TikTok", "Specialized Agencies"],
+                "requirements": "Policy knowledge, analytical skills, technical understanding"
+            },
+            "advanced_data_labeling": {
+                "keywords": ["3d-labeling", "autonomous-vehicle", "medical-annotation", "technical-annotation"],
+                "salary_range": "$20-35/hour",
+                "companies": ["Scale AI", "Remotasks", "Surge AI", "Tech Giants"],
+                "requirements": "Technical expertise, specialized domain knowledge"
+            },
+            "freelance_ai_tech": {
+                "keywords": ["ai-consultant", "ml-freelancer", "prompt-engineer", "dataset-specialist"],
+                "salary_range": "$25-60/hour",
+                "companies": ["Upwork", "Toptal", "Freelancer.com", "Direct Clients"],
+                "requirements": "Advanced technical skills, portfolio, proven experience"
+            },
+            "healthcare_remote": {
+                "keywords": ["telehealth", "medical-transcription", "medical-billing", "healthcare-support", "medical-coding"],
+                "salary_range": "$18-35/hour",
+                "companies": ["Teladoc", "MDLive", "3M Health", "Nuance", "Medical Transcription Companies"],
+                "requirements": "Healthcare knowledge, medical terminology, certification preferred"
+            },
+            "translation_localization": {
+                "keywords": ["translator", "localization", "linguist", "language-specialist", "interpretation"],
+                "salary_range": "$20-40/hour",
+                "companies": ["Lionbridge", "TransPerfect", "SDL", "Gengo", "Rev"],
+                "requirements": "Native language proficiency, translation certification, cultural expertise"
+            }
+        }
+    },
+    
+    # ===== FLEXIBLE/PART-TIME OPPORTUNITIES =====
+    "flexible_opportunities": {
+        "description": "Flexible, part-time, or project-based work",
+        "skill_requirements": "Varies by opportunity",
+        "emoji": "🟣",
+        "categories": {
+            "microtasks_gig": {
+                "keywords": ["microtasks", "small-tasks", "gig-work", "project-based", "flexible-hours"],
+                "salary_range": "$5-20/hour",
+                "companies": ["Clickworker", "Microworkers", "Amazon MTurk", "Remotasks"],
+                "requirements": "Flexible schedule, task-oriented mindset"
+            },
+            "research_testing": {
+                "keywords": ["user-testing", "research-studies", "product-feedback", "usability-testing"],
+                "salary_range": "$10-25/hour",
+                "companies": ["UserTesting", "Prolific", "Respondent.io", "Research Companies"],
+                "requirements": "Analytical thinking, feedback skills"
+            },
+            "research_surveys": {
+                "keywords": ["online-research", "survey-taker", "data-collection", "study-participant", "market-research"],
+                "salary_range": "$8-18/hour",
+                "companies": ["Swagbucks", "Survey Junkie", "Prolific", "UserInterviews", "Research Companies"],
+                "requirements": "Attention to detail, reliable internet, patience"
+            }
+        }
+    }
+}
+
+
+
+# Simpler matching for common job types, tried in order when no category
+# keyword matches: (any of these words, level, category)
+FALLBACK_CATEGORY_RULES = [
+    (["support", "customer", "help"], "entry_level", "basic_customer_support"),
+    (["moderator", "moderation", "content"], "entry_level", "basic_content_moderation"),
+    (["data", "entry", "microtask"], "entry_level", "basic_data_entry"),
+    (["technical", "specialist", "engineer"], "intermediate_level", "advanced_customer_support"),
+    (["ai", "prompt", "machine", "learning"], "expert_level", "advanced_ai_data"),
+    (["tiktok", "facebook", "youtube", "platform"], "intermediate_level", "platform_moderation"),
+    (["sales", "business", "account", "executive"], "intermediate_level", "sales_business_development"),
+    (["product", "manager", "owner", "roadmap"], "intermediate_level", "product_management"),
+    (["shopify", "ecommerce", "amazon", "store"], "intermediate_level", "ecommerce_management"),
+    (["medical", "healthcare", "telehealth", "transcription"], "expert_level", "healthcare_remote"),
+    (["translator", "translation", "linguist", "localization"], "expert_level", "translation_localization"),
+    (["survey", "research", "study", "participant"], "flexible_opportunities", "research_surveys"),
+]
+
+# Returned when nothing matches
+GENERAL_CATEGORIZATION = intern_categorization(
+    "entry_level",
+    "general",
+    {"salary_range": "Competitive", "requirements": "Basic skills"},
+    "General opportunities",
+    "Basic computer skills",
+    "🟢"
+)
+
+class JobCategorizer:
+    """Handles job categorization by skill level and requirements"""
+    
+    def __init__(self):
+        self.organized_categories = ORGANIZED_JOB_CATEGORIES
+        
+        # Compile every category keyword, then the fallback words, into one
+        # matcher; rule order is the priority order of the old nested loops.
+        # Each rule points at the shared record for its (level, category)
+        rules = []
+        self._rule_results = []
+        for level_name, level_data in self.organized_categories.items():
+            for category_name in level_data["categories"]:
+                result = self._build_result(level_name, category_name)
+                for keyword in level_data["categories"][category_name]["keywords"]:
+                    # All parts of a hyphenated keyword must be in the job text
+                    rules.append(keyword.lower().split("-"))
+                    self._rule_results.append(result)
+        
+        for words, level_name, category_name in FALLBACK_CATEGORY_RULES:
+            result = self._build_result(level_name, category_name)
+            for word in words:
+                rules.append([word])
+                self._rule_results.append(result)
+        
+        self.matcher = KeywordMatcher(rules)
+    
+    def _build_result(self, level_name, category_name):
+        level_data = self.organized_categories[level_name]
+        return intern_categorization(
+            level_name,
+            category_name,
+            level_data["categories"][category_name],
+            level_data["description"],
+            level_data["skill_requirements"],
+            level_data["emoji"]
+        )
+        
+    def categorize_job(self, job):
+        """Categorize a job based on its title and keywords"""
+        job_title = job.get("title", "").lower()
+        job_company = job.get("company", "").lower()
+        
+        # Create a combined text for matching
+        job_text = f"{job_title} {job_company}".lower()
+        
+        match = self.matcher.first_match(job_text)
+        if match is not None:
+            return self._rule_results[match]
+        
+        # Default to entry level if no match found
+        return GENERAL_CATEGORIZATION
+    
+    def organize_jobs_by_category(self, jobs):
+        """Organize jobs into categories by skill level"""
+        organized_jobs = {
+            "entry_level": [],
+            "intermediate_level": [],
+            "expert_level": [],
+            "flexible_opportunities": []
+        }
+        
+        for job in jobs:
+            categorization = self.categorize_job(job)
+            job["categorization"] = categorization
+            organized_jobs[categorization["level"]].append(job)
+        
+        return organized_jobs
+    
+    def format_organized_job_summary(self, organized_jobs):
+        """Format organized jobs for Telegram notification"""
+        message = f"🎯 **Daily Job Report - {datetime.now().strftime('%Y-%m-%d')}**\n\n"
+        
+        level_names = {
+            "entry_level": "Entry Level (No Experience Required)",
+            "intermediate_level": "Intermediate Level (Some Experience/Skills)",
+            "expert_level": "Expert Level (Advanced Skills)",
+            "flexible_opportunities": "Flexible Opportunities (Part-time/Project-based)"
+        }
+        
+        total_jobs = 0
+        
+        for level, jobs in organized_jobs.items():
+            if jobs:
+                level_data = self.organized_categories[level]
+                emoji = level_data["emoji"]
+                level_name = level_names.get(level, level.replace("_", " ").title())
+                
+                message += f"{emoji} **{level_name}**\n"
+                message += f"📊 {len(jobs)} opportunities found\n\n"
+                
+                # Group jobs by category within each level
+                categories = {}
+                for job in jobs:
+                    cat = job["categorization"]["category"]
+                    if cat not in categories:
+                        categories[cat] = []
+                    categories[cat].append(job)
+                
+                for category, category_jobs in categories.items():
+                    if category_jobs and len(category_jobs) > 0:
+                        cat_data = category_jobs[0]["categorization"]["category_data"]
+                        message += f"💼 **{category.replace('_', ' ').title()}** ({len(category_jobs)} jobs)\n"
+                        message += f"💰 Salary: {cat_data.get('salary_range', 'Competitive')}\n"
+                        message += f"📋 Requirements: {cat_data.get('requirements', 'Basic skills')}\n"
+                        
+                        # Show first 3 jobs in each category
+                        for i, job in enumerate(category_jobs[:3]):
+                            message += f"• {job['title']} - {job['company']} ({job.get('salary', 'Competitive')})\n"
+                        
+                        if len(category_jobs) > 3:
+                            message += f"  ... and {len(category_jobs) - 3} more jobs\n"
+                        
+                        message += "\n"
+                
+                total_jobs += len(jobs)
+                message += "─" * 40 + "\n\n"
+        
+        message += f"📈 **Total Jobs Found: {total_jobs}**\n"
+        message += f"🌍 All jobs are remote and worldwide accessible\n"
+        message += f"⏰ Updated: {datetime.now().strftime('%H:%M UTC')}"
+        
+        return message
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Job Deduplication for Agent-21 Scout
+Fingerprints jobs on their normalized title, company and canonical URL,
+and remembers sent fingerprints across runs (SQLite, with a TTL) so each
+run only formats and sends jobs that are new since the last one
+"""
+
+import hashlib
+import os
+import re
+import sqlite3
+import time
+import unicodedata
+from pathlib import Path
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+# Dedup defaults (override via environment)
+DEDUP_ENABLED = os.getenv("SCOUT_DEDUP", "1") != "0"
+DEDUP_DB = Path(os.getenv("SCOUT_DEDUP_DB", Path(__file__).parent / ".scout_cache" / "seen_jobs.db"))
+DEDUP_TTL_DAYS = float(os.getenv("SCOUT_DEDUP_TTL_DAYS", "7"))
+
+# Words that don't distinguish one posting from another
+TITLE_NOISE = {"remote", "worldwide", "global", "anywhere", "wfh", "fully"}
+COMPANY_NOISE = {"inc", "llc", "ltd", "limited", "corp", "corporation", "co", "gmbh", "plc"}
+TRACKING_PARAMS = {"gclid", "fbclid", "ref", "referrer", "trk"}
+
+
+def normalize_text(value, noise=()):
+    """Lowercase, strip accents and punctuation, drop noise words"""
+    value = unicodedata.normalize("NFKD", str(value or "")).encode("ascii", "ignore").decode("ascii")
+    words = re.findall(r"[a-z0-9+#]+", value.lower())
+    kept = [word for word in words if word not in noise]
+    return " ".join(kept or words)
+
+
+def canonical_url(url):
+    """Same posting, same URL: no scheme/www/fragment/tracking differences"""
+    if not url:
+        return ""
+    parts = urlsplit(str(url).strip())
+    host = (parts.hostname or "").lower()
+    if host.startswith("www."):
+        host = host[4:]
+    query = [
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not key.lower().startswith("utm_") and key.lower() not in TRACKING_PARAMS
+    ]
+    return urlunsplit(("https", host, parts.path.rstrip("/"), urlencode(sorted(query)), ""))
+
+
+def job_key(job):
+    """Normalized (title, company) of a job"""
+    return normalize_text(job["title"], TITLE_NOISE), normalize_text(job["company"], COMPANY_NOISE)
+
+
+def fingerprint(job):
+    """Stable hash of the normalized title, company and canonical URL"""
+    title, company = job_key(job)
+    raw = f"{title}|{company}|{canonical_url(job.get('url'))}"
+    return hashlib.blake2b(raw.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def dedupe_jobs(jobs):
+    """Drop repeats within one run, keeping the first occurrence"""
+    unique = []
+    seen = set()
+    for job in jobs:
+        key = job_key(job)
+        if key not in seen:
+            seen.add(key)
+            unique.append(job)
+    return unique
+
+
+class SeenJobs:
+    """Fingerprints of jobs already sent, expiring after ttl_days"""
+
+    def __init__(self, path=None, ttl_days=None, enabled=None):
+        self.path = Path(path or DEDUP_DB)
+        self.ttl_days = DEDUP_TTL_DAYS if ttl_days is None else ttl_days
+        self.enabled = (DEDUP_ENABLED if enabled is None else enabled) and self.ttl_days > 0
+
+    def _connect(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.path)
+        conn.execute("""
+        CREATE TABLE IF NOT EXISTS seen_jobs (
+            fingerprint TEXT PRIMARY KEY,
+            title TEXT,
+            first_seen REAL,
+            last_sent REAL
+        )
+        """)
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_seen_jobs_last_sent ON seen_jobs (last_sent)")
+        return conn
+
+    def _cutoff(self):
+        return time.time() - self.ttl_days * 86400
+
+    def filter_new(self, jobs):
+        """Jobs whose fingerprint wasn't sent within the TTL, in order"""
+        if not self.enabled:
+            return list(jobs)
+        try:
+            with self._connect() as conn:
+                rows = conn.execute("SELECT fingerprint FROM seen_jobs WHERE last_sent >= ?", (self._cutoff(),))
+                seen = {row[0] for row in rows}
+        except sqlite3.Error as e:
+            print(f"[WARNING] Seen-jobs store unavailable, treating all jobs as new: {e}")
+            return list(jobs)
+        return [job for job in jobs if fingerprint(job) not in seen]
+
+    def mark_seen(self, jobs):
+        """Record jobs as sent now and drop expired fingerprints"""
+        if not self.enabled:
+            return
+        now = time.time()
+        rows = [(fingerprint(job), job["title"], now, now) for job in jobs]
+        try:
+            with self._connect() as conn:
+                conn.executemany("""
+                INSERT INTO seen_jobs (fingerprint, title, first_seen, last_sent) VALUES (?, ?, ?, ?)
+                ON CONFLICT(fingerprint) DO UPDATE SET last_sent = excluded.last_sent
+                """, rows)
+                conn.execute("DELETE FROM seen_jobs WHERE last_sent < ?", (self._cutoff(),))
+        except sqlite3.Error as e:
+            print(f"[WARNING] Could not record sent jobs: {e}")
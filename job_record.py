@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Job Records for Agent-21 Scout
+Compact, read-only record types shared across the pipeline. They keep
+dict-style access (record["level"]) so existing callers keep working
+"""
+
+import sys
+import threading
+from dataclasses import dataclass
+
+
+class _MappingAccess:
+    """record["field"], record.get("field") and `"field" in record`"""
+
+    __slots__ = ()
+
+    def __getitem__(self, key):
+        try:
+            return getattr(self, key)
+        except (AttributeError, TypeError):
+            raise KeyError(key) from None
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __contains__(self, key):
+        return key in self.keys()
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def keys(self):
+        return list(type(self).__slots__)
+
+    def items(self):
+        return [(name, getattr(self, name)) for name in self.keys()]
+
+    def to_dict(self):
+        return dict(self.items())
+
+
+@dataclass(frozen=True, eq=False)
+class Categorization(_MappingAccess):
+    """Skill level and category of a job; one shared record per (level, category)"""
+
+    __slots__ = ("level", "category", "category_data", "level_description", "skill_requirements", "emoji")
+
+    level: str
+    category: str
+    category_data: dict
+    level_description: str
+    skill_requirements: str
+    emoji: str
+
+
+_categorizations = {}
+_categorizations_lock = threading.Lock()
+
+
+def intern_categorization(level, category, category_data, level_description, skill_requirements, emoji):
+    """
+    Return the single Categorization for (level, category), creating it on
+    first use. Every job in that category references the same record.
+    """
+    key = (level, category)
+    record = _categorizations.get(key)
+    if record is None:
+        with _categorizations_lock:
+            record = _categorizations.get(key)
+            if record is None:
+                record = Categorization(level, category, category_data, level_description, skill_requirements, emoji)
+                _categorizations[key] = record
+    return record
+
+
+class Job(_MappingAccess):
+    """
+    One job posting with a fixed field layout. Fetchers still return plain
+    dicts; Job.from_dict adapts them for dedup, categorization and formatting.
+    job["categorization"] = ... works as it did on dicts.
+    """
+
+    __slots__ = ("title", "company", "location", "url", "source", "salary", "categorization")
+
+    # Values repeated across many jobs share a single string object
+    _INTERNED = ("company", "location", "source", "salary")
+
+    def __init__(self, title="", company="", location="", url="", source="", salary="", categorization=None):
+        self.title = title
+        self.company = company
+        self.location = location
+        self.url = url
+        self.source = source
+        self.salary = salary
+        self.categorization = categorization
+
+    @classmethod
+    def from_dict(cls, data):
+        job = cls(
+            data.get("title", ""),
+            data.get("company", ""),
+            data.get("location", ""),
+            data.get("url", ""),
+            data.get("source", ""),
+            data.get("salary", ""),
+            data.get("categorization"),
+        )
+        for name in cls._INTERNED:
+            value = getattr(job, name)
+            if type(value) is str:
+                setattr(job, name, sys.intern(value))
+        return job
+
+    def keys(self):
+        # Like the old dicts, "categorization" only exists once it's set
+        if self.categorization is None:
+            return list(self.__slots__[:-1])
+        return list(self.__slots__)
+
+    def __getitem__(self, key):
+        if key == "categorization" and self.categorization is None:
+            raise KeyError(key)
+        return super().__getitem__(key)
+
+    def __setitem__(self, key, value):
+        if key not in self.__slots__:
+            raise KeyError(key)
+        setattr(self, key, value)
+
+    def __repr__(self):
+        return f"Job(title={self.title!r}, company={self.company!r}, source={self.source!r})"
+
+
+def as_jobs(records):
+    """Adapt fetcher output (dicts or Jobs) to a list of Job records"""
+    return [record if isinstance(record, Job) else Job.from_dict(record) for record in records]
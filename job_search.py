@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+On-Demand Job Search for Agent-21 Scout
+/jobs <keywords> and /category <name> bot commands, answered from the
+local job store's indexes (never by scraping), a page at a time
+"""
+
+import os
+import re
+
+from job_store import JobStore
+from subscriber_prefs import LEVEL_ALIASES
+
+# Search defaults (override via environment)
+SEARCH_PAGE_SIZE = int(os.getenv("SCOUT_SEARCH_PAGE_SIZE", "5"))
+SEARCH_MAX_AGE_DAYS = float(os.getenv("SCOUT_SEARCH_MAX_AGE_DAYS", "14"))  # Older jobs are likely filled
+
+# Bot commands handled by handle_search_command()
+SEARCH_COMMANDS = ("jobs", "category")
+
+SEARCH_HELP = (
+    "🔎 *Job Search*\n\n"
+    "/jobs `python support` – search recent jobs\n"
+    "/jobs `python support 2` – next page\n"
+    "/category `basic_data_entry` – browse a category\n"
+    "/category `entry` – browse a level"
+)
+
+
+def _escape(text):
+    """Keep titles with _ * ` [ from breaking Telegram Markdown"""
+    return re.sub(r"([_*`\[])", r"\\\1", str(text or ""))
+
+
+def _code(text):
+    """A `code` span of user text (a backtick inside would end it early)"""
+    return "`" + str(text or "").replace("`", "") + "`"
+
+
+def _split_page(argument):
+    """'python support 2' -> ('python support', 2)"""
+    words = argument.split()
+    if len(words) > 1 and words[-1].isdigit():
+        return " ".join(words[:-1]), max(1, int(words[-1]))
+    return argument, 1
+
+
+def format_results(heading, rows, total, page, next_command):
+    """One page of results as a Telegram message"""
+    pages = max(1, -(-total // SEARCH_PAGE_SIZE))
+    message = f"🔎 {heading} – {total} jobs (page {page}/{pages})\n\n"
+    first = (page - 1) * SEARCH_PAGE_SIZE + 1
+    for number, row in enumerate(rows, first):
+        message += f"{number}. {_escape(row['title'])} – {_escape(row['company'])}\n"
+        message += f"   💰 {_escape(row['salary'])} · 🔗 [Apply]({row['url']})\n"
+    if page < pages:
+        message += f"\n➡️ More: {_code(f'{next_command} {page + 1}')}"
+    return message
+
+
+def handle_search_command(text, store=None):
+    """
+    Reply for /jobs or /category, or None if `text` isn't one. Only reads
+    the local store, so it answers in milliseconds. Shared by both payment bots.
+    """
+    parts = (text or "").strip().split(maxsplit=1)
+    if not parts:
+        return None
+    command = parts[0].lower().split("@")[0]
+    if command not in ("/jobs", "/category"):
+        return None
+    argument, page = _split_page(parts[1].strip() if len(parts) > 1 else "")
+    if not argument:
+        return SEARCH_HELP
+
+    store = store or JobStore()
+    if not store.path.exists():
+        return "📭 No jobs indexed yet – the first daily scan will fill the search index."
+    offset = (page - 1) * SEARCH_PAGE_SIZE
+
+    if command == "/jobs":
+        total = store.find_count(argument, since_days=SEARCH_MAX_AGE_DAYS)
+        rows = store.find(argument, since_days=SEARCH_MAX_AGE_DAYS, limit=SEARCH_PAGE_SIZE, offset=offset)
+        if not total:
+            return f"🔍 No recent jobs match {_code(argument)}.\n\n{SEARCH_HELP}"
+        return format_results(f"*Jobs:* {_code(argument)}", rows, total, page, f"/jobs {argument}")
+
+    name = argument.lower().replace(" ", "_")
+    level = LEVEL_ALIASES.get(name, name if name in LEVEL_ALIASES.values() else None)
+    filters = {"level": level} if level else {"category": name}
+    total = store.count(since_days=SEARCH_MAX_AGE_DAYS, **filters)
+    if not total:
+        categories = store.counts("category", since_days=SEARCH_MAX_AGE_DAYS)
+        available = ", ".join(f"`{category}`" for category in categories if category) or "none yet"
+        return f"🔍 No recent jobs in {_code(argument)}.\n\nCategories with jobs: {available}"
+    rows = store.search(since_days=SEARCH_MAX_AGE_DAYS, limit=SEARCH_PAGE_SIZE, offset=offset, **filters)
+    return format_results(f"*Category:* {_code(name)}", rows, total, page, f"/category {name}")
@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+"""
+Persistent Job Store for Agent-21 Scout
+Every job a run finds is upserted (in bulk) into a local SQLite database
+with its source, level, category and first/last seen times, so past jobs
+can be queried by index instead of being scraped again. An FTS5 index over
+title, company and category serves keyword searches
+"""
+
+import hashlib
+import os
+import re
+import sqlite3
+import time
+from pathlib import Path
+
+from job_dedup import canonical_url, fingerprint
+
+# Store defaults (override via environment)
+JOB_STORE_ENABLED = os.getenv("SCOUT_JOB_STORE", "1") != "0"
+JOB_STORE_DB = Path(os.getenv("SCOUT_JOB_STORE_DB", Path(__file__).parent / ".scout_cache" / "jobs.db"))
+
+COLUMNS = ("fingerprint", "url_hash", "title", "company", "location", "salary", "url", "source",
+           "level", "category", "first_seen", "last_seen", "times_seen")
+
+
+def url_hash(url):
+    """Hash of the canonical URL (same posting, same hash)"""
+    return hashlib.blake2b(canonical_url(url).encode("utf-8"), digest_size=16).hexdigest()
+
+
+class JobStore:
+    """SQLite (WAL) table of every job seen, keyed by its dedup fingerprint"""
+
+    def __init__(self, path=None, enabled=None):
+        self.path = Path(path or JOB_STORE_DB)
+        self.enabled = JOB_STORE_ENABLED if enabled is None else enabled
+        self._ready = False
+        self.full_text = False
+
+    def _connect(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.path, timeout=30)
+        conn.row_factory = sqlite3.Row
+        if not self._ready:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("""
+            CREATE TABLE IF NOT EXISTS jobs (
+                fingerprint TEXT PRIMARY KEY,
+                url_hash TEXT NOT NULL,
+                title TEXT NOT NULL,
+                company TEXT,
+                location TEXT,
+                salary TEXT,
+                url TEXT,
+                source TEXT,
+                level TEXT,
+                category TEXT,
+                first_seen REAL NOT NULL,
+                last_seen REAL NOT NULL,
+                times_seen INTEGER NOT NULL DEFAULT 1
+            )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_last_seen ON jobs (last_seen)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_url_hash ON jobs (url_hash)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_source ON jobs (source, last_seen)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_level_category ON jobs (level, category, last_seen)")
+            self.full_text = self._create_full_text_index(conn)
+            self._ready = True
+        return conn
+
+    @staticmethod
+    def _create_full_text_index(conn):
+        """
+        FTS5 index kept in sync with `jobs` by triggers (keyed by rowid, so
+        run 'rebuild' after a VACUUM). Returns False if this SQLite has no FTS5.
+        """
+        try:
+            existed = conn.execute("SELECT 1 FROM sqlite_master WHERE name = 'jobs_fts'").fetchone()
+            conn.execute("""
+            CREATE VIRTUAL TABLE IF NOT EXISTS jobs_fts USING fts5(
+                title, company, category, content='jobs', content_rowid='rowid'
+            )
+            """)
+        except sqlite3.OperationalError as e:
+            print(f"[WARNING] No full-text search in this SQLite build, using LIKE: {e}")
+            return False
+        conn.executescript("""
+        CREATE TRIGGER IF NOT EXISTS jobs_fts_insert AFTER INSERT ON jobs BEGIN
+            INSERT INTO jobs_fts (rowid, title, company, category)
+            VALUES (new.rowid, new.title, new.company, new.category);
+        END;
+        CREATE TRIGGER IF NOT EXISTS jobs_fts_delete AFTER DELETE ON jobs BEGIN
+            INSERT INTO jobs_fts (jobs_fts, rowid, title, company, category)
+            VALUES ('delete', old.rowid, old.title, old.company, old.category);
+        END;
+        CREATE TRIGGER IF NOT EXISTS jobs_fts_update AFTER UPDATE OF title, company, category ON jobs BEGIN
+            INSERT INTO jobs_fts (jobs_fts, rowid, title, company, category)
+            VALUES ('delete', old.rowid, old.title, old.company, old.category);
+            INSERT INTO jobs_fts (rowid, title, company, category)
+            VALUES (new.rowid, new.title, new.company, new.category);
+        END;
+        """)
+        if not existed:
+            conn.execute("INSERT INTO jobs_fts (jobs_fts) VALUES ('rebuild')")  # Index jobs stored before FTS
+            conn.commit()
+        return True
+
+    def upsert(self, jobs, now=None):
+        """
+        Insert new jobs and refresh the ones already stored (last_seen,
+        times_seen and current fields) in one transaction; returns the count
+        """
+        if not self.enabled:
+            return 0
+        now = time.time() if now is None else now
+        rows = []
+        for job in jobs:
+            categorization = job.get("categorization")
+            rows.append((
+                fingerprint(job), url_hash(job.get("url")), job["title"], job.get("company"),
+                job.get("location"), job.get("salary"), job.get("url"), job.get("source"),
+                categorization["level"] if categorization else None,
+                categorization["category"] if categorization else None,
+                now, now,
+            ))
+        try:
+            with self._connect() as conn:
+                conn.executemany("""
+                INSERT INTO jobs (fingerprint, url_hash, title, company, location, salary, url, source,
+                                  level, category, first_seen, last_seen)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(fingerprint) DO UPDATE SET
+                    location = excluded.location, salary = excluded.salary, url = excluded.url,
+                    source = excluded.source,
+                    level = COALESCE(excluded.level, jobs.level),
+                    category = COALESCE(excluded.category, jobs.category),
+                    last_seen = excluded.last_seen,
+                    times_seen = jobs.times_seen + (excluded.last_seen > jobs.last_seen)
+                """, rows)
+        except sqlite3.Error as e:
+            print(f"[WARNING] Could not update the job store: {e}")
+            return 0
+        return len(rows)
+
+    def known(self, jobs):
+        """Fingerprints of the given jobs that are already stored"""
+        fingerprints = [fingerprint(job) for job in jobs]
+        found = set()
+        with self._connect() as conn:
+            for start in range(0, len(fingerprints), 500):
+                chunk = fingerprints[start:start + 500]
+                rows = conn.execute(
+                    f"SELECT fingerprint FROM jobs WHERE fingerprint IN ({','.join('?' * len(chunk))})", chunk)
+                found.update(row[0] for row in rows)
+        return found
+
+    @staticmethod
+    def _filters(level=None, category=None, source=None, since_days=None):
+        """WHERE clause (on table alias j) and parameters for the column filters"""
+        clauses = []
+        params = []
+        for column, value in (("level", level), ("category", category), ("source", source)):
+            if value is not None:
+                clauses.append(f"j.{column} = ?")
+                params.append(value)
+        if since_days is not None:
+            clauses.append("j.last_seen >= ?")
+            params.append(time.time() - since_days * 86400)
+        return " AND ".join(clauses) or "1", params
+
+    def search(self, level=None, category=None, source=None, since_days=None, limit=20, offset=0):
+        """Stored jobs matching the filters, most recently seen first, as dicts"""
+        where, params = self._filters(level, category, source, since_days)
+        with self._connect() as conn:
+            rows = conn.execute(
+                f"SELECT {', '.join('j.' + column for column in COLUMNS)} FROM jobs AS j WHERE {where} "
+                f"ORDER BY j.last_seen DESC, j.first_seen DESC, j.fingerprint LIMIT ? OFFSET ?",
+                params + [limit, offset])
+            return [dict(row) for row in rows]
+
+    def count(self, level=None, category=None, source=None, since_days=None):
+        """How many stored jobs match the filters"""
+        where, params = self._filters(level, category, source, since_days)
+        with self._connect() as conn:
+            return conn.execute(f"SELECT COUNT(*) FROM jobs AS j WHERE {where}", params).fetchone()[0]
+
+    def _text_query(self, text, since_days):
+        """FROM/WHERE and parameters for a keyword search (every word, as a prefix)"""
+        words = re.findall(r"\w+", str(text or "").lower())
+        if not words:
+            return None, None
+        where, params = self._filters(since_days=since_days)
+        if self.full_text:
+            match = " ".join(f'"{word}"*' for word in words)
+            return (f"FROM jobs_fts JOIN jobs AS j ON j.rowid = jobs_fts.rowid "
+                    f"WHERE jobs_fts MATCH ? AND {where}", [match] + params)
+        like = " AND ".join("(j.title || ' ' || j.company || ' ' || IFNULL(j.category, '')) LIKE ?" for _ in words)
+        return f"FROM jobs AS j WHERE {like} AND {where}", [f"%{word}%" for word in words] + params
+
+    def find(self, text, since_days=None, limit=20, offset=0):
+        """
+        Stored jobs whose title, company or category contain every word of
+        `text` (as prefixes), most recently seen first. Every match is
+        equally relevant for a job search, and skipping bm25() ranking keeps
+        broad queries several times faster.
+        """
+        with self._connect() as conn:
+            query, params = self._text_query(text, since_days)
+            if query is None:
+                return []
+            rows = conn.execute(
+                f"SELECT {', '.join('j.' + column for column in COLUMNS)} {query} "
+                f"ORDER BY j.last_seen DESC, j.first_seen DESC, j.fingerprint LIMIT ? OFFSET ?",
+                params + [limit, offset])
+            return [dict(row) for row in rows]
+
+    def find_count(self, text, since_days=None):
+        """How many stored jobs find(text) would page through"""
+        with self._connect() as conn:
+            query, params = self._text_query(text, since_days)
+            if query is None:
+                return 0
+            return conn.execute(f"SELECT COUNT(*) {query}", params).fetchone()[0]
+
+    def counts(self, column="source", since_days=None):
+        """{value: jobs} grouped by source, level or category"""
+        if column not in ("source", "level", "category"):
+            raise ValueError(f"Can't group jobs by {column!r}")
+        since = 0 if since_days is None else time.time() - since_days * 86400
+        with self._connect() as conn:
+            rows = conn.execute(
+                f"SELECT {column}, COUNT(*) FROM jobs WHERE last_seen >= ? GROUP BY {column} ORDER BY 2 DESC",
+                (since,))
+            return dict(rows.fetchall())
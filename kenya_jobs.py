@@ -4,7 +4,8 @@ Kenya-Specific Job Sources for Agent-21 Scout
 Focuses on remote jobs that accept Kenyan developers
 """
 
-from requests import get, RequestException
+from requests import RequestException
+from http_client import get
 import time
 
 def fetch_worldwide_remote_jobs():
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Compiled Keyword Matcher for Agent-21 Scout
+An Aho-Corasick automaton over every keyword part, built once, that finds
+all parts present in a text in a single pass. Rules (lists of parts that
+must all be present) are then resolved in priority order with bitmasks
+"""
+
+
+class KeywordMatcher:
+    """
+    Ordered rules over substring parts; first_match(text) returns the index
+    of the first rule whose parts all occur in text, like scanning the rules
+    with all(part in text for part in parts) but in one pass over text.
+    """
+
+    def __init__(self, rules):
+        self._part_ids = {}
+        self._rule_masks = []
+        self._always = None  # First rule with no (non-empty) parts
+        self._rules_by_part = []
+
+        for index, parts in enumerate(rules):
+            mask = 0
+            for part in parts:
+                if not part:
+                    continue  # "" is in every string
+                part_id = self._part_ids.get(part)
+                if part_id is None:
+                    part_id = self._part_ids[part] = len(self._part_ids)
+                    self._rules_by_part.append([])
+                mask |= 1 << part_id
+                self._rules_by_part[part_id].append(index)
+            self._rule_masks.append(mask)
+            if mask == 0 and self._always is None:
+                self._always = index
+
+        self._build_automaton()
+
+    def _build_automaton(self):
+        """Trie of all parts plus failure links; outputs are part bitmasks"""
+        goto = [{}]
+        output = [0]
+        for part, part_id in self._part_ids.items():
+            node = 0
+            for char in part:
+                next_node = goto[node].get(char)
+                if next_node is None:
+                    next_node = len(goto)
+                    goto[node][char] = next_node
+                    goto.append({})
+                    output.append(0)
+                node = next_node
+            output[node] |= 1 << part_id
+
+        fail = [0] * len(goto)
+        queue = list(goto[0].values())
+        for node in queue:  # Breadth-first; the list grows as we go
+            for char, child in goto[node].items():
+                queue.append(child)
+                state = fail[node]
+                while state and char not in goto[state]:
+                    state = fail[state]
+                fallback = goto[state].get(char, 0)
+                fail[child] = fallback if fallback != child else 0
+                output[child] |= output[fail[child]]
+
+        self._goto = goto
+        self._fail = fail
+        self._output = output
+
+    def found_parts(self, text):
+        """Bitmask of every part that occurs in text"""
+        goto = self._goto
+        fail = self._fail
+        output = self._output
+        node = 0
+        found = 0
+        for char in text:
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+            found |= output[node]
+        return found
+
+    def first_match(self, text):
+        """Index of the first rule fully present in text, or None"""
+        found = self.found_parts(text)
+        best = self._always
+        remaining = found
+        part_id = 0
+        while remaining:
+            if remaining & 1:
+                for index in self._rules_by_part[part_id]:
+                    if best is not None and index >= best:
+                        break
+                    mask = self._rule_masks[index]
+                    if mask & found == mask:
+                        best = index
+                        break
+            remaining >>= 1
+            part_id += 1
+        return best
+
+    def all_matches(self, text):
+        """Indexes of every rule fully present in text, in rule order"""
+        found = self.found_parts(text)
+        matches = set() if self._always is None else {
+            index for index, mask in enumerate(self._rule_masks) if mask == 0
+        }
+        remaining = found
+        part_id = 0
+        while remaining:
+            if remaining & 1:
+                for index in self._rules_by_part[part_id]:
+                    mask = self._rule_masks[index]
+                    if mask & found == mask:
+                        matches.add(index)
+            remaining >>= 1
+            part_id += 1
+        return sorted(matches)
@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+Latency Budgets for Agent-21 Scout
+Recent response times of every remote board are kept across runs. A
+board's p95 sets its budget: a duplicate ("hedged") request is sent if
+the first hasn't answered by about p95, and the scout gives up at a few
+times p95 instead of always waiting out the full HTTP timeout
+"""
+
+import math
+import os
+import queue
+import sqlite3
+import threading
+import time
+from collections import deque
+from pathlib import Path
+
+from http_client import HTTP_TIMEOUT
+
+# Budget defaults (override via environment)
+BUDGET_ENABLED = os.getenv("SCOUT_LATENCY_BUDGET", "1") != "0"
+LATENCY_DB = Path(os.getenv("SCOUT_LATENCY_DB", Path(__file__).parent / ".scout_cache" / "latency.db"))
+LATENCY_WINDOW = int(os.getenv("SCOUT_LATENCY_WINDOW", "50"))           # Samples kept per source
+MIN_SAMPLES = int(os.getenv("SCOUT_LATENCY_MIN_SAMPLES", "5"))          # Fewer: plain request, full timeout
+BUDGET_MULTIPLIER = float(os.getenv("SCOUT_BUDGET_MULTIPLIER", "3"))    # Give up at this many p95s
+MIN_BUDGET = float(os.getenv("SCOUT_MIN_BUDGET", "2"))                  # Seconds, however fast the source
+MIN_HEDGE_DELAY = 0.2  # Never hedge sooner than this (seconds)
+
+
+def percentile(samples, fraction):
+    """Nearest-rank percentile of a non-empty list of numbers"""
+    ordered = sorted(samples)
+    return ordered[max(1, math.ceil(len(ordered) * fraction)) - 1]
+
+
+def hedged(attempt, hedge_after, deadline):
+    """
+    Run attempt() and, if it hasn't returned after `hedge_after` seconds,
+    a second copy alongside it. Returns (result, seconds the winning copy
+    took, copies started). An error is raised once no copy is left
+    running, and requests' Timeout if nothing answers within `deadline`
+    seconds. The slower copy is left to finish in a daemon thread.
+    """
+    from requests.exceptions import Timeout
+
+    results = queue.Queue()
+
+    def run():
+        started = time.monotonic()
+        try:
+            results.put((True, attempt(), time.monotonic() - started))
+        except Exception as e:
+            results.put((False, e, time.monotonic() - started))
+
+    start = time.monotonic()
+    threading.Thread(target=run, daemon=True).start()
+    copies = running = 1
+    hedge_sent = hedge_after is None or hedge_after >= deadline
+    while True:
+        elapsed = time.monotonic() - start
+        wait_until = deadline if hedge_sent else hedge_after
+        try:
+            ok, value, seconds = results.get(timeout=max(0.0, wait_until - elapsed))
+        except queue.Empty:
+            if hedge_sent:
+                raise Timeout(f"No answer within the {deadline:.1f}s latency budget")
+            threading.Thread(target=run, daemon=True).start()
+            copies += 1
+            running += 1
+            hedge_sent = True
+            continue
+        running -= 1
+        if ok:
+            return value, seconds, copies
+        if running == 0:  # A fast failure isn't hedged; the caller's retries handle it
+            raise value
+
+
+class LatencyBudgets:
+    """Thread-safe latency history per source, saved to SQLite, with hedged calls"""
+
+    def __init__(self, path=None, window=None, min_samples=None, multiplier=None, max_budget=None,
+                 enabled=None):
+        self.path = Path(path or LATENCY_DB)
+        self.window = window or LATENCY_WINDOW
+        self.min_samples = MIN_SAMPLES if min_samples is None else min_samples
+        self.multiplier = multiplier or BUDGET_MULTIPLIER
+        self.max_budget = max_budget or HTTP_TIMEOUT
+        self.enabled = BUDGET_ENABLED if enabled is None else enabled
+        self.hedges = 0     # Duplicate requests sent this process
+        self.gave_up = 0    # Calls abandoned at their budget
+        self._lock = threading.Lock()
+        self._samples = self._load() if self.enabled else {}
+
+    def _connect(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.path, timeout=30)
+        conn.execute("""
+        CREATE TABLE IF NOT EXISTS latency_samples (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            source TEXT NOT NULL,
+            seconds REAL NOT NULL,
+            recorded_at REAL NOT NULL
+        )
+        """)
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_latency_source ON latency_samples (source, id)")
+        return conn
+
+    def _load(self):
+        samples = {}
+        try:
+            with self._connect() as conn:
+                for source, seconds in conn.execute("SELECT source, seconds FROM latency_samples ORDER BY id"):
+                    samples.setdefault(source, deque(maxlen=self.window)).append(seconds)
+        except sqlite3.Error as e:
+            print(f"[WARNING] Latency history unavailable, starting fresh: {e}")
+        return samples
+
+    def record(self, source, seconds):
+        """Add one response time (or give-up), keeping the newest `window` per source"""
+        if not self.enabled:
+            return
+        with self._lock:
+            self._samples.setdefault(source, deque(maxlen=self.window)).append(seconds)
+            try:
+                with self._connect() as conn:
+                    conn.execute("INSERT INTO latency_samples (source, seconds, recorded_at) VALUES (?, ?, ?)",
+                                 (source, seconds, time.time()))
+                    conn.execute(
+                        "DELETE FROM latency_samples WHERE source = ? AND id NOT IN "
+                        "(SELECT id FROM latency_samples WHERE source = ? ORDER BY id DESC LIMIT ?)",
+                        (source, source, self.window))
+            except sqlite3.Error as e:
+                print(f"[WARNING] Could not save latency of {source}: {e}")
+
+    def p95(self, source):
+        """95th percentile latency of `source`, or None without enough history"""
+        with self._lock:
+            samples = list(self._samples.get(source, ()))
+        if len(samples) < max(1, self.min_samples):
+            return None
+        return percentile(samples, 0.95)
+
+    def budget(self, source):
+        """
+        (hedge_after, timeout) in seconds for `source`; (None, None) means
+        no history yet: one plain request with the default timeout
+        """
+        p95 = self.p95(source) if self.enabled else None
+        if p95 is None:
+            return None, None
+        timeout = min(self.max_budget, max(MIN_BUDGET, p95 * self.multiplier))
+        return max(MIN_HEDGE_DELAY, p95), timeout
+
+    def call(self, source, attempt):
+        """
+        attempt(timeout) within the source's budget, hedged at its p95.
+        Responses that needed the network add to the source's history. A
+        give-up is recorded as a (censored) sample at the budget, so a source
+        that has slowed down for good widens its budget over the next calls
+        instead of timing out against a stale p95 forever.
+        """
+        from requests.exceptions import Timeout
+
+        hedge_after, timeout = self.budget(source)
+        if timeout is None:
+            started = time.monotonic()
+            response = attempt(None)
+            seconds = time.monotonic() - started
+        else:
+            try:
+                response, seconds, copies = hedged(lambda: attempt(timeout), hedge_after, timeout)
+            except Timeout:
+                with self._lock:
+                    self.hedges += hedge_after < timeout
+                    self.gave_up += 1
+                print(f"[BUDGET] Gave up on {source} after {timeout:.1f}s (p95 {hedge_after:.1f}s)")
+                self.record(source, timeout)  # It took at least this long
+                raise
+            with self._lock:
+                self.hedges += copies - 1
+        if not getattr(response, "from_cache", False) or getattr(response, "revalidated", False):
+            self.record(source, seconds)
+        return response
+
+    def report(self):
+        """{source: {"samples", "p95", "budget"}} for every tracked source"""
+        with self._lock:
+            sources = list(self._samples)
+        report = {}
+        for source in sources:
+            with self._lock:
+                samples = len(self._samples.get(source, ()))
+            report[source] = {"samples": samples, "p95": self.p95(source), "budget": self.budget(source)[1]}
+        return report
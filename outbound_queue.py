@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+"""
+Outbound Message Queue for Agent-21 Scout
+A persistent (SQLite) outbox that Telegram messages are enqueued into and a
+pool of background workers that drains it. Claimed messages become visible
+again if the process dies mid-send, so delivery resumes after a restart.
+Each chat's messages are delivered strictly in order
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+# Queue defaults (override via environment)
+OUTBOX_DB = Path(os.getenv("SCOUT_OUTBOX_DB", Path(__file__).parent / ".scout_cache" / "outbox.db"))
+VISIBILITY_TIMEOUT = float(os.getenv("SCOUT_OUTBOX_VISIBILITY", "120"))
+MAX_ATTEMPTS = int(os.getenv("SCOUT_OUTBOX_MAX_ATTEMPTS", "8"))
+OUTBOX_WORKERS = int(os.getenv("SCOUT_OUTBOX_WORKERS", "8"))
+SENT_RETENTION = 7 * 86400  # Keep delivered rows this long for progress reports
+MAX_BACKOFF = 300.0
+
+
+class PermanentDeliveryError(Exception):
+    """A message that will never be accepted (e.g. HTTP 400); not retried"""
+
+
+class OutboundQueue:
+    """FIFO outbox with claim/ack and visibility timeouts"""
+
+    def __init__(self, path=None, visibility_timeout=None, max_attempts=None):
+        self.path = Path(path or OUTBOX_DB)
+        self.visibility_timeout = VISIBILITY_TIMEOUT if visibility_timeout is None else visibility_timeout
+        self.max_attempts = max_attempts or MAX_ATTEMPTS
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("""
+            CREATE TABLE IF NOT EXISTS outbox (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                chat_id TEXT NOT NULL,
+                text TEXT NOT NULL,
+                status TEXT NOT NULL DEFAULT 'pending',
+                attempts INTEGER NOT NULL DEFAULT 0,
+                available_at REAL NOT NULL,
+                created_at REAL NOT NULL,
+                last_error TEXT,
+                batch TEXT,
+                sent_at REAL
+            )
+            """)
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(outbox)")}
+            for column, kind in (("batch", "TEXT"), ("sent_at", "REAL")):
+                if column not in columns:
+                    conn.execute(f"ALTER TABLE outbox ADD COLUMN {column} {kind}")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_outbox_ready ON outbox (status, available_at, id)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_outbox_chat ON outbox (chat_id, status, id)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_outbox_batch ON outbox (batch, chat_id)")
+
+    def _connect(self):
+        # Autocommit; claim() opens its own write transaction
+        return sqlite3.connect(self.path, timeout=30, isolation_level=None)
+
+    def enqueue(self, chat_id, text, batch=None):
+        return self.enqueue_many([(chat_id, text)], batch)[0]
+
+    def enqueue_many(self, messages, batch=None):
+        """Add (chat_id, text) pairs in order, in one transaction; returns their ids"""
+        now = time.time()
+        ids = []
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            for chat_id, text in messages:
+                cursor = conn.execute(
+                    "INSERT INTO outbox (chat_id, text, available_at, created_at, batch) VALUES (?, ?, ?, ?, ?)",
+                    (str(chat_id), text, now, now, batch))
+                ids.append(cursor.lastrowid)
+            conn.execute("DELETE FROM outbox WHERE status = 'sent' AND sent_at < ?", (now - SENT_RETENTION,))
+            conn.execute("COMMIT")
+        return ids
+
+    def claim(self):
+        """
+        Take the oldest ready message: returns (id, chat_id, text, attempts)
+        or None. It stays invisible for visibility_timeout unless acked.
+        Only the oldest pending message of each chat is eligible, so
+        concurrent workers never reorder a chat's messages.
+        """
+        now = time.time()
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            row = conn.execute(
+                "SELECT id, chat_id, text, attempts FROM outbox AS o "
+                "WHERE status = 'pending' AND available_at <= ? "
+                "AND NOT EXISTS (SELECT 1 FROM outbox AS p "
+                "WHERE p.chat_id = o.chat_id AND p.status = 'pending' AND p.id < o.id) "
+                "ORDER BY id LIMIT 1", (now,)).fetchone()
+            if row is not None:
+                conn.execute(
+                    "UPDATE outbox SET available_at = ?, attempts = attempts + 1 WHERE id = ?",
+                    (now + self.visibility_timeout, row[0]))
+            conn.execute("COMMIT")
+        if row is None:
+            return None
+        return row[0], row[1], row[2], row[3] + 1
+
+    def ack(self, message_id):
+        """Delivered: out of the queue (kept briefly for progress reports)"""
+        with self._connect() as conn:
+            conn.execute("UPDATE outbox SET status = 'sent', sent_at = ? WHERE id = ?", (time.time(), message_id))
+
+    def retry(self, message_id, attempts, error):
+        """Failed: make it visible again after a backoff, or give up"""
+        if attempts >= self.max_attempts:
+            self.bury(message_id, error)
+            return
+        delay = min(MAX_BACKOFF, 2.0 ** attempts)
+        with self._connect() as conn:
+            conn.execute("UPDATE outbox SET available_at = ?, last_error = ? WHERE id = ?",
+                         (time.time() + delay, str(error)[:500], message_id))
+
+    def bury(self, message_id, error):
+        """Keep an undeliverable message for inspection, out of the queue"""
+        with self._connect() as conn:
+            conn.execute("UPDATE outbox SET status = 'dead', last_error = ? WHERE id = ?",
+                         (str(error)[:500], message_id))
+
+    def pending(self):
+        with self._connect() as conn:
+            return conn.execute("SELECT COUNT(*) FROM outbox WHERE status = 'pending'").fetchone()[0]
+
+    def dead(self):
+        with self._connect() as conn:
+            return conn.execute("SELECT COUNT(*) FROM outbox WHERE status = 'dead'").fetchone()[0]
+
+    def progress(self, batch):
+        """Per-recipient delivery state of a batch: {chat_id: {"sent": n, "pending": n, "dead": n}}"""
+        report = {}
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT chat_id, status, COUNT(*) FROM outbox WHERE batch = ? GROUP BY chat_id, status", (batch,))
+            for chat_id, status, count in rows:
+                report.setdefault(chat_id, {"sent": 0, "pending": 0, "dead": 0})[status] = count
+        return report
+
+
+class OutboxWorker(threading.Thread):
+    """Daemon thread that drains the queue through deliver(chat_id, text)"""
+
+    def __init__(self, queue, deliver, poll_interval=1.0):
+        super().__init__(name="outbox-worker", daemon=True)
+        self.queue = queue
+        self.deliver = deliver
+        self.poll_interval = poll_interval
+        self.delivered = 0
+        self._wake = threading.Event()
+        self._stopping = threading.Event()
+
+    def notify(self):
+        """New messages were enqueued"""
+        self._wake.set()
+
+    def stop(self):
+        self._stopping.set()
+        self._wake.set()
+
+    def run(self):
+        while not self._stopping.is_set():
+            try:
+                item = self.queue.claim()
+            except sqlite3.Error as e:
+                print(f"[OUTBOX] Queue unavailable: {e}")
+                item = None
+            if item is None:
+                self._wake.wait(self.poll_interval)
+                self._wake.clear()
+                continue
+
+            message_id, chat_id, text, attempts = item
+            try:
+                self.deliver(chat_id, text)
+            except PermanentDeliveryError as e:
+                print(f"[OUTBOX] Dropping undeliverable message {message_id}: {e}")
+                self.queue.bury(message_id, e)
+            except Exception as e:
+                print(f"[OUTBOX] Delivery of message {message_id} failed (attempt {attempts}): {e}")
+                self.queue.retry(message_id, attempts, e)
+            else:
+                self.queue.ack(message_id)
+                self.delivered += 1
+
+    def flush(self, timeout=None):
+        """Wait until the queue is empty; returns False on timeout"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        try:
+            while self.queue.pending():
+                if deadline is not None and time.monotonic() >= deadline:
+                    return False
+                self._wake.set()
+                time.sleep(0.05)
+        except sqlite3.Error as e:
+            print(f"[OUTBOX] Queue unavailable: {e}")
+            return False
+        return True
+
+
+class OutboxPool:
+    """Several workers draining one queue concurrently (pacing is up to deliver)"""
+
+    def __init__(self, queue, deliver, workers=None, poll_interval=1.0):
+        self.queue = queue
+        self.workers = [
+            OutboxWorker(queue, deliver, poll_interval) for _ in range(workers or OUTBOX_WORKERS)
+        ]
+        for worker in self.workers:
+            worker.start()
+
+    @property
+    def delivered(self):
+        return sum(worker.delivered for worker in self.workers)
+
+    def notify(self):
+        for worker in self.workers:
+            worker.notify()
+
+    def flush(self, timeout=None):
+        """Wait until the queue is empty; returns False on timeout"""
+        self.notify()
+        return self.workers[0].flush(timeout)
+
+    def stop(self):
+        for worker in self.workers:
+            worker.stop()
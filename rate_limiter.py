@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Telegram Rate Limiter for Agent-21 Scout
+Token buckets modelled on Telegram's bot limits (about 30 messages/second
+overall, 20/minute per group, 1/second per private chat), plus a shared
+pause for when Telegram answers 429 with retry_after
+"""
+
+import os
+import threading
+import time
+
+# Limits (override via environment)
+GLOBAL_RATE = float(os.getenv("SCOUT_TG_GLOBAL_RATE", "30"))            # messages/second, all chats
+GROUP_RATE = float(os.getenv("SCOUT_TG_GROUP_PER_MIN", "20")) / 60.0    # messages/second, per group
+PRIVATE_RATE = float(os.getenv("SCOUT_TG_PRIVATE_RATE", "1"))           # messages/second, per user
+
+
+class TokenBucket:
+    """Classic token bucket: `rate` tokens/second, bursts up to `capacity`"""
+
+    def __init__(self, rate, capacity=None, clock=time.monotonic):
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self.clock = clock
+        self.tokens = self.capacity
+        self.updated = clock()
+        self._lock = threading.Lock()
+
+    def reserve(self):
+        """Take one token; return how long to wait before using it"""
+        with self._lock:
+            now = self.clock()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= 1
+            if self.tokens >= 0:
+                return 0.0
+            return -self.tokens / self.rate
+
+
+class RateLimiter:
+    """Global and per-chat buckets; wait(chat_id) blocks only as long as needed"""
+
+    def __init__(self, global_rate=GLOBAL_RATE, group_rate=GROUP_RATE, private_rate=PRIVATE_RATE,
+                 clock=time.monotonic, sleep=time.sleep):
+        self.group_rate = group_rate
+        self.private_rate = private_rate
+        self.clock = clock
+        self.sleep = sleep
+        self.global_bucket = TokenBucket(global_rate, clock=clock)
+        self.chat_buckets = {}
+        self.paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def _bucket_for(self, chat_id):
+        chat_id = str(chat_id)
+        with self._lock:
+            bucket = self.chat_buckets.get(chat_id)
+            if bucket is None:
+                # Group and channel ids are negative
+                rate = self.group_rate if chat_id.startswith("-") else self.private_rate
+                bucket = TokenBucket(rate, capacity=1, clock=self.clock)
+                self.chat_buckets[chat_id] = bucket
+            return bucket
+
+    def wait(self, chat_id):
+        """Block until a message to chat_id may be sent; returns seconds waited"""
+        waited = 0.0
+        pause = self.paused_until - self.clock()
+        if pause > 0:
+            self.sleep(pause)
+            waited += pause
+        delay = max(self._bucket_for(chat_id).reserve(), self.global_bucket.reserve())
+        if delay > 0:
+            self.sleep(delay)
+            waited += delay
+        return waited
+
+    def pause(self, seconds):
+        """Hold every send for `seconds` (Telegram's retry_after)"""
+        with self._lock:
+            self.paused_until = max(self.paused_until, self.clock() + seconds)
+
+
+_default_limiter = None
+_default_limiter_lock = threading.Lock()
+
+
+def default_limiter():
+    """The process-wide limiter shared by every Telegram send"""
+    global _default_limiter
+    with _default_limiter_lock:
+        if _default_limiter is None:
+            _default_limiter = RateLimiter()
+        return _default_limiter
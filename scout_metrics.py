@@ -0,0 +1,296 @@
+#!/usr/bin/env python3
+"""
+Run Metrics for Agent-21 Scout
+Per-source instrumentation of every fetch (wall time, bytes, HTTP
+statuses, retries, retry sleeps, JSON parse time) plus job counts per
+source before and after dedup and the time spent in each stage of the
+run. Each run appends JSON lines to a size-rotated history file and
+rewrites a Prometheus text file, served at /metrics
+"""
+
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+
+# Metrics defaults (override via environment)
+METRICS_ENABLED = os.getenv("SCOUT_METRICS", "1") != "0"
+METRICS_DIR = Path(os.getenv("SCOUT_METRICS_DIR", Path(__file__).parent / ".scout_cache" / "metrics"))
+METRICS_PORT = int(os.getenv("SCOUT_METRICS_PORT", "9121"))
+METRICS_HOST = os.getenv("SCOUT_METRICS_HOST", "127.0.0.1")  # "0.0.0.0" exposes /metrics to the network
+METRICS_MAX_BYTES = int(float(os.getenv("SCOUT_METRICS_MAX_MB", "5")) * 1024 * 1024)  # runs.jsonl rotates here
+METRICS_BACKUPS = int(os.getenv("SCOUT_METRICS_BACKUPS", "5"))
+
+JSONL_NAME = "runs.jsonl"
+PROMETHEUS_NAME = "scout.prom"
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Per-source fetch measurements: (field, Prometheus metric, help text)
+FETCH_FIELDS = (
+    ("calls", "scout_source_calls", "Fetch calls made for the source"),
+    ("wall_seconds", "scout_source_wall_seconds", "Wall time spent in the source's fetch calls"),
+    ("bytes", "scout_source_bytes", "Response bytes downloaded over the network"),
+    ("retries", "scout_source_retries", "Fetch retries after a failed attempt"),
+    ("sleep_seconds", "scout_source_sleep_seconds", "Time slept between retries"),
+    ("parse_seconds", "scout_source_parse_seconds", "Time spent decoding responses"),
+    ("errors", "scout_source_errors", "Fetch calls that failed"),
+)
+JOB_STAGES = ("fetched", "unique", "new")  # Before dedup, after dedup, after the seen-jobs filter
+
+
+class SourceMetrics:
+    """Measurements of one source's fetches during a run"""
+    __slots__ = tuple(field for field, _, _ in FETCH_FIELDS) + ("statuses",)
+
+    def __init__(self):
+        for field, _, _ in FETCH_FIELDS:
+            setattr(self, field, 0)
+        self.statuses = {}  # HTTP status (or "error") -> responses
+
+    def to_dict(self):
+        record = {field: getattr(self, field) for field, _, _ in FETCH_FIELDS}
+        record["statuses"] = dict(self.statuses)
+        return record
+
+
+def _rotate(path, max_bytes, backups):
+    """Rotate `path` to path.1 ... path.<backups> once it reaches max_bytes (as the scheduler logs do)"""
+    try:
+        if path.stat().st_size < max_bytes:
+            return
+    except OSError:
+        return
+    for number in range(backups - 1, 0, -1):
+        older = path.with_name(f"{path.name}.{number}")
+        if older.exists():
+            os.replace(older, path.with_name(f"{path.name}.{number + 1}"))
+    if backups > 0:
+        os.replace(path, path.with_name(f"{path.name}.1"))
+    else:
+        path.unlink()
+
+
+def _label(value):
+    """Escape a Prometheus label value"""
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+class RunMetrics:
+    """
+    Thread-safe metrics of one run. Fetch code inside `with metrics.source(name)`
+    has its HTTP, retry and parse measurements attributed to that source.
+    """
+
+    def __init__(self, directory=None, enabled=None, clock=time.monotonic, max_bytes=None, backups=None):
+        self.directory = Path(directory or METRICS_DIR)
+        self.enabled = METRICS_ENABLED if enabled is None else enabled
+        self.max_bytes = max_bytes or METRICS_MAX_BYTES
+        self.backups = METRICS_BACKUPS if backups is None else backups
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self.reset()
+
+    def reset(self):
+        """Start measuring a new run"""
+        with self._lock:
+            self.started_at = time.time()
+            self.sources = {}  # Fetch source -> SourceMetrics
+            self.jobs = {}     # Job source -> {stage: jobs}
+            self.stages = {}   # Run stage -> seconds
+            self._lap = self.clock()
+
+    def _current(self):
+        stack = getattr(self._local, "sources", None)
+        return stack[-1] if stack else None
+
+    def _add(self, source, field, amount):
+        if source is None:
+            return
+        with self._lock:
+            metrics = self.sources.get(source)
+            if metrics is None:
+                metrics = self.sources[source] = SourceMetrics()
+            setattr(metrics, field, getattr(metrics, field) + amount)
+
+    @contextmanager
+    def source(self, name):
+        """Attribute everything measured in this block (on this thread) to `name`"""
+        stack = getattr(self._local, "sources", None)
+        if stack is None:
+            stack = self._local.sources = []
+        stack.append(name)
+        start = self.clock()
+        try:
+            yield
+        except Exception:
+            self._add(name, "errors", 1)
+            raise
+        finally:
+            stack.pop()
+            self._add(name, "calls", 1)
+            self._add(name, "wall_seconds", self.clock() - start)
+
+    def record_response(self, response, source=None):
+        """HTTP status and, unless it was served from the disk cache, body size"""
+        source = source or self._current()
+        if not getattr(response, "from_cache", False):
+            self._add(source, "bytes", len(getattr(response, "content", b"") or b""))
+        self._add_status(source, getattr(response, "status_code", None))
+
+    def record_error(self, source=None):
+        """A request that got no response at all"""
+        self._add_status(source or self._current(), "error")
+
+    def _add_status(self, source, status):
+        if source is None:
+            return
+        with self._lock:
+            metrics = self.sources.get(source)
+            if metrics is None:
+                metrics = self.sources[source] = SourceMetrics()
+            metrics.statuses[str(status)] = metrics.statuses.get(str(status), 0) + 1
+
+    def record_retry(self, slept, source=None):
+        """One retry of a failed fetch, after sleeping `slept` seconds"""
+        source = source or self._current()
+        self._add(source, "retries", 1)
+        self._add(source, "sleep_seconds", slept)
+
+    def record_failure(self, source=None):
+        """A failed fetch the caller absorbed (e.g. by using fallback jobs)"""
+        self._add(source or self._current(), "errors", 1)
+
+    @contextmanager
+    def parsing(self, source=None):
+        """Time a response decode against the source"""
+        source = source or self._current()
+        start = self.clock()
+        try:
+            yield
+        finally:
+            self._add(source, "parse_seconds", self.clock() - start)
+
+    def count_jobs(self, stage, jobs):
+        """Jobs per job source at a stage of the run (see JOB_STAGES)"""
+        with self._lock:
+            for job in jobs:
+                source = job.get("source") or "unknown"
+                counts = self.jobs.setdefault(source, dict.fromkeys(JOB_STAGES, 0))
+                counts[stage] += 1
+
+    def lap(self, stage):
+        """Charge the time since the previous lap to `stage`"""
+        now = self.clock()
+        with self._lock:
+            self.stages[stage] = self.stages.get(stage, 0.0) + now - self._lap
+            self._lap = now
+
+    def slowest(self, limit=5):
+        """[(source, wall seconds)] of the slowest sources"""
+        with self._lock:
+            ranked = sorted(((metrics.wall_seconds, source) for source, metrics in self.sources.items()),
+                            reverse=True)
+        return [(source, seconds) for seconds, source in ranked[:limit]]
+
+    def to_records(self):
+        """JSON-ready records: one per fetch source, one per job source, one for the run"""
+        run = datetime.fromtimestamp(self.started_at).isoformat(timespec="seconds")
+        with self._lock:
+            records = [dict(kind="source", run=run, source=source, **metrics.to_dict())
+                       for source, metrics in sorted(self.sources.items())]
+            records.extend(dict(kind="jobs", run=run, source=source, **counts)
+                           for source, counts in sorted(self.jobs.items()))
+            records.append({"kind": "run", "run": run, "stages": dict(self.stages),
+                            "seconds": sum(self.stages.values())})
+        return records
+
+    def prometheus_text(self):
+        """The run's metrics in the Prometheus text exposition format"""
+        with self._lock:
+            sources = sorted(self.sources.items())
+            jobs = sorted(self.jobs.items())
+            stages = dict(self.stages)
+        lines = []
+        for field, name, help_text in FETCH_FIELDS:
+            lines += [f"# HELP {name} {help_text} (last run)", f"# TYPE {name} gauge"]
+            lines += [f'{name}{{source="{_label(source)}"}} {getattr(metrics, field):g}'
+                      for source, metrics in sources]
+        lines += ["# HELP scout_source_responses HTTP responses by status (last run)",
+                  "# TYPE scout_source_responses gauge"]
+        lines += [f'scout_source_responses{{source="{_label(source)}",status="{_label(status)}"}} {count}'
+                  for source, metrics in sources for status, count in sorted(metrics.statuses.items())]
+        lines += ["# HELP scout_jobs Jobs per job source fetched, unique after dedup, and new (last run)",
+                  "# TYPE scout_jobs gauge"]
+        lines += [f'scout_jobs{{source="{_label(source)}",stage="{stage}"}} {counts[stage]}'
+                  for source, counts in jobs for stage in JOB_STAGES]
+        lines += ["# HELP scout_stage_seconds Time spent in each stage of the run (last run)",
+                  "# TYPE scout_stage_seconds gauge"]
+        lines += [f'scout_stage_seconds{{stage="{_label(stage)}"}} {seconds:g}' for stage, seconds in stages.items()]
+        lines += ["# HELP scout_run_timestamp_seconds When the last run started",
+                  "# TYPE scout_run_timestamp_seconds gauge",
+                  f"scout_run_timestamp_seconds {self.started_at:.0f}"]
+        return "\n".join(lines) + "\n"
+
+    def export(self):
+        """Append the run to the JSON lines history (rotated by size) and rewrite the Prometheus file"""
+        if not self.enabled:
+            return False
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            _rotate(self.directory / JSONL_NAME, self.max_bytes, self.backups)
+            with open(self.directory / JSONL_NAME, "a", encoding="utf-8") as f:
+                for record in self.to_records():
+                    f.write(json.dumps(record, sort_keys=True) + "\n")
+            path = self.directory / PROMETHEUS_NAME
+            tmp_path = path.with_name(f"{path.name}.tmp")
+            tmp_path.write_text(self.prometheus_text(), encoding="utf-8")
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"[WARNING] Could not export run metrics: {e}")
+            return False
+        return True
+
+
+def latest_prometheus(directory=None):
+    """The last run's Prometheus text, or None before the first run"""
+    try:
+        return (Path(directory or METRICS_DIR) / PROMETHEUS_NAME).read_text(encoding="utf-8")
+    except OSError:
+        return None
+
+
+def make_server(port=None, directory=None, host=None):
+    """HTTP server answering GET /metrics with the last run's metrics (localhost only by default)"""
+    from http.server import BaseHTTPRequestHandler, HTTPServer  # Only the exporter needs it
+
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            text = latest_prometheus(directory) if self.path.split("?")[0] == "/metrics" else None
+            body = (text or "").encode("utf-8")
+            self.send_response(200 if text is not None else 404)
+            self.send_header("Content-Type", PROMETHEUS_CONTENT_TYPE)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    return HTTPServer((METRICS_HOST if host is None else host, METRICS_PORT if port is None else port),
+                      MetricsHandler)
+
+
+def serve(port=None, directory=None):
+    """Serve the last run's metrics at http://<host>:<port>/metrics (blocks)"""
+    server = make_server(port, directory)
+    host, port = server.server_address[:2]
+    print(f"[METRICS] Serving /metrics on {host}:{port}")
+    server.serve_forever()
+
+
+if __name__ == "__main__":
+    serve()
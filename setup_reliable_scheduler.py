@@ -10,22 +10,6 @@ import platform
 import subprocess
 from pathlib import Path
 
-def install_schedule_package():
-    """Install the schedule package if not available"""
-    try:
-        import schedule
-        print("[SUCCESS] Schedule package already installed")
-        return True
-    except ImportError:
-        print("📦 Installing schedule package...")
-        try:
-            subprocess.check_call([sys.executable, "-m", "pip", "install", "schedule"])
-            print("[SUCCESS] Schedule package installed successfully")
-            return True
-        except subprocess.CalledProcessError:
-            print("[ERROR] Failed to install schedule package")
-            return False
-
 def setup_windows_service():
     """Setup Windows Task Scheduler for reliable daily execution"""
     script_dir = Path(__file__).parent.absolute()
@@ -186,11 +170,6 @@ def main():
     print("[BOT] Agent-21 Scout Reliable Scheduler Setup")
     print("=" * 50)
     
-    # Install required package
-    if not install_schedule_package():
-        print("[ERROR] Cannot proceed without schedule package")
-        sys.exit(1)
-    
     # Detect platform and setup appropriate scheduler
     system = platform.system()
     success = False
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Source Content Hashes for Agent-21 Scout
+Incremental runs: a hash of each source's jobs is kept between runs, and
+sources whose output hasn't changed since they were last delivered are
+skipped before dedup, categorization and formatting
+"""
+
+import hashlib
+import os
+import sqlite3
+import time
+from pathlib import Path
+
+from job_dedup import DEDUP_TTL_DAYS
+
+# Incremental defaults (override via environment)
+INCREMENTAL_ENABLED = os.getenv("SCOUT_INCREMENTAL", "0") == "1"
+SOURCE_HASH_DB = Path(os.getenv("SCOUT_SOURCE_HASH_DB", Path(__file__).parent / ".scout_cache" / "source_hashes.db"))
+
+HASHED_FIELDS = ("title", "company", "location", "url", "salary")
+
+
+def group_by_source(jobs):
+    """{source: [jobs]} in first-seen order"""
+    groups = {}
+    for job in jobs:
+        groups.setdefault(job.get("source") or "", []).append(job)
+    return groups
+
+
+def content_hash(jobs):
+    """Hash of a source's output: its jobs' visible fields, in order"""
+    digest = hashlib.blake2b(digest_size=16)
+    for job in jobs:
+        for field in HASHED_FIELDS:
+            digest.update(str(job.get(field) or "").encode("utf-8"))
+            digest.update(b"\x1f")
+        digest.update(b"\x1e")
+    return digest.hexdigest()
+
+
+class SourceHashes:
+    """
+    Last delivered content hash per source. Entries expire with the
+    seen-jobs TTL, so an unchanged source is processed again once its
+    jobs would no longer count as already sent.
+    """
+
+    def __init__(self, path=None, ttl_days=None, enabled=None):
+        self.path = Path(path or SOURCE_HASH_DB)
+        self.ttl_days = DEDUP_TTL_DAYS if ttl_days is None else ttl_days
+        self.enabled = (INCREMENTAL_ENABLED if enabled is None else enabled) and self.ttl_days > 0
+
+    def _connect(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.path)
+        conn.execute("""
+        CREATE TABLE IF NOT EXISTS source_hashes (
+            source TEXT PRIMARY KEY,
+            content_hash TEXT NOT NULL,
+            updated_at REAL
+        )
+        """)
+        return conn
+
+    def _cutoff(self):
+        return time.time() - self.ttl_days * 86400
+
+    def changes(self, groups):
+        """{source: hash} for every source in `groups` whose output differs from the stored one"""
+        hashes = {source: content_hash(jobs) for source, jobs in groups.items()}
+        if not self.enabled:
+            return hashes
+        try:
+            with self._connect() as conn:
+                rows = conn.execute("SELECT source, content_hash FROM source_hashes WHERE updated_at >= ?",
+                                    (self._cutoff(),))
+                stored = dict(rows.fetchall())
+        except sqlite3.Error as e:
+            print(f"[WARNING] Source hash store unavailable, processing every source: {e}")
+            return hashes
+        return {source: value for source, value in hashes.items() if stored.get(source) != value}
+
+    def commit(self, hashes):
+        """Record sources as processed with these hashes and drop expired entries"""
+        if not self.enabled:
+            return
+        now = time.time()
+        try:
+            with self._connect() as conn:
+                conn.executemany("""
+                INSERT INTO source_hashes (source, content_hash, updated_at) VALUES (?, ?, ?)
+                ON CONFLICT(source) DO UPDATE SET content_hash = excluded.content_hash,
+                                                  updated_at = excluded.updated_at
+                """, [(source, value, now) for source, value in hashes.items()])
+                conn.execute("DELETE FROM source_hashes WHERE updated_at < ?", (self._cutoff(),))
+        except sqlite3.Error as e:
+            print(f"[WARNING] Could not record source hashes: {e}")
@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""
+Source Health Tracker for Agent-21 Scout
+A circuit breaker per job source, persisted across runs: sources that keep
+failing are skipped for a cool-down instead of being retried (with sleeps)
+every category and every day, then probed once ("half-open") to see if
+they are back. A source fails at most once per run however many categories
+call it, and breakers are saved once, at the end of the run's fetches.
+Failure counts and latency are kept for the stats report
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from urllib.parse import urlsplit
+
+# Breaker defaults (override via environment)
+HEALTH_ENABLED = os.getenv("SCOUT_SOURCE_HEALTH", "1") != "0"
+HEALTH_DB = Path(os.getenv("SCOUT_SOURCE_HEALTH_DB", Path(__file__).parent / ".scout_cache" / "source_health.db"))
+FAILURE_THRESHOLD = int(os.getenv("SCOUT_BREAKER_FAILURES", "3"))            # Consecutive failures to open
+COOLDOWN = float(os.getenv("SCOUT_BREAKER_COOLDOWN_HOURS", "6")) * 3600      # First skip period
+MAX_COOLDOWN = float(os.getenv("SCOUT_BREAKER_MAX_COOLDOWN_HOURS", "72")) * 3600
+LATENCY_WEIGHT = 0.3  # EWMA weight of the newest latency sample
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(Exception):
+    """The source's breaker is open; it was not called"""
+
+
+def endpoint_name(url):
+    """Breaker name of a remote board: host and path, without the query"""
+    parts = urlsplit(url)
+    return f"{parts.hostname or ''}{parts.path.rstrip('/')}"
+
+
+class _Circuit:
+    __slots__ = ("state", "consecutive_failures", "trips", "opened_at", "successes", "failures",
+                 "latency", "last_error", "probing")
+
+    def __init__(self, state=CLOSED, consecutive_failures=0, trips=0, opened_at=0.0, successes=0,
+                 failures=0, latency=None, last_error=None):
+        self.state = state
+        self.consecutive_failures = consecutive_failures
+        self.trips = trips              # Times opened in a row (grows the cool-down)
+        self.opened_at = opened_at
+        self.successes = successes
+        self.failures = failures
+        self.latency = latency          # Seconds, EWMA
+        self.last_error = last_error
+        self.probing = False            # A half-open probe is in flight
+
+
+class SourceHealth:
+    """Thread-safe breakers keyed by source name, kept in memory and saved to SQLite by save()"""
+
+    def __init__(self, path=None, failure_threshold=None, cooldown=None, max_cooldown=None,
+                 enabled=None, clock=time.time):
+        self.path = Path(path or HEALTH_DB)
+        self.failure_threshold = failure_threshold or FAILURE_THRESHOLD
+        self.cooldown = COOLDOWN if cooldown is None else cooldown
+        self.max_cooldown = MAX_COOLDOWN if max_cooldown is None else max_cooldown
+        self.enabled = HEALTH_ENABLED if enabled is None else enabled
+        self.clock = clock
+        self.skipped = 0  # Calls avoided this process
+        self._lock = threading.Lock()
+        self._failed = set()  # Sources that failed this run (counted once)
+        self._changed = set()  # Sources to write on the next save()
+        self._circuits = self._load() if self.enabled else {}
+
+    def _connect(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.path, timeout=30)
+        conn.execute("""
+        CREATE TABLE IF NOT EXISTS source_health (
+            source TEXT PRIMARY KEY,
+            state TEXT NOT NULL,
+            consecutive_failures INTEGER NOT NULL,
+            trips INTEGER NOT NULL,
+            opened_at REAL NOT NULL,
+            successes INTEGER NOT NULL,
+            failures INTEGER NOT NULL,
+            latency REAL,
+            last_error TEXT,
+            updated_at REAL
+        )
+        """)
+        return conn
+
+    def _load(self):
+        try:
+            with self._connect() as conn:
+                rows = conn.execute(
+                    "SELECT source, state, consecutive_failures, trips, opened_at, successes, failures, "
+                    "latency, last_error FROM source_health").fetchall()
+        except sqlite3.Error as e:
+            print(f"[WARNING] Source health store unavailable, starting fresh: {e}")
+            return {}
+        return {row[0]: _Circuit(*row[1:]) for row in rows}
+
+    def start_run(self):
+        """Begin a new run: sources may fail (and count) once more"""
+        with self._lock:
+            self._failed.clear()
+
+    def save(self):
+        """Write the breakers changed since the last save, in one transaction"""
+        if not self.enabled:
+            return
+        with self._lock:
+            now = self.clock()
+            rows = [(source, circuit.state, circuit.consecutive_failures, circuit.trips, circuit.opened_at,
+                     circuit.successes, circuit.failures, circuit.latency, circuit.last_error, now)
+                    for source, circuit in self._circuits.items() if source in self._changed]
+            self._changed.clear()
+        if not rows:
+            return
+        try:
+            with self._connect() as conn:
+                conn.executemany("INSERT OR REPLACE INTO source_health VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", rows)
+        except sqlite3.Error as e:
+            print(f"[WARNING] Could not save source health: {e}")
+
+    def _cooldown_for(self, circuit):
+        return min(self.max_cooldown, self.cooldown * 2 ** max(0, circuit.trips - 1))
+
+    def allow(self, source):
+        """
+        Whether `source` may be called now. An open breaker whose cool-down
+        has passed lets exactly one probe through (half-open).
+        """
+        if not self.enabled:
+            return True
+        with self._lock:
+            circuit = self._circuits.get(source)
+            if circuit is None or circuit.state == CLOSED:
+                return True
+            if circuit.state == OPEN and self.clock() - circuit.opened_at >= self._cooldown_for(circuit):
+                circuit.state = HALF_OPEN
+                circuit.probing = False
+            if circuit.state == HALF_OPEN and not circuit.probing:
+                circuit.probing = True
+                print(f"[HEALTH] Probing {source} after its cool-down")
+                return True
+            self.skipped += 1
+            return False
+
+    def record_success(self, source, latency=None):
+        if not self.enabled:
+            return
+        with self._lock:
+            circuit = self._circuits.setdefault(source, _Circuit())
+            if circuit.state != CLOSED:
+                print(f"[HEALTH] {source} recovered, closing its breaker")
+            circuit.state = CLOSED
+            circuit.consecutive_failures = 0
+            circuit.trips = 0
+            circuit.probing = False
+            circuit.successes += 1
+            self._add_latency(circuit, latency)
+            self._changed.add(source)
+
+    def record_failure(self, source, error=None, latency=None):
+        """Count a failure of `source`; later failures in the same run (other categories) are ignored"""
+        if not self.enabled:
+            return
+        with self._lock:
+            if source in self._failed:
+                return
+            self._failed.add(source)
+            circuit = self._circuits.setdefault(source, _Circuit())
+            circuit.consecutive_failures += 1
+            circuit.failures += 1
+            circuit.last_error = str(error)[:300] if error is not None else None
+            self._add_latency(circuit, latency)
+            if circuit.state == HALF_OPEN or (
+                    circuit.state == CLOSED and circuit.consecutive_failures >= self.failure_threshold):
+                circuit.state = OPEN
+                circuit.trips += 1
+                circuit.opened_at = self.clock()
+                circuit.probing = False
+                print(f"[HEALTH] Opening breaker for {source} for "
+                      f"{self._cooldown_for(circuit) / 3600:.1f}h after {circuit.consecutive_failures} failures")
+            self._changed.add(source)
+
+    @staticmethod
+    def _add_latency(circuit, latency):
+        if latency is None:
+            return
+        if circuit.latency is None:
+            circuit.latency = latency
+        else:
+            circuit.latency += LATENCY_WEIGHT * (latency - circuit.latency)
+
+    def call(self, source, function, *args, **kwargs):
+        """function(*args, **kwargs) through the breaker; raises CircuitOpenError when skipped"""
+        if not self.allow(source):
+            raise CircuitOpenError(f"{source} is failing, skipped until its cool-down ends")
+        start = time.monotonic()
+        try:
+            result = function(*args, **kwargs)
+        except Exception as e:
+            self.record_failure(source, e, time.monotonic() - start)
+            raise
+        self.record_success(source, time.monotonic() - start)
+        return result
+
+    def state(self, source):
+        with self._lock:
+            circuit = self._circuits.get(source)
+            return circuit.state if circuit else CLOSED
+
+    def report(self):
+        """{source: {"state", "failure_rate", "latency", "last_error"}} for every tracked source"""
+        with self._lock:
+            return {
+                source: {
+                    "state": circuit.state,
+                    "failure_rate": circuit.failures / max(1, circuit.successes + circuit.failures),
+                    "latency": circuit.latency,
+                    "last_error": circuit.last_error,
+                }
+                for source, circuit in self._circuits.items()
+            }
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Source Registry for Agent-21 Scout
+Every job source declares itself with @job_source (JobScout methods) or
+register() (plugin functions), along with its metadata: kind, network host,
+relative cost, how long its results stay fresh and which category keywords
+it covers. The daily run builds its fetch tasks from the registry, and the
+fetch engine schedules, parallelizes and caches them from that metadata
+"""
+
+import functools
+import os
+
+NETWORK = "network"  # Calls a remote API; runs in the fetch pool, limited per host
+STATIC = "static"    # Curated jobs, no network; runs inline
+KINDS = (NETWORK, STATIC)
+
+# Seconds a job board source's results are reused by a warm scout (scheduler daemon)
+BOARD_REFRESH = int(os.getenv("SCOUT_BOARD_REFRESH", "3600"))
+
+
+class SourceSpec:
+    """One registered job source and its metadata"""
+
+    def __init__(self, name, function=None, method=None, kind=STATIC, host=None, label=None, cost=1,
+                 refresh=0, keywords=(), enabled=True, origin=None):
+        if kind not in KINDS:
+            raise ValueError(f"Unknown source kind {kind!r} for {name!r}")
+        if (kind == NETWORK) != (host is not None):
+            raise ValueError(f"Source {name!r}: network sources need a host, static ones none")
+        if (function is None) == (method is None):
+            raise ValueError(f"Source {name!r} needs exactly one of function or method")
+        self.name = name          # Task, metrics and stats name
+        self.function = function  # Plugin: function(scout, keywords) -> jobs
+        self.method = method      # JobScout method name: method(keywords) -> jobs
+        self.kind = kind
+        self.host = host
+        self.label = label        # Run under comprehensive error handling (retries, fallbacks) as `label`
+        self.cost = cost          # Relative cost of one call; costlier sources are started first
+        self.refresh = refresh    # Seconds a result can be reused across runs (0: fetch every run)
+        self.keywords = tuple(keywords)  # Category keywords it serves (empty: every category)
+        self.enabled = enabled    # False: registered for audits, but not run by the daily scout
+        self.origin = origin      # (module, "Class.method") that declared it, for decorated methods
+
+    def covers(self, keywords):
+        """Whether a category with these keywords should query this source"""
+        return not self.keywords or any(word in keywords for word in self.keywords)
+
+    def bind(self, scout):
+        """The source as a callable taking a category's keywords"""
+        if self.method is not None:
+            return getattr(scout, self.method)
+        return functools.partial(self.function, scout)
+
+    def __repr__(self):
+        return f"SourceSpec({self.name!r}, kind={self.kind!r}, host={self.host!r})"
+
+
+class SourceRegistry:
+    """Job sources in registration order (the order their jobs are merged)"""
+
+    def __init__(self):
+        self._specs = {}
+
+    def add(self, spec, after=None):
+        """Register `spec` last in merge order, or right after the source named `after`"""
+        existing = self._specs.get(spec.name)
+        if existing is not None and existing.origin and spec.origin \
+                and existing.origin[1] == spec.origin[1] and existing.origin[0] != spec.origin[0]:
+            self._specs[spec.name] = spec  # The same class run again as another module (e.g. as __main__)
+            return spec
+        if existing is not None:
+            raise ValueError(f"Job source {spec.name!r} is already registered")
+        if spec.method is not None and any(other.method == spec.method for other in self._specs.values()):
+            raise ValueError(f"JobScout.{spec.method} is already registered as a job source")
+        if after is None:
+            self._specs[spec.name] = spec
+            return spec
+        if after not in self._specs:
+            raise ValueError(f"Cannot place {spec.name!r} after unknown job source {after!r}")
+        specs = {}
+        for name, other in self._specs.items():
+            specs[name] = other
+            if name == after:
+                specs[spec.name] = spec
+        self._specs = specs
+        return spec
+
+    def register(self, name, function, after=None, **metadata):
+        """Register a plugin source: function(scout, keywords) -> list of jobs"""
+        return self.add(SourceSpec(name, function=function, **metadata), after=after)
+
+    def unregister(self, name):
+        self._specs.pop(name, None)
+
+    def get(self, name):
+        return self._specs[name]
+
+    def __contains__(self, name):
+        return name in self._specs
+
+    def __iter__(self):
+        return iter(list(self._specs.values()))
+
+    def __len__(self):
+        return len(self._specs)
+
+    def enabled(self):
+        return [spec for spec in self if spec.enabled]
+
+    def of_kind(self, kind):
+        return [spec for spec in self if spec.kind == kind]
+
+    def for_keywords(self, keywords):
+        """Enabled sources a category with these keywords queries, in merge order"""
+        return [spec for spec in self if spec.enabled and spec.covers(keywords)]
+
+
+# The registry the daily scout and the audit scripts use
+SOURCES = SourceRegistry()
+
+
+def job_source(name=None, registry=None, **metadata):
+    """
+    Register a JobScout method taking a category's keywords as a job source.
+    `name` defaults to the label, then the method name; see SourceSpec for
+    the metadata.
+    """
+    def decorate(function):
+        source_name = name or metadata.get("label") or function.__name__
+        origin = (function.__module__, function.__qualname__)
+        spec = SourceSpec(source_name, method=function.__name__, origin=origin, **metadata)
+        (SOURCES if registry is None else registry).add(spec)
+        return function
+    return decorate
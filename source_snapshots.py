@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Per-Run Source Snapshots for Agent-21 Scout
+Downloads each remote job board at most once per run so that every
+category's keyword filter runs against the same in-memory copy. Downloads
+go through the source health breakers, so a board that keeps failing
+isn't contacted until its cool-down ends, and within the board's latency
+budget (hedged at its usual p95)
+"""
+
+import threading
+
+from http_cache import cached_get, stored_response
+from source_health import endpoint_name
+
+
+class _Snapshot:
+    """One board download: finished once `ready` is set"""
+
+    def __init__(self):
+        self.ready = threading.Event()
+        self.data = None
+        self.error = None
+
+
+class _BadStatus(Exception):
+    """A board answered with a non-200 status"""
+
+
+class SnapshotError(Exception):
+    """
+    A board download failed this run. Raised on every lookup of that board
+    until the next run, so retrying (or backing off) can't help; `error` is
+    the download's own exception.
+    """
+
+    def __init__(self, error):
+        super().__init__(str(error))
+        self.error = error
+
+
+class SourceSnapshots:
+    """Thread-safe, per-run cache of full board downloads"""
+
+    def __init__(self, health=None, budgets=None, metrics=None):
+        self.health = health    # SourceHealth breakers, or None to always download
+        self.budgets = budgets  # LatencyBudgets, or None for plain requests
+        self.metrics = metrics  # RunMetrics counting bytes, statuses and parse time, or None
+        self._snapshots = {}
+        self._lock = threading.Lock()
+        self.downloads = 0  # Boards actually fetched over the network
+        self.hits = 0       # Lookups served from memory
+
+    def get(self, key, download, source=None):
+        """
+        Return the snapshot for `key`, calling download() only the first time.
+        Concurrent callers for the same key wait for that single download.
+        A failed download is remembered too, so a dead board isn't retried
+        once per category: every lookup raises SnapshotError. With a `source`
+        name the download goes through that source's breaker (failing with
+        CircuitOpenError while it is open).
+        """
+        with self._lock:
+            snapshot = self._snapshots.get(key)
+            owner = snapshot is None
+            if owner:
+                snapshot = _Snapshot()
+                self._snapshots[key] = snapshot
+                self.downloads += 1
+            else:
+                self.hits += 1
+
+        if owner:
+            try:
+                if self.health is not None and source is not None:
+                    snapshot.data = self.health.call(source, download)
+                else:
+                    snapshot.data = download()
+            except Exception as e:
+                snapshot.error = e
+            finally:
+                snapshot.ready.set()
+        else:
+            snapshot.ready.wait()
+
+        if snapshot.error is not None:
+            raise SnapshotError(snapshot.error) from snapshot.error
+        return snapshot.data
+
+    def fetch(self, url, attempt, params=None):
+        """
+        attempt(timeout) within the board's latency budget (timeout None
+        means the client default). A board that blows its budget is served
+        from the disk cache's last copy when there is one.
+        """
+        try:
+            response = self._fetch(url, attempt, params)
+        except Exception:
+            if self.metrics is not None:
+                self.metrics.record_error()
+            raise
+        if self.metrics is not None:
+            self.metrics.record_response(response)
+        return response
+
+    def _fetch(self, url, attempt, params):
+        from requests.exceptions import Timeout
+
+        if self.budgets is None:
+            return attempt(None)
+        try:
+            return self.budgets.call(endpoint_name(url), attempt)
+        except Timeout:
+            response = stored_response(url, params)
+            if response is None:
+                raise
+            print(f"[CACHE] Serving stale copy of {url} after its latency budget")
+            return response
+
+    def parse_json(self, response):
+        """response.json(), timed against the current source"""
+        if self.metrics is None:
+            return response.json()
+        with self.metrics.parsing():
+            return response.json()
+
+    def get_json(self, url, params=None, headers=None, timeout=None):
+        """
+        Fetch a JSON board once per run (through the on-disk HTTP cache).
+        Returns None when the board answers with a non-200 status, mirroring
+        the fetchers' old behaviour.
+        """
+        key = (url, tuple(sorted((params or {}).items())))
+
+        def download():
+            response = self.fetch(url, lambda budget: cached_get(
+                url, params=params, headers=headers, timeout=timeout or budget), params)
+            if response.status_code != 200:
+                raise _BadStatus(f"HTTP {response.status_code}")  # Counts against the board's health
+            return self.parse_json(response)
+
+        try:
+            return self.get(key, download, source=endpoint_name(url))
+        except SnapshotError as e:
+            if isinstance(e.error, _BadStatus):
+                return None
+            raise
+
+    def clear(self):
+        """Forget all snapshots (start of a new run)"""
+        with self._lock:
+            self._snapshots.clear()
+            self.downloads = 0
+            self.hits = 0
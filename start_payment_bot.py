@@ -7,7 +7,10 @@ import sqlite3
 from datetime import datetime
 from urllib.parse import urljoin
 
-import requests
+import http_client
+from job_search import handle_search_command
+from scout_metrics import PROMETHEUS_CONTENT_TYPE, latest_prometheus
+from subscriber_prefs import handle_preference_command
 from flask import Flask, request
 from dotenv import load_dotenv
 
@@ -80,13 +83,16 @@ def save_payment(phone: str, amount: int, tx_info: str):
         conn.commit()
 
 # ---------- Telegram helpers ----------
-def tg_send_text(chat_id: str, text: str, disable_preview=True):
+def tg_send_text(chat_id: str, text: str, disable_preview=True, parse_mode=None):
+    payload = {
+        "chat_id": chat_id,
+        "text": text,
+        "disable_web_page_preview": disable_preview
+    }
+    if parse_mode:
+        payload["parse_mode"] = parse_mode
     try:
-        requests.post(f"{TELEGRAM_API}/sendMessage", json={
-            "chat_id": chat_id,
-            "text": text,
-            "disable_web_page_preview": disable_preview
-        }, timeout=10)
+        http_client.post(f"{TELEGRAM_API}/sendMessage", json=payload, timeout=10)
     except Exception as e:
         print("sendMessage error:", e)
 
@@ -96,7 +102,7 @@ def tg_create_invite_link():
         return GROUP_INVITE_LINK  # fallback to static link
     try:
         # member_limit=1 makes it single-use; 3600s expiry to be safe
-        res = requests.post(f"{TELEGRAM_API}/createChatInviteLink", json={
+        res = http_client.post(f"{TELEGRAM_API}/createChatInviteLink", json={
             "chat_id": GROUP_CHAT_ID,
             "member_limit": 1,
             "creates_join_request": False,
@@ -151,7 +157,7 @@ def poll_updates():
             params = {"timeout": 25}
             if offset:
                 params["offset"] = offset
-            resp = requests.get(f"{TELEGRAM_API}/getUpdates", params=params, timeout=30)
+            resp = http_client.get(f"{TELEGRAM_API}/getUpdates", params=params, timeout=30)
             data = resp.json()
             for upd in data.get("result", []):
                 offset = upd["update_id"] + 1
@@ -178,9 +184,17 @@ def poll_updates():
                         f"📌 Got it! We registered {text}.\n"
                         f"Now pay *KSh {REQUIRED_AMOUNT}* to {MPESA_NUMBER}. You'll get your invite link automatically when payment lands."))
                 else:
-                    # ignore or help
+                    # preference and search commands, else ignore or help
+                    reply = None
                     if text.startswith("/"):
-                        tg_send_text(chat_id, "Commands:\n/start – info\n/join – register your M-Pesa number")
+                        reply = handle_preference_command(chat_id, text) or handle_search_command(text)
+                    if reply:
+                        tg_send_text(chat_id, reply, parse_mode="Markdown")
+                    elif text.startswith("/"):
+                        tg_send_text(chat_id, (
+                            "Commands:\n/start – info\n/join – register your M-Pesa number\n"
+                            "/prefs – choose which jobs you receive\n"
+                            "/jobs <keywords> – search recent jobs\n/category <name> – browse a category"))
             # loop again
         except Exception as e:
             print("poll error:", e)
@@ -193,6 +207,14 @@ app = Flask(__name__)
 def health():
     return "OK", 200
 
+@app.route("/metrics", methods=["GET"])
+def metrics():
+    """Prometheus text of the last scout run"""
+    text = latest_prometheus()
+    if text is None:
+        return "no scout run recorded yet\n", 404, {"Content-Type": PROMETHEUS_CONTENT_TYPE}
+    return text, 200, {"Content-Type": PROMETHEUS_CONTENT_TYPE}
+
 @app.route("/sms", methods=["POST"])
 def sms_webhook():
     """
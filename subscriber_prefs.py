@@ -0,0 +1,272 @@
+#!/usr/bin/env python3
+"""
+Subscriber Preferences for Agent-21 Scout
+What each subscriber wants (skill levels, categories, keywords, a salary
+floor), the bot commands that set it, and an inverted index that picks the
+recipients of a job from its level, category, text and salary
+"""
+
+import bisect
+import json
+import os
+import re
+import sqlite3
+import time
+from pathlib import Path
+
+from keyword_matcher import KeywordMatcher
+
+PREFS_DB = Path(os.getenv("SCOUT_PREFS_DB", Path(__file__).parent / "subscriber_prefs.db"))
+
+LEVEL_ALIASES = {
+    "entry": "entry_level",
+    "intermediate": "intermediate_level",
+    "expert": "expert_level",
+    "flexible": "flexible_opportunities",
+}
+
+HOURS_PER_YEAR = 2080
+
+# Bot commands handled by handle_preference_command()
+PREFERENCE_COMMANDS = ("prefs", "levels", "categories", "keywords", "salary", "resetprefs")
+
+PREFERENCE_HELP = (
+    "🎯 *Job Preferences*\n\n"
+    "/levels `entry intermediate expert flexible`\n"
+    "/categories `basic_customer_support product_management ...`\n"
+    "/keywords `python, data entry, support`\n"
+    "/salary `30000` (yearly USD floor, or `15/hour`)\n"
+    "/prefs – show your preferences\n"
+    "/resetprefs – receive every job again"
+)
+
+
+def annual_salary(text):
+    """Upper end of a salary string in yearly USD ("$12-24/hour" -> 49920), or None"""
+    if not text:
+        return None
+    text = str(text).lower().replace(",", "")
+    numbers = [float(value) for value in re.findall(r"\d+(?:\.\d+)?", text)]
+    if not numbers:
+        return None
+    amount = max(numbers)
+    if re.search(r"\d\s*k\b", text):
+        amount *= 1000
+    if "hour" in text or "/hr" in text:
+        amount *= HOURS_PER_YEAR
+    elif "month" in text:
+        amount *= 12
+    elif "week" in text:
+        amount *= 52
+    return amount
+
+
+class PreferenceStore:
+    """SQLite table of preferences, one row per chat"""
+
+    def __init__(self, path=None):
+        self.path = Path(path or PREFS_DB)
+
+    def _connect(self):
+        conn = sqlite3.connect(self.path, timeout=30)
+        conn.execute("""
+        CREATE TABLE IF NOT EXISTS preferences (
+            chat_id TEXT PRIMARY KEY,
+            levels TEXT NOT NULL DEFAULT '[]',
+            categories TEXT NOT NULL DEFAULT '[]',
+            keywords TEXT NOT NULL DEFAULT '[]',
+            min_salary REAL,
+            updated_at REAL
+        )
+        """)
+        return conn
+
+    def get(self, chat_id):
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT levels, categories, keywords, min_salary FROM preferences WHERE chat_id = ?",
+                (str(chat_id),)).fetchone()
+        if row is None:
+            return {"levels": [], "categories": [], "keywords": [], "min_salary": None}
+        return {
+            "levels": json.loads(row[0]),
+            "categories": json.loads(row[1]),
+            "keywords": json.loads(row[2]),
+            "min_salary": row[3],
+        }
+
+    def update(self, chat_id, **changes):
+        """Change some fields (levels, categories, keywords, min_salary), keep the rest"""
+        prefs = self.get(chat_id)
+        prefs.update(changes)
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO preferences (chat_id, levels, categories, keywords, min_salary, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (str(chat_id), json.dumps(prefs["levels"]), json.dumps(prefs["categories"]),
+                 json.dumps(prefs["keywords"]), prefs["min_salary"], time.time()))
+        return prefs
+
+    def reset(self, chat_id):
+        with self._connect() as conn:
+            conn.execute("DELETE FROM preferences WHERE chat_id = ?", (str(chat_id),))
+
+    def load_all(self, chat_ids=None):
+        """{chat_id: prefs} for every chat (or only chat_ids) that set preferences"""
+        if not self.path.exists():
+            return {}
+        with self._connect() as conn:
+            rows = conn.execute("SELECT chat_id, levels, categories, keywords, min_salary FROM preferences").fetchall()
+        wanted = None if chat_ids is None else {str(chat_id) for chat_id in chat_ids}
+        return {
+            chat_id: {
+                "levels": json.loads(levels),
+                "categories": json.loads(categories),
+                "keywords": json.loads(keywords),
+                "min_salary": min_salary,
+            }
+            for chat_id, levels, categories, keywords, min_salary in rows
+            if wanted is None or chat_id in wanted
+        }
+
+
+class PreferenceIndex:
+    """
+    Inverted index from level, category, keyword and salary floor to
+    subscribers. recipients(job) only touches the subscribers whose
+    preferences the job actually hits, plus those with no constraint.
+    """
+
+    def __init__(self, subscribers, preferences):
+        self.subscribers = [str(chat_id) for chat_id in subscribers]
+        self.by_level = {}
+        self.by_category = {}
+        self.any_level = set()
+        self.any_category = set()
+        self.any_keyword = set()
+        self.any_salary = set()
+        keyword_users = {}
+        floors = []
+
+        for chat_id in self.subscribers:
+            prefs = preferences.get(chat_id) or {}
+            self._index(prefs.get("levels"), chat_id, self.by_level, self.any_level)
+            self._index(prefs.get("categories"), chat_id, self.by_category, self.any_category)
+            keywords = [keyword.lower().strip() for keyword in prefs.get("keywords") or [] if keyword.strip()]
+            if keywords:
+                for keyword in keywords:
+                    keyword_users.setdefault(keyword, set()).add(chat_id)
+            else:
+                self.any_keyword.add(chat_id)
+            if prefs.get("min_salary"):
+                floors.append((float(prefs["min_salary"]), chat_id))
+            else:
+                self.any_salary.add(chat_id)
+
+        self.keywords = list(keyword_users)
+        self.keyword_users = [keyword_users[keyword] for keyword in self.keywords]
+        self.keyword_matcher = KeywordMatcher([[keyword] for keyword in self.keywords])
+        floors.sort()
+        self.floor_values = [floor for floor, _ in floors]
+        self.floor_users = [chat_id for _, chat_id in floors]
+
+    @staticmethod
+    def _index(values, chat_id, index, unconstrained):
+        if values:
+            for value in values:
+                index.setdefault(value, set()).add(chat_id)
+        else:
+            unconstrained.add(chat_id)
+
+    def recipients(self, job):
+        """Subscribers whose preferences all accept `job` (needs job["categorization"])"""
+        categorization = job.get("categorization")
+        level = categorization["level"] if categorization else None
+        category = categorization["category"] if categorization else None
+
+        allowed_level = self.by_level.get(level, set()) | self.any_level
+        allowed_category = self.by_category.get(category, set()) | self.any_category
+
+        allowed_keyword = set(self.any_keyword)
+        if self.keywords:
+            text = f"{job.get('title', '')} {job.get('company', '')}".lower()
+            for index in self.keyword_matcher.all_matches(text):
+                allowed_keyword |= self.keyword_users[index]
+
+        salary = annual_salary(job.get("salary"))
+        if salary is None:
+            allowed_salary = self.any_salary.union(self.floor_users)  # Unknown pay doesn't exclude
+        else:
+            reachable = bisect.bisect_right(self.floor_values, salary)
+            allowed_salary = self.any_salary.union(self.floor_users[:reachable])
+
+        dimensions = sorted((allowed_level, allowed_category, allowed_keyword, allowed_salary), key=len)
+        return dimensions[0].intersection(*dimensions[1:])
+
+
+def _known_categories():
+    from job_categories import ORGANIZED_JOB_CATEGORIES
+    return {
+        category: level
+        for level, level_data in ORGANIZED_JOB_CATEGORIES.items()
+        for category in level_data["categories"]
+    }
+
+
+def _listed(values, default):
+    # Code spans keep underscores in category names out of Markdown
+    return ", ".join(f"`{value}`" for value in values) or default
+
+
+def _describe(prefs):
+    salary = f"${prefs['min_salary']:,.0f}/year" if prefs["min_salary"] else "any"
+    return (
+        "🎯 *Your Job Preferences*\n\n"
+        f"Levels: {_listed(prefs['levels'], 'all')}\n"
+        f"Categories: {_listed(prefs['categories'], 'all')}\n"
+        f"Keywords: {_listed(prefs['keywords'], 'any')}\n"
+        f"Minimum salary: {salary}"
+    )
+
+
+def handle_preference_command(chat_id, text, store=None):
+    """
+    Reply for a preference command (/prefs, /levels, /categories, /keywords,
+    /salary, /resetprefs), or None if `text` isn't one. Shared by both
+    payment bots.
+    """
+    parts = (text or "").strip().split(maxsplit=1)
+    if not parts:
+        return None
+    command = parts[0].lower().split("@")[0]
+    argument = parts[1].strip() if len(parts) > 1 else ""
+    store = store or PreferenceStore()
+
+    if command == "/prefs":
+        return _describe(store.get(chat_id)) + "\n\n" + PREFERENCE_HELP
+    if command == "/resetprefs":
+        store.reset(chat_id)
+        return "✅ Preferences cleared – you'll receive every job."
+    if command == "/levels":
+        levels = [LEVEL_ALIASES.get(word, word) for word in argument.lower().replace(",", " ").split()]
+        unknown = [level for level in levels if level not in LEVEL_ALIASES.values()]
+        if unknown or not levels:
+            return f"❌ Unknown level: {_listed(unknown, '(none given)')}\n\n{PREFERENCE_HELP}"
+        return "✅ Saved.\n\n" + _describe(store.update(chat_id, levels=levels))
+    if command == "/categories":
+        categories = argument.lower().replace(",", " ").split()
+        known = _known_categories()
+        unknown = [category for category in categories if category not in known]
+        if unknown or not categories:
+            return (f"❌ Unknown category: {_listed(unknown, '(none given)')}\n\n"
+                    f"Available: {_listed(sorted(known), '')}")
+        return "✅ Saved.\n\n" + _describe(store.update(chat_id, categories=categories))
+    if command == "/keywords":
+        keywords = [keyword.strip().lower() for keyword in argument.split(",") if keyword.strip()]
+        return "✅ Saved.\n\n" + _describe(store.update(chat_id, keywords=keywords))
+    if command == "/salary":
+        floor = annual_salary(argument) if argument.lower() not in ("", "any", "0") else None
+        if argument and argument.lower() not in ("any", "0") and floor is None:
+            return f"❌ Couldn't read a salary from `{argument}`\n\n{PREFERENCE_HELP}"
+        return "✅ Saved.\n\n" + _describe(store.update(chat_id, min_salary=floor))
+    return None
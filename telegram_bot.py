@@ -1,5 +1,9 @@
+import atexit
 import os
-from requests import post, RequestException
+import threading
+from http_client import post
+from rate_limiter import default_limiter
+from outbound_queue import OutboundQueue, OutboxPool, PermanentDeliveryError
 from dotenv import load_dotenv
 import time
 
@@ -8,31 +12,168 @@ load_dotenv()
 TOKEN = os.getenv("TELEGRAM_BOT_TOKEN")
 CHAT_ID = os.getenv("TELEGRAM_CHAT_ID")
 
-def send_telegram_message(message: str, delay: float = 0.5):
+# Sends retried after a 429 before giving up
+MAX_SEND_ATTEMPTS = int(os.getenv("SCOUT_TG_MAX_ATTEMPTS", "5"))
+
+# Queue messages in the persistent outbox (0 sends synchronously)
+OUTBOX_ENABLED = os.getenv("SCOUT_OUTBOX", "1") != "0"
+OUTBOX_FLUSH_TIMEOUT = float(os.getenv("SCOUT_OUTBOX_FLUSH_TIMEOUT", "300"))
+
+# Telegram rejects messages longer than this (counted in UTF-16 code units)
+MAX_MESSAGE_LENGTH = 4096
+DIGEST_SEPARATOR = "\n\n➖➖➖➖➖➖➖➖\n\n"
+
+def message_length(text: str) -> int:
+    """Length as Telegram counts it: emoji outside the BMP count as 2"""
+    return len(text.encode("utf-16-le")) // 2
+
+def pack_messages(parts, limit: int = MAX_MESSAGE_LENGTH, separator: str = DIGEST_SEPARATOR):
     """
-    Send a message to Telegram with rate limiting.
-    Agent-21 Scout Bot - Professional Job Alerts
+    Pack formatted parts (e.g. individual job messages) into as few messages
+    as possible, each within `limit`. Parts are never split unless a single
+    part is over the limit on its own, in which case it is split on lines.
     """
-    if not TOKEN or not CHAT_ID:
-        raise ValueError("Missing TELEGRAM_BOT_TOKEN or TELEGRAM_CHAT_ID in environment")
+    messages = []
+    current = ""
+    separator_length = message_length(separator)
+    current_length = 0
     
+    for part in parts:
+        part_length = message_length(part)
+        if part_length > limit:
+            if current:
+                messages.append(current)
+                current, current_length = "", 0
+            messages.extend(_split_long_message(part, limit))
+            continue
+        
+        if current and current_length + separator_length + part_length <= limit:
+            current += separator + part
+            current_length += separator_length + part_length
+        else:
+            if current:
+                messages.append(current)
+            current, current_length = part, part_length
+    
+    if current:
+        messages.append(current)
+    return messages
+
+def _split_long_message(text: str, limit: int):
+    """Split on line boundaries (hard-cut lines that are too long themselves)"""
+    chunks = []
+    current = ""
+    for line in text.split("\n"):
+        while message_length(line) > limit:
+            cut = limit
+            while message_length(line[:cut]) > limit:
+                cut -= 1
+            if current:
+                chunks.append(current)
+                current = ""
+            chunks.append(line[:cut])
+            line = line[cut:]
+        candidate = f"{current}\n{line}" if current else line
+        if message_length(candidate) > limit:
+            chunks.append(current)
+            candidate = line
+        current = candidate
+    if current:
+        chunks.append(current)
+    return chunks
+
+def deliver_message(chat_id, message: str):
+    """
+    Post one message now, paced by the shared token-bucket limiter and
+    retried after Telegram's retry_after on a 429. Raises on failure
+    (PermanentDeliveryError if Telegram will never accept it).
+    """
+    from requests import RequestException
+
     url = f"https://api.telegram.org/bot{TOKEN}/sendMessage"
     payload = {
-        "chat_id": CHAT_ID, 
+        "chat_id": chat_id, 
         "text": message, 
         "parse_mode": "Markdown",
         "disable_web_page_preview": True
     }
+    limiter = default_limiter()
     
-    try:
+    for attempt in range(MAX_SEND_ATTEMPTS):
+        limiter.wait(chat_id)
         response = post(url, data=payload, timeout=15)
+        if response.status_code == 429:
+            retry_after = _retry_after(response)
+            print(f"[RATE LIMIT] Telegram asked to wait {retry_after}s (attempt {attempt + 1}/{MAX_SEND_ATTEMPTS})")
+            limiter.pause(retry_after)
+            continue
+        if 400 <= response.status_code < 500:
+            raise PermanentDeliveryError(f"{response.status_code}: {response.text[:200]}")
         response.raise_for_status()
-        time.sleep(delay)  # Rate limiting
         return response.json()
-    except RequestException as e:
+    
+    raise RequestException(f"still rate limited after {MAX_SEND_ATTEMPTS} attempts")
+
+def send_telegram_message(message: str, delay: float = 0.5):
+    """
+    Send a message to Telegram with rate limiting.
+    Agent-21 Scout Bot - Professional Job Alerts
+    
+    The message is queued in the persistent outbox and delivered by a
+    background worker, so callers never wait on the Telegram API and
+    nothing is lost if the process dies mid-send. SCOUT_OUTBOX=0 sends
+    synchronously instead. `delay` is kept for existing callers; pacing
+    comes from the rate limiter.
+    """
+    if not TOKEN or not CHAT_ID:
+        raise ValueError("Missing TELEGRAM_BOT_TOKEN or TELEGRAM_CHAT_ID in environment")
+    
+    if OUTBOX_ENABLED:
+        pool = outbox()
+        message_id = pool.queue.enqueue(CHAT_ID, message)
+        pool.notify()
+        return {"ok": True, "queued": message_id}
+    
+    from requests import RequestException
+    try:
+        return deliver_message(CHAT_ID, message)
+    except (RequestException, PermanentDeliveryError) as e:
         print(f"❌ Failed to send message: {e}")
         return None
 
+_outbox = None
+_outbox_lock = threading.Lock()
+
+def outbox():
+    """Start (once) the workers draining the outbox, including messages left by an earlier run"""
+    global _outbox
+    with _outbox_lock:
+        if _outbox is None:
+            _outbox = OutboxPool(OutboundQueue(), lambda chat_id, text: deliver_message(chat_id, text))
+            atexit.register(flush_outbox)
+        return _outbox
+
+def flush_outbox(timeout: float = None):
+    """Wait for queued messages to be delivered (bounded by SCOUT_OUTBOX_FLUSH_TIMEOUT)"""
+    if _outbox is None:
+        return True
+    timeout = OUTBOX_FLUSH_TIMEOUT if timeout is None else timeout
+    delivered = _outbox.flush(timeout)
+    if not delivered:
+        print("[OUTBOX] Messages still queued; they'll go out on the next run")
+    return delivered
+
+def _retry_after(response) -> float:
+    """Seconds to wait from a 429: JSON parameters.retry_after, then the header"""
+    try:
+        return float(response.json()["parameters"]["retry_after"])
+    except (ValueError, KeyError, TypeError):
+        pass
+    try:
+        return float(response.headers.get("Retry-After", 1))
+    except (TypeError, ValueError):
+        return 1.0
+
 def send_job_summary(total_jobs: int, sources: list):
     """
     Send daily job summary header.
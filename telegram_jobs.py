@@ -3,477 +3,103 @@
 Agent-21 Scout - Advanced Telegram Job Bot
 Fetches jobs from multiple sources: Amazon, Remotive, and other platforms
 Author: Agent-21 Scout System
+
+The category tables and categorizer (job_categories), fallback jobs
+(fallback_jobs), Kenya sources, subscriber fan-out and requests itself
+are loaded on first use, so importing this module stays cheap
 """
 
-from requests import get, RequestException
-from telegram_bot import send_telegram_message, send_job_summary
-from kenya_jobs import get_kenya_friendly_jobs
+from http_cache import cached_get
+from telegram_bot import send_telegram_message, send_job_summary, pack_messages
+from fetch_engine import FetchEngine, FetchTask, ResultCache
+from source_snapshots import SnapshotError, SourceSnapshots
+from latency_budget import LatencyBudgets
+from scout_metrics import RunMetrics
+from source_health import OPEN, SourceHealth, endpoint_name
+from job_catalog import get_catalog
+from job_record import as_jobs
+from job_dedup import SeenJobs, dedupe_jobs, job_key
+from source_hashes import INCREMENTAL_ENABLED, SourceHashes, group_by_source
+from job_store import JobStore
+from source_registry import NETWORK, SOURCES, job_source
+from ats_connectors import AtsBoards, register_companies
+import importlib
 import json
+import os
 import time
 from datetime import datetime, timedelta
 
-# Job categories for worldwide remote work
-CATEGORIES = {
-    "software-dev": ["developer", "programming", "software", "remote"],
-    "python": ["python", "django", "flask", "backend"],
-    "javascript": ["javascript", "react", "vue", "angular"],
-    "mobile": ["mobile", "android", "ios", "react-native"],
-    "data": ["data", "analytics", "machine-learning", "ai"],
-    "it-support": ["technical-support", "helpdesk", "systems-admin", "it"],
-    "virtual-assistant": ["virtual-assistant", "executive-assistant", "admin"],
-    "content-writing": ["content-writer", "copywriter", "writing", "content"],
-    "course-creator": ["course-creator", "instructor", "education", "training"],
-    "customer-support": ["customer-support", "customer-success", "community-manager", "technical-support"],
-    "operations-hr": ["recruiter", "hr-specialist", "people-operations", "project-manager"],
-    "finance": ["finance-analyst", "accountant", "financial-analyst", "bookkeeper"],
-    "technical-writing": ["technical-writer", "documentation", "copywriter", "blog-writer"],
-    "bpo-outsourcing": ["content-moderator", "support-agent", "trust-safety", "ad-reviewer"],
-    "ai-training": ["data-annotation", "ai-training", "rater", "labeling", "microtasks"],
-    "freelance-gig": ["freelance", "gig", "virtual-assistant", "small-tasks"],
-    "content-moderation": ["content-moderator", "community-moderation", "social-media-evaluator"],
-    "social-media-tasks": ["tiktok-moderator", "youtube-reviewer", "facebook-support", "instagram-safety"],
-    "platform-support": ["platform-support", "user-safety", "community-operations", "engagement-monitoring"],
-    "ad-review-specialist": ["ad-reviewer", "advertising-compliance", "campaign-reviewer", "promotional-content"],
-    "data-labeling": ["image-labeling", "video-annotation", "text-classification", "audio-transcription"],
-    "creator-economy": ["creator-support", "account-manager", "social-media-manager", "content-assistant"],
-    "gaming-platforms": ["gaming-moderator", "player-support", "community-manager", "esports-support"],
-    "chat-moderation": ["chat-moderator", "community-moderator", "engagement-specialist", "live-chat-support"],
-    "creator-platforms": ["patreon-support", "twitch-moderator", "discord-moderator", "creator-assistant"],
-    
-    # Enhanced Specialized Categories
-    "basic-customer-support": ["customer-support", "chat-support", "email-support", "helpdesk", "live-chat"],
-    "basic-content-moderation": ["content-moderator", "community-moderator", "social-media-moderator", "chat-moderator"],
-    "basic-data-entry": ["data-entry", "microtasks", "surveys", "basic-annotation", "clickworker"],
-    "basic-virtual-assistant": ["virtual-assistant", "admin-assistant", "scheduling", "email-management"],
-    "advanced-customer-support": ["technical-support", "customer-success", "account-manager", "support-specialist"],
-    "platform-moderation": ["tiktok-moderator", "facebook-moderator", "youtube-reviewer", "instagram-safety", "trust-safety"],
-    "ai-training-evaluation": ["search-evaluator", "ads-evaluator", "ai-rater", "content-evaluator", "social-media-evaluator"],
-    "gaming-community": ["gaming-moderator", "player-support", "community-manager", "esports-support"],
-    "creator-economy-support": ["creator-support", "account-manager", "fan-engagement", "content-assistant", "social-media-manager"],
-    "advanced-ai-data": ["prompt-engineering", "ai-training", "machine-learning", "data-annotation", "model-training"],
-    "linguistic-specialist": ["linguistic-annotation", "translation-evaluation", "grammar-analysis", "language-quality"],
-    "technical-moderation": ["trust-safety-specialist", "policy-specialist", "content-reviewer", "safety-analyst"],
-    "advanced-data-labeling": ["3d-labeling", "autonomous-vehicle", "medical-annotation", "technical-annotation"],
-    "freelance-ai-tech": ["ai-consultant", "ml-freelancer", "prompt-engineer", "dataset-specialist"],
-    "microtasks-gig": ["microtasks", "small-tasks", "gig-work", "project-based", "flexible-hours"],
-    "research-testing": ["user-testing", "research-studies", "product-feedback", "usability-testing"],
-    
-    # Additional High-Demand Remote Categories
-    "sales-bizdev": ["sales", "account-executive", "business-development", "lead-generation", "sales-rep"],
-    "product-management": ["product-manager", "product-owner", "roadmap", "agile", "scrum-master"],
-    "ecommerce": ["shopify", "woocommerce", "amazon-va", "store-manager", "ecommerce-support", "dropshipping"],
-    "healthcare-remote": ["telehealth", "medical-transcription", "medical-billing", "healthcare-support", "medical-coding"],
-    "translation-localization": ["translator", "localization", "linguist", "language-specialist", "interpretation"],
-    "research-surveys": ["online-research", "survey-taker", "data-collection", "study-participant", "market-research"]
-}
-
-# Organized Job Categories by Skill Level and Requirements
-ORGANIZED_JOB_CATEGORIES = {
-    
-    # ===== ENTRY LEVEL JOBS (No Experience Required) =====
-    "entry_level": {
-        "description": "Jobs requiring no prior experience - perfect for beginners",
-        "skill_requirements": "Basic computer skills, reliable internet",
-        "emoji": "🟢",
-        "categories": {
-            "basic_customer_support": {
-                "keywords": ["customer-support", "chat-support", "email-support", "helpdesk", "live-chat"],
-                "salary_range": "$12-20/hour",
-                "companies": ["LiveWorld", "ModSquad", "SupportNinja", "Teleperformance", "TTEC"],
-                "requirements": "Good communication, basic computer skills"
-            },
-            "basic_content_moderation": {
-                "keywords": ["content-moderator", "community-moderator", "social-media-moderator", "chat-moderator"],
-                "salary_range": "$13-18/hour", 
-                "companies": ["Majorel", "TaskUs", "Concentrix", "Alorica", "ModSquad"],
-                "requirements": "Attention to detail, cultural awareness"
-            },
-            "basic_data_entry": {
-                "keywords": ["data-entry", "microtasks", "surveys", "basic-annotation", "clickworker"],
-                "salary_range": "$8-15/hour",
-                "companies": ["Clickworker", "Microworkers", "Amazon MTurk", "OneForma"],
-                "requirements": "Basic computer skills, attention to detail"
-            },
-            "basic_virtual_assistant": {
-                "keywords": ["virtual-assistant", "admin-assistant", "scheduling", "email-management"],
-                "salary_range": "$10-18/hour",
-                "companies": ["Fancy Hands", "Time Etc", "Belay Solutions", "CloudTask"],
-                "requirements": "Organization skills, basic office software"
-            }
-        }
-    },
-    
-    # ===== INTERMEDIATE LEVEL JOBS (Some Experience/Skills Required) =====
-    "intermediate_level": {
-        "description": "Jobs requiring some experience or specific skills",
-        "skill_requirements": "1-2 years experience or specific technical skills",
-        "emoji": "🟡",
-        "categories": {
-            "advanced_customer_support": {
-                "keywords": ["technical-support", "customer-success", "account-manager", "support-specialist"],
-                "salary_range": "$18-30/hour",
-                "companies": ["SupportNinja", "Automattic", "GitLab", "Buffer", "Remote.com"],
-                "requirements": "Technical knowledge, problem-solving skills"
-            },
-            "platform_moderation": {
-                "keywords": ["tiktok-moderator", "facebook-moderator", "youtube-reviewer", "instagram-safety", "trust-safety"],
-                "salary_range": "$16-25/hour",
-                "companies": ["ByteDance", "Meta", "Google", "Twitter", "Reddit", "Discord"],
-                "requirements": "Platform knowledge, policy understanding"
-            },
-            "ai_training_evaluation": {
-                "keywords": ["search-evaluator", "ads-evaluator", "ai-rater", "content-evaluator", "social-media-evaluator"],
-                "salary_range": "$14-22/hour",
-                "companies": ["TELUS International", "Appen", "Lionbridge", "OneForma", "iSoftStone"],
-                "requirements": "Analytical skills, cultural knowledge, attention to detail"
-            },
-            "gaming_community": {
-                "keywords": ["gaming-moderator", "player-support", "community-manager", "esports-support"],
-                "salary_range": "$15-25/hour",
-                "companies": ["Roblox", "Epic Games", "Riot Games", "Activision Blizzard", "Twitch"],
-                "requirements": "Gaming knowledge, community management experience"
-            },
-            "creator_economy": {
-                "keywords": ["creator-support", "account-manager", "fan-engagement", "content-assistant", "social-media-manager"],
-                "salary_range": "$15-28/hour",
-                "companies": ["Creator Agencies", "Patreon", "OnlyFans Agencies", "Social Media Agencies"],
-                "requirements": "Social media knowledge, customer service skills"
-            },
-            "sales_business_development": {
-                "keywords": ["sales", "account-executive", "business-development", "lead-generation", "sales-rep"],
-                "salary_range": "$20-35/hour + commission",
-                "companies": ["HubSpot", "Salesforce", "Remote SaaS Companies", "Tech Startups"],
-                "requirements": "Sales experience, communication skills, CRM knowledge"
-            },
-            "product_management": {
-                "keywords": ["product-manager", "product-owner", "roadmap", "agile", "scrum-master"],
-                "salary_range": "$25-45/hour",
-                "companies": ["Tech Companies", "SaaS Platforms", "Remote Startups", "Digital Agencies"],
-                "requirements": "Product experience, agile methodology, stakeholder management"
-            },
-            "ecommerce_management": {
-                "keywords": ["shopify", "woocommerce", "amazon-va", "store-manager", "ecommerce-support", "dropshipping"],
-                "salary_range": "$15-30/hour",
-                "companies": ["Shopify Partners", "Amazon Agencies", "E-commerce Stores", "Digital Marketing Agencies"],
-                "requirements": "E-commerce platform knowledge, digital marketing basics"
-            }
-        }
-    },
-    
-    # ===== SPECIALIZED/EXPERT LEVEL JOBS (Advanced Skills Required) =====
-    "expert_level": {
-        "description": "Jobs requiring specialized skills or advanced experience",
-        "skill_requirements": "Advanced technical skills, specialized knowledge, or 3+ years experience",
-        "emoji": "🔴",
-        "categories": {
-            "advanced_ai_data": {
-                "keywords": ["prompt-engineering", "ai-training", "machine-learning", "data-annotation", "model-training"],
-                "salary_range": "$20-40/hour",
-                "companies": ["Scale AI", "Surge AI", "Outlier AI", "OpenAI Contractors", "Anthropic Contractors"],
-                "requirements": "AI/ML knowledge, programming skills, advanced analytical skills"
-            },
-            "linguistic_specialist": {
-                "keywords": ["linguistic-annotation", "translation-evaluation", "grammar-analysis", "language-quality"],
-                "salary_range": "$18-35/hour",
-                "companies": ["TELUS International", "Lionbridge", "iSoftStone", "Appen"],
-                "requirements": "Advanced language skills, linguistic education, cultural expertise"
-            },
-            "technical_moderation": {
-                "keywords": ["trust-safety-specialist", "policy-specialist", "content-reviewer", "safety-analyst"],
-                "salary_range": "$22-35/hour",
-                "companies": ["Meta", "Google", "Twitter", "TikTok", "Specialized Agencies"],
-                "requirements": "Policy knowledge, analytical skills, technical understanding"
-            },
-            "advanced_data_labeling": {
-                "keywords": ["3d-labeling", "autonomous-vehicle", "medical-annotation", "technical-annotation"],
-                "salary_range": "$20-35/hour",
-                "companies": ["Scale AI", "Remotasks", "Surge AI", "Tech Giants"],
-                "requirements": "Technical expertise, specialized domain knowledge"
-            },
-            "freelance_ai_tech": {
-                "keywords": ["ai-consultant", "ml-freelancer", "prompt-engineer", "dataset-specialist"],
-                "salary_range": "$25-60/hour",
-                "companies": ["Upwork", "Toptal", "Freelancer.com", "Direct Clients"],
-                "requirements": "Advanced technical skills, portfolio, proven experience"
-            },
-            "healthcare_remote": {
-                "keywords": ["telehealth", "medical-transcription", "medical-billing", "healthcare-support", "medical-coding"],
-                "salary_range": "$18-35/hour",
-                "companies": ["Teladoc", "MDLive", "3M Health", "Nuance", "Medical Transcription Companies"],
-                "requirements": "Healthcare knowledge, medical terminology, certification preferred"
-            },
-            "translation_localization": {
-                "keywords": ["translator", "localization", "linguist", "language-specialist", "interpretation"],
-                "salary_range": "$20-40/hour",
-                "companies": ["Lionbridge", "TransPerfect", "SDL", "Gengo", "Rev"],
-                "requirements": "Native language proficiency, translation certification, cultural expertise"
-            }
-        }
-    },
-    
-    # ===== FLEXIBLE/PART-TIME OPPORTUNITIES =====
-    "flexible_opportunities": {
-        "description": "Flexible, part-time, or project-based work",
-        "skill_requirements": "Varies by opportunity",
-        "emoji": "🟣",
-        "categories": {
-            "microtasks_gig": {
-                "keywords": ["microtasks", "small-tasks", "gig-work", "project-based", "flexible-hours"],
-                "salary_range": "$5-20/hour",
-                "companies": ["Clickworker", "Microworkers", "Amazon MTurk", "Remotasks"],
-                "requirements": "Flexible schedule, task-oriented mindset"
-            },
-            "research_testing": {
-                "keywords": ["user-testing", "research-studies", "product-feedback", "usability-testing"],
-                "salary_range": "$10-25/hour",
-                "companies": ["UserTesting", "Prolific", "Respondent.io", "Research Companies"],
-                "requirements": "Analytical thinking, feedback skills"
-            },
-            "research_surveys": {
-                "keywords": ["online-research", "survey-taker", "data-collection", "study-participant", "market-research"],
-                "salary_range": "$8-18/hour",
-                "companies": ["Swagbucks", "Survey Junkie", "Prolific", "UserInterviews", "Research Companies"],
-                "requirements": "Attention to detail, reliable internet, patience"
-            }
-        }
-    }
+# Names still importable from here, loaded from their module on first access
+LAZY_ATTRIBUTES = {
+    "CATEGORIES": "job_categories",
+    "ORGANIZED_JOB_CATEGORIES": "job_categories",
+    "FALLBACK_CATEGORY_RULES": "job_categories",
+    "GENERAL_CATEGORIZATION": "job_categories",
+    "JobCategorizer": "job_categories",
+    "get_kenya_friendly_jobs": "kenya_jobs",
 }
 
+def __getattr__(name):
+    module = LAZY_ATTRIBUTES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
 
+# How jobs are delivered: "digest" packs several jobs into each message (up to
+# Telegram's 4096-character limit), "individual" sends one message per job
+DELIVERY_MODE = os.getenv("SCOUT_DELIVERY_MODE", "digest").strip().lower()
+MAX_INDIVIDUAL_JOBS = 25  # Limit to avoid spam
+MAX_DIGEST_JOBS = int(os.getenv("SCOUT_DIGEST_MAX_JOBS", "200"))
 
-class JobCategorizer:
-    """Handles job categorization by skill level and requirements"""
-    
-    def __init__(self):
-        self.organized_categories = ORGANIZED_JOB_CATEGORIES
-        
-    def categorize_job(self, job):
-        """Categorize a job based on its title and keywords"""
-        job_title = job.get("title", "").lower()
-        job_company = job.get("company", "").lower()
-        
-        # Create a combined text for matching
-        job_text = f"{job_title} {job_company}".lower()
-        
-        for level_name, level_data in self.organized_categories.items():
-            for category_name, category_data in level_data["categories"].items():
-                category_keywords = category_data["keywords"]
-                
-                # Check if any category keywords match the job text
-                for keyword in category_keywords:
-                    keyword_parts = keyword.lower().split("-")
-                    # Check if all parts of the keyword are in the job text
-                    if all(part in job_text for part in keyword_parts):
-                        return {
-                            "level": level_name,
-                            "category": category_name,
-                            "category_data": category_data,
-                            "level_description": level_data["description"],
-                            "skill_requirements": level_data["skill_requirements"],
-                            "emoji": level_data["emoji"]
-                        }
-        
-        # Try simpler matching for common job types
-        if any(word in job_text for word in ["support", "customer", "help"]):
-            return {
-                "level": "entry_level",
-                "category": "basic_customer_support",
-                "category_data": self.organized_categories["entry_level"]["categories"]["basic_customer_support"],
-                "level_description": self.organized_categories["entry_level"]["description"],
-                "skill_requirements": self.organized_categories["entry_level"]["skill_requirements"],
-                "emoji": "🟢"
-            }
-        elif any(word in job_text for word in ["moderator", "moderation", "content"]):
-            return {
-                "level": "entry_level",
-                "category": "basic_content_moderation",
-                "category_data": self.organized_categories["entry_level"]["categories"]["basic_content_moderation"],
-                "level_description": self.organized_categories["entry_level"]["description"],
-                "skill_requirements": self.organized_categories["entry_level"]["skill_requirements"],
-                "emoji": "🟢"
-            }
-        elif any(word in job_text for word in ["data", "entry", "microtask"]):
-            return {
-                "level": "entry_level",
-                "category": "basic_data_entry",
-                "category_data": self.organized_categories["entry_level"]["categories"]["basic_data_entry"],
-                "level_description": self.organized_categories["entry_level"]["description"],
-                "skill_requirements": self.organized_categories["entry_level"]["skill_requirements"],
-                "emoji": "🟢"
-            }
-        elif any(word in job_text for word in ["technical", "specialist", "engineer"]):
-            return {
-                "level": "intermediate_level",
-                "category": "advanced_customer_support",
-                "category_data": self.organized_categories["intermediate_level"]["categories"]["advanced_customer_support"],
-                "level_description": self.organized_categories["intermediate_level"]["description"],
-                "skill_requirements": self.organized_categories["intermediate_level"]["skill_requirements"],
-                "emoji": "🟡"
-            }
-        elif any(word in job_text for word in ["ai", "prompt", "machine", "learning"]):
-            return {
-                "level": "expert_level",
-                "category": "advanced_ai_data",
-                "category_data": self.organized_categories["expert_level"]["categories"]["advanced_ai_data"],
-                "level_description": self.organized_categories["expert_level"]["description"],
-                "skill_requirements": self.organized_categories["expert_level"]["skill_requirements"],
-                "emoji": "🔴"
-            }
-        elif any(word in job_text for word in ["tiktok", "facebook", "youtube", "platform"]):
-            return {
-                "level": "intermediate_level",
-                "category": "platform_moderation",
-                "category_data": self.organized_categories["intermediate_level"]["categories"]["platform_moderation"],
-                "level_description": self.organized_categories["intermediate_level"]["description"],
-                "skill_requirements": self.organized_categories["intermediate_level"]["skill_requirements"],
-                "emoji": "🟡"
-            }
-        elif any(word in job_text for word in ["sales", "business", "account", "executive"]):
-            return {
-                "level": "intermediate_level",
-                "category": "sales_business_development",
-                "category_data": self.organized_categories["intermediate_level"]["categories"]["sales_business_development"],
-                "level_description": self.organized_categories["intermediate_level"]["description"],
-                "skill_requirements": self.organized_categories["intermediate_level"]["skill_requirements"],
-                "emoji": "🟡"
-            }
-        elif any(word in job_text for word in ["product", "manager", "owner", "roadmap"]):
-            return {
-                "level": "intermediate_level",
-                "category": "product_management",
-                "category_data": self.organized_categories["intermediate_level"]["categories"]["product_management"],
-                "level_description": self.organized_categories["intermediate_level"]["description"],
-                "skill_requirements": self.organized_categories["intermediate_level"]["skill_requirements"],
-                "emoji": "🟡"
-            }
-        elif any(word in job_text for word in ["shopify", "ecommerce", "amazon", "store"]):
-            return {
-                "level": "intermediate_level",
-                "category": "ecommerce_management",
-                "category_data": self.organized_categories["intermediate_level"]["categories"]["ecommerce_management"],
-                "level_description": self.organized_categories["intermediate_level"]["description"],
-                "skill_requirements": self.organized_categories["intermediate_level"]["skill_requirements"],
-                "emoji": "🟡"
-            }
-        elif any(word in job_text for word in ["medical", "healthcare", "telehealth", "transcription"]):
-            return {
-                "level": "expert_level",
-                "category": "healthcare_remote",
-                "category_data": self.organized_categories["expert_level"]["categories"]["healthcare_remote"],
-                "level_description": self.organized_categories["expert_level"]["description"],
-                "skill_requirements": self.organized_categories["expert_level"]["skill_requirements"],
-                "emoji": "🔴"
-            }
-        elif any(word in job_text for word in ["translator", "translation", "linguist", "localization"]):
-            return {
-                "level": "expert_level",
-                "category": "translation_localization",
-                "category_data": self.organized_categories["expert_level"]["categories"]["translation_localization"],
-                "level_description": self.organized_categories["expert_level"]["description"],
-                "skill_requirements": self.organized_categories["expert_level"]["skill_requirements"],
-                "emoji": "🔴"
-            }
-        elif any(word in job_text for word in ["survey", "research", "study", "participant"]):
-            return {
-                "level": "flexible_opportunities",
-                "category": "research_surveys",
-                "category_data": self.organized_categories["flexible_opportunities"]["categories"]["research_surveys"],
-                "level_description": self.organized_categories["flexible_opportunities"]["description"],
-                "skill_requirements": self.organized_categories["flexible_opportunities"]["skill_requirements"],
-                "emoji": "🟣"
-            }
-        
-        # Default to entry level if no match found
-        return {
-            "level": "entry_level",
-            "category": "general",
-            "category_data": {"salary_range": "Competitive", "requirements": "Basic skills"},
-            "level_description": "General opportunities",
-            "skill_requirements": "Basic computer skills",
-            "emoji": "🟢"
-        }
-    
-    def organize_jobs_by_category(self, jobs):
-        """Organize jobs into categories by skill level"""
-        organized_jobs = {
-            "entry_level": [],
-            "intermediate_level": [],
-            "expert_level": [],
-            "flexible_opportunities": []
-        }
-        
-        for job in jobs:
-            categorization = self.categorize_job(job)
-            job["categorization"] = categorization
-            organized_jobs[categorization["level"]].append(job)
-        
-        return organized_jobs
-    
-    def format_organized_job_summary(self, organized_jobs):
-        """Format organized jobs for Telegram notification"""
-        message = f"🎯 **Daily Job Report - {datetime.now().strftime('%Y-%m-%d')}**\n\n"
-        
-        level_names = {
-            "entry_level": "Entry Level (No Experience Required)",
-            "intermediate_level": "Intermediate Level (Some Experience/Skills)",
-            "expert_level": "Expert Level (Advanced Skills)",
-            "flexible_opportunities": "Flexible Opportunities (Part-time/Project-based)"
-        }
-        
-        total_jobs = 0
-        
-        for level, jobs in organized_jobs.items():
-            if jobs:
-                level_data = self.organized_categories[level]
-                emoji = level_data["emoji"]
-                level_name = level_names.get(level, level.replace("_", " ").title())
-                
-                message += f"{emoji} **{level_name}**\n"
-                message += f"📊 {len(jobs)} opportunities found\n\n"
-                
-                # Group jobs by category within each level
-                categories = {}
-                for job in jobs:
-                    cat = job["categorization"]["category"]
-                    if cat not in categories:
-                        categories[cat] = []
-                    categories[cat].append(job)
-                
-                for category, category_jobs in categories.items():
-                    if category_jobs and len(category_jobs) > 0:
-                        cat_data = category_jobs[0]["categorization"]["category_data"]
-                        message += f"💼 **{category.replace('_', ' ').title()}** ({len(category_jobs)} jobs)\n"
-                        message += f"💰 Salary: {cat_data.get('salary_range', 'Competitive')}\n"
-                        message += f"📋 Requirements: {cat_data.get('requirements', 'Basic skills')}\n"
-                        
-                        # Show first 3 jobs in each category
-                        for i, job in enumerate(category_jobs[:3]):
-                            message += f"• {job['title']} - {job['company']} ({job.get('salary', 'Competitive')})\n"
-                        
-                        if len(category_jobs) > 3:
-                            message += f"  ... and {len(category_jobs) - 3} more jobs\n"
-                        
-                        message += "\n"
-                
-                total_jobs += len(jobs)
-                message += "─" * 40 + "\n\n"
-        
-        message += f"📈 **Total Jobs Found: {total_jobs}**\n"
-        message += f"🌍 All jobs are remote and worldwide accessible\n"
-        message += f"⏰ Updated: {datetime.now().strftime('%H:%M UTC')}"
-        
-        return message
+# Categories that also get curated Amazon opportunities
+AMAZON_KEYWORDS = ["developer", "python", "javascript", "data", "software"]
 
 class JobScout:
     def __init__(self):
         self.total_jobs = 0
         self.sources = []
         self.jobs_found = []
-        self.categorizer = JobCategorizer()
+        self._categorizer = None  # Built on first use (see categorizer)
         self.source_stats = {}  # Track performance of each source
+        self.health = SourceHealth()  # Per-source circuit breakers, kept across runs
+        self.budgets = LatencyBudgets()  # Per-source timeouts and hedging learned from past runs
+        self.metrics = RunMetrics()  # Per-source timings and job counts, exported after the run
+        self.snapshots = SourceSnapshots(self.health, self.budgets, self.metrics)  # Boards downloaded once per run
+        self.seen_jobs = SeenJobs()  # Jobs sent on earlier runs
+        self.source_hashes = SourceHashes()  # Source outputs already delivered (incremental mode)
+        self.job_store = JobStore()  # Every job found, queryable after the run
+        self.catalog = get_catalog()  # Curated static jobs, loaded once per process
+        self.registry = SOURCES  # Every @job_source method and plugin source
+        self.source_results = ResultCache()  # Source results reused across runs (see refresh)
+        self.ats = AtsBoards()  # Company ATS boards (ats_companies.json), streamed page by page
+    
+    @property
+    def categorizer(self):
+        """The JobCategorizer, compiled the first time a job is categorized"""
+        if self._categorizer is None:
+            from job_categories import JobCategorizer
+            self._categorizer = JobCategorizer()
+        return self._categorizer
+    
+    def reset_run(self, incremental=None):
+        """
+        Clear the previous run's results so this scout can run again (the
+        scheduler daemon reuses one warm instance). `incremental` overrides
+        SCOUT_INCREMENTAL for the next run.
+        """
+        self.total_jobs = 0
+        self.sources = []
+        self.jobs_found = []
+        self.source_stats = {}
+        enabled = INCREMENTAL_ENABLED if incremental is None else incremental
+        self.source_hashes.enabled = enabled and self.source_hashes.ttl_days > 0
+        self.ats.incremental = enabled
     
     def fetch_with_error_handling(self, fetch_function, source_name, *args, **kwargs):
         """Enhanced error handling wrapper for all fetch functions"""
+        from requests import RequestException
         try:
             jobs = fetch_function(*args, **kwargs)
             job_count = len(jobs) if jobs else 0
@@ -491,60 +117,44 @@ class JobScout:
     
     def _get_fallback_jobs(self, source_name):
         """Provide fallback jobs when a source fails"""
-        fallback_jobs = {
-            "Adult Platform Jobs": [
-                {
-                    "title": "Chat Moderator - Creator Platform",
-                    "company": "Creator Support Agency",
-                    "location": "Remote - Worldwide",
-                    "url": "https://www.patreon.com/careers",
-                    "source": "Creator Economy (Fallback)",
-                    "salary": "$15-25/hour"
-                }
-            ],
-            "Social Media Platform Jobs": [
-                {
-                    "title": "Content Moderator",
-                    "company": "Social Media Agency",
-                    "location": "Remote - Global",
-                    "url": "https://example-social.com/careers",
-                    "source": "Social Media (Fallback)",
-                    "salary": "$16-22/hour"
-                }
-            ],
-            "AI Training Jobs": [
-                {
-                    "title": "Search Quality Evaluator",
-                    "company": "AI Training Company",
-                    "location": "Remote - Worldwide",
-                    "url": "https://example-ai.com/careers",
-                    "source": "AI Training (Fallback)",
-                    "salary": "$14-20/hour"
-                }
-            ]
-        }
-        
-        return fallback_jobs.get(source_name, [])
+        from fallback_jobs import FALLBACK_JOBS
+        return FALLBACK_JOBS.get(source_name, [])
     
-    def fetch_with_comprehensive_error_handling(self, fetch_function, source_name, *args, **kwargs):
+    def fetch_with_comprehensive_error_handling(self, fetch_function, source_name, *args, network=True, **kwargs):
         """
-        Comprehensive error handling with retry logic and fallbacks
+        Comprehensive error handling with retry logic and fallbacks. Only
+        `network` sources go through their circuit breaker.
         """
         import time
         import random
+        from requests import RequestException
         
         max_retries = 3
         base_delay = 1  # Base delay in seconds
         
+        # Sources that failed run after run are skipped until their cool-down ends
+        if network and not self.health.allow(source_name):
+            print(f"⏸️ Skipping {source_name}: failing repeatedly, circuit open")
+            self.source_stats[source_name] = {"status": "circuit_open", "jobs": 0, "attempts": 0}
+            return self._get_comprehensive_fallback_jobs(source_name)
+        
         for attempt in range(max_retries):
+            if attempt > 0 and network and self.health.state(source_name) == OPEN:
+                # Other categories' calls gave up on it meanwhile; don't sleep on retries
+                print(f"⏸️ Not retrying {source_name}: circuit opened")
+                self.source_stats[source_name] = {"status": "circuit_open", "jobs": 0, "attempts": attempt}
+                return self._get_comprehensive_fallback_jobs(source_name)
+            
             try:
                 # Add jitter to prevent thundering herd
                 if attempt > 0:
                     delay = base_delay * (2 ** (attempt - 1)) + random.uniform(0, 1)
                     print(f"🔄 Retrying {source_name} in {delay:.1f}s (attempt {attempt + 1}/{max_retries})")
                     time.sleep(delay)
+                    self.metrics.record_retry(delay, source_name)
                 
                 # Call the fetch function
+                started = time.monotonic()
                 jobs = fetch_function(*args, **kwargs)
                 
                 # Validate results
@@ -565,14 +175,35 @@ class JobScout:
                     "jobs": len(jobs), 
                     "attempts": attempt + 1
                 }
+                if network:
+                    self.health.record_success(source_name, time.monotonic() - started)
                 return jobs
                 
+            except SnapshotError as e:
+                # Its board already failed to download this run: a retry would only re-raise that
+                network_error = isinstance(e.error, RequestException)
+                error_msg = f"{'Network' if network_error else 'Unexpected'} error: {e}"
+                print(f"[ERROR] {source_name} attempt {attempt + 1}: {error_msg} (board failed this run, not retrying)")
+                if network:
+                    self.health.record_failure(source_name, error_msg)
+                self.metrics.record_failure(source_name)
+                self.source_stats[source_name] = {
+                    "status": "network_error" if network_error else "function_error",
+                    "jobs": 0,
+                    "attempts": attempt + 1,
+                    "error": error_msg
+                }
+                return self._get_comprehensive_fallback_jobs(source_name)
+                
             except RequestException as e:
                 error_msg = f"Network error: {str(e)}"
                 print(f"[ERROR] {source_name} attempt {attempt + 1}: {error_msg}")
                 
                 if attempt == max_retries - 1:  # Last attempt
                     print(f"🚨 {source_name} failed after {max_retries} attempts")
+                    if network:
+                        self.health.record_failure(source_name, error_msg)
+                    self.metrics.record_failure(source_name)
                     self.source_stats[source_name] = {
                         "status": "network_error", 
                         "jobs": 0, 
@@ -587,6 +218,9 @@ class JobScout:
                 
                 if attempt == max_retries - 1:  # Last attempt
                     print(f"🚨 {source_name} failed after {max_retries} attempts")
+                    if network:
+                        self.health.record_failure(source_name, error_msg)
+                    self.metrics.record_failure(source_name)
                     self.source_stats[source_name] = {
                         "status": "function_error", 
                         "jobs": 0, 
@@ -602,123 +236,10 @@ class JobScout:
         """
         Comprehensive fallback job provider with high-quality curated jobs
         """
-        comprehensive_fallbacks = {
-            # Core API fallbacks
-            "Remotive API": [
-                {
-                    "title": "Remote Software Developer",
-                    "company": "Tech Startup",
-                    "location": "Remote - Worldwide",
-                    "url": "https://remotive.io/remote-jobs",
-                    "source": "Remotive (Fallback)",
-                    "salary": "$50-80k/year"
-                },
-                {
-                    "title": "Customer Support Representative",
-                    "company": "Remote Company",
-                    "location": "Remote - Global",
-                    "url": "https://remotive.io/remote-jobs",
-                    "source": "Remotive (Fallback)",
-                    "salary": "$35-45k/year"
-                }
-            ],
-            
-            # Company-specific fallbacks
-            "Zapier": [
-                {
-                    "title": "Customer Success Specialist",
-                    "company": "Zapier",
-                    "location": "Remote - Worldwide",
-                    "url": "https://zapier.com/jobs",
-                    "source": "Zapier (Fallback)",
-                    "salary": "$60-80k/year"
-                }
-            ],
-            
-            "Deel": [
-                {
-                    "title": "Customer Support Agent",
-                    "company": "Deel",
-                    "location": "Remote - Global",
-                    "url": "https://deel.com/careers",
-                    "source": "Deel (Fallback)",
-                    "salary": "$40-55k/year"
-                }
-            ],
-            
-            # Platform-specific fallbacks
-            "Social Media Platform Jobs": [
-                {
-                    "title": "Content Moderator",
-                    "company": "ModSquad",
-                    "location": "Remote - Worldwide",
-                    "url": "https://modsquad.com/careers",
-                    "source": "Social Media (Fallback)",
-                    "salary": "$16-22/hour"
-                },
-                {
-                    "title": "Community Manager",
-                    "company": "LiveWorld",
-                    "location": "Remote - Global",
-                    "url": "https://liveworld.com/careers",
-                    "source": "Social Media (Fallback)",
-                    "salary": "$18-25/hour"
-                }
-            ],
-            
-            "Creator Economy Jobs": [
-                {
-                    "title": "Creator Support Specialist",
-                    "company": "Creator Agency",
-                    "location": "Remote - Worldwide",
-                    "url": "https://example-creator.com/careers",
-                    "source": "Creator Economy (Fallback)",
-                    "salary": "$20-30/hour"
-                }
-            ],
-            
-            "Gaming Platform Jobs": [
-                {
-                    "title": "Community Moderator",
-                    "company": "Gaming Company",
-                    "location": "Remote - Global",
-                    "url": "https://example-gaming.com/careers",
-                    "source": "Gaming (Fallback)",
-                    "salary": "$18-28/hour"
-                }
-            ],
-            
-            # Generic fallbacks for any source
-            "default": [
-                {
-                    "title": "Remote Customer Support",
-                    "company": "Global Remote Company",
-                    "location": "Remote - Worldwide",
-                    "url": "https://remote-jobs.com",
-                    "source": "Fallback Jobs",
-                    "salary": "$15-25/hour"
-                },
-                {
-                    "title": "Virtual Assistant",
-                    "company": "Remote VA Agency",
-                    "location": "Remote - Global",
-                    "url": "https://remote-va.com",
-                    "source": "Fallback Jobs",
-                    "salary": "$12-20/hour"
-                },
-                {
-                    "title": "Data Entry Specialist",
-                    "company": "Remote Data Company",
-                    "location": "Remote - Worldwide",
-                    "url": "https://remote-data.com",
-                    "source": "Fallback Jobs",
-                    "salary": "$10-18/hour"
-                }
-            ]
-        }
+        from fallback_jobs import COMPREHENSIVE_FALLBACK_JOBS
         
         # Try to find specific fallback, otherwise use default
-        fallback_jobs = comprehensive_fallbacks.get(source_name, comprehensive_fallbacks["default"])
+        fallback_jobs = COMPREHENSIVE_FALLBACK_JOBS.get(source_name, COMPREHENSIVE_FALLBACK_JOBS["default"])
         
         print(f"🔄 Using {len(fallback_jobs)} fallback jobs for {source_name}")
         return fallback_jobs
@@ -727,128 +248,79 @@ class JobScout:
         """
         Fetch worldwide remote jobs from Remotive API with improved error handling
         """
+        from requests import RequestException
         try:
             url = f"https://remotive.com/api/remote-jobs?category={category}"
+            data = self.snapshots.get(url, lambda: self._download_remotive(url), source=endpoint_name(url))
+            jobs = data.get("jobs", [])
             
-            # Try with shorter timeout first, then fallback
-            for timeout_val in [8, 15]:
+            # Filter for worldwide remote jobs
+            worldwide_jobs = []
+            cutoff_date = datetime.now() - timedelta(days=7)
+            
+            for job in jobs[:15]:  # Check more jobs
                 try:
-                    response = get(url, timeout=timeout_val)
-                    response.raise_for_status()
-                    data = response.json()
-                    jobs = data.get("jobs", [])
-                    
-                    # Filter for worldwide remote jobs
-                    worldwide_jobs = []
-                    cutoff_date = datetime.now() - timedelta(days=7)
-                    
-                    for job in jobs[:15]:  # Check more jobs
-                        try:
-                            pub_date = datetime.strptime(job.get("publication_date", "")[:10], "%Y-%m-%d")
-                            location = job.get("candidate_required_location", "").lower()
-                            
-                            # Filter for worldwide/global remote jobs
-                            if (pub_date >= cutoff_date and 
-                                ("worldwide" in location or "global" in location or 
-                                 "anywhere" in location or location == "" or
-                                 "remote" in location)):
-                                
-                                worldwide_jobs.append({
-                                    "title": job.get("title", "N/A"),
-                                    "company": job.get("company_name", "N/A"),
-                                    "location": "Remote Worldwide",
-                                    "url": job.get("url", ""),
-                                    "source": "Remotive",
-                                    "salary": job.get("salary", "Competitive")
-                                })
-                        except:
-                            continue
-                    
-                    return worldwide_jobs
-                    
-                except RequestException as e:
-                    if timeout_val == 15:  # Last attempt failed
-                        print(f"[ERROR] Remotive API timeout for {category}: {e}")
-                        # Return fallback jobs for this category
-                        return self._get_remotive_fallback_jobs(category)
-                    continue  # Try with longer timeout
+                    pub_date = datetime.strptime(job.get("publication_date", "")[:10], "%Y-%m-%d")
+                    location = job.get("candidate_required_location", "").lower()
                     
+                    # Filter for worldwide/global remote jobs
+                    if (pub_date >= cutoff_date and 
+                        ("worldwide" in location or "global" in location or 
+                         "anywhere" in location or location == "" or
+                         "remote" in location)):
+                        
+                        worldwide_jobs.append({
+                            "title": job.get("title", "N/A"),
+                            "company": job.get("company_name", "N/A"),
+                            "location": "Remote Worldwide",
+                            "url": job.get("url", ""),
+                            "source": "Remotive",
+                            "salary": job.get("salary", "Competitive")
+                        })
+                except:
+                    continue
+            
+            return worldwide_jobs
+            
+        except RequestException as e:
+            print(f"[ERROR] Remotive API timeout for {category}: {e}")
+            # Return fallback jobs for this category
+            return self._get_remotive_fallback_jobs(category)
         except Exception as e:
             print(f"[ERROR] Remotive API error for {category}: {e}")
             return self._get_remotive_fallback_jobs(category)
     
+    def _download_remotive(self, url):
+        """Download a Remotive board (revalidated against the disk cache)"""
+        response = self.snapshots.fetch(url, lambda budget: cached_get(url, timeout=budget))
+        response.raise_for_status()
+        return self.snapshots.parse_json(response)
+    
     def _get_remotive_fallback_jobs(self, category):
         """Provide fallback jobs when Remotive API fails"""
-        fallback_jobs = [
-            {
-                "title": f"Remote {category.title()} Specialist",
-                "company": "Global Remote Company",
-                "location": "Remote - Worldwide",
-                "url": "https://remoteok.io/",
-                "source": "Remotive (Fallback)",
-                "salary": "$20-35/hour"
-            },
-            {
-                "title": f"{category.title()} Professional - Remote",
-                "company": "International Tech Firm",
-                "location": "Remote - Global",
-                "url": "https://weworkremotely.com/",
-                "source": "Remotive (Fallback)",
-                "salary": "$25-40/hour"
-            }
-        ]
-        return fallback_jobs
-    
-    def fetch_reliable_jobs(self, keywords):
-        """
-        Fetch jobs from reliable static sources
-        """
-        jobs = []
-        
-        # Tech jobs
-        if any(word in keywords for word in ["developer", "python", "javascript", "mobile", "data"]):
-            jobs.extend([
-                {
-                    "title": f"Remote {keywords[0].title()} Developer",
-                    "company": "Global Tech Co",
-                    "location": "Remote - Worldwide",
-                    "url": "https://weworkremotely.com/categories/remote-programming-jobs",
-                    "source": "WeWorkRemotely",
-                    "salary": "$40-80k/year"
-                },
-                {
-                    "title": f"{keywords[0].title()} Engineer",
-                    "company": "Remote First Inc",
-                    "location": "Remote - Global",
-                    "url": "https://remoteok.io/remote-dev-jobs",
-                    "source": "RemoteOK",
-                    "salary": "$35-70k/year"
-                }
-            ])
-        
-        return jobs
+        from fallback_jobs import remotive_fallback_jobs
+        return remotive_fallback_jobs(category)
     
+    @job_source(kind=NETWORK, host="wellfound.com", cost=3, enabled=False)
     def fetch_wellfound_jobs(self, keywords):
         """
         Fetch jobs from Wellfound (AngelList) - Global remote jobs
         """
         try:
-            # Wellfound has good global remote opportunities
+            # Wellfound has good global remote opportunities; download the
+            # remote board once and filter by keywords locally
             url = "https://wellfound.com/api/startups/jobs"
-            params = {
-                "remote": "true",
-                "keywords": " ".join(keywords[:2]),
-                "limit": "10"
-            }
-            
-            headers = {"User-Agent": "Mozilla/5.0 (compatible; Agent21Scout/1.0)"}
-            response = get(url, params=params, headers=headers, timeout=15)
+            params = {"remote": "true", "limit": "100"}
             
-            if response.status_code == 200:
-                data = response.json()
+            data = self.snapshots.get_json(url, params=params)
+            if data is not None:
                 jobs = []
+                matching = [
+                    job for job in data.get("jobs", [])
+                    if any(keyword.lower() in job.get("title", "").lower() for keyword in keywords[:2])
+                ]
                 
-                for job in data.get("jobs", [])[:3]:
+                for job in matching[:3]:
                     jobs.append({
                         "title": job.get("title", "N/A"),
                         "company": job.get("startup", {}).get("name", "N/A"),
@@ -863,6 +335,7 @@ class JobScout:
             print(f"[WARNING] Wellfound API error: {e}")
         return []
     
+    @job_source(kind=NETWORK, host="www.nowhiteboard.org", cost=3, enabled=False)
     def fetch_nowhiteboard_jobs(self, keywords):
         """
         Fetch from NoWhiteboard.org - Remote-friendly tech jobs
@@ -871,9 +344,8 @@ class JobScout:
             url = "https://www.nowhiteboard.org/api/jobs"
             params = {"remote": "true", "limit": "5"}
             
-            response = get(url, params=params, timeout=15)
-            if response.status_code == 200:
-                jobs_data = response.json()
+            jobs_data = self.snapshots.get_json(url, params=params)
+            if jobs_data is not None:
                 jobs = []
                 
                 for job in jobs_data.get("jobs", [])[:3]:
@@ -892,6 +364,7 @@ class JobScout:
             print(f"[WARNING] NoWhiteboard API error: {e}")
         return []
     
+    @job_source(kind=NETWORK, host="www.workingnomads.co", cost=3, enabled=False)
     def fetch_workingnomads_jobs(self, keywords):
         """
         Fetch from WorkingNomads - Global remote jobs
@@ -899,9 +372,8 @@ class JobScout:
         try:
             url = "https://www.workingnomads.co/api/exposed_jobs"
             
-            response = get(url, timeout=15)
-            if response.status_code == 200:
-                jobs_data = response.json()
+            jobs_data = self.snapshots.get_json(url)
+            if jobs_data is not None:
                 jobs = []
                 
                 for job in jobs_data[:5]:
@@ -921,44 +393,13 @@ class JobScout:
             print(f"[WARNING] WorkingNomads API error: {e}")
         return []
     
+    @job_source(name="Amazon Jobs", keywords=AMAZON_KEYWORDS)
     def fetch_amazon_jobs(self, keywords):
         """
         Fetch Amazon-related remote jobs from multiple sources (since direct API is blocked)
         """
-        jobs = []
-        
         # Since Amazon's direct API is blocked, provide curated Amazon opportunities
-        if any(word in keywords for word in ["developer", "python", "javascript", "software"]):
-            jobs.extend([
-                {
-                    "title": "Software Development Engineer (Remote)",
-                    "company": "Amazon",
-                    "location": "Remote - Worldwide",
-                    "url": "https://www.amazon.jobs/en/search?base_query=software+engineer&loc_query=virtual",
-                    "source": "Amazon Jobs",
-                    "salary": "$80-150k/year"
-                },
-                {
-                    "title": "Frontend Developer (AWS)",
-                    "company": "Amazon Web Services",
-                    "location": "Remote - Global",
-                    "url": "https://www.amazon.jobs/en/teams/aws",
-                    "source": "Amazon AWS",
-                    "salary": "$70-130k/year"
-                }
-            ])
-        
-        if any(word in keywords for word in ["data", "analytics", "machine-learning"]):
-            jobs.extend([
-                {
-                    "title": "Data Engineer (Remote)",
-                    "company": "Amazon",
-                    "location": "Remote - Worldwide",
-                    "url": "https://www.amazon.jobs/en/search?base_query=data+engineer&loc_query=virtual",
-                    "source": "Amazon Jobs",
-                    "salary": "$90-160k/year"
-                }
-            ])
+        jobs = self.catalog.jobs_for("amazon_jobs", keywords)
         
         # Try alternative approach with different endpoint
         try:
@@ -991,2492 +432,228 @@ class JobScout:
         """
         Fetch AWS and Amazon-related remote opportunities from multiple sources
         """
-        jobs = [
-            {
-                "title": "AWS Cloud Support Engineer",
-                "company": "Amazon Web Services",
-                "location": "Remote - Worldwide",
-                "url": "https://www.amazon.jobs/en/teams/aws",
-                "source": "Amazon AWS",
-                "salary": "$50-90k/year"
-            },
-            {
-                "title": "AWS Solutions Architect (Remote)",
-                "company": "Amazon Web Services",
-                "location": "Remote - Global",
-                "url": "https://www.amazon.jobs/en/search?base_query=solutions+architect&loc_query=virtual",
-                "source": "Amazon AWS",
-                "salary": "$100-180k/year"
-            },
-            {
-                "title": "Amazon Seller Support Specialist",
-                "company": "Amazon",
-                "location": "Remote - Worldwide",
-                "url": "https://www.amazon.jobs/en/search?base_query=seller+support&loc_query=virtual",
-                "source": "Amazon Jobs",
-                "salary": "$35-55k/year"
-            }
-        ]
-        
-        return jobs
-    
-    def fetch_static_jobs(self, keywords):
-        """
-        Fetch from static job sources that don't require API calls
-        """
-        jobs = []
-        
-        # IT Support jobs
-        if any(word in keywords for word in ["support", "helpdesk", "it", "technical"]):
-            jobs.extend([
-                {
-                    "title": "Technical Support Specialist",
-                    "company": "SupportNinja",
-                    "location": "Remote - Worldwide",
-                    "url": "https://supportninja.com/careers/",
-                    "source": "SupportNinja",
-                    "salary": "$15-30/hour"
-                },
-                {
-                    "title": "IT Helpdesk Remote",
-                    "company": "LiveWorld",
-                    "location": "Remote - Global",
-                    "url": "https://www.liveworld.com/careers/",
-                    "source": "LiveWorld",
-                    "salary": "$18-35/hour"
-                }
-            ])
-        
-        # Virtual Assistant jobs
-        if any(word in keywords for word in ["assistant", "admin", "virtual"]):
-            jobs.extend([
-                {
-                    "title": "Virtual Assistant",
-                    "company": "Fancy Hands",
-                    "location": "Remote - Any Country",
-                    "url": "https://www.fancyhands.com/jobs",
-                    "source": "Fancy Hands",
-                    "salary": "$12-20/hour"
-                }
-            ])
-        
-        # Content Writing jobs
-        if any(word in keywords for word in ["writer", "content", "copywriter"]):
-            jobs.extend([
-                {
-                    "title": "Content Writer",
-                    "company": "Scripted",
-                    "location": "Remote - Worldwide",
-                    "url": "https://scripted.com/writers",
-                    "source": "Scripted",
-                    "salary": "$15-40/hour"
-                }
-            ])
-        
-        return jobs
-    
-    def fetch_flexjobs_api(self, keywords):
-        """
-        Fetch jobs from FlexJobs-style API for IT support and VA roles
-        """
-        try:
-            # Simulated FlexJobs data for IT support and VA roles
-            jobs = []
-            
-            if any(word in keywords for word in ["support", "helpdesk", "it", "technical"]):
-                jobs.extend([
-                    {
-                        "title": "Remote IT Support Specialist",
-                        "company": "TechSupport Global",
-                        "location": "Remote - Worldwide",
-                        "url": "https://www.flexjobs.com/jobs/computer-it",
-                        "source": "FlexJobs",
-                        "salary": "$18-35/hour"
-                    }
-                ])
-            
-            if any(word in keywords for word in ["assistant", "admin", "virtual"]):
-                jobs.extend([
-                    {
-                        "title": "Virtual Executive Assistant",
-                        "company": "Remote Assistants Inc",
-                        "location": "Remote - Global",
-                        "url": "https://www.flexjobs.com/jobs/administrative",
-                        "source": "FlexJobs",
-                        "salary": "$15-28/hour"
-                    }
-                ])
-            
-            return jobs
-        except Exception as e:
-            print(f"[WARNING] FlexJobs API error: {e}")
-        return []
+        return self.catalog.jobs_for("amazon_aws_jobs")
     
     def fetch_gitlab_jobs(self, keywords):
         """
-        Fetch remote jobs from GitLab (all-remote company)
+        Fetch remote jobs from GitLab (all-remote company) from its
+        Greenhouse board (an ats_companies.json entry)
         """
         try:
-            # GitLab Jobs API
-            url = "https://boards-api.greenhouse.io/v1/boards/gitlab/jobs"
-            headers = {"User-Agent": "Mozilla/5.0 (compatible; Agent21Scout/1.0)"}
-            
-            response = get(url, headers=headers, timeout=15)
-            if response.status_code == 200:
-                data = response.json()
-                jobs = []
-                
-                for job in data.get("jobs", [])[:4]:
-                    # GitLab is fully remote, so all jobs are remote-friendly
-                    title = job.get("title", "")
-                    if any(keyword.lower() in title.lower() for keyword in keywords):
-                        jobs.append({
-                            "title": title,
-                            "company": "GitLab",
-                            "location": "Remote - Worldwide",
-                            "url": f"https://about.gitlab.com/jobs/apply/{job.get('id', '')}",
-                            "source": "GitLab",
-                            "salary": "Competitive"
-                        })
-                
-                return jobs
+            return self.ats.jobs_for("GitLab", keywords, self.snapshots)
         except Exception as e:
             print(f"[WARNING] GitLab API error: {e}")
         return []
     
+    @job_source(label="Automattic")
     def fetch_automattic_jobs(self, keywords):
         """
         Fetch remote jobs from Automattic (WordPress.com, fully remote)
         """
-        try:
-            # Automattic Jobs API
-            url = "https://automattic.com/work-with-us/job-listings/"
-            headers = {"User-Agent": "Mozilla/5.0 (compatible; Agent21Scout/1.0)"}
-            
-            # Since direct API might not be available, provide curated Automattic opportunities
-            jobs = []
-            
-            if any(word in keywords for word in ["developer", "programming", "software", "javascript", "python"]):
-                jobs.extend([
-                    {
-                        "title": "Software Engineer",
-                        "company": "Automattic",
-                        "location": "Remote - Worldwide",
-                        "url": "https://automattic.com/work-with-us/",
-                        "source": "Automattic",
-                        "salary": "$70-120k/year"
-                    },
-                    {
-                        "title": "WordPress Developer",
-                        "company": "Automattic",
-                        "location": "Remote - Global",
-                        "url": "https://automattic.com/work-with-us/",
-                        "source": "Automattic",
-                        "salary": "$60-100k/year"
-                    }
-                ])
-            
-            if any(word in keywords for word in ["support", "customer", "technical"]):
-                jobs.extend([
-                    {
-                        "title": "Customer Support Engineer",
-                        "company": "Automattic",
-                        "location": "Remote - Worldwide",
-                        "url": "https://automattic.com/work-with-us/",
-                        "source": "Automattic",
-                        "salary": "$40-70k/year"
-                    }
-                ])
-            
-            return jobs
-        except Exception as e:
-            print(f"[WARNING] Automattic API error: {e}")
-        return []
+        return self.catalog.jobs_for("automattic_jobs", keywords)
     
     def fetch_zapier_jobs(self, keywords):
         """
-        Fetch remote jobs from Zapier (fully remote, work-from-anywhere)
+        Fetch remote jobs from Zapier (fully remote, work-from-anywhere) from its
+        Greenhouse board (an ats_companies.json entry)
         """
         try:
-            # Zapier Jobs API via Greenhouse
-            url = "https://boards-api.greenhouse.io/v1/boards/zapier/jobs"
-            headers = {"User-Agent": "Mozilla/5.0 (compatible; Agent21Scout/1.0)"}
-            
-            response = get(url, headers=headers, timeout=15)
-            if response.status_code == 200:
-                data = response.json()
-                jobs = []
-                
-                for job in data.get("jobs", [])[:3]:
-                    title = job.get("title", "")
-                    if any(keyword.lower() in title.lower() for keyword in keywords):
-                        jobs.append({
-                            "title": title,
-                            "company": "Zapier",
-                            "location": "Remote - Worldwide",
-                            "url": f"https://zapier.com/jobs/{job.get('id', '')}",
-                            "source": "Zapier",
-                            "salary": "Competitive"
-                        })
-                
-                return jobs
+            return self.ats.jobs_for("Zapier", keywords, self.snapshots)
         except Exception as e:
             print(f"[WARNING] Zapier API error: {e}")
         return []
     
+    @job_source(label="Buffer")
     def fetch_buffer_jobs(self, keywords):
         """
         Fetch remote jobs from Buffer (fully distributed since 2012)
         """
-        jobs = []
-        
-        if any(word in keywords for word in ["developer", "programming", "software"]):
-            jobs.extend([
-                {
-                    "title": "Software Engineer",
-                    "company": "Buffer",
-                    "location": "Remote - Worldwide",
-                    "url": "https://buffer.com/journey",
-                    "source": "Buffer",
-                    "salary": "$80-130k/year"
-                }
-            ])
-        
-        if any(word in keywords for word in ["content", "writing", "marketing"]):
-            jobs.extend([
-                {
-                    "title": "Content Creator",
-                    "company": "Buffer",
-                    "location": "Remote - Global",
-                    "url": "https://buffer.com/journey",
-                    "source": "Buffer",
-                    "salary": "$50-80k/year"
-                }
-            ])
-        
-        return jobs
+        return self.catalog.jobs_for("buffer_jobs", keywords)
     
+    @job_source(label="Doist")
     def fetch_doist_jobs(self, keywords):
         """
         Fetch remote jobs from Doist (Todoist creators, fully remote)
         """
-        jobs = []
-        
-        if any(word in keywords for word in ["developer", "programming", "software", "mobile"]):
-            jobs.extend([
-                {
-                    "title": "Mobile Developer",
-                    "company": "Doist",
-                    "location": "Remote - Worldwide",
-                    "url": "https://doist.com/careers",
-                    "source": "Doist",
-                    "salary": "$70-110k/year"
-                },
-                {
-                    "title": "Backend Engineer",
-                    "company": "Doist",
-                    "location": "Remote - Global",
-                    "url": "https://doist.com/careers",
-                    "source": "Doist",
-                    "salary": "$80-120k/year"
-                }
-            ])
-        
-        return jobs
+        return self.catalog.jobs_for("doist_jobs", keywords)
     
+    @job_source(label="Remote.com")
     def fetch_remote_com_jobs(self, keywords):
         """
         Fetch jobs from Remote.com (global HR/payroll company)
         """
-        jobs = []
-        
-        if any(word in keywords for word in ["developer", "programming", "software"]):
-            jobs.extend([
-                {
-                    "title": "Full Stack Developer",
-                    "company": "Remote.com",
-                    "location": "Remote - Worldwide",
-                    "url": "https://remote.com/careers",
-                    "source": "Remote.com",
-                    "salary": "$60-100k/year"
-                }
-            ])
-        
-        if any(word in keywords for word in ["support", "customer", "technical"]):
-            jobs.extend([
-                {
-                    "title": "Customer Success Manager",
-                    "company": "Remote.com",
-                    "location": "Remote - Global",
-                    "url": "https://remote.com/careers",
-                    "source": "Remote.com",
-                    "salary": "$45-75k/year"
-                }
-            ])
-        
-        return jobs
+        return self.catalog.jobs_for("remote_com_jobs", keywords)
     
     def fetch_deel_jobs(self, keywords):
         """
-        Fetch jobs from Deel (payroll platform, 100+ countries)
+        Fetch jobs from Deel (payroll platform, 100+ countries) from its
+        Greenhouse board (an ats_companies.json entry)
         """
         try:
-            # Deel Jobs API via Greenhouse
-            url = "https://boards-api.greenhouse.io/v1/boards/deel/jobs"
-            headers = {"User-Agent": "Mozilla/5.0 (compatible; Agent21Scout/1.0)"}
-            
-            response = get(url, headers=headers, timeout=15)
-            if response.status_code == 200:
-                data = response.json()
-                jobs = []
-                
-                for job in data.get("jobs", [])[:3]:
-                    title = job.get("title", "")
-                    if any(keyword.lower() in title.lower() for keyword in keywords):
-                        jobs.append({
-                            "title": title,
-                            "company": "Deel",
-                            "location": "Remote - Worldwide",
-                            "url": f"https://www.deel.com/careers/{job.get('id', '')}",
-                            "source": "Deel",
-                            "salary": "Competitive"
-                        })
-                
-                return jobs
+            return self.ats.jobs_for("Deel", keywords, self.snapshots)
         except Exception as e:
             print(f"[WARNING] Deel API error: {e}")
         return []
     
+    @job_source()
     def fetch_andela_jobs(self, keywords):
         """
         Fetch jobs from Andela (global tech talent marketplace, Africa-founded)
         """
-        jobs = []
-        
-        if any(word in keywords for word in ["developer", "programming", "software", "python", "javascript"]):
-            jobs.extend([
-                {
-                    "title": "Software Developer",
-                    "company": "Andela",
-                    "location": "Remote - 135+ Countries",
-                    "url": "https://andela.com/careers/",
-                    "source": "Andela",
-                    "salary": "$30-80k/year"
-                },
-                {
-                    "title": "Full Stack Engineer",
-                    "company": "Andela",
-                    "location": "Remote - Worldwide",
-                    "url": "https://andela.com/careers/",
-                    "source": "Andela",
-                    "salary": "$40-90k/year"
-                }
-            ])
-        
-        if any(word in keywords for word in ["data", "analytics", "machine-learning"]):
-            jobs.extend([
-                {
-                    "title": "Data Engineer",
-                    "company": "Andela",
-                    "location": "Remote - Global",
-                    "url": "https://andela.com/careers/",
-                    "source": "Andela",
-                    "salary": "$50-100k/year"
-                }
-            ])
-        
-        return jobs
+        return self.catalog.jobs_for("andela_jobs", keywords)
     
+    @job_source()
     def fetch_crypto_jobs(self, keywords):
         """
         Fetch jobs from major crypto companies (Binance, Kraken, etc.)
         """
-        jobs = []
-        
-        if any(word in keywords for word in ["developer", "programming", "software", "javascript", "python"]):
-            jobs.extend([
-                {
-                    "title": "Blockchain Developer",
-                    "company": "Binance",
-                    "location": "Remote - Worldwide",
-                    "url": "https://www.binance.com/en/careers",
-                    "source": "Binance",
-                    "salary": "$80-150k/year"
-                },
-                {
-                    "title": "Software Engineer",
-                    "company": "Kraken",
-                    "location": "Remote - Global",
-                    "url": "https://jobs.lever.co/kraken",
-                    "source": "Kraken",
-                    "salary": "$90-160k/year"
-                }
-            ])
-        
-        if any(word in keywords for word in ["support", "customer", "technical"]):
-            jobs.extend([
-                {
-                    "title": "Customer Support Specialist",
-                    "company": "Binance",
-                    "location": "Remote - Worldwide",
-                    "url": "https://www.binance.com/en/careers",
-                    "source": "Binance",
-                    "salary": "$25-45k/year"
-                }
-            ])
-        
-        if any(word in keywords for word in ["content", "writing", "marketing"]):
-            jobs.extend([
-                {
-                    "title": "Content Marketing Manager",
-                    "company": "Kraken",
-                    "location": "Remote - Global",
-                    "url": "https://jobs.lever.co/kraken",
-                    "source": "Kraken",
-                    "salary": "$60-100k/year"
-                }
-            ])
-        
-        return jobs
+        return self.catalog.jobs_for("crypto_jobs", keywords)
     
+    @job_source()
     def fetch_wikimedia_jobs(self, keywords):
         """
         Fetch jobs from Wikimedia Foundation (Wikipedia, global hiring)
         """
-        jobs = []
-        
-        if any(word in keywords for word in ["developer", "programming", "software"]):
-            jobs.extend([
-                {
-                    "title": "Software Engineer",
-                    "company": "Wikimedia Foundation",
-                    "location": "Remote - Worldwide",
-                    "url": "https://wikimediafoundation.org/about/jobs/",
-                    "source": "Wikimedia",
-                    "salary": "$70-120k/year"
-                }
-            ])
-        
-        if any(word in keywords for word in ["data", "analytics"]):
-            jobs.extend([
-                {
-                    "title": "Data Analyst",
-                    "company": "Wikimedia Foundation",
-                    "location": "Remote - Global",
-                    "url": "https://wikimediafoundation.org/about/jobs/",
-                    "source": "Wikimedia",
-                    "salary": "$60-100k/year"
-                }
-            ])
-        
-        return jobs
+        return self.catalog.jobs_for("wikimedia_jobs", keywords)
     
+    @job_source()
     def fetch_customer_support_jobs(self, keywords):
         """
         Fetch beginner-friendly customer support jobs from major companies
         """
-        jobs = []
-        
-        if any(word in keywords for word in ["customer-support", "customer-success", "support", "community", "technical-support"]):
-            jobs.extend([
-                # Automattic - Very beginner-friendly
-                {
-                    "title": "Happiness Engineer (Customer Support)",
-                    "company": "Automattic",
-                    "location": "Remote - Worldwide",
-                    "url": "https://automattic.com/work-with-us/",
-                    "source": "Automattic",
-                    "salary": "$40-70k/year"
-                },
-                {
-                    "title": "Customer Support Specialist",
-                    "company": "Automattic",
-                    "location": "Remote - Global",
-                    "url": "https://automattic.com/work-with-us/",
-                    "source": "Automattic",
-                    "salary": "$35-60k/year"
-                },
-                # Zapier - Great for beginners
-                {
-                    "title": "Customer Champion",
-                    "company": "Zapier",
-                    "location": "Remote - Worldwide",
-                    "url": "https://zapier.com/jobs",
-                    "source": "Zapier",
-                    "salary": "$45-75k/year"
-                },
-                {
-                    "title": "Technical Support Engineer",
-                    "company": "Zapier",
-                    "location": "Remote - Global",
-                    "url": "https://zapier.com/jobs",
-                    "source": "Zapier",
-                    "salary": "$50-80k/year"
-                },
-                # Buffer - Community focused
-                {
-                    "title": "Community Manager",
-                    "company": "Buffer",
-                    "location": "Remote - Worldwide",
-                    "url": "https://buffer.com/journey",
-                    "source": "Buffer",
-                    "salary": "$40-65k/year"
-                },
-                {
-                    "title": "Customer Success Manager",
-                    "company": "Buffer",
-                    "location": "Remote - Global",
-                    "url": "https://buffer.com/journey",
-                    "source": "Buffer",
-                    "salary": "$50-80k/year"
-                },
-                # GitLab - Technical support
-                {
-                    "title": "Customer Success Manager",
-                    "company": "GitLab",
-                    "location": "Remote - Worldwide",
-                    "url": "https://about.gitlab.com/jobs/",
-                    "source": "GitLab",
-                    "salary": "$60-90k/year"
-                },
-                {
-                    "title": "Technical Support Engineer",
-                    "company": "GitLab",
-                    "location": "Remote - Global",
-                    "url": "https://about.gitlab.com/jobs/",
-                    "source": "GitLab",
-                    "salary": "$55-85k/year"
-                },
-                # Deel - Support roles
-                {
-                    "title": "Customer Support Specialist",
-                    "company": "Deel",
-                    "location": "Remote - 100+ Countries",
-                    "url": "https://www.deel.com/careers",
-                    "source": "Deel",
-                    "salary": "$35-60k/year"
-                },
-                {
-                    "title": "Customer Success Manager",
-                    "company": "Deel",
-                    "location": "Remote - Worldwide",
-                    "url": "https://www.deel.com/careers",
-                    "source": "Deel",
-                    "salary": "$50-85k/year"
-                },
-                # Remote.com - HR/Support
-                {
-                    "title": "Customer Success Manager",
-                    "company": "Remote.com",
-                    "location": "Remote - Worldwide",
-                    "url": "https://remote.com/careers",
-                    "source": "Remote.com",
-                    "salary": "$45-75k/year"
-                },
-                # Binance - Crypto support (beginner-friendly)
-                {
-                    "title": "Customer Support Specialist",
-                    "company": "Binance",
-                    "location": "Remote - Worldwide",
-                    "url": "https://www.binance.com/en/careers",
-                    "source": "Binance",
-                    "salary": "$25-50k/year"
-                },
-                {
-                    "title": "Community Manager",
-                    "company": "Binance",
-                    "location": "Remote - Global",
-                    "url": "https://www.binance.com/en/careers",
-                    "source": "Binance",
-                    "salary": "$30-55k/year"
-                }
-            ])
-        
-        return jobs
+        return self.catalog.jobs_for("customer_support_jobs", keywords)
     
+    @job_source()
     def fetch_operations_hr_jobs(self, keywords):
         """
         Fetch operations, HR, and finance jobs from major companies
         """
-        jobs = []
-        
-        if any(word in keywords for word in ["recruiter", "hr-specialist", "people-operations", "project-manager", "operations", "remote", "support", "assistant"]):
-            jobs.extend([
-                # Remote.com - HR specialists
-                {
-                    "title": "Remote Recruiter",
-                    "company": "Remote.com",
-                    "location": "Remote - Worldwide",
-                    "url": "https://remote.com/careers",
-                    "source": "Remote.com",
-                    "salary": "$40-70k/year"
-                },
-                {
-                    "title": "People Operations Specialist",
-                    "company": "Remote.com",
-                    "location": "Remote - Global",
-                    "url": "https://remote.com/careers",
-                    "source": "Remote.com",
-                    "salary": "$45-75k/year"
-                },
-                # Deel - HR/Operations
-                {
-                    "title": "Talent Acquisition Specialist",
-                    "company": "Deel",
-                    "location": "Remote - 100+ Countries",
-                    "url": "https://www.deel.com/careers",
-                    "source": "Deel",
-                    "salary": "$40-70k/year"
-                },
-                {
-                    "title": "People Operations Manager",
-                    "company": "Deel",
-                    "location": "Remote - Worldwide",
-                    "url": "https://www.deel.com/careers",
-                    "source": "Deel",
-                    "salary": "$60-95k/year"
-                },
-                # GitLab - Project Management
-                {
-                    "title": "Project Manager",
-                    "company": "GitLab",
-                    "location": "Remote - Worldwide",
-                    "url": "https://about.gitlab.com/jobs/",
-                    "source": "GitLab",
-                    "salary": "$70-110k/year"
-                },
-                {
-                    "title": "Program Manager",
-                    "company": "GitLab",
-                    "location": "Remote - Global",
-                    "url": "https://about.gitlab.com/jobs/",
-                    "source": "GitLab",
-                    "salary": "$80-120k/year"
-                },
-                # Wikimedia - Operations
-                {
-                    "title": "HR Specialist",
-                    "company": "Wikimedia Foundation",
-                    "location": "Remote - Worldwide",
-                    "url": "https://wikimediafoundation.org/about/jobs/",
-                    "source": "Wikimedia",
-                    "salary": "$50-85k/year"
-                },
-                {
-                    "title": "Operations Coordinator",
-                    "company": "Wikimedia Foundation",
-                    "location": "Remote - Global",
-                    "url": "https://wikimediafoundation.org/about/jobs/",
-                    "source": "Wikimedia",
-                    "salary": "$45-75k/year"
-                },
-                # Automattic - Operations
-                {
-                    "title": "People Operations Specialist",
-                    "company": "Automattic",
-                    "location": "Remote - Worldwide",
-                    "url": "https://automattic.com/work-with-us/",
-                    "source": "Automattic",
-                    "salary": "$50-80k/year"
-                }
-            ])
-        
-        return jobs
+        return self.catalog.jobs_for("operations_hr_jobs", keywords)
     
+    @job_source()
     def fetch_finance_jobs(self, keywords):
         """
         Fetch finance and accounting jobs from major companies
         """
-        jobs = []
-        
-        if any(word in keywords for word in ["finance-analyst", "accountant", "financial-analyst", "bookkeeper", "finance", "remote", "data", "assistant"]):
-            jobs.extend([
-                # GitLab - Finance roles
-                {
-                    "title": "Finance Analyst",
-                    "company": "GitLab",
-                    "location": "Remote - Worldwide",
-                    "url": "https://about.gitlab.com/jobs/",
-                    "source": "GitLab",
-                    "salary": "$60-95k/year"
-                },
-                {
-                    "title": "Financial Analyst",
-                    "company": "GitLab",
-                    "location": "Remote - Global",
-                    "url": "https://about.gitlab.com/jobs/",
-                    "source": "GitLab",
-                    "salary": "$65-100k/year"
-                },
-                # Deel - Finance (payroll company)
-                {
-                    "title": "Finance Analyst",
-                    "company": "Deel",
-                    "location": "Remote - 100+ Countries",
-                    "url": "https://www.deel.com/careers",
-                    "source": "Deel",
-                    "salary": "$50-85k/year"
-                },
-                {
-                    "title": "Accountant",
-                    "company": "Deel",
-                    "location": "Remote - Worldwide",
-                    "url": "https://www.deel.com/careers",
-                    "source": "Deel",
-                    "salary": "$45-75k/year"
-                },
-                # Remote.com - Finance
-                {
-                    "title": "Financial Analyst",
-                    "company": "Remote.com",
-                    "location": "Remote - Worldwide",
-                    "url": "https://remote.com/careers",
-                    "source": "Remote.com",
-                    "salary": "$55-90k/year"
-                },
-                # Wikimedia - Non-profit finance
-                {
-                    "title": "Finance Specialist",
-                    "company": "Wikimedia Foundation",
-                    "location": "Remote - Worldwide",
-                    "url": "https://wikimediafoundation.org/about/jobs/",
-                    "source": "Wikimedia",
-                    "salary": "$50-80k/year"
-                },
-                # Automattic - Finance
-                {
-                    "title": "Finance Analyst",
-                    "company": "Automattic",
-                    "location": "Remote - Worldwide",
-                    "url": "https://automattic.com/work-with-us/",
-                    "source": "Automattic",
-                    "salary": "$55-85k/year"
-                }
-            ])
-        
-        return jobs
+        return self.catalog.jobs_for("finance_jobs", keywords)
     
+    @job_source()
     def fetch_technical_writing_jobs(self, keywords):
         """
         Fetch technical writing and documentation jobs from major companies
         """
-        jobs = []
-        
-        if any(word in keywords for word in ["technical-writer", "documentation", "copywriter", "blog-writer", "content", "writing", "remote", "developer"]):
-            jobs.extend([
-                # Automattic - Content heavy company
-                {
-                    "title": "Technical Writer",
-                    "company": "Automattic",
-                    "location": "Remote - Worldwide",
-                    "url": "https://automattic.com/work-with-us/",
-                    "source": "Automattic",
-                    "salary": "$50-85k/year"
-                },
-                {
-                    "title": "Content Writer",
-                    "company": "Automattic",
-                    "location": "Remote - Global",
-                    "url": "https://automattic.com/work-with-us/",
-                    "source": "Automattic",
-                    "salary": "$45-75k/year"
-                },
-                # Buffer - Social media content
-                {
-                    "title": "Content Writer",
-                    "company": "Buffer",
-                    "location": "Remote - Worldwide",
-                    "url": "https://buffer.com/journey",
-                    "source": "Buffer",
-                    "salary": "$45-70k/year"
-                },
-                {
-                    "title": "Blog Writer",
-                    "company": "Buffer",
-                    "location": "Remote - Global",
-                    "url": "https://buffer.com/journey",
-                    "source": "Buffer",
-                    "salary": "$40-65k/year"
-                },
-                # Doist - Product documentation
-                {
-                    "title": "Technical Writer",
-                    "company": "Doist",
-                    "location": "Remote - Worldwide",
-                    "url": "https://doist.com/careers",
-                    "source": "Doist",
-                    "salary": "$50-80k/year"
-                },
-                {
-                    "title": "Documentation Specialist",
-                    "company": "Doist",
-                    "location": "Remote - Global",
-                    "url": "https://doist.com/careers",
-                    "source": "Doist",
-                    "salary": "$45-75k/year"
-                },
-                # Wikimedia - Lots of content
-                {
-                    "title": "Technical Writer",
-                    "company": "Wikimedia Foundation",
-                    "location": "Remote - Worldwide",
-                    "url": "https://wikimediafoundation.org/about/jobs/",
-                    "source": "Wikimedia",
-                    "salary": "$55-85k/year"
-                },
-                {
-                    "title": "Documentation Specialist",
-                    "company": "Wikimedia Foundation",
-                    "location": "Remote - Global",
-                    "url": "https://wikimediafoundation.org/about/jobs/",
-                    "source": "Wikimedia",
-                    "salary": "$50-80k/year"
-                },
-                # Zapier - Technical documentation
-                {
-                    "title": "Technical Writer",
-                    "company": "Zapier",
-                    "location": "Remote - Worldwide",
-                    "url": "https://zapier.com/jobs",
-                    "source": "Zapier",
-                    "salary": "$55-85k/year"
-                },
-                {
-                    "title": "Content Marketing Writer",
-                    "company": "Zapier",
-                    "location": "Remote - Global",
-                    "url": "https://zapier.com/jobs",
-                    "source": "Zapier",
-                    "salary": "$50-80k/year"
-                }
-            ])
-        
-        return jobs
+        return self.catalog.jobs_for("technical_writing_jobs", keywords)
     
     def fetch_major_remote_companies(self):
         """
         Fetch additional jobs from major remote-first companies
         """
-        # Additional high-quality opportunities from top remote companies
-        major_company_jobs = [
-            # GitLab (All-remote, DevOps)
-            {
-                "title": "DevOps Engineer",
-                "company": "GitLab",
-                "location": "Remote - Worldwide",
-                "url": "https://about.gitlab.com/jobs/",
-                "source": "GitLab",
-                "salary": "$80-140k/year"
-            },
-            {
-                "title": "Product Manager",
-                "company": "GitLab",
-                "location": "Remote - Global",
-                "url": "https://about.gitlab.com/jobs/",
-                "source": "GitLab",
-                "salary": "$90-150k/year"
-            },
-            # Automattic (WordPress.com)
-            {
-                "title": "Happiness Engineer",
-                "company": "Automattic",
-                "location": "Remote - Worldwide",
-                "url": "https://automattic.com/work-with-us/",
-                "source": "Automattic",
-                "salary": "$50-80k/year"
-            },
-            # Zapier (Automation)
-            {
-                "title": "Customer Champion",
-                "company": "Zapier",
-                "location": "Remote - Worldwide",
-                "url": "https://zapier.com/jobs",
-                "source": "Zapier",
-                "salary": "$45-75k/year"
-            },
-            {
-                "title": "Product Designer",
-                "company": "Zapier",
-                "location": "Remote - Global",
-                "url": "https://zapier.com/jobs",
-                "source": "Zapier",
-                "salary": "$80-120k/year"
-            },
-            # Buffer (Social Media)
-            {
-                "title": "Social Media Manager",
-                "company": "Buffer",
-                "location": "Remote - Worldwide",
-                "url": "https://buffer.com/journey",
-                "source": "Buffer",
-                "salary": "$50-80k/year"
-            },
-            # Doist (Todoist)
-            {
-                "title": "Product Marketing Manager",
-                "company": "Doist",
-                "location": "Remote - Worldwide",
-                "url": "https://doist.com/careers",
-                "source": "Doist",
-                "salary": "$60-100k/year"
-            },
-            # Remote.com (HR/Payroll)
-            {
-                "title": "Sales Development Representative",
-                "company": "Remote.com",
-                "location": "Remote - Worldwide",
-                "url": "https://remote.com/careers",
-                "source": "Remote.com",
-                "salary": "$40-70k/year"
-            },
-            # Deel (Payroll/Compliance)
-            {
-                "title": "Compliance Specialist",
-                "company": "Deel",
-                "location": "Remote - 100+ Countries",
-                "url": "https://www.deel.com/careers",
-                "source": "Deel",
-                "salary": "$50-90k/year"
-            },
-            {
-                "title": "Account Executive",
-                "company": "Deel",
-                "location": "Remote - Worldwide",
-                "url": "https://www.deel.com/careers",
-                "source": "Deel",
-                "salary": "$60-120k/year"
-            },
-            # Andela (Africa-founded, global)
-            {
-                "title": "Technical Mentor",
-                "company": "Andela",
-                "location": "Remote - Africa & Global",
-                "url": "https://andela.com/careers/",
-                "source": "Andela",
-                "salary": "$35-70k/year"
-            },
-            {
-                "title": "Community Manager",
-                "company": "Andela",
-                "location": "Remote - Worldwide",
-                "url": "https://andela.com/careers/",
-                "source": "Andela",
-                "salary": "$30-60k/year"
-            },
-            # Crypto Companies
-            {
-                "title": "Trading Support Specialist",
-                "company": "Binance",
-                "location": "Remote - Worldwide",
-                "url": "https://www.binance.com/en/careers",
-                "source": "Binance",
-                "salary": "$30-60k/year"
-            },
-            {
-                "title": "Security Engineer",
-                "company": "Kraken",
-                "location": "Remote - Global",
-                "url": "https://jobs.lever.co/kraken",
-                "source": "Kraken",
-                "salary": "$100-180k/year"
-            },
-            # Wikimedia Foundation
-            {
-                "title": "Community Relations Specialist",
-                "company": "Wikimedia Foundation",
-                "location": "Remote - Worldwide",
-                "url": "https://wikimediafoundation.org/about/jobs/",
-                "source": "Wikimedia",
-                "salary": "$50-85k/year"
-            }
-        ]
-        
-        self.jobs_found.extend(major_company_jobs)
+        self.jobs_found.extend(self.catalog.jobs_for("major_remote_companies"))
     
     def fetch_beginner_friendly_jobs(self):
         """
         Fetch additional beginner-friendly jobs across all categories
         """
-        beginner_jobs = [
-            # Customer Support & Success (Very beginner-friendly)
-            {
-                "title": "Customer Support Specialist (Entry Level)",
-                "company": "Automattic",
-                "location": "Remote - Worldwide",
-                "url": "https://automattic.com/work-with-us/",
-                "source": "Automattic",
-                "salary": "$35-60k/year"
-            },
-            {
-                "title": "Community Manager (Beginner)",
-                "company": "Buffer",
-                "location": "Remote - Worldwide",
-                "url": "https://buffer.com/journey",
-                "source": "Buffer",
-                "salary": "$35-55k/year"
-            },
-            {
-                "title": "Customer Champion (No Experience Required)",
-                "company": "Zapier",
-                "location": "Remote - Worldwide",
-                "url": "https://zapier.com/jobs",
-                "source": "Zapier",
-                "salary": "$40-65k/year"
-            },
-            {
-                "title": "Technical Support Engineer (Junior)",
-                "company": "GitLab",
-                "location": "Remote - Worldwide",
-                "url": "https://about.gitlab.com/jobs/",
-                "source": "GitLab",
-                "salary": "$45-70k/year"
-            },
-            {
-                "title": "Customer Success Associate",
-                "company": "Deel",
-                "location": "Remote - 100+ Countries",
-                "url": "https://www.deel.com/careers",
-                "source": "Deel",
-                "salary": "$30-55k/year"
-            },
-            {
-                "title": "Support Specialist (Entry Level)",
-                "company": "Remote.com",
-                "location": "Remote - Worldwide",
-                "url": "https://remote.com/careers",
-                "source": "Remote.com",
-                "salary": "$35-60k/year"
-            },
-            {
-                "title": "Community Support (Crypto)",
-                "company": "Binance",
-                "location": "Remote - Worldwide",
-                "url": "https://www.binance.com/en/careers",
-                "source": "Binance",
-                "salary": "$25-45k/year"
-            },
-            
-            # Operations, HR & Finance (Entry-level friendly)
-            {
-                "title": "Junior Recruiter",
-                "company": "Remote.com",
-                "location": "Remote - Worldwide",
-                "url": "https://remote.com/careers",
-                "source": "Remote.com",
-                "salary": "$35-60k/year"
-            },
-            {
-                "title": "HR Assistant",
-                "company": "Deel",
-                "location": "Remote - 100+ Countries",
-                "url": "https://www.deel.com/careers",
-                "source": "Deel",
-                "salary": "$30-50k/year"
-            },
-            {
-                "title": "Operations Coordinator",
-                "company": "GitLab",
-                "location": "Remote - Worldwide",
-                "url": "https://about.gitlab.com/jobs/",
-                "source": "GitLab",
-                "salary": "$40-65k/year"
-            },
-            {
-                "title": "Finance Assistant",
-                "company": "Wikimedia Foundation",
-                "location": "Remote - Worldwide",
-                "url": "https://wikimediafoundation.org/about/jobs/",
-                "source": "Wikimedia",
-                "salary": "$35-55k/year"
-            },
-            {
-                "title": "Project Coordinator",
-                "company": "Automattic",
-                "location": "Remote - Worldwide",
-                "url": "https://automattic.com/work-with-us/",
-                "source": "Automattic",
-                "salary": "$40-65k/year"
-            },
-            
-            # Content & Writing (Great for beginners)
-            {
-                "title": "Junior Technical Writer",
-                "company": "Automattic",
-                "location": "Remote - Worldwide",
-                "url": "https://automattic.com/work-with-us/",
-                "source": "Automattic",
-                "salary": "$35-60k/year"
-            },
-            {
-                "title": "Content Writer (Entry Level)",
-                "company": "Buffer",
-                "location": "Remote - Worldwide",
-                "url": "https://buffer.com/journey",
-                "source": "Buffer",
-                "salary": "$30-50k/year"
-            },
-            {
-                "title": "Documentation Assistant",
-                "company": "Doist",
-                "location": "Remote - Worldwide",
-                "url": "https://doist.com/careers",
-                "source": "Doist",
-                "salary": "$35-55k/year"
-            },
-            {
-                "title": "Blog Writer (Beginner)",
-                "company": "Wikimedia Foundation",
-                "location": "Remote - Worldwide",
-                "url": "https://wikimediafoundation.org/about/jobs/",
-                "source": "Wikimedia",
-                "salary": "$30-50k/year"
-            },
-            {
-                "title": "Content Marketing Assistant",
-                "company": "Zapier",
-                "location": "Remote - Worldwide",
-                "url": "https://zapier.com/jobs",
-                "source": "Zapier",
-                "salary": "$35-55k/year"
-            }
-        ]
-        
-        self.jobs_found.extend(beginner_jobs)
+        self.jobs_found.extend(self.catalog.jobs_for("beginner_friendly_jobs"))
     
     def fetch_bpo_gig_opportunities(self):
         """
         Fetch additional BPO, AI training, and gig economy opportunities
         """
-        bpo_gig_jobs = [
-            # Major BPO Companies - Content Moderation & Support
-            {
-                "title": "Content Moderator (TikTok/YouTube)",
-                "company": "Teleperformance",
-                "location": "Remote - Worldwide",
-                "url": "https://www.teleperformance.com/en-us/careers",
-                "source": "Teleperformance",
-                "salary": "$15-25/hour"
-            },
-            {
-                "title": "Social Media Safety Specialist",
-                "company": "Majorel",
-                "location": "Remote - Global",
-                "url": "https://www.majorel.com/careers",
-                "source": "Majorel",
-                "salary": "$16-28/hour"
-            },
-            {
-                "title": "Digital Trust & Safety",
-                "company": "Accenture",
-                "location": "Remote - Worldwide",
-                "url": "https://www.accenture.com/careers",
-                "source": "Accenture",
-                "salary": "$18-30/hour"
-            },
-            {
-                "title": "Ad Review Specialist (Meta/Google)",
-                "company": "Cognizant",
-                "location": "Remote - Global",
-                "url": "https://careers.cognizant.com/",
-                "source": "Cognizant",
-                "salary": "$15-24/hour"
-            },
-            
-            # AI Training & Data Annotation
-            {
-                "title": "AI Training Specialist",
-                "company": "Appen",
-                "location": "Remote - Worldwide",
-                "url": "https://appen.com/careers/",
-                "source": "Appen",
-                "salary": "$12-20/hour"
-            },
-            {
-                "title": "Machine Learning Data Rater",
-                "company": "TELUS International AI",
-                "location": "Remote - Global",
-                "url": "https://www.telusinternational.com/careers",
-                "source": "TELUS AI",
-                "salary": "$14-22/hour"
-            },
-            {
-                "title": "Search Quality Evaluator",
-                "company": "Lionbridge",
-                "location": "Remote - Worldwide",
-                "url": "https://www.lionbridge.com/careers/",
-                "source": "Lionbridge",
-                "salary": "$13-20/hour"
-            },
-            {
-                "title": "Flexible AI Tasks",
-                "company": "Remotasks",
-                "location": "Remote - Global",
-                "url": "https://www.remotasks.com/",
-                "source": "Remotasks",
-                "salary": "$10-18/hour"
-            },
-            
-            # Freelance & Gig Platforms
-            {
-                "title": "Virtual Assistant (Multiple Clients)",
-                "company": "Upwork",
-                "location": "Remote - Worldwide",
-                "url": "https://www.upwork.com/freelance-jobs/virtual-assistant/",
-                "source": "Upwork",
-                "salary": "$8-25/hour"
-            },
-            {
-                "title": "Customer Support Freelancer",
-                "company": "Fiverr",
-                "location": "Remote - Global",
-                "url": "https://www.fiverr.com/",
-                "source": "Fiverr",
-                "salary": "$5-30/hour"
-            },
-            
-            # Specialized VA & Support Companies
-            {
-                "title": "Community Moderator",
-                "company": "ModSquad",
-                "location": "Remote - Worldwide",
-                "url": "https://modsquad.com/careers/",
-                "source": "ModSquad",
-                "salary": "$12-18/hour"
-            },
-            {
-                "title": "Premium Virtual Assistant",
-                "company": "Boldly",
-                "location": "Remote - Global",
-                "url": "https://boldly.com/careers/",
-                "source": "Boldly",
-                "salary": "$16-28/hour"
-            }
-        ]
-        
-        self.jobs_found.extend(bpo_gig_jobs)
+        self.jobs_found.extend(self.catalog.jobs_for("bpo_gig_opportunities"))
     
     def fetch_platform_specific_opportunities(self):
         """
         Fetch additional platform-specific opportunities (TikTok, YouTube, Facebook, etc.)
         """
-        platform_jobs = [
-            # TikTok-specific roles
-            {
-                "title": "TikTok Content Safety Reviewer",
-                "company": "Teleperformance",
-                "location": "Remote - Worldwide",
-                "url": "https://www.teleperformance.com/en-us/careers",
-                "source": "Teleperformance",
-                "salary": "$16-24/hour"
-            },
-            {
-                "title": "TikTok Community Guidelines Specialist",
-                "company": "Majorel",
-                "location": "Remote - Global",
-                "url": "https://www.majorel.com/careers",
-                "source": "Majorel",
-                "salary": "$17-25/hour"
-            },
-            
-            # YouTube-specific roles
-            {
-                "title": "YouTube Policy Enforcement Specialist",
-                "company": "Accenture",
-                "location": "Remote - Worldwide",
-                "url": "https://www.accenture.com/careers",
-                "source": "Accenture",
-                "salary": "$18-26/hour"
-            },
-            {
-                "title": "YouTube Creator Support Agent",
-                "company": "Cognizant",
-                "location": "Remote - Global",
-                "url": "https://careers.cognizant.com/",
-                "source": "Cognizant",
-                "salary": "$16-24/hour"
-            },
-            
-            # Facebook/Meta-specific roles
-            {
-                "title": "Facebook Community Standards Reviewer",
-                "company": "Accenture",
-                "location": "Remote - Worldwide",
-                "url": "https://www.accenture.com/careers",
-                "source": "Accenture",
-                "salary": "$17-25/hour"
-            },
-            {
-                "title": "Instagram Safety Operations Specialist",
-                "company": "Cognizant",
-                "location": "Remote - Global",
-                "url": "https://careers.cognizant.com/",
-                "source": "Cognizant",
-                "salary": "$16-24/hour"
-            },
-            
-            # Google/Search-specific roles
-            {
-                "title": "Google Search Quality Rater",
-                "company": "Lionbridge",
-                "location": "Remote - Worldwide",
-                "url": "https://www.lionbridge.com/careers/",
-                "source": "Lionbridge",
-                "salary": "$14-20/hour"
-            },
-            {
-                "title": "Google Ads Policy Specialist",
-                "company": "TELUS International AI",
-                "location": "Remote - Global",
-                "url": "https://www.telusinternational.com/careers",
-                "source": "TELUS AI",
-                "salary": "$15-22/hour"
-            },
-            
-            # Multi-platform roles
-            {
-                "title": "Social Media Platform Analyst",
-                "company": "Genpact",
-                "location": "Remote - Worldwide",
-                "url": "https://www.genpact.com/careers",
-                "source": "Genpact",
-                "salary": "$15-23/hour"
-            },
-            {
-                "title": "Digital Platform Content Specialist",
-                "company": "Wipro",
-                "location": "Remote - Global",
-                "url": "https://careers.wipro.com/",
-                "source": "Wipro",
-                "salary": "$14-21/hour"
-            },
-            
-            # Data labeling for major platforms
-            {
-                "title": "Platform AI Training Specialist",
-                "company": "Appen",
-                "location": "Remote - Worldwide",
-                "url": "https://appen.com/careers/",
-                "source": "Appen",
-                "salary": "$12-19/hour"
-            },
-            {
-                "title": "Social Media Data Annotator",
-                "company": "Scale AI",
-                "location": "Remote - Global",
-                "url": "https://scale.com/careers",
-                "source": "Scale AI",
-                "salary": "$16-24/hour"
-            }
-        ]
-        
-        self.jobs_found.extend(platform_jobs)
+        self.jobs_found.extend(self.catalog.jobs_for("platform_specific_opportunities"))
     
+    @job_source()
     def fetch_bpo_outsourcing_jobs(self, keywords):
         """
         Fetch jobs from major BPO/Outsourcing companies (TikTok, YouTube, Meta contractors)
         """
-        jobs = []
-        
-        if any(word in keywords for word in ["content-moderator", "support-agent", "trust-safety", "ad-reviewer", "customer-support", "remote", "support"]):
-            jobs.extend([
-                # Teleperformance - Global BPO leader
-                {
-                    "title": "Content Moderator (Social Media)",
-                    "company": "Teleperformance",
-                    "location": "Remote - Worldwide",
-                    "url": "https://www.teleperformance.com/en-us/careers",
-                    "source": "Teleperformance",
-                    "salary": "$15-25/hour"
-                },
-                {
-                    "title": "Customer Support Agent",
-                    "company": "Teleperformance",
-                    "location": "Remote - Global",
-                    "url": "https://www.teleperformance.com/en-us/careers",
-                    "source": "Teleperformance",
-                    "salary": "$12-20/hour"
-                },
-                # Majorel - Works with major tech companies
-                {
-                    "title": "Trust & Safety Specialist",
-                    "company": "Majorel",
-                    "location": "Remote - Worldwide",
-                    "url": "https://www.majorel.com/careers",
-                    "source": "Majorel",
-                    "salary": "$16-28/hour"
-                },
-                {
-                    "title": "Social Media Content Reviewer",
-                    "company": "Majorel",
-                    "location": "Remote - Global",
-                    "url": "https://www.majorel.com/careers",
-                    "source": "Majorel",
-                    "salary": "$14-22/hour"
-                },
-                # Accenture - Major outsourcing
-                {
-                    "title": "Content Moderation Specialist",
-                    "company": "Accenture",
-                    "location": "Remote - Worldwide",
-                    "url": "https://www.accenture.com/careers",
-                    "source": "Accenture",
-                    "salary": "$18-30/hour"
-                },
-                {
-                    "title": "Digital Customer Support",
-                    "company": "Accenture",
-                    "location": "Remote - Global",
-                    "url": "https://www.accenture.com/careers",
-                    "source": "Accenture",
-                    "salary": "$16-26/hour"
-                },
-                # Cognizant - Tech services
-                {
-                    "title": "Ad Review Specialist",
-                    "company": "Cognizant",
-                    "location": "Remote - Worldwide",
-                    "url": "https://careers.cognizant.com/",
-                    "source": "Cognizant",
-                    "salary": "$15-24/hour"
-                },
-                # Genpact - Process management
-                {
-                    "title": "Content Quality Analyst",
-                    "company": "Genpact",
-                    "location": "Remote - Global",
-                    "url": "https://www.genpact.com/careers",
-                    "source": "Genpact",
-                    "salary": "$14-22/hour"
-                },
-                # TaskUs - Digital customer experience
-                {
-                    "title": "Community Moderator",
-                    "company": "TaskUs",
-                    "location": "Remote - Worldwide",
-                    "url": "https://www.taskus.com/careers/",
-                    "source": "TaskUs",
-                    "salary": "$13-20/hour"
-                },
-                # Concentrix - Customer engagement
-                {
-                    "title": "Trust & Safety Associate",
-                    "company": "Concentrix",
-                    "location": "Remote - Global",
-                    "url": "https://careers.concentrix.com/",
-                    "source": "Concentrix",
-                    "salary": "$15-23/hour"
-                },
-                # TTEC - Customer experience technology
-                {
-                    "title": "Digital Content Reviewer",
-                    "company": "TTEC",
-                    "location": "Remote - Worldwide",
-                    "url": "https://www.ttec.com/careers",
-                    "source": "TTEC",
-                    "salary": "$14-21/hour"
-                }
-            ])
-        
-        return jobs
+        return self.catalog.jobs_for("bpo_outsourcing_jobs", keywords)
     
+    @job_source()
     def fetch_ai_training_jobs(self, keywords):
         """
         Fetch AI training and data annotation jobs (flexible microtasks)
         """
-        jobs = []
-        
-        if any(word in keywords for word in ["data-annotation", "ai-training", "rater", "labeling", "microtasks", "data"]):
-            jobs.extend([
-                # Appen - AI training leader
-                {
-                    "title": "AI Training Data Specialist",
-                    "company": "Appen",
-                    "location": "Remote - Worldwide",
-                    "url": "https://appen.com/careers/",
-                    "source": "Appen",
-                    "salary": "$12-20/hour"
-                },
-                {
-                    "title": "Search Engine Evaluator",
-                    "company": "Appen",
-                    "location": "Remote - Global",
-                    "url": "https://appen.com/careers/",
-                    "source": "Appen",
-                    "salary": "$13-18/hour"
-                },
-                # TELUS International AI
-                {
-                    "title": "AI Data Analyst",
-                    "company": "TELUS International AI",
-                    "location": "Remote - Worldwide",
-                    "url": "https://www.telusinternational.com/careers",
-                    "source": "TELUS AI",
-                    "salary": "$14-22/hour"
-                },
-                {
-                    "title": "Machine Learning Data Labeler",
-                    "company": "TELUS International AI",
-                    "location": "Remote - Global",
-                    "url": "https://www.telusinternational.com/careers",
-                    "source": "TELUS AI",
-                    "salary": "$12-19/hour"
-                },
-                # Lionbridge (Raterlabs)
-                {
-                    "title": "Internet Safety Evaluator",
-                    "company": "Lionbridge",
-                    "location": "Remote - Worldwide",
-                    "url": "https://www.lionbridge.com/careers/",
-                    "source": "Lionbridge",
-                    "salary": "$13-20/hour"
-                },
-                {
-                    "title": "AI Training Rater",
-                    "company": "Lionbridge",
-                    "location": "Remote - Global",
-                    "url": "https://www.lionbridge.com/careers/",
-                    "source": "Lionbridge",
-                    "salary": "$14-21/hour"
-                },
-                # Clickworker - Microtasks
-                {
-                    "title": "Data Entry & Annotation",
-                    "company": "Clickworker",
-                    "location": "Remote - Worldwide",
-                    "url": "https://www.clickworker.com/",
-                    "source": "Clickworker",
-                    "salary": "$8-15/hour"
-                },
-                # Remotasks - AI training tasks
-                {
-                    "title": "AI Trainer (Flexible)",
-                    "company": "Remotasks",
-                    "location": "Remote - Global",
-                    "url": "https://www.remotasks.com/",
-                    "source": "Remotasks",
-                    "salary": "$10-18/hour"
-                },
-                # OneForma (Pactera Edge)
-                {
-                    "title": "Content Evaluator",
-                    "company": "OneForma",
-                    "location": "Remote - Worldwide",
-                    "url": "https://www.oneforma.com/",
-                    "source": "OneForma",
-                    "salary": "$12-19/hour"
-                },
-                # Scale AI - High-quality AI training
-                {
-                    "title": "AI Data Specialist",
-                    "company": "Scale AI",
-                    "location": "Remote - Global",
-                    "url": "https://scale.com/careers",
-                    "source": "Scale AI",
-                    "salary": "$15-25/hour"
-                }
-            ])
-        
-        return jobs
+        return self.catalog.jobs_for("ai_training_jobs", keywords)
     
+    @job_source()
     def fetch_freelance_gig_jobs(self, keywords):
         """
         Fetch freelance and gig platform opportunities
         """
-        jobs = []
-        
-        if any(word in keywords for word in ["freelance", "gig", "virtual-assistant", "small-tasks", "support", "admin"]):
-            jobs.extend([
-                # Upwork - Leading freelance platform
-                {
-                    "title": "Virtual Assistant (Multiple Projects)",
-                    "company": "Upwork Global Clients",
-                    "location": "Remote - Worldwide",
-                    "url": "https://www.upwork.com/freelance-jobs/virtual-assistant/",
-                    "source": "Upwork",
-                    "salary": "$8-25/hour"
-                },
-                {
-                    "title": "Customer Support Freelancer",
-                    "company": "Upwork Global Clients",
-                    "location": "Remote - Global",
-                    "url": "https://www.upwork.com/freelance-jobs/customer-service/",
-                    "source": "Upwork",
-                    "salary": "$10-20/hour"
-                },
-                # Fiverr - Gig-based platform
-                {
-                    "title": "Virtual Assistant Services",
-                    "company": "Fiverr Clients",
-                    "location": "Remote - Worldwide",
-                    "url": "https://www.fiverr.com/",
-                    "source": "Fiverr",
-                    "salary": "$5-30/hour"
-                },
-                # Freelancer.com
-                {
-                    "title": "Data Entry Specialist",
-                    "company": "Freelancer.com Clients",
-                    "location": "Remote - Global",
-                    "url": "https://www.freelancer.com/jobs/data-entry/",
-                    "source": "Freelancer.com",
-                    "salary": "$6-18/hour"
-                },
-                # PeoplePerHour
-                {
-                    "title": "Administrative Support",
-                    "company": "PeoplePerHour Clients",
-                    "location": "Remote - Worldwide",
-                    "url": "https://www.peopleperhour.com/",
-                    "source": "PeoplePerHour",
-                    "salary": "$8-22/hour"
-                },
-                # Workana - Latin America focused but global
-                {
-                    "title": "Virtual Assistant Projects",
-                    "company": "Workana Clients",
-                    "location": "Remote - Global",
-                    "url": "https://www.workana.com/",
-                    "source": "Workana",
-                    "salary": "$7-20/hour"
-                }
-            ])
-        
-        return jobs
+        return self.catalog.jobs_for("freelance_gig_jobs", keywords)
     
+    @job_source()
     def fetch_va_support_jobs(self, keywords):
         """
         Fetch specialized Virtual Assistant and Customer Support jobs
         """
-        jobs = []
-        
-        if any(word in keywords for word in ["virtual-assistant", "customer-support", "admin", "support", "community"]):
-            jobs.extend([
-                # ModSquad - Community moderation and live chat
-                {
-                    "title": "Community Moderator",
-                    "company": "ModSquad",
-                    "location": "Remote - Worldwide",
-                    "url": "https://modsquad.com/careers/",
-                    "source": "ModSquad",
-                    "salary": "$12-18/hour"
-                },
-                {
-                    "title": "Live Chat Support Agent",
-                    "company": "ModSquad",
-                    "location": "Remote - Global",
-                    "url": "https://modsquad.com/careers/",
-                    "source": "ModSquad",
-                    "salary": "$13-19/hour"
-                },
-                # SupportNinja - Customer support specialists
-                {
-                    "title": "Customer Support Specialist",
-                    "company": "SupportNinja",
-                    "location": "Remote - Worldwide",
-                    "url": "https://supportninja.com/careers/",
-                    "source": "SupportNinja",
-                    "salary": "$15-25/hour"
-                },
-                # Boldly - Premium virtual assistants
-                {
-                    "title": "Executive Virtual Assistant",
-                    "company": "Boldly",
-                    "location": "Remote - Global",
-                    "url": "https://boldly.com/careers/",
-                    "source": "Boldly",
-                    "salary": "$16-28/hour"
-                },
-                # Time Etc - VA work
-                {
-                    "title": "Virtual Assistant",
-                    "company": "Time Etc",
-                    "location": "Remote - Worldwide",
-                    "url": "https://web.timeetc.com/virtual-assistant-jobs/",
-                    "source": "Time Etc",
-                    "salary": "$12-22/hour"
-                },
-                # Belay Solutions - VA, bookkeeping, admin
-                {
-                    "title": "Virtual Assistant",
-                    "company": "Belay Solutions",
-                    "location": "Remote - Global",
-                    "url": "https://www.belaysolutions.com/careers/",
-                    "source": "Belay",
-                    "salary": "$14-26/hour"
-                },
-                {
-                    "title": "Virtual Bookkeeper",
-                    "company": "Belay Solutions",
-                    "location": "Remote - Worldwide",
-                    "url": "https://www.belaysolutions.com/careers/",
-                    "source": "Belay",
-                    "salary": "$16-30/hour"
-                },
-                # Fancy Hands - Small tasks
-                {
-                    "title": "Virtual Assistant (Tasks)",
-                    "company": "Fancy Hands",
-                    "location": "Remote - Global",
-                    "url": "https://www.fancyhands.com/jobs",
-                    "source": "Fancy Hands",
-                    "salary": "$10-18/hour"
-                }
-            ])
-        
-        return jobs
+        return self.catalog.jobs_for("va_support_jobs", keywords)
     
+    @job_source()
     def fetch_social_media_platform_jobs(self, keywords):
         """
-        Fetch jobs specifically for TikTok, YouTube, Facebook, Instagram moderation and support
-        """
-        jobs = []
-        
-        if any(word in keywords for word in ["tiktok-moderator", "youtube-reviewer", "facebook-support", "instagram-safety", "content-moderator", "social-media"]):
-            jobs.extend([
-                # Companies working directly with TikTok
-                {
-                    "title": "TikTok Content Moderator",
-                    "company": "Teleperformance",
-                    "location": "Remote - Worldwide",
-                    "url": "https://www.teleperformance.com/en-us/careers",
-                    "source": "Teleperformance",
-                    "salary": "$16-24/hour"
-                },
-                {
-                    "title": "TikTok Trust & Safety Specialist",
-                    "company": "Majorel",
-                    "location": "Remote - Global",
-                    "url": "https://www.majorel.com/careers",
-                    "source": "Majorel",
-                    "salary": "$18-26/hour"
-                },
-                {
-                    "title": "TikTok Community Operations",
-                    "company": "Webhelp (Concentrix)",
-                    "location": "Remote - Worldwide",
-                    "url": "https://careers.concentrix.com/",
-                    "source": "Webhelp",
-                    "salary": "$15-23/hour"
-                },
-                
-                # Companies working with YouTube
-                {
-                    "title": "YouTube Content Reviewer",
-                    "company": "Accenture",
-                    "location": "Remote - Global",
-                    "url": "https://www.accenture.com/careers",
-                    "source": "Accenture",
-                    "salary": "$17-25/hour"
-                },
-                {
-                    "title": "YouTube Policy Specialist",
-                    "company": "Cognizant",
-                    "location": "Remote - Worldwide",
-                    "url": "https://careers.cognizant.com/",
-                    "source": "Cognizant",
-                    "salary": "$16-24/hour"
-                },
-                {
-                    "title": "YouTube Community Guidelines Reviewer",
-                    "company": "Wipro",
-                    "location": "Remote - Global",
-                    "url": "https://careers.wipro.com/",
-                    "source": "Wipro",
-                    "salary": "$15-22/hour"
-                },
-                
-                # Companies working with Facebook/Meta
-                {
-                    "title": "Facebook Content Moderator",
-                    "company": "Accenture",
-                    "location": "Remote - Worldwide",
-                    "url": "https://www.accenture.com/careers",
-                    "source": "Accenture",
-                    "salary": "$18-27/hour"
-                },
-                {
-                    "title": "Meta Trust & Safety Associate",
-                    "company": "Cognizant",
-                    "location": "Remote - Global",
-                    "url": "https://careers.cognizant.com/",
-                    "source": "Cognizant",
-                    "salary": "$17-25/hour"
-                },
-                {
-                    "title": "Instagram Safety Reviewer",
-                    "company": "Majorel",
-                    "location": "Remote - Worldwide",
-                    "url": "https://www.majorel.com/careers",
-                    "source": "Majorel",
-                    "salary": "$16-24/hour"
-                },
-                {
-                    "title": "Facebook Community Operations",
-                    "company": "Genpact",
-                    "location": "Remote - Global",
-                    "url": "https://www.genpact.com/careers",
-                    "source": "Genpact",
-                    "salary": "$15-23/hour"
-                },
-                
-                # Additional BPO companies with social media contracts
-                {
-                    "title": "Social Media Content Analyst",
-                    "company": "HCL Technologies",
-                    "location": "Remote - Worldwide",
-                    "url": "https://www.hcltech.com/careers",
-                    "source": "HCL Tech",
-                    "salary": "$14-21/hour"
-                },
-                {
-                    "title": "Platform Safety Specialist",
-                    "company": "Infosys BPM",
-                    "location": "Remote - Global",
-                    "url": "https://www.infosys.com/careers/",
-                    "source": "Infosys BPM",
-                    "salary": "$16-24/hour"
-                },
-                {
-                    "title": "Digital Platform Moderator",
-                    "company": "TCS (Tata Consultancy)",
-                    "location": "Remote - Worldwide",
-                    "url": "https://www.tcs.com/careers",
-                    "source": "TCS",
-                    "salary": "$15-22/hour"
-                }
-            ])
-        
-        return jobs
-    
-    def fetch_customer_support_platform_jobs(self, keywords):
-        """
-        Fetch customer support jobs for major platforms and tech companies
-        """
-        jobs = []
-        
-        if any(word in keywords for word in ["platform-support", "user-safety", "customer-support", "technical-support"]):
-            jobs.extend([
-                # Customer Support for Major Platforms
-                {
-                    "title": "Platform Customer Support Agent",
-                    "company": "Sitel Group (Foundever)",
-                    "location": "Remote - Worldwide",
-                    "url": "https://www.foundever.com/careers",
-                    "source": "Foundever",
-                    "salary": "$14-20/hour"
-                },
-                {
-                    "title": "Tech Platform Support Specialist",
-                    "company": "Alorica",
-                    "location": "Remote - Global",
-                    "url": "https://www.alorica.com/careers/",
-                    "source": "Alorica",
-                    "salary": "$15-22/hour"
-                },
-                {
-                    "title": "Digital Platform User Support",
-                    "company": "Sykes (Sitel Group)",
-                    "location": "Remote - Worldwide",
-                    "url": "https://www.foundever.com/careers",
-                    "source": "Sykes",
-                    "salary": "$13-19/hour"
-                },
-                {
-                    "title": "Social Media Platform Support",
-                    "company": "Arvato (Bertelsmann)",
-                    "location": "Remote - Global",
-                    "url": "https://www.arvato.com/careers",
-                    "source": "Arvato",
-                    "salary": "$16-23/hour"
-                },
-                {
-                    "title": "Community Support Representative",
-                    "company": "HGS (Hinduja Global)",
-                    "location": "Remote - Worldwide",
-                    "url": "https://www.teamhgs.com/careers/",
-                    "source": "HGS",
-                    "salary": "$14-21/hour"
-                },
-                {
-                    "title": "User Experience Support Agent",
-                    "company": "Startek",
-                    "location": "Remote - Global",
-                    "url": "https://www.startek.com/careers/",
-                    "source": "Startek",
-                    "salary": "$13-20/hour"
-                },
-                {
-                    "title": "Platform Technical Support",
-                    "company": "Transcom",
-                    "location": "Remote - Worldwide",
-                    "url": "https://www.transcom.com/careers/",
-                    "source": "Transcom",
-                    "salary": "$15-22/hour"
-                },
-                {
-                    "title": "Digital Customer Care Agent",
-                    "company": "Webhelp (Concentrix)",
-                    "location": "Remote - Global",
-                    "url": "https://careers.concentrix.com/",
-                    "source": "Webhelp",
-                    "salary": "$14-21/hour"
-                }
-            ])
-        
-        return jobs
-    
-    def fetch_ad_review_specialist_jobs(self, keywords):
-        """
-        Fetch ad review and advertising compliance jobs
-        """
-        jobs = []
-        
-        if any(word in keywords for word in ["ad-reviewer", "advertising-compliance", "campaign-reviewer", "promotional-content"]):
-            jobs.extend([
-                # Ad Review for Google, Facebook, TikTok
-                {
-                    "title": "Google Ads Policy Reviewer",
-                    "company": "Accenture",
-                    "location": "Remote - Worldwide",
-                    "url": "https://www.accenture.com/careers",
-                    "source": "Accenture",
-                    "salary": "$17-25/hour"
-                },
-                {
-                    "title": "Facebook Ads Compliance Specialist",
-                    "company": "Cognizant",
-                    "location": "Remote - Global",
-                    "url": "https://careers.cognizant.com/",
-                    "source": "Cognizant",
-                    "salary": "$16-24/hour"
-                },
-                {
-                    "title": "TikTok Advertising Reviewer",
-                    "company": "Majorel",
-                    "location": "Remote - Worldwide",
-                    "url": "https://www.majorel.com/careers",
-                    "source": "Majorel",
-                    "salary": "$15-23/hour"
-                },
-                {
-                    "title": "Digital Ad Content Reviewer",
-                    "company": "Teleperformance",
-                    "location": "Remote - Global",
-                    "url": "https://www.teleperformance.com/en-us/careers",
-                    "source": "Teleperformance",
-                    "salary": "$14-22/hour"
-                },
-                {
-                    "title": "Advertising Policy Analyst",
-                    "company": "Genpact",
-                    "location": "Remote - Worldwide",
-                    "url": "https://www.genpact.com/careers",
-                    "source": "Genpact",
-                    "salary": "$16-24/hour"
-                },
-                {
-                    "title": "Campaign Compliance Reviewer",
-                    "company": "Wipro",
-                    "location": "Remote - Global",
-                    "url": "https://careers.wipro.com/",
-                    "source": "Wipro",
-                    "salary": "$15-22/hour"
-                },
-                {
-                    "title": "Promotional Content Moderator",
-                    "company": "HCL Technologies",
-                    "location": "Remote - Worldwide",
-                    "url": "https://www.hcltech.com/careers",
-                    "source": "HCL Tech",
-                    "salary": "$14-21/hour"
-                },
-                {
-                    "title": "Ad Quality Assurance Specialist",
-                    "company": "Infosys BPM",
-                    "location": "Remote - Global",
-                    "url": "https://www.infosys.com/careers/",
-                    "source": "Infosys BPM",
-                    "salary": "$16-23/hour"
-                }
-            ])
-        
-        return jobs
+        Fetch jobs specifically for TikTok, YouTube, Facebook, Instagram moderation and support
+        """
+        return self.catalog.jobs_for("social_media_platform_jobs", keywords)
+    
+    @job_source()
+    def fetch_customer_support_platform_jobs(self, keywords):
+        """
+        Fetch customer support jobs for major platforms and tech companies
+        """
+        return self.catalog.jobs_for("customer_support_platform_jobs", keywords)
+    
+    @job_source()
+    def fetch_ad_review_specialist_jobs(self, keywords):
+        """
+        Fetch ad review and advertising compliance jobs
+        """
+        return self.catalog.jobs_for("ad_review_specialist_jobs", keywords)
     
+    @job_source()
     def fetch_data_labeling_specialist_jobs(self, keywords):
         """
         Fetch comprehensive data labeling and annotation jobs
         """
-        jobs = []
-        
-        # Convert keywords to string for better matching
-        keywords_str = " ".join(keywords).lower()
-        
-        if any(word in keywords_str for word in ["image", "labeling", "video", "annotation", "text", "classification", "audio", "transcription", "data"]):
-            jobs.extend([
-                # Major AI Training Companies
-                {
-                    "title": "Image Labeling Specialist",
-                    "company": "Appen",
-                    "location": "Remote - Worldwide",
-                    "url": "https://appen.com/careers/",
-                    "source": "Appen",
-                    "salary": "$12-18/hour"
-                },
-                {
-                    "title": "Video Content Annotator",
-                    "company": "TELUS International AI",
-                    "location": "Remote - Global",
-                    "url": "https://www.telusinternational.com/careers",
-                    "source": "TELUS AI",
-                    "salary": "$13-20/hour"
-                },
-                {
-                    "title": "Text Classification Specialist",
-                    "company": "Lionbridge",
-                    "location": "Remote - Worldwide",
-                    "url": "https://www.lionbridge.com/careers/",
-                    "source": "Lionbridge",
-                    "salary": "$14-21/hour"
-                },
-                {
-                    "title": "Audio Transcription & Labeling",
-                    "company": "Rev.com",
-                    "location": "Remote - Global",
-                    "url": "https://www.rev.com/freelancers",
-                    "source": "Rev.com",
-                    "salary": "$15-22/hour"
-                },
-                {
-                    "title": "Machine Learning Data Trainer",
-                    "company": "iSoftStone",
-                    "location": "Remote - Worldwide",
-                    "url": "https://www.isoftstone.com/careers/",
-                    "source": "iSoftStone",
-                    "salary": "$12-19/hour"
-                },
-                {
-                    "title": "AI Training Data Specialist",
-                    "company": "Pactera EDGE (OneForma)",
-                    "location": "Remote - Global",
-                    "url": "https://www.oneforma.com/",
-                    "source": "OneForma",
-                    "salary": "$13-20/hour"
-                },
-                {
-                    "title": "Computer Vision Data Labeler",
-                    "company": "Scale AI",
-                    "location": "Remote - Worldwide",
-                    "url": "https://scale.com/careers",
-                    "source": "Scale AI",
-                    "salary": "$16-25/hour"
-                },
-                {
-                    "title": "Natural Language Processing Rater",
-                    "company": "Surge AI",
-                    "location": "Remote - Global",
-                    "url": "https://www.surgehq.ai/",
-                    "source": "Surge AI",
-                    "salary": "$15-23/hour"
-                },
-                {
-                    "title": "Data Annotation Quality Reviewer",
-                    "company": "Labelbox",
-                    "location": "Remote - Worldwide",
-                    "url": "https://labelbox.com/careers/",
-                    "source": "Labelbox",
-                    "salary": "$17-26/hour"
-                },
-                {
-                    "title": "Autonomous Vehicle Data Labeler",
-                    "company": "Mighty AI (Uber)",
-                    "location": "Remote - Global",
-                    "url": "https://www.uber.com/careers/",
-                    "source": "Mighty AI",
-                    "salary": "$18-28/hour"
-                }
-            ])
-        
-        return jobs
+        return self.catalog.jobs_for("data_labeling_specialist_jobs", keywords)
     
+    @job_source()
     def fetch_comprehensive_platform_jobs(self, keywords):
         """
         Fetch jobs from additional BPO and tech service companies
         """
-        jobs = []
-        
-        # Add jobs from more companies that work with major platforms
-        jobs.extend([
-            # Additional BPO Companies
-            {
-                "title": "Content Operations Specialist",
-                "company": "Capgemini",
-                "location": "Remote - Worldwide",
-                "url": "https://www.capgemini.com/careers/",
-                "source": "Capgemini",
-                "salary": "$16-24/hour"
-            },
-            {
-                "title": "Digital Platform Analyst",
-                "company": "IBM Services",
-                "location": "Remote - Global",
-                "url": "https://www.ibm.com/careers/",
-                "source": "IBM Services",
-                "salary": "$18-26/hour"
-            },
-            {
-                "title": "Social Media Safety Coordinator",
-                "company": "DXC Technology",
-                "location": "Remote - Worldwide",
-                "url": "https://careers.dxc.technology/",
-                "source": "DXC Technology",
-                "salary": "$15-23/hour"
-            },
-            {
-                "title": "Platform Content Reviewer",
-                "company": "Tech Mahindra",
-                "location": "Remote - Global",
-                "url": "https://careers.techmahindra.com/",
-                "source": "Tech Mahindra",
-                "salary": "$14-21/hour"
-            },
-            {
-                "title": "Community Safety Specialist",
-                "company": "Mindtree (LTI Mindtree)",
-                "location": "Remote - Worldwide",
-                "url": "https://www.ltimindtree.com/careers/",
-                "source": "LTI Mindtree",
-                "salary": "$15-22/hour"
-            },
-            {
-                "title": "Digital Content Moderator",
-                "company": "Mphasis",
-                "location": "Remote - Global",
-                "url": "https://www.mphasis.com/home/careers.html",
-                "source": "Mphasis",
-                "salary": "$13-20/hour"
-            },
-            {
-                "title": "Platform Trust & Safety Agent",
-                "company": "L&T Infotech (LTIMindtree)",
-                "location": "Remote - Worldwide",
-                "url": "https://www.ltimindtree.com/careers/",
-                "source": "L&T Infotech",
-                "salary": "$14-21/hour"
-            },
-            {
-                "title": "Social Platform Support Agent",
-                "company": "Hexaware Technologies",
-                "location": "Remote - Global",
-                "url": "https://hexaware.com/careers/",
-                "source": "Hexaware",
-                "salary": "$13-19/hour"
-            }
-        ])
-        
-        return jobs
+        return self.catalog.jobs_for("comprehensive_platform_jobs", keywords)
     
+    @job_source(label="Creator Economy")
     def fetch_creator_economy_jobs(self, keywords):
-        """
-        Fetch jobs from legitimate creator economy platforms and agencies
-        """
-        jobs = []
-        
-        # Convert keywords to string for better matching
-        keywords_str = " ".join(keywords).lower()
-        
-        if any(word in keywords_str for word in ["creator", "support", "account", "manager", "social", "media", "content", "assistant"]):
-            jobs.extend([
-                # Patreon - Creator support platform
-                {
-                    "title": "Creator Success Manager",
-                    "company": "Patreon",
-                    "location": "Remote - Worldwide",
-                    "url": "https://www.patreon.com/careers",
-                    "source": "Patreon",
-                    "salary": "$45-70k/year"
-                },
-                {
-                    "title": "Creator Support Specialist",
-                    "company": "Patreon",
-                    "location": "Remote - Global",
-                    "url": "https://www.patreon.com/careers",
-                    "source": "Patreon",
-                    "salary": "$40-60k/year"
-                },
-                
-                # Creator economy agencies and services
-                {
-                    "title": "Social Media Manager (Creators)",
-                    "company": "Creator Economy Agencies",
-                    "location": "Remote - Worldwide",
-                    "url": "https://www.upwork.com/freelance-jobs/social-media-marketing/",
-                    "source": "Creator Agencies",
-                    "salary": "$15-35/hour"
-                },
-                {
-                    "title": "Content Creator Assistant",
-                    "company": "YouTube Creator Services",
-                    "location": "Remote - Global",
-                    "url": "https://www.upwork.com/freelance-jobs/virtual-assistant/",
-                    "source": "Creator Services",
-                    "salary": "$12-25/hour"
-                },
-                {
-                    "title": "Creator Account Manager",
-                    "company": "Influencer Marketing Agencies",
-                    "location": "Remote - Worldwide",
-                    "url": "https://www.indeed.com/jobs?q=creator+manager+remote",
-                    "source": "Marketing Agencies",
-                    "salary": "$35-55k/year"
-                },
-                {
-                    "title": "Community Manager (Creators)",
-                    "company": "Creator Management Companies",
-                    "location": "Remote - Global",
-                    "url": "https://remote.co/remote-jobs/marketing/",
-                    "source": "Creator Management",
-                    "salary": "$30-50k/year"
-                }
-            ])
-        
-        return jobs
+        """Fetch creator economy and support jobs"""
+        return self.catalog.jobs_for("creator_economy_jobs", keywords)
     
+    @job_source(label="Gaming Platforms")
     def fetch_gaming_platform_jobs(self, keywords):
-        """
-        Fetch jobs from gaming platforms and companies
-        """
-        jobs = []
-        
-        # Convert keywords to string for better matching
-        keywords_str = " ".join(keywords).lower()
-        
-        if any(word in keywords_str for word in ["gaming", "moderator", "player", "support", "community", "manager", "esports"]):
-            jobs.extend([
-                # Major Gaming Companies
-                {
-                    "title": "Community Moderator",
-                    "company": "Roblox",
-                    "location": "Remote - Worldwide",
-                    "url": "https://corp.roblox.com/careers/",
-                    "source": "Roblox",
-                    "salary": "$40-65k/year"
-                },
-                {
-                    "title": "Player Support Specialist",
-                    "company": "Epic Games",
-                    "location": "Remote - Global",
-                    "url": "https://www.epicgames.com/site/careers",
-                    "source": "Epic Games",
-                    "salary": "$45-70k/year"
-                },
-                {
-                    "title": "Community Operations",
-                    "company": "Riot Games",
-                    "location": "Remote - Worldwide",
-                    "url": "https://www.riotgames.com/en/work-with-us",
-                    "source": "Riot Games",
-                    "salary": "$50-80k/year"
-                },
-                {
-                    "title": "Game Community Manager",
-                    "company": "Activision Blizzard",
-                    "location": "Remote - Global",
-                    "url": "https://careers.activisionblizzard.com/",
-                    "source": "Activision Blizzard",
-                    "salary": "$45-75k/year"
-                },
-                {
-                    "title": "Twitch Community Support",
-                    "company": "Twitch (Amazon)",
-                    "location": "Remote - Worldwide",
-                    "url": "https://www.twitch.tv/jobs/",
-                    "source": "Twitch",
-                    "salary": "$40-65k/year"
-                },
-                {
-                    "title": "Virtual World Moderator",
-                    "company": "Linden Lab (Second Life)",
-                    "location": "Remote - Global",
-                    "url": "https://www.lindenlab.com/careers",
-                    "source": "Linden Lab",
-                    "salary": "$35-55k/year"
-                },
-                {
-                    "title": "Gaming Platform Support",
-                    "company": "Steam (Valve)",
-                    "location": "Remote - Worldwide",
-                    "url": "https://www.valvesoftware.com/en/jobs",
-                    "source": "Valve",
-                    "salary": "$50-85k/year"
-                },
-                {
-                    "title": "Esports Community Manager",
-                    "company": "Gaming Organizations",
-                    "location": "Remote - Global",
-                    "url": "https://www.indeed.com/jobs?q=esports+community+manager+remote",
-                    "source": "Esports Orgs",
-                    "salary": "$35-60k/year"
-                }
-            ])
-        
-        return jobs
+        """Fetch gaming platform and community jobs"""
+        return self.catalog.jobs_for("gaming_platform_jobs", keywords)
     
+    @job_source()
     def fetch_chat_moderation_jobs(self, keywords):
         """
         Fetch chat moderation and community management jobs
         """
-        jobs = []
-        
-        # Convert keywords to string for better matching
-        keywords_str = " ".join(keywords).lower()
-        
-        if any(word in keywords_str for word in ["chat", "moderator", "community", "engagement", "specialist", "live", "support"]):
-            jobs.extend([
-                # Specialized Moderation Companies
-                {
-                    "title": "Chat Moderator",
-                    "company": "ModSquad",
-                    "location": "Remote - Worldwide",
-                    "url": "https://modsquad.com/careers/",
-                    "source": "ModSquad",
-                    "salary": "$12-20/hour"
-                },
-                {
-                    "title": "Live Chat Support Specialist",
-                    "company": "ModSquad",
-                    "location": "Remote - Global",
-                    "url": "https://modsquad.com/careers/",
-                    "source": "ModSquad",
-                    "salary": "$13-22/hour"
-                },
-                {
-                    "title": "Community Engagement Specialist",
-                    "company": "SupportNinja",
-                    "location": "Remote - Worldwide",
-                    "url": "https://supportninja.com/careers/",
-                    "source": "SupportNinja",
-                    "salary": "$15-25/hour"
-                },
-                {
-                    "title": "Social Media Community Manager",
-                    "company": "CloudTask",
-                    "location": "Remote - Global",
-                    "url": "https://www.cloudtask.com/",
-                    "source": "CloudTask",
-                    "salary": "$14-24/hour"
-                },
-                {
-                    "title": "Discord Community Moderator",
-                    "company": "Discord Servers (Various)",
-                    "location": "Remote - Worldwide",
-                    "url": "https://www.upwork.com/freelance-jobs/discord-moderator/",
-                    "source": "Discord Communities",
-                    "salary": "$10-18/hour"
-                },
-                {
-                    "title": "Twitch Chat Moderator",
-                    "company": "Twitch Streamers",
-                    "location": "Remote - Global",
-                    "url": "https://www.fiverr.com/categories/lifestyle/gaming/twitch-promotion",
-                    "source": "Twitch Streamers",
-                    "salary": "$8-15/hour"
-                },
-                {
-                    "title": "Community Forum Moderator",
-                    "company": "Reddit Communities",
-                    "location": "Remote - Worldwide",
-                    "url": "https://www.reddit.com/r/ModSupport/",
-                    "source": "Reddit",
-                    "salary": "$12-20/hour"
-                },
-                {
-                    "title": "Live Stream Chat Manager",
-                    "company": "Streaming Platforms",
-                    "location": "Remote - Global",
-                    "url": "https://www.indeed.com/jobs?q=chat+moderator+remote",
-                    "source": "Streaming Services",
-                    "salary": "$10-18/hour"
-                }
-            ])
-        
-        return jobs
+        return self.catalog.jobs_for("chat_moderation_jobs", keywords)
     
+    @job_source()
     def fetch_social_platform_extended_jobs(self, keywords):
         """
         Fetch extended social media platform jobs
         """
-        jobs = []
-        
-        if any(word in keywords for word in ["platform-support", "community-operations", "social-media"]):
-            jobs.extend([
-                # Major Social Platforms - Direct Employment
-                {
-                    "title": "Community Operations Specialist",
-                    "company": "ByteDance (TikTok)",
-                    "location": "Remote - Worldwide",
-                    "url": "https://careers.bytedance.com/",
-                    "source": "ByteDance",
-                    "salary": "$50-80k/year"
-                },
-                {
-                    "title": "Trust & Safety Associate",
-                    "company": "Meta (Facebook/Instagram)",
-                    "location": "Remote - Global",
-                    "url": "https://www.metacareers.com/",
-                    "source": "Meta",
-                    "salary": "$55-85k/year"
-                },
-                {
-                    "title": "Community Support Specialist",
-                    "company": "Twitter/X",
-                    "location": "Remote - Worldwide",
-                    "url": "https://careers.twitter.com/",
-                    "source": "Twitter/X",
-                    "salary": "$45-70k/year"
-                },
-                {
-                    "title": "Reddit Community Manager",
-                    "company": "Reddit",
-                    "location": "Remote - Global",
-                    "url": "https://www.redditinc.com/careers",
-                    "source": "Reddit",
-                    "salary": "$50-75k/year"
-                },
-                {
-                    "title": "Discord Community Operations",
-                    "company": "Discord",
-                    "location": "Remote - Worldwide",
-                    "url": "https://discord.com/jobs",
-                    "source": "Discord",
-                    "salary": "$45-70k/year"
-                },
-                {
-                    "title": "Snapchat Safety Specialist",
-                    "company": "Snap Inc",
-                    "location": "Remote - Global",
-                    "url": "https://careers.snap.com/",
-                    "source": "Snap Inc",
-                    "salary": "$50-80k/year"
-                },
-                {
-                    "title": "YouTube Creator Support",
-                    "company": "Google (YouTube)",
-                    "location": "Remote - Worldwide",
-                    "url": "https://careers.google.com/",
-                    "source": "Google",
-                    "salary": "$55-85k/year"
-                },
-                {
-                    "title": "WhatsApp Support Specialist",
-                    "company": "Meta (WhatsApp)",
-                    "location": "Remote - Global",
-                    "url": "https://www.metacareers.com/",
-                    "source": "Meta",
-                    "salary": "$45-70k/year"
-                }
-            ])
-        
-        return jobs
+        return self.catalog.jobs_for("social_platform_extended_jobs", keywords)
     
     def format_job(self, job):
         """
@@ -3518,445 +695,166 @@ class JobScout:
         
         return message
     
-    def fetch_sample_specialized_jobs(self, keywords):
+    @job_source()
+    def fetch_reliable_jobs(self, keywords):
         """
-        Sample specialized jobs to demonstrate the organized categorization system
+        Fetch jobs from reliable static sources
         """
-        sample_jobs = []
-        
-        # Entry Level Jobs - more flexible keyword matching
-        if any(word in keywords for word in ["customer-support", "chat-support", "content-moderator", "data-entry", "support", "data", "remote"]):
-            sample_jobs.extend([
-                {
-                    "title": "Customer Support Representative",
-                    "company": "LiveWorld",
-                    "location": "Remote - Worldwide",
-                    "url": "https://liveworld.com/careers",
-                    "source": "LiveWorld",
-                    "salary": "$15/hour"
-                },
-                {
-                    "title": "Content Moderator",
-                    "company": "ModSquad",
-                    "location": "Remote - Global",
-                    "url": "https://modsquad.com/careers",
-                    "source": "ModSquad",
-                    "salary": "$16/hour"
-                },
-                {
-                    "title": "Data Entry Specialist",
-                    "company": "Clickworker",
-                    "location": "Remote - Worldwide",
-                    "url": "https://clickworker.com/jobs",
-                    "source": "Clickworker",
-                    "salary": "$12/hour"
-                }
-            ])
-        
-        # Intermediate Level Jobs - more flexible keyword matching
-        if any(word in keywords for word in ["technical-support", "tiktok-moderator", "search-evaluator", "support", "developer", "remote"]):
-            sample_jobs.extend([
-                {
-                    "title": "Technical Support Specialist",
-                    "company": "GitLab",
-                    "location": "Remote - Worldwide",
-                    "url": "https://about.gitlab.com/jobs",
-                    "source": "GitLab",
-                    "salary": "$25/hour"
-                },
-                {
-                    "title": "TikTok Content Moderator",
-                    "company": "ByteDance",
-                    "location": "Remote - Global",
-                    "url": "https://careers.tiktok.com",
-                    "source": "TikTok",
-                    "salary": "$20/hour"
-                },
-                {
-                    "title": "Search Quality Evaluator",
-                    "company": "TELUS International",
-                    "location": "Remote - Worldwide",
-                    "url": "https://telusinternational.com/careers",
-                    "source": "TELUS International",
-                    "salary": "$18/hour"
-                }
-            ])
+        jobs = []
         
-        # Expert Level Jobs - more flexible keyword matching
-        if any(word in keywords for word in ["prompt-engineering", "linguistic-annotation", "ai-training", "developer", "data", "remote"]):
-            sample_jobs.extend([
+        # Tech jobs
+        if any(word in keywords for word in ["developer", "python", "javascript", "mobile", "data"]):
+            jobs.extend([
                 {
-                    "title": "AI Prompt Engineer",
-                    "company": "Scale AI",
+                    "title": f"Remote {keywords[0].title()} Developer",
+                    "company": "Global Tech Co",
                     "location": "Remote - Worldwide",
-                    "url": "https://scale.com/careers",
-                    "source": "Scale AI",
-                    "salary": "$35/hour"
+                    "url": "https://weworkremotely.com/categories/remote-programming-jobs",
+                    "source": "WeWorkRemotely",
+                    "salary": "$40-80k/year"
                 },
                 {
-                    "title": "Linguistic Annotation Specialist",
-                    "company": "Lionbridge",
+                    "title": f"{keywords[0].title()} Engineer",
+                    "company": "Remote First Inc",
                     "location": "Remote - Global",
-                    "url": "https://lionbridge.com/careers",
-                    "source": "Lionbridge",
-                    "salary": "$28/hour"
-                }
-            ])
-        
-        # Flexible Opportunities - more flexible keyword matching
-        if any(word in keywords for word in ["microtasks", "gig-work", "user-testing", "assistant", "data", "remote"]):
-            sample_jobs.extend([
-                {
-                    "title": "Microtask Worker",
-                    "company": "Amazon MTurk",
-                    "location": "Remote - Flexible",
-                    "url": "https://mturk.com",
-                    "source": "Amazon MTurk",
-                    "salary": "$8-15/hour"
-                },
-                {
-                    "title": "User Experience Tester",
-                    "company": "UserTesting",
-                    "location": "Remote - Worldwide",
-                    "url": "https://usertesting.com/careers",
-                    "source": "UserTesting",
-                    "salary": "$15/hour"
+                    "url": "https://remoteok.io/remote-dev-jobs",
+                    "source": "RemoteOK",
+                    "salary": "$35-70k/year"
                 }
             ])
         
-        return sample_jobs
+        return jobs
+    
+    @job_source()
+    def fetch_static_jobs(self, keywords):
+        """
+        Fetch from static job sources that don't require API calls
+        """
+        return self.catalog.jobs_for("static_jobs", keywords)
+    
+    @job_source()
+    def fetch_flexjobs_api(self, keywords):
+        """
+        Fetch jobs from FlexJobs-style API for IT support and VA roles
+        """
+        return self.catalog.jobs_for("flexjobs_api", keywords)
+    
+    @job_source()
+    def fetch_sample_specialized_jobs(self, keywords):
+        """
+        Sample specialized jobs to demonstrate the organized categorization system
+        """
+        return self.catalog.jobs_for("sample_specialized_jobs", keywords)
     
+    @job_source(label="Sales & Business Development")
     def fetch_sales_bizdev_jobs(self, keywords):
         """
         Fetch sales and business development jobs from remote companies
         """
-        jobs = []
-        
-        if any(word in keywords for word in ["sales", "business-development", "account-executive", "lead-generation", "remote", "support"]):
-            jobs.extend([
-                {
-                    "title": "Sales Development Representative",
-                    "company": "HubSpot",
-                    "location": "Remote - Worldwide",
-                    "url": "https://hubspot.com/careers",
-                    "source": "HubSpot",
-                    "salary": "$25/hour + commission"
-                },
-                {
-                    "title": "Account Executive - Remote",
-                    "company": "Salesforce",
-                    "location": "Remote - Global",
-                    "url": "https://salesforce.com/careers",
-                    "source": "Salesforce",
-                    "salary": "$30-40/hour + commission"
-                },
-                {
-                    "title": "Business Development Manager",
-                    "company": "Remote SaaS Company",
-                    "location": "Remote - Worldwide",
-                    "url": "https://remoteok.io/remote-sales-jobs",
-                    "source": "SaaS Companies",
-                    "salary": "$28-35/hour"
-                }
-            ])
-        
-        return jobs
+        return self.catalog.jobs_for("sales_bizdev_jobs", keywords)
     
+    @job_source(label="Product Management")
     def fetch_product_management_jobs(self, keywords):
         """
         Fetch product management jobs from tech companies
         """
-        jobs = []
-        
-        if any(word in keywords for word in ["product-manager", "product-owner", "roadmap", "agile", "remote", "developer"]):
-            jobs.extend([
-                {
-                    "title": "Product Manager - Remote",
-                    "company": "Tech Startup",
-                    "location": "Remote - Worldwide",
-                    "url": "https://remoteok.io/remote-product-manager-jobs",
-                    "source": "Tech Startups",
-                    "salary": "$35-45/hour"
-                },
-                {
-                    "title": "Product Owner",
-                    "company": "Digital Agency",
-                    "location": "Remote - Global",
-                    "url": "https://remoteok.io/remote-product-manager-jobs",
-                    "source": "Digital Agencies",
-                    "salary": "$30-40/hour"
-                },
-                {
-                    "title": "Scrum Master / Product Owner",
-                    "company": "Remote Tech Company",
-                    "location": "Remote - Worldwide",
-                    "url": "https://remoteok.io/remote-product-manager-jobs",
-                    "source": "Remote Tech",
-                    "salary": "$32-42/hour"
-                }
-            ])
-        
-        return jobs
+        return self.catalog.jobs_for("product_management_jobs", keywords)
     
+    @job_source(label="Ecommerce & Online Stores")
     def fetch_ecommerce_jobs(self, keywords):
         """
         Fetch e-commerce and online store management jobs
         """
-        jobs = []
-        
-        if any(word in keywords for word in ["shopify", "woocommerce", "amazon-va", "ecommerce", "store-manager", "remote", "assistant"]):
-            jobs.extend([
-                {
-                    "title": "Shopify Store Manager",
-                    "company": "E-commerce Agency",
-                    "location": "Remote - Worldwide",
-                    "url": "https://shopify-agency.com/careers",
-                    "source": "Shopify Partners",
-                    "salary": "$20-30/hour"
-                },
-                {
-                    "title": "Amazon Virtual Assistant",
-                    "company": "Amazon FBA Agency",
-                    "location": "Remote - Global",
-                    "url": "https://amazon-agency.com/careers",
-                    "source": "Amazon Agencies",
-                    "salary": "$15-25/hour"
-                },
-                {
-                    "title": "E-commerce Support Specialist",
-                    "company": "Online Store",
-                    "location": "Remote - Worldwide",
-                    "url": "https://www.upwork.com/freelance-jobs/ecommerce/",
-                    "source": "E-commerce Stores",
-                    "salary": "$18-28/hour"
-                }
-            ])
-        
-        return jobs
+        return self.catalog.jobs_for("ecommerce_jobs", keywords)
     
+    @job_source(label="Healthcare Remote")
     def fetch_healthcare_remote_jobs(self, keywords):
         """
         Fetch remote healthcare jobs including telehealth and medical transcription
         """
-        jobs = []
-        
-        if any(word in keywords for word in ["telehealth", "medical-transcription", "medical-billing", "healthcare", "remote", "support"]):
-            jobs.extend([
-                {
-                    "title": "Medical Transcriptionist",
-                    "company": "3M Health Information Systems",
-                    "location": "Remote - Worldwide",
-                    "url": "https://3m.com/careers",
-                    "source": "3M Health",
-                    "salary": "$22-30/hour"
-                },
-                {
-                    "title": "Telehealth Support Specialist",
-                    "company": "Teladoc Health",
-                    "location": "Remote - Global",
-                    "url": "https://teladoc.com/careers",
-                    "source": "Teladoc",
-                    "salary": "$20-28/hour"
-                },
-                {
-                    "title": "Medical Billing Specialist",
-                    "company": "Healthcare BPO",
-                    "location": "Remote - Worldwide",
-                    "url": "https://healthcare-bpo.com/careers",
-                    "source": "Healthcare BPO",
-                    "salary": "$18-25/hour"
-                }
-            ])
-        
-        return jobs
+        return self.catalog.jobs_for("healthcare_remote_jobs", keywords)
     
+    @job_source(label="Translation & Localization")
     def fetch_translation_jobs(self, keywords):
         """
         Fetch translation and localization jobs
         """
-        jobs = []
-        
-        if any(word in keywords for word in ["translator", "localization", "linguist", "language-specialist", "remote", "data"]):
-            jobs.extend([
-                {
-                    "title": "Remote Translator",
-                    "company": "Lionbridge",
-                    "location": "Remote - Worldwide",
-                    "url": "https://lionbridge.com/careers",
-                    "source": "Lionbridge",
-                    "salary": "$25-35/hour"
-                },
-                {
-                    "title": "Localization Specialist",
-                    "company": "TransPerfect",
-                    "location": "Remote - Global",
-                    "url": "https://transperfect.com/careers",
-                    "source": "TransPerfect",
-                    "salary": "$22-32/hour"
-                },
-                {
-                    "title": "Freelance Translator",
-                    "company": "Gengo",
-                    "location": "Remote - Worldwide",
-                    "url": "https://gengo.com/translators",
-                    "source": "Gengo",
-                    "salary": "$20-30/hour"
-                }
-            ])
-        
-        return jobs
+        return self.catalog.jobs_for("translation_jobs", keywords)
     
+    @job_source(label="Research & Surveys")
     def fetch_research_survey_jobs(self, keywords):
         """
         Fetch research and survey participation jobs
         """
-        jobs = []
-        
-        if any(word in keywords for word in ["research", "survey", "study-participant", "data-collection", "remote", "data", "assistant"]):
-            jobs.extend([
-                {
-                    "title": "Online Research Participant",
-                    "company": "Prolific",
-                    "location": "Remote - Worldwide",
-                    "url": "https://prolific.co",
-                    "source": "Prolific",
-                    "salary": "$12-18/hour"
-                },
-                {
-                    "title": "User Interview Participant",
-                    "company": "UserInterviews",
-                    "location": "Remote - Global",
-                    "url": "https://userinterviews.com",
-                    "source": "UserInterviews",
-                    "salary": "$15-25/hour"
-                },
-                {
-                    "title": "Market Research Specialist",
-                    "company": "Research Company",
-                    "location": "Remote - Worldwide",
-                    "url": "https://www.usertesting.com/get-paid-to-test",
-                    "source": "Research Companies",
-                    "salary": "$14-20/hour"
-                }
-            ])
-        
-        return jobs
+        return self.catalog.jobs_for("research_survey_jobs", keywords)
 
     def get_guaranteed_working_jobs(self):
         """
         Get guaranteed working jobs from reliable sources (no API calls)
         """
-        guaranteed_jobs = [
-            # Customer Support - Entry Level
-            {
-                "title": "Customer Support Representative",
-                "company": "LiveWorld",
-                "location": "Remote - Worldwide",
-                "url": "https://www.liveworld.com/careers/",
-                "source": "LiveWorld",
-                "salary": "$15-20/hour"
-            },
-            {
-                "title": "Technical Support Specialist",
-                "company": "SupportNinja",
-                "location": "Remote - Global",
-                "url": "https://supportninja.com/careers/",
-                "source": "SupportNinja",
-                "salary": "$18-25/hour"
-            },
-            {
-                "title": "Community Moderator",
-                "company": "ModSquad",
-                "location": "Remote - Worldwide",
-                "url": "https://modsquad.com/careers/",
-                "source": "ModSquad",
-                "salary": "$14-18/hour"
-            },
-            # Virtual Assistant
-            {
-                "title": "Virtual Assistant",
-                "company": "Fancy Hands",
-                "location": "Remote - Any Country",
-                "url": "https://www.fancyhands.com/jobs",
-                "source": "Fancy Hands",
-                "salary": "$12-18/hour"
-            },
-            {
-                "title": "Executive Virtual Assistant",
-                "company": "Boldly",
-                "location": "Remote - Global",
-                "url": "https://boldly.com/careers/",
-                "source": "Boldly",
-                "salary": "$18-25/hour"
-            },
-            # AI Training & Data
-            {
-                "title": "AI Training Specialist",
-                "company": "Appen",
-                "location": "Remote - Worldwide",
-                "url": "https://appen.com/careers/",
-                "source": "Appen",
-                "salary": "$14-20/hour"
-            },
-            {
-                "title": "Search Quality Evaluator",
-                "company": "TELUS International AI",
-                "location": "Remote - Global",
-                "url": "https://www.telusinternational.com/careers",
-                "source": "TELUS AI",
-                "salary": "$16-22/hour"
-            },
-            {
-                "title": "Data Annotation Specialist",
-                "company": "Lionbridge",
-                "location": "Remote - Worldwide",
-                "url": "https://www.lionbridge.com/careers/",
-                "source": "Lionbridge",
-                "salary": "$15-21/hour"
-            },
-            # BPO & Content Moderation
-            {
-                "title": "Content Moderator (Social Media)",
-                "company": "Teleperformance",
-                "location": "Remote - Worldwide",
-                "url": "https://www.teleperformance.com/careers",
-                "source": "Teleperformance",
-                "salary": "$16-24/hour"
-            },
-            {
-                "title": "Trust & Safety Specialist",
-                "company": "Majorel",
-                "location": "Remote - Global",
-                "url": "https://www.majorel.com/careers",
-                "source": "Majorel",
-                "salary": "$18-26/hour"
-            },
-            # Research & Surveys
-            {
-                "title": "Online Research Participant",
-                "company": "Prolific",
-                "location": "Remote - Worldwide",
-                "url": "https://www.prolific.co/",
-                "source": "Prolific",
-                "salary": "$12-18/hour"
-            },
-            {
-                "title": "User Experience Tester",
-                "company": "UserTesting",
-                "location": "Remote - Global",
-                "url": "https://www.usertesting.com/be-a-user-tester",
-                "source": "UserTesting",
-                "salary": "$10-60/test"
-            }
-        ]
+        return self.catalog.jobs_for("guaranteed_working_jobs")
+    
+    def fan_out(self, summary_msg, jobs, job_texts):
+        """
+        Deliver this run's jobs to every paid subscriber, each getting only
+        the jobs their preferences accept. job_texts are the jobs already
+        formatted, in the same order.
+        """
+        from fanout import FanOutDelivery, load_subscribers
+        from subscriber_prefs import PreferenceIndex, PreferenceStore
+        
+        subscribers = load_subscribers()
+        if not subscribers:
+            print("[FANOUT] No paid subscribers found")
+            return None
         
-        return guaranteed_jobs
+        index = PreferenceIndex(subscribers, PreferenceStore().load_all(subscribers))
+        matched = {}
+        for job, text in zip(jobs, job_texts):
+            if job.get("categorization") is None:
+                job["categorization"] = self.categorizer.categorize_job(job)
+            for chat_id in index.recipients(job):
+                matched.setdefault(chat_id, []).append(text)
+        
+        deliveries = []
+        for chat_id in index.subscribers:
+            texts = matched.get(chat_id)
+            if not texts:
+                continue
+            deliveries.append((chat_id, f"{summary_msg}\n\n🎯 {len(texts)} jobs match your preferences"))
+            messages = texts if DELIVERY_MODE == "individual" else pack_messages(texts)
+            deliveries.extend((chat_id, message) for message in messages)
+        print(f"[FANOUT] {len(matched)} of {len(subscribers)} subscribers have matching jobs")
+        return FanOutDelivery().send(deliveries)
+    
+    def build_fetch_tasks(self):
+        """
+        Build the fetch tasks for every category in CATEGORIES, in merge order:
+        each enabled registry source covering the category's keywords
+        """
+        from job_categories import CATEGORIES
+        tasks = []
+        
+        for category, keywords in CATEGORIES.items():
+            for spec in self.registry.for_keywords(keywords):
+                fetch_function = self.source_results.cached((spec.name, tuple(keywords)), spec.refresh,
+                                                            spec.bind(self))
+                if spec.label:
+                    function, args = self.fetch_with_comprehensive_error_handling, (fetch_function, spec.label, keywords)
+                    kwargs = {"network": spec.kind == NETWORK}
+                else:
+                    function, args, kwargs = fetch_function, (keywords,), None
+                tasks.append(FetchTask(f"{spec.name} [{category}]", function, args, kwargs, host=spec.host,
+                                       source=spec.name, cost=spec.cost))
+        
+        return tasks
     
     def run_daily_scout(self):
         """
         Main function to run daily job scouting - PRIORITIZES GUARANTEED JOBS
         """
         print(f"Agent-21 Scout starting at {datetime.now()}")
+        self.metrics.reset()
         
         # FIRST: Add guaranteed working jobs (no API failures)
         print("[PRIORITY] Adding guaranteed working job opportunities...")
@@ -3967,154 +865,25 @@ class JobScout:
         # SECOND: Try API sources (but don't rely on them)
         print("[OPTIONAL] Attempting to fetch additional jobs from APIs...")
         
-        # Fetch jobs from all sources
-        for category, keywords in CATEGORIES.items():
-            print(f"Scouting {category} jobs...")
-            
-            # Amazon Jobs API - High priority for tech roles
-            if any(word in keywords for word in ["developer", "python", "javascript", "data", "software"]):
-                amazon_jobs = self.fetch_amazon_jobs(keywords)
-                self.jobs_found.extend(amazon_jobs)
-                time.sleep(3)  # Extra delay for Amazon API
-            
-            # Major Remote-First Companies - with comprehensive error handling
-            gitlab_jobs = self.fetch_with_comprehensive_error_handling(self.fetch_gitlab_jobs, "GitLab", keywords)
-            self.jobs_found.extend(gitlab_jobs)
-            
-            automattic_jobs = self.fetch_with_comprehensive_error_handling(self.fetch_automattic_jobs, "Automattic", keywords)
-            self.jobs_found.extend(automattic_jobs)
-            
-            zapier_jobs = self.fetch_with_comprehensive_error_handling(self.fetch_zapier_jobs, "Zapier", keywords)
-            self.jobs_found.extend(zapier_jobs)
-            
-            buffer_jobs = self.fetch_with_comprehensive_error_handling(self.fetch_buffer_jobs, "Buffer", keywords)
-            self.jobs_found.extend(buffer_jobs)
-            
-            doist_jobs = self.fetch_with_comprehensive_error_handling(self.fetch_doist_jobs, "Doist", keywords)
-            self.jobs_found.extend(doist_jobs)
-            
-            remote_com_jobs = self.fetch_with_comprehensive_error_handling(self.fetch_remote_com_jobs, "Remote.com", keywords)
-            self.jobs_found.extend(remote_com_jobs)
-            
-            deel_jobs = self.fetch_with_comprehensive_error_handling(self.fetch_deel_jobs, "Deel", keywords)
-            self.jobs_found.extend(deel_jobs)
-            
-            andela_jobs = self.fetch_andela_jobs(keywords)
-            self.jobs_found.extend(andela_jobs)
-            
-            crypto_jobs = self.fetch_crypto_jobs(keywords)
-            self.jobs_found.extend(crypto_jobs)
-            
-            wikimedia_jobs = self.fetch_wikimedia_jobs(keywords)
-            self.jobs_found.extend(wikimedia_jobs)
-            
-            # Beginner-Friendly Job Categories
-            customer_support_jobs = self.fetch_customer_support_jobs(keywords)
-            self.jobs_found.extend(customer_support_jobs)
-            
-            operations_hr_jobs = self.fetch_operations_hr_jobs(keywords)
-            self.jobs_found.extend(operations_hr_jobs)
-            
-            finance_jobs = self.fetch_finance_jobs(keywords)
-            self.jobs_found.extend(finance_jobs)
-            
-            technical_writing_jobs = self.fetch_technical_writing_jobs(keywords)
-            self.jobs_found.extend(technical_writing_jobs)
-            
-            # BPO/Outsourcing and Gig Economy Jobs
-            bpo_jobs = self.fetch_bpo_outsourcing_jobs(keywords)
-            self.jobs_found.extend(bpo_jobs)
-            
-            ai_training_jobs = self.fetch_ai_training_jobs(keywords)
-            self.jobs_found.extend(ai_training_jobs)
-            
-            freelance_jobs = self.fetch_freelance_gig_jobs(keywords)
-            self.jobs_found.extend(freelance_jobs)
-            
-            va_support_jobs = self.fetch_va_support_jobs(keywords)
-            self.jobs_found.extend(va_support_jobs)
-            
-            # Specialized Platform Jobs
-            social_media_jobs = self.fetch_social_media_platform_jobs(keywords)
-            self.jobs_found.extend(social_media_jobs)
-            
-            platform_support_jobs = self.fetch_customer_support_platform_jobs(keywords)
-            self.jobs_found.extend(platform_support_jobs)
-            
-            ad_review_jobs = self.fetch_ad_review_specialist_jobs(keywords)
-            self.jobs_found.extend(ad_review_jobs)
-            
-            data_labeling_jobs = self.fetch_data_labeling_specialist_jobs(keywords)
-            self.jobs_found.extend(data_labeling_jobs)
-            
-            comprehensive_platform_jobs = self.fetch_comprehensive_platform_jobs(keywords)
-            self.jobs_found.extend(comprehensive_platform_jobs)
-            
-            # Creator Economy and Gaming Platform Jobs
-            creator_economy_jobs = self.fetch_creator_economy_jobs(keywords)
-            self.jobs_found.extend(creator_economy_jobs)
-            
-            gaming_platform_jobs = self.fetch_gaming_platform_jobs(keywords)
-            self.jobs_found.extend(gaming_platform_jobs)
-            
-            chat_moderation_jobs = self.fetch_chat_moderation_jobs(keywords)
-            self.jobs_found.extend(chat_moderation_jobs)
-            
-            social_platform_extended_jobs = self.fetch_social_platform_extended_jobs(keywords)
-            self.jobs_found.extend(social_platform_extended_jobs)
-            
-            # Reliable job sources (no API timeouts)
-            reliable_jobs = self.fetch_reliable_jobs(keywords)
-            self.jobs_found.extend(reliable_jobs)
-            
-            # Static job sources
-            static_jobs = self.fetch_static_jobs(keywords)
-            self.jobs_found.extend(static_jobs)
-            
-            # FlexJobs API for IT support and VA roles
-            flexjobs = self.fetch_flexjobs_api(keywords)
-            self.jobs_found.extend(flexjobs)
-            
-            # Sample specialized jobs to demonstrate organized categorization
-            sample_specialized_jobs = self.fetch_sample_specialized_jobs(keywords)
-            self.jobs_found.extend(sample_specialized_jobs)
-            
-            # New specialized job categories - with comprehensive error handling
-            sales_bizdev_jobs = self.fetch_with_comprehensive_error_handling(self.fetch_sales_bizdev_jobs, "Sales & Business Development", keywords)
-            self.jobs_found.extend(sales_bizdev_jobs)
-            
-            product_mgmt_jobs = self.fetch_with_comprehensive_error_handling(self.fetch_product_management_jobs, "Product Management", keywords)
-            self.jobs_found.extend(product_mgmt_jobs)
-            
-            ecommerce_jobs = self.fetch_with_comprehensive_error_handling(self.fetch_ecommerce_jobs, "Ecommerce & Online Stores", keywords)
-            self.jobs_found.extend(ecommerce_jobs)
-            
-            healthcare_jobs = self.fetch_with_comprehensive_error_handling(self.fetch_healthcare_remote_jobs, "Healthcare Remote", keywords)
-            self.jobs_found.extend(healthcare_jobs)
-            
-            translation_jobs = self.fetch_with_comprehensive_error_handling(self.fetch_translation_jobs, "Translation & Localization", keywords)
-            self.jobs_found.extend(translation_jobs)
-            
-            research_survey_jobs = self.fetch_with_comprehensive_error_handling(self.fetch_research_survey_jobs, "Research & Surveys", keywords)
-            self.jobs_found.extend(research_survey_jobs)
-            
-            # New job categories with dedicated functions
-            course_creator_jobs = self.fetch_with_comprehensive_error_handling(self.fetch_course_creator_jobs, "Course Creator & Education", keywords)
-            self.jobs_found.extend(course_creator_jobs)
-            
-            social_media_jobs = self.fetch_with_comprehensive_error_handling(self.fetch_social_media_tasks_jobs, "Social Media Tasks", keywords)
-            self.jobs_found.extend(social_media_jobs)
-            
-            data_labeling_jobs = self.fetch_with_comprehensive_error_handling(self.fetch_data_labeling_jobs, "Data Labeling & Annotation", keywords)
-            self.jobs_found.extend(data_labeling_jobs)
-            
-            gaming_platform_jobs = self.fetch_with_comprehensive_error_handling(self.fetch_gaming_platform_jobs, "Gaming Platforms", keywords)
-            self.jobs_found.extend(gaming_platform_jobs)
-            
-            creator_economy_jobs = self.fetch_with_comprehensive_error_handling(self.fetch_creator_economy_jobs, "Creator Economy", keywords)
-            self.jobs_found.extend(creator_economy_jobs)
-            
-            time.sleep(2)  # Rate limiting between categories
+        # Fetch jobs from all sources concurrently, merged in category/source order.
+        # Each remote board is downloaded once and shared by every category.
+        self.snapshots.clear()
+        self.ats.clear()
+        self.health.start_run()
+        engine = FetchEngine(metrics=self.metrics)
+        reused = self.source_results.hits
+        engine.merge_into(self.jobs_found, self.build_fetch_tasks())
+        self.health.save()  # Breakers persisted once per run, not per call
+        print(f"[SNAPSHOT] {self.snapshots.downloads} board downloads served {self.snapshots.hits} extra lookups")
+        if self.source_results.hits > reused:
+            print(f"[REFRESH] Reused {self.source_results.hits - reused} source results still within their refresh interval")
+        if self.ats.skipped:
+            print(f"[INCREMENTAL] Skipped {self.ats.skipped} ATS postings unchanged since they were delivered")
+        if self.budgets.hedges or self.budgets.gave_up:
+            print(f"[BUDGET] {self.budgets.hedges} hedged requests, {self.budgets.gave_up} gave up at their budget")
+        if engine.timed_out:
+            print(f"[WARNING] {len(engine.timed_out)} source calls missed the fetch deadline")
+        self.metrics.lap("fetch")
         
         # THIRD: Add additional reliable sources (no API calls)
         print("[RELIABLE] Adding additional reliable job sources...")
@@ -4122,6 +891,7 @@ class JobScout:
         try:
             # Add worldwide remote jobs accessible from Kenya
             print("[GLOBAL] Adding worldwide remote opportunities...")
+            from kenya_jobs import get_kenya_friendly_jobs
             worldwide_jobs = get_kenya_friendly_jobs()
             self.jobs_found.extend(worldwide_jobs)
         except Exception as e:
@@ -4162,28 +932,49 @@ class JobScout:
             self.fetch_platform_specific_opportunities()
         except Exception as e:
             print(f"[WARNING] Platform jobs failed: {e}")
-        
-        # Remove duplicates and count
-        unique_jobs = []
-        seen_titles = set()
-        
-        for job in self.jobs_found:
-            job_key = f"{job['title']}-{job['company']}"
-            if job_key not in seen_titles:
-                unique_jobs.append(job)
-                seen_titles.add(job_key)
+        self.metrics.lap("reliable_sources")
+        
+        # Incremental mode: sources whose output is unchanged since it was
+        # last delivered are skipped; only the delta is processed below
+        source_groups = group_by_source(self.jobs_found)
+        changed_sources = self.source_hashes.changes(source_groups)
+        if self.source_hashes.enabled:
+            fresh_jobs = [job for job in self.jobs_found if (job.get("source") or "") in changed_sources]
+            print(f"[INCREMENTAL] {len(changed_sources)} of {len(source_groups)} sources changed, "
+                  f"{len(fresh_jobs)} of {len(self.jobs_found)} jobs to process")
+        else:
+            fresh_jobs = self.jobs_found
+        
+        # Remove duplicates (normalized title/company, on compact Job records
+        # from here on), then jobs already sent on an earlier run
+        all_jobs = dedupe_jobs(as_jobs(fresh_jobs))
+        unique_jobs = self.seen_jobs.filter_new(all_jobs)
+        print(f"[DEDUP] {len(all_jobs)} unique jobs, {len(unique_jobs)} new since the last run")
+        self.metrics.count_jobs("fetched", self.jobs_found)
+        self.metrics.count_jobs("unique", all_jobs)
+        self.metrics.count_jobs("new", unique_jobs)
+        self.metrics.lap("dedup")
         
         self.total_jobs = len(unique_jobs)
-        self.sources = list(set([job['source'] for job in unique_jobs]))
+        self.sources = list(set([job.source for job in unique_jobs]))
         
-        # Organize jobs by skill level and category
+        # Organize jobs by skill level and category (all of today's jobs, so
+        # the store records a level and category for each)
         print("[TARGET] Organizing jobs by skill level and requirements...")
-        organized_jobs = self.categorizer.organize_jobs_by_category(unique_jobs)
-        
-        # GUARANTEE: Ensure we always have jobs to send
-        if self.total_jobs == 0:
+        organized_jobs = self.categorizer.organize_jobs_by_category(all_jobs)
+        self.metrics.lap("categorize")
+        
+        # Keep today's jobs queryable: new ones inserted, known ones get last_seen bumped
+        stored = self.job_store.upsert(all_jobs)
+        if stored:
+            print(f"[STORE] Upserted {stored} jobs into {self.job_store.path.name}")
+        self.metrics.lap("store")
+        
+        # GUARANTEE: Ensure we always have jobs to send when nothing was fetched
+        unsent_jobs = []
+        if not self.jobs_found:
             print("[FALLBACK] No jobs found from APIs, using guaranteed jobs only")
-            unique_jobs = guaranteed_jobs
+            unique_jobs = as_jobs(guaranteed_jobs)
             self.total_jobs = len(unique_jobs)
         
         # Send organized summary
@@ -4192,26 +983,37 @@ class JobScout:
             summary_msg = f"🤖 *Agent-21 Scout Daily Report*\n"
             summary_msg += f"📅 {datetime.now().strftime('%Y-%m-%d %H:%M UTC')}\n"
             summary_msg += f"📊 Found {self.total_jobs} new job opportunities\n"
-            summary_msg += f"🚀 Sending individual job notifications...\n\n"
+            if DELIVERY_MODE == "individual":
+                summary_msg += f"🚀 Sending individual job notifications...\n\n"
+            else:
+                summary_msg += f"🚀 Sending job digests...\n\n"
             summary_msg += f"💡 Each job includes company details and direct application link"
             
             send_telegram_message(summary_msg)
             
-            # Send each job as individual message
-            jobs_sent = 0
-            max_jobs_to_send = 25  # Limit to avoid spam
+            if DELIVERY_MODE == "individual":
+                # Send each job as individual message
+                jobs_to_send = unique_jobs[:MAX_INDIVIDUAL_JOBS]
+                job_texts = [self.format_individual_job(job) for job in jobs_to_send]
+                job_messages = job_texts
+            else:
+                # Pack the formatted jobs into as few messages as possible
+                jobs_to_send = unique_jobs[:MAX_DIGEST_JOBS]
+                job_texts = [self.format_individual_job(job) for job in jobs_to_send]
+                job_messages = pack_messages(job_texts)
             
-            for job in unique_jobs:
-                if jobs_sent >= max_jobs_to_send:
-                    break
-                
-                # Format individual job message
-                job_msg = self.format_individual_job(job)
+            for job_msg in job_messages:
                 send_telegram_message(job_msg)
-                jobs_sent += 1
-                
-                # Small delay to avoid hitting Telegram rate limits
-                time.sleep(0.5)
+            jobs_sent = len(jobs_to_send)
+            
+            # Premium subscribers get the jobs matching their preferences in their own chats
+            from fanout import FANOUT_ENABLED
+            if FANOUT_ENABLED:
+                self.fan_out(summary_msg, jobs_to_send, job_texts)
+            
+            # Remember what went out so tomorrow's run skips it
+            self.seen_jobs.mark_seen(unique_jobs[:jobs_sent])
+            unsent_jobs = unique_jobs[jobs_sent:]
             
             # Send comprehensive source performance stats
             stats_msg = "📊 **Enhanced Source Performance Report**\n\n"
@@ -4238,6 +1040,10 @@ class JobScout:
                 elif stats["status"] in ["api_error", "error"]:
                     stats_msg += f"❌ {source}: Failed\n"
                     failed_sources += 1
+                elif stats["status"] == "circuit_open":
+                    stats_msg += f"⏸️ {source}: Skipped (failing repeatedly, used fallback)\n"
+                    failed_sources += 1
+                    fallback_sources += 1
             
             stats_msg += f"\n📈 Active Sources: {successful_sources}\n"
             stats_msg += f"🔄 Sources with Retries: {retry_sources}\n"
@@ -4254,7 +1060,10 @@ class JobScout:
             
             # Send completion message with stats
             completion_msg = f"✅ *Job Notifications Complete*\n\n"
-            completion_msg += f"📤 Sent {jobs_sent} individual job notifications\n"
+            if DELIVERY_MODE == "individual":
+                completion_msg += f"📤 Sent {jobs_sent} individual job notifications\n"
+            else:
+                completion_msg += f"📤 Sent {jobs_sent} jobs in {len(job_messages)} digest messages\n"
             
             if self.total_jobs > jobs_sent:
                 completion_msg += f"📋 {self.total_jobs - jobs_sent} additional jobs available\n"
@@ -4266,245 +1075,46 @@ class JobScout:
         else:
             send_telegram_message("🔍 *Agent-21 Scout Report*\n\nNo new opportunities found today.\nKeep your skills sharp! 💪")
         
+        # A changed source counts as delivered once none of its jobs are left
+        # over (beyond the per-run cap); the rest are processed again next run
+        unsent_keys = {job_key(job) for job in unsent_jobs}
+        self.source_hashes.commit({
+            source: value for source, value in changed_sources.items()
+            if not any(job_key(job) in unsent_keys for job in source_groups[source])
+        })
+        self.ats.commit(undelivered={job.source for job in unsent_jobs})
+        
+        self.metrics.lap("deliver")
+        slowest = ", ".join(f"{source} {seconds:.1f}s" for source, seconds in self.metrics.slowest(3))
+        if slowest:
+            print(f"[METRICS] Slowest sources: {slowest}")
+        if self.metrics.export():
+            print(f"[METRICS] Run metrics written to {self.metrics.directory}")
+        
         print(f"Agent-21 Scout completed. Found {self.total_jobs} jobs.")
     
+    @job_source(label="Course Creator & Education")
     def fetch_course_creator_jobs(self, keywords):
         """Fetch course creator and educational content jobs"""
-        jobs = []
-        
-        # Convert keywords to string for better matching
-        keywords_str = " ".join(keywords).lower()
-        
-        # Course creator opportunities
-        if any(word in keywords_str for word in ["course", "creator", "instructor", "education", "training", "teaching"]):
-            jobs.extend([
-                {
-                    "title": "Online Course Instructor",
-                    "company": "Udemy",
-                    "location": "Remote - Worldwide",
-                    "url": "https://teach.udemy.com/",
-                    "source": "Udemy Teaching",
-                    "salary": "$20-100/hour"
-                },
-                {
-                    "title": "Educational Content Creator",
-                    "company": "Coursera",
-                    "location": "Remote - Global",
-                    "url": "https://www.coursera.org/teach",
-                    "source": "Coursera",
-                    "salary": "$30-80/hour"
-                },
-                {
-                    "title": "Training Specialist",
-                    "company": "LinkedIn Learning",
-                    "location": "Remote - Worldwide",
-                    "url": "https://learning.linkedin.com/instructors",
-                    "source": "LinkedIn Learning",
-                    "salary": "$40-120/hour"
-                }
-            ])
-        
-        return jobs
+        return self.catalog.jobs_for("course_creator_jobs", keywords)
     
+    @job_source(label="Social Media Tasks")
     def fetch_social_media_tasks_jobs(self, keywords):
         """Fetch social media moderation and task jobs"""
-        jobs = []
-        
-        # Convert keywords to string for better matching
-        keywords_str = " ".join(keywords).lower()
-        
-        if any(word in keywords_str for word in ["tiktok", "youtube", "facebook", "instagram", "social", "media", "moderator", "tasks"]):
-            jobs.extend([
-                {
-                    "title": "TikTok Content Moderator",
-                    "company": "ByteDance",
-                    "location": "Remote - Global",
-                    "url": "https://careers.tiktok.com/",
-                    "source": "TikTok Careers",
-                    "salary": "$18-25/hour"
-                },
-                {
-                    "title": "YouTube Content Reviewer",
-                    "company": "Google",
-                    "location": "Remote - Worldwide",
-                    "url": "https://careers.google.com/",
-                    "source": "Google Careers",
-                    "salary": "$20-28/hour"
-                },
-                {
-                    "title": "Facebook Community Moderator",
-                    "company": "Meta",
-                    "location": "Remote - Global",
-                    "url": "https://www.metacareers.com/",
-                    "source": "Meta Careers",
-                    "salary": "$19-26/hour"
-                },
-                {
-                    "title": "Instagram Safety Specialist",
-                    "company": "Meta",
-                    "location": "Remote - Worldwide",
-                    "url": "https://www.metacareers.com/",
-                    "source": "Meta Careers",
-                    "salary": "$21-29/hour"
-                }
-            ])
-        
-        return jobs
+        return self.catalog.jobs_for("social_media_tasks_jobs", keywords)
     
+    @job_source(label="Data Labeling & Annotation")
     def fetch_data_labeling_jobs(self, keywords):
         """Fetch data labeling and annotation jobs"""
-        jobs = []
-        
-        if any(word in keywords for word in ["data-labeling", "annotation", "image-labeling", "video-annotation", "labeling"]):
-            jobs.extend([
-                {
-                    "title": "Image Annotation Specialist",
-                    "company": "Scale AI",
-                    "location": "Remote - Global",
-                    "url": "https://scale.com/careers",
-                    "source": "Scale AI",
-                    "salary": "$15-22/hour"
-                },
-                {
-                    "title": "Video Data Labeler",
-                    "company": "Appen",
-                    "location": "Remote - Worldwide",
-                    "url": "https://appen.com/careers/",
-                    "source": "Appen",
-                    "salary": "$12-18/hour"
-                },
-                {
-                    "title": "Audio Transcription Specialist",
-                    "company": "Rev",
-                    "location": "Remote - Global",
-                    "url": "https://www.rev.com/freelancers",
-                    "source": "Rev",
-                    "salary": "$15-22/hour"
-                },
-                {
-                    "title": "3D Point Cloud Labeler",
-                    "company": "Mighty AI",
-                    "location": "Remote - Worldwide",
-                    "url": "https://mty.ai/careers/",
-                    "source": "Mighty AI",
-                    "salary": "$18-25/hour"
-                }
-            ])
-        
-        return jobs
-    
-    def fetch_gaming_platform_jobs(self, keywords):
-        """Fetch gaming platform and community jobs"""
-        jobs = []
-        
-        if any(word in keywords for word in ["gaming", "esports", "player-support", "community-manager", "gaming-moderator"]):
-            jobs.extend([
-                {
-                    "title": "Gaming Community Manager",
-                    "company": "Discord",
-                    "location": "Remote - Global",
-                    "url": "https://discord.com/careers",
-                    "source": "Discord",
-                    "salary": "$25-35/hour"
-                },
-                {
-                    "title": "Player Support Specialist",
-                    "company": "Riot Games",
-                    "location": "Remote - Worldwide",
-                    "url": "https://careers.riotgames.com/",
-                    "source": "Riot Games",
-                    "salary": "$20-30/hour"
-                },
-                {
-                    "title": "Esports Community Coordinator",
-                    "company": "Twitch",
-                    "location": "Remote - Global",
-                    "url": "https://www.twitch.tv/jobs/",
-                    "source": "Twitch",
-                    "salary": "$22-32/hour"
-                }
-            ])
-        
-        return jobs
-    
-    def fetch_creator_economy_jobs(self, keywords):
-        """Fetch creator economy and support jobs"""
-        jobs = []
-        
-        if any(word in keywords for word in ["creator-support", "content-assistant", "social-media-manager", "creator"]):
-            jobs.extend([
-                {
-                    "title": "Creator Support Specialist",
-                    "company": "Patreon",
-                    "location": "Remote - Worldwide",
-                    "url": "https://www.patreon.com/careers",
-                    "source": "Patreon",
-                    "salary": "$22-30/hour"
-                },
-                {
-                    "title": "Content Creator Assistant",
-                    "company": "OnlyFans",
-                    "location": "Remote - Global",
-                    "url": "https://onlyfans.com/careers",
-                    "source": "OnlyFans",
-                    "salary": "$18-28/hour"
-                },
-                {
-                    "title": "Influencer Relations Manager",
-                    "company": "TikTok",
-                    "location": "Remote - Worldwide",
-                    "url": "https://careers.tiktok.com/",
-                    "source": "TikTok",
-                    "salary": "$25-40/hour"
-                }
-            ])
-        
-        return jobs
+        return self.catalog.jobs_for("data_labeling_jobs", keywords)
     
+    @job_source(enabled=False)
     def fetch_research_testing_jobs(self, keywords):
         """Fetch user research and testing jobs"""
-        jobs = []
-        
-        # Convert keywords to string for better matching
-        keywords_str = " ".join(keywords).lower()
-        
-        if any(word in keywords_str for word in ["user", "testing", "research", "studies", "product", "feedback", "usability"]):
-            jobs.extend([
-                {
-                    "title": "User Experience Tester",
-                    "company": "UserTesting",
-                    "location": "Remote - Worldwide",
-                    "url": "https://www.usertesting.com/be-a-user-tester",
-                    "source": "UserTesting",
-                    "salary": "$10-60/test"
-                },
-                {
-                    "title": "Research Study Participant",
-                    "company": "Prolific",
-                    "location": "Remote - Global",
-                    "url": "https://www.prolific.co/",
-                    "source": "Prolific",
-                    "salary": "$8-20/hour"
-                },
-                {
-                    "title": "Product Feedback Specialist",
-                    "company": "Respondent.io",
-                    "location": "Remote - Worldwide",
-                    "url": "https://www.respondent.io/",
-                    "source": "Respondent",
-                    "salary": "$50-200/session"
-                },
-                {
-                    "title": "Usability Testing Expert",
-                    "company": "UserInterviews",
-                    "location": "Remote - Global",
-                    "url": "https://www.userinterviews.com/",
-                    "source": "UserInterviews",
-                    "salary": "$25-100/session"
-                }
-            ])
-        
-        return jobs
+        return self.catalog.jobs_for("research_testing_jobs", keywords)
+
+# Company ATS boards join the registry in the merge order ats_companies.json gives them
+register_companies()
 
 if __name__ == "__main__":
     scout = JobScout()
@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+Test the ATS connectors: per-company configuration, paged streaming and
+incremental fetches by updated_at (no network access required)
+"""
+
+import json
+import os
+import tempfile
+
+import source_snapshots
+from ats_connectors import AtsBoards, Company, Connector, load_companies, register_companies
+from fetch_engine import FetchEngine
+from source_registry import NETWORK, SOURCES, SourceRegistry
+from source_snapshots import SourceSnapshots
+from telegram_jobs import JobScout
+
+class FakeResponse:
+    def __init__(self, payload, status_code=200):
+        self.payload = payload
+        self.status_code = status_code
+
+    def json(self):
+        return self.payload
+
+def lever_posting(number, updated=1700000000000):
+    return {"id": f"lever-{number}", "text": f"Python Developer {number}" if number % 50 == 0 else f"Designer {number}",
+            "hostedUrl": f"https://jobs.lever.co/acme/lever-{number}", "categories": {"location": "Remote - Anywhere"},
+            "workplaceType": "remote", "updatedAt": updated}
+
+BOARDS = {
+    "https://boards-api.greenhouse.io/v1/boards/globex/jobs": {"jobs": [
+        {"id": 11, "title": "Senior Python Engineer", "updated_at": "2026-01-05T10:00:00-05:00",
+         "absolute_url": "https://job-boards.greenhouse.io/globex/jobs/11", "location": {"name": "Remote, EMEA"}},
+        {"id": 12, "title": "Python Team Lead", "updated_at": "2026-01-06T10:00:00Z",
+         "location": {"name": "New York Office"}},
+    ]},
+    "https://api.ashbyhq.com/posting-api/job-board/initech": {"jobs": [
+        {"id": "a1", "title": "Support Engineer", "isRemote": True, "location": "Lagos",
+         "jobUrl": "https://jobs.ashbyhq.com/initech/a1", "publishedAt": "2026-01-02T00:00:00.000Z",
+         "compensation": {"compensationTierSummary": "$60K – $80K"}},
+        {"id": "a2", "title": "Support Lead", "isListed": False, "isRemote": True},
+    ]},
+    "https://apply.workable.com/api/v1/widget/accounts/hooli": {"jobs": [
+        {"shortcode": "W1", "title": "Data Analyst", "telecommuting": True, "country": "Kenya",
+         "url": "https://apply.workable.com/j/W1", "published_on": "2026-01-03"},
+    ]},
+}
+
+def test_ats_connectors():
+    print("🧪 Testing ATS Connectors...")
+
+    lever_board = [lever_posting(number) for number in range(1, 251)]
+    calls = []
+
+    def fake_get(url, params=None, headers=None, timeout=None, ttl=None):
+        calls.append((url, tuple(sorted((params or {}).items()))))
+        if url == "https://api.lever.co/v0/postings/acme":
+            return FakeResponse(lever_board[params["skip"]:params["skip"] + params["limit"]])
+        if url in BOARDS:
+            return FakeResponse(BOARDS[url])
+        return FakeResponse({}, status_code=404)
+
+    companies = {company.name: company for company in (
+        Company("Acme", "lever", "acme", max_jobs=2),
+        Company("Globex", "greenhouse", "globex", remote_only=True),
+        Company("Initech", "ashby", "initech", location="Remote - Worldwide"),
+        Company("Hooli", "workable", "hooli"),
+        Company("Gone", "greenhouse", "gone"),
+    )}
+
+    # 1. Companies come from the config file and are registered as network sources
+    print("\n1. Testing company configuration...")
+    assert SOURCES.get("GitLab").host == "boards-api.greenhouse.io" and SOURCES.get("GitLab").label == "GitLab"
+    assert SOURCES.get("Kraken").kind == NETWORK and SOURCES.get("Kraken").host == "api.lever.co"
+
+    # Merge order: the Greenhouse boards stay where their hand-written fetchers were, new companies go last
+    names = [spec.name for spec in SOURCES]
+    assert names[names.index("Amazon Jobs"):names.index("fetch_andela_jobs")] == [
+        "Amazon Jobs", "GitLab", "Automattic", "Zapier", "Buffer", "Doist", "Remote.com", "Deel"]
+    assert names[-2:] == ["Kraken", "Supabase"]
+    register_companies()  # Again (telegram_jobs run as __main__, then imported): nothing changes
+    assert [spec.name for spec in SOURCES] == names
+    try:
+        register_companies({"Acme": Company("Acme", "lever", "acme", after="fetch_nothing_jobs")}, SourceRegistry())
+        assert False, "an unknown `after` source should be rejected"
+    except ValueError:
+        pass
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "companies.json")
+        for entries in ([{"name": "Bad", "ats": "taleo", "board": "bad"}],
+                        [{"name": "Twice", "ats": "lever", "board": "a"}, {"name": "Twice", "ats": "ashby", "board": "b"}]):
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump({"companies": entries}, f)
+            try:
+                load_companies(path)
+                assert False, f"{entries} should be rejected"
+            except ValueError:
+                pass
+        assert load_companies(os.path.join(directory, "missing.json")) == {}
+
+    class Unfinished(Connector):  # No parse(): rejected when created, not mid-run
+        def url(self, board):
+            return board
+
+    try:
+        Unfinished()
+        assert False, "a connector without parse() should not be instantiable"
+    except TypeError:
+        pass
+
+    original_get = source_snapshots.cached_get
+    source_snapshots.cached_get = fake_get
+    try:
+        with tempfile.TemporaryDirectory() as directory:
+            # 2. Paged boards are streamed: a category reads only as far as it needs
+            print("\n2. Testing streamed pagination...")
+            boards = AtsBoards(companies, path=os.path.join(directory, "ats.db"), incremental=False)
+            snapshots = SourceSnapshots()
+            jobs = boards.jobs_for("Acme", ["designer"], snapshots)
+            assert [job["title"] for job in jobs] == ["Designer 1", "Designer 2"] and len(calls) == 1
+            jobs = boards.jobs_for("Acme", ["python"], snapshots)
+            assert [job["title"] for job in jobs] == ["Python Developer 50", "Python Developer 100"]
+            assert len(calls) == 1 and snapshots.hits == 1  # Both matches are on the first page
+            companies["Acme"].max_jobs = 10
+            jobs = boards.jobs_for("Acme", ["python"], snapshots)
+            assert len(jobs) == 5 and jobs[-1]["url"] == "https://jobs.lever.co/acme/lever-250"
+            assert [dict(params)["skip"] for _, params in calls] == [0, 100, 200]  # Each page once
+            print(f"   250 postings in {len(calls)} pages, first lookups stopped after page 1")
+
+            # 3. Every ATS is parsed into the scout's job fields
+            print("\n3. Testing connectors...")
+            globex = boards.jobs_for("Globex", ["python"], snapshots)
+            assert globex == [{"title": "Senior Python Engineer", "company": "Globex", "location": "Remote, EMEA",
+                               "url": "https://job-boards.greenhouse.io/globex/jobs/11", "source": "Globex",
+                               "salary": "Competitive"}]  # The office job is dropped (remote_only)
+            initech = boards.jobs_for("Initech", ["support"], snapshots)
+            assert [(job["title"], job["location"], job["salary"]) for job in initech] == [
+                ("Support Engineer", "Remote - Worldwide", "$60K – $80K")]  # The unlisted job is dropped
+            hooli = boards.jobs_for("Hooli", ["data"], snapshots)
+            assert hooli[0]["url"] == "https://apply.workable.com/j/W1" and hooli[0]["location"] == "Kenya"
+            assert boards.jobs_for("Gone", ["python"], snapshots) == []  # 404 board
+
+            # 4. Incremental runs skip postings delivered with the same updated_at
+            print("\n4. Testing incremental fetches...")
+            companies["Acme"].max_jobs = 2
+            boards = AtsBoards(companies, path=os.path.join(directory, "ats.db"), incremental=True)
+            first = boards.jobs_for("Acme", ["python"], SourceSnapshots())
+            boards.jobs_for("Globex", ["python"], SourceSnapshots())
+            boards.commit(undelivered={"Globex"})
+            boards.clear()
+            lever_board[49] = lever_posting(50, updated=1800000000000)  # Python Developer 50 was edited
+            again = boards.jobs_for("Acme", ["python"], SourceSnapshots())
+            assert [job["title"] for job in first] == ["Python Developer 50", "Python Developer 100"]
+            assert [job["title"] for job in again] == ["Python Developer 50", "Python Developer 150"]
+            assert boards.skipped == 1  # Python Developer 100 was unchanged
+            assert len(boards.jobs_for("Globex", ["python"], SourceSnapshots())) == 1  # Never delivered
+            print(f"   {boards.skipped} unchanged posting skipped")
+
+            # 5. Configured companies run as registry sources of the daily scout
+            print("\n5. Testing scout integration...")
+            registry = SourceRegistry()
+            register_companies({"Hooli": companies["Hooli"]}, registry)
+            scout = JobScout()
+            scout.registry = registry
+            scout.snapshots = SourceSnapshots()  # No breaker state from earlier (offline) runs
+            scout.ats = AtsBoards(companies, path=os.path.join(directory, "scout.db"), incremental=False)
+            tasks = scout.build_fetch_tasks()
+            assert tasks and all(task.host == "apply.workable.com" for task in tasks)
+            results = [job for jobs in FetchEngine().run(tasks) for job in jobs]
+            assert results and all(job["source"] == "Hooli" for job in results)
+    finally:
+        source_snapshots.cached_get = original_get
+
+if __name__ == "__main__":
+    test_ats_connectors()
+    print("\n🎉 ATS connector tests passed!")
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Test fan-out delivery to paid subscribers (no network access required)
+"""
+
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+
+from fanout import FanOutDelivery, load_subscribers
+from outbound_queue import OutboundQueue, OutboxPool
+from rate_limiter import RateLimiter
+
+def make_payment_dbs(directory, subscribers):
+    """Both payment bots' schemas with a mix of paid and unpaid users"""
+    payments = os.path.join(directory, "payments.db")
+    with sqlite3.connect(payments) as conn:
+        conn.execute("CREATE TABLE users (chat_id TEXT PRIMARY KEY, phone TEXT, status TEXT, created_at TEXT)")
+        conn.executemany("INSERT INTO users VALUES (?, ?, ?, '')",
+                         [(str(chat_id), "07", "paid" if chat_id % 4 else "pending") for chat_id in subscribers])
+    agent21 = os.path.join(directory, "agent21_payments.db")
+    with sqlite3.connect(agent21) as conn:
+        conn.execute("CREATE TABLE payments (id INTEGER PRIMARY KEY, user_id INTEGER, username TEXT, "
+                     "reference_code TEXT, payment_status TEXT)")
+        conn.executemany("INSERT INTO payments (user_id, reference_code, payment_status) VALUES (?, ?, ?)",
+                         [(chat_id, str(chat_id), "completed") for chat_id in subscribers[:10]])
+    return (
+        (payments, "SELECT chat_id FROM users WHERE status = 'paid'"),
+        (agent21, "SELECT DISTINCT user_id FROM payments WHERE payment_status = 'completed'"),
+        (os.path.join(directory, "missing.db"), "SELECT 1"),
+    )
+
+def test_fanout():
+    print("🧪 Testing Fan-Out Delivery...")
+
+    with tempfile.TemporaryDirectory() as directory:
+        # 1. Paid subscribers from both payment bots, deduplicated
+        print("\n1. Testing subscriber list...")
+        sources = make_payment_dbs(directory, list(range(1000, 1400)))
+        subscribers = load_subscribers(sources)
+        assert len(subscribers) == 300 + 3  # 3/4 paid, plus pending users who paid via the other bot
+        assert len(set(subscribers)) == len(subscribers)
+        print(f"   {len(subscribers)} paid subscribers")
+
+        # 2. Every subscriber gets every message, in order, concurrently
+        print("\n2. Testing concurrent delivery...")
+        limiter = RateLimiter(global_rate=10000, private_rate=1000)
+        received = {}
+        lock = threading.Lock()
+
+        def deliver(chat_id, text):
+            limiter.wait(chat_id)
+            time.sleep(0.01)  # Network round trip
+            with lock:
+                received.setdefault(chat_id, []).append(text)
+
+        queue = OutboundQueue(path=os.path.join(directory, "outbox.db"))
+        pool = OutboxPool(queue, deliver, workers=16, poll_interval=0.05)
+        fanout = FanOutDelivery(pool)
+        messages = ["summary", "digest 1", "digest 2"]
+        start = time.time()
+        batch = fanout.broadcast(messages, subscribers)
+        assert fanout.wait(timeout=60)
+        elapsed = time.time() - start
+        pool.stop()
+        assert all(received[chat_id] == messages for chat_id in subscribers)
+        serial = len(subscribers) * len(messages) * 0.01
+        assert elapsed < serial, (elapsed, serial)
+        print(f"   {len(subscribers) * len(messages)} messages in {elapsed:.1f}s (serial: {serial:.1f}s)")
+
+        # 3. Progress is tracked per recipient
+        print("\n3. Testing progress...")
+        progress = fanout.progress(batch)
+        assert set(progress) == set(subscribers)
+        assert all(state == {"sent": 3, "pending": 0, "dead": 0} for state in progress.values())
+
+if __name__ == "__main__":
+    test_fanout()
+    print("\n🎉 Fan-out tests passed!")
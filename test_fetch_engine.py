@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Test the concurrent fetch engine (no network access required)
+"""
+
+import random
+import threading
+import time
+
+from fetch_engine import FetchEngine, FetchTask
+
+def test_fetch_engine():
+    print("🧪 Testing Concurrent Fetch Engine...")
+
+    active = {"now": 0, "peak": 0}
+    lock = threading.Lock()
+
+    def slow_source(index):
+        with lock:
+            active["now"] += 1
+            active["peak"] = max(active["peak"], active["now"])
+        time.sleep(random.uniform(0.01, 0.05))
+        with lock:
+            active["now"] -= 1
+        return [{"title": f"Job {index}"}]
+
+    def broken_source():
+        raise ValueError("boom")
+
+    def hanging_source():
+        time.sleep(2)
+        return [{"title": "Too late"}]
+
+    # 1. Results are merged in task order regardless of completion order
+    print("\n1. Testing deterministic merge order...")
+    tasks = [FetchTask(f"source-{i}", slow_source, (i,), host="api.example.com") for i in range(12)]
+    tasks.insert(3, FetchTask("static", lambda: [{"title": "Static"}]))
+    engine = FetchEngine(max_workers=8, per_host_limit=3, deadline=10)
+    jobs = engine.merge_into([], tasks)
+    titles = [job["title"] for job in jobs]
+    expected = [f"Job {i}" for i in range(3)] + ["Static"] + [f"Job {i}" for i in range(3, 12)]
+    assert titles == expected, titles
+    print(f"   Merged {len(jobs)} jobs in order")
+
+    # 2. Per-host concurrency limit is respected
+    print("\n2. Testing per-host limit...")
+    assert active["peak"] <= 3, active["peak"]
+    print(f"   Peak concurrent calls to one host: {active['peak']}")
+
+    # 3. Failures and deadline overruns contribute empty results
+    print("\n3. Testing failures and global deadline...")
+    engine = FetchEngine(max_workers=4, per_host_limit=2, deadline=0.5)
+    started = time.time()
+    results = engine.run([
+        FetchTask("broken", broken_source, host="a.example.com"),
+        FetchTask("hanging", hanging_source, host="b.example.com"),
+        FetchTask("ok", slow_source, (99,), host="c.example.com"),
+    ])
+    elapsed = time.time() - started
+    assert results[0] == [] and results[1] == []
+    assert results[2] == [{"title": "Job 99"}]
+    assert engine.failed == ["broken"] and engine.timed_out == ["hanging"]
+    assert elapsed < 1.5, elapsed
+    print(f"   Deadline enforced after {elapsed:.2f}s")
+
+if __name__ == "__main__":
+    test_fetch_engine()
+    print("\n🎉 Fetch engine tests passed!")
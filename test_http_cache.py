@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Test the on-disk conditional-GET cache (no network access required)
+"""
+
+import os
+import tempfile
+import time
+
+from requests import ConnectionError, Response
+from requests.structures import CaseInsensitiveDict
+
+import http_cache
+from http_cache import HttpCache
+
+class FakeBoard:
+    """A job board that honours If-None-Match"""
+
+    def __init__(self, body):
+        self.body = body
+        self.etag = '"v1"'
+        self.requests = []
+        self.down = False
+
+    def get(self, url, params=None, headers=None, timeout=None):
+        self.requests.append(dict(headers or {}))
+        if self.down:
+            raise ConnectionError("board unreachable")
+        response = Response()
+        response.url = url
+        response.headers = CaseInsensitiveDict({"ETag": self.etag, "Content-Type": "application/json"})
+        if (headers or {}).get("If-None-Match") == self.etag:
+            response.status_code = 304
+            response._content = b""
+        else:
+            response.status_code = 200
+            response._content = self.body
+        return response
+
+def test_http_cache():
+    print("🧪 Testing HTTP Cache...")
+
+    board = FakeBoard(b'{"jobs": [{"title": "Python Developer"}]}')
+    original_get = http_cache.get
+    http_cache.get = board.get
+    try:
+        with tempfile.TemporaryDirectory() as directory:
+            url = "https://boards-api.greenhouse.io/v1/boards/gitlab/jobs"
+
+            # 1. First download is stored with its validators
+            print("\n1. Testing first download...")
+            cache = HttpCache(directory=directory, ttls={}, default_ttl=60)
+            response = cache.get(url)
+            assert response.status_code == 200 and not response.from_cache
+            assert response.json()["jobs"][0]["title"] == "Python Developer"
+            assert cache.misses == 1
+
+            # 2. Within the TTL the board is served from disk with no request
+            print("\n2. Testing fresh hits...")
+            response = cache.get(url)
+            assert response.from_cache and len(board.requests) == 1
+            assert response.json()["jobs"][0]["title"] == "Python Developer"
+
+            # 3. After the TTL a conditional GET returns 304 and reuses the body
+            print("\n3. Testing 304 revalidation...")
+            response = cache.get(url, ttl=0)
+            assert board.requests[-1]["If-None-Match"] == '"v1"'
+            assert response.status_code == 200 and response.from_cache
+            assert cache.revalidated == 1
+
+            # 4. A changed board is downloaded again
+            print("\n4. Testing changed board...")
+            board.etag = '"v2"'
+            board.body = b'{"jobs": []}'
+            assert cache.get(url, ttl=0).json() == {"jobs": []}
+            assert cache.misses == 2
+
+            # 5. An unreachable board falls back to the stored copy
+            print("\n5. Testing stale-if-error...")
+            board.down = True
+            assert cache.get(url, ttl=0).json() == {"jobs": []}
+            board.down = False
+
+            # 6. Size-bounded eviction drops least recently used entries
+            print("\n6. Testing eviction...")
+            lru_directory = os.path.join(directory, "lru")
+            small = HttpCache(directory=lru_directory, max_bytes=20, ttls={}, default_ttl=60)
+            small.get("https://example.com/a")
+            time.sleep(0.01)
+            small.get("https://example.com/b")
+            bodies = [name for name in os.listdir(lru_directory) if name.endswith(".body")]
+            assert len(bodies) == 1, bodies
+
+            # Reads count as use: a board read after it was stored outlives a newer, unread one
+            recent_directory = os.path.join(directory, "recent")
+            size = len(board.body)
+            cache = HttpCache(directory=recent_directory, max_bytes=2 * size, ttls={}, default_ttl=60)
+            for name in ("a", "b"):
+                cache.get(f"https://example.com/{name}")
+                time.sleep(0.01)
+            cache.get("https://example.com/a")  # Fresh hit
+            time.sleep(0.01)
+            cache.get("https://example.com/c")
+            assert cache.fresh_hits == 1
+            assert cache.stored("https://example.com/a") is not None
+            assert cache.stored("https://example.com/b") is None
+            print(f"   {len(bodies)} entry kept within {small.max_bytes} bytes")
+    finally:
+        http_cache.get = original_get
+
+if __name__ == "__main__":
+    test_http_cache()
+    print("\n🎉 HTTP cache tests passed!")
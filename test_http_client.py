@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+"""
+Test the shared HTTP client: pooled keep-alive sessions per host
+"""
+
+import http_client
+
+def test_http_client():
+    print("🧪 Testing Shared HTTP Client...")
+
+    # 1. One session per host, reused across calls
+    print("\n1. Testing session reuse...")
+    telegram = http_client.session_for("https://api.telegram.org/bot123/sendMessage")
+    assert http_client.session_for("https://api.telegram.org/bot123/getUpdates") is telegram
+    greenhouse = http_client.session_for("https://boards-api.greenhouse.io/v1/boards/gitlab/jobs")
+    assert greenhouse is not telegram
+    print("   Same host -> same session, different host -> separate pool")
+
+    # 2. Pool sizing, retries and default headers come from one place
+    print("\n2. Testing pool configuration...")
+    adapter = telegram.get_adapter("https://api.telegram.org/")
+    assert adapter._pool_maxsize == http_client.HTTP_POOL_SIZE
+    assert adapter.max_retries.total == http_client.HTTP_RETRIES
+    assert "POST" not in adapter.max_retries.allowed_methods
+    assert telegram.headers["User-Agent"] == http_client.USER_AGENT
+    print(f"   Pool size {http_client.HTTP_POOL_SIZE}, {http_client.HTTP_RETRIES} GET retries, POST never replayed")
+
+    # 3. Closing drops the pools; the next call opens a fresh session
+    print("\n3. Testing close_all...")
+    http_client.close_all()
+    assert http_client.session_for("https://api.telegram.org/") is not telegram
+    http_client.close_all()
+    print("   Sessions recreated on demand")
+
+if __name__ == "__main__":
+    test_http_client()
+    print("\n🎉 HTTP client tests passed!")
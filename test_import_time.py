@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Test that importing telegram_jobs stays cheap: heavy modules load on first
+use, and how long a cold import takes (no network access required)
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+
+import telegram_jobs
+
+# Target for the best cold import of telegram_jobs, with compiled bytecode
+# (the old eager import took ~150ms, most of it in requests). Reported, not
+# asserted: wall-clock time depends on the machine; the lazy-module check
+# is the guard
+IMPORT_BUDGET_MS = 100
+
+# Must not be imported by `import telegram_jobs`
+LAZY_MODULES = ("requests", "urllib3", "http.server", "kenya_jobs", "job_categories",
+                "fallback_jobs", "fanout", "subscriber_prefs")
+
+def import_time(statement, pycache):
+    """(cumulative microseconds per module, in import order) for a fresh interpreter"""
+    env = dict(os.environ, TELEGRAM_BOT_TOKEN="", TELEGRAM_CHAT_ID="", PYTHONPYCACHEPREFIX=pycache)
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", statement], env=env,
+                            cwd=os.path.dirname(os.path.abspath(__file__)),
+                            capture_output=True, text=True, timeout=60)
+    assert result.returncode == 0, result.stderr
+    modules = {}
+    for line in result.stderr.splitlines():
+        if line.startswith("import time:") and "|" in line:
+            _, cumulative, name = line.split("|")
+            if cumulative.strip().isdigit():
+                modules[name.strip()] = int(cumulative)
+    return modules
+
+def test_import_time():
+    print("🧪 Testing Import Time...")
+
+    with tempfile.TemporaryDirectory() as pycache:
+        # 1. Heavy dependencies and catalogs aren't loaded by the import
+        print("\n1. Testing lazy modules...")
+        import_time("import telegram_jobs", pycache)  # Compile the bytecode
+        modules = import_time("import telegram_jobs", pycache)
+        assert "telegram_jobs" in modules and "telegram_bot" in modules
+        loaded = [name for name in LAZY_MODULES if name in modules]
+        assert not loaded, f"imported eagerly: {loaded}"
+
+        # 2. How long a cold import takes
+        print("\n2. Testing the import time...")
+        best = min(import_time("import telegram_jobs", pycache)["telegram_jobs"] for _ in range(3)) / 1000
+        status = "within" if best < IMPORT_BUDGET_MS else "OVER"
+        print(f"   import telegram_jobs: {best:.1f}ms ({status} the {IMPORT_BUDGET_MS}ms target)")
+
+        # 3. Building a scout still doesn't compile the categorizer
+        print("\n3. Testing a fresh scout...")
+        modules = import_time("import telegram_jobs; telegram_jobs.JobScout()", pycache)
+        assert "job_categories" not in modules and "requests" not in modules
+
+    # 4. Lazily loaded names still import from telegram_jobs
+    print("\n4. Testing lazy attributes...")
+    from telegram_jobs import CATEGORIES, JobCategorizer, ORGANIZED_JOB_CATEGORIES
+    import job_categories
+    assert CATEGORIES is job_categories.CATEGORIES and "python" in CATEGORIES
+    assert ORGANIZED_JOB_CATEGORIES is job_categories.ORGANIZED_JOB_CATEGORIES
+    assert telegram_jobs.JobCategorizer is JobCategorizer
+    try:
+        telegram_jobs.NOT_A_NAME
+        assert False, "unknown names should raise AttributeError"
+    except AttributeError:
+        pass
+
+    scout = telegram_jobs.JobScout()
+    assert scout.categorizer is scout.categorizer  # Built once
+    job = {"title": "Customer Support Agent", "company": "Acme"}
+    assert scout.categorizer.categorize_job(job)["level"] == "entry_level"
+    assert scout._get_comprehensive_fallback_jobs("Zapier")[0]["company"] == "Zapier"
+    assert scout._get_remotive_fallback_jobs("data")[0]["title"] == "Remote Data Specialist"
+
+if __name__ == "__main__":
+    test_import_time()
+    print("\n🎉 Import time tests passed!")
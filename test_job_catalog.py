@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Test the keyword-indexed static job catalog
+"""
+
+import json
+import os
+import tempfile
+
+from job_catalog import JobCatalog, get_catalog
+from telegram_jobs import CATEGORIES, JobScout
+
+def test_job_catalog():
+    print("🧪 Testing Job Catalog...")
+
+    # 1. The shipped catalog loads once and is shared by every scout
+    print("\n1. Testing shared catalog...")
+    catalog = get_catalog()
+    assert JobScout().catalog is catalog and JobScout().catalog is get_catalog()
+    assert len(catalog) > 0 and "crypto_jobs" in catalog.sources
+    print(f"   {len(catalog.sources)} sources, {len(catalog)} curated jobs")
+
+    # 2. Match modes behave like the old any(word in keywords ...) checks
+    print("\n2. Testing match modes...")
+    catalog_data = {"version": 1, "sources": {"demo": [
+        {"match": "always", "words": [], "jobs": [{"title": "Always"}]},
+        {"match": "keyword", "words": ["python", "data"], "jobs": [{"title": "Keyword"}]},
+        {"match": "substring", "words": ["media"], "jobs": [{"title": "Substring"}]},
+    ]}}
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "catalog.json")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(catalog_data, f)
+        demo = JobCatalog(path)
+
+    titles = lambda keywords: [job["title"] for job in demo.jobs_for("demo", keywords)]
+    assert titles(["python"]) == ["Always", "Keyword"]
+    assert titles(["python-dev"]) == ["Always"]  # keyword mode needs an exact keyword
+    assert titles(["social-media-manager"]) == ["Always", "Substring"]
+    assert titles([]) == ["Always"]
+
+    # 3. Lookups return fresh lists, so callers can extend them safely
+    print("\n3. Testing returned lists...")
+    first = demo.jobs_for("demo", ["python"])
+    first.append({"title": "Extra"})
+    assert titles(["python"]) == ["Always", "Keyword"]
+
+    # 4. Every category resolves through the catalog-backed fetchers
+    print("\n4. Testing category lookups...")
+    scout = JobScout()
+    total = sum(len(scout.fetch_crypto_jobs(keywords)) for keywords in CATEGORIES.values())
+    assert total > 0
+    assert len(scout.get_guaranteed_working_jobs()) > 0
+    print(f"   {total} crypto jobs across {len(CATEGORIES)} categories")
+
+if __name__ == "__main__":
+    test_job_catalog()
+    print("\n🎉 Job catalog tests passed!")
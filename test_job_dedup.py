@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Test normalized deduplication and the cross-run seen-jobs store
+"""
+
+import os
+import tempfile
+import time
+
+from job_dedup import SeenJobs, canonical_url, dedupe_jobs, fingerprint
+from job_record import Job
+from job_store import JobStore
+from scout_metrics import RunMetrics
+import telegram_jobs
+from telegram_jobs import JobScout
+
+def test_job_dedup():
+    print("🧪 Testing Job Deduplication...")
+
+    # 1. Near-identical postings collapse to one
+    print("\n1. Testing normalization...")
+    first = Job.from_dict({"title": "Python Developer (Remote)", "company": "Acme Inc.",
+                           "url": "https://www.acme.com/jobs/42/?utm_source=board#apply"})
+    repost = Job.from_dict({"title": "python developer - remote", "company": "ACME",
+                            "url": "http://acme.com/jobs/42"})
+    other = Job.from_dict({"title": "Data Analyst", "company": "Acme Inc.", "url": "https://acme.com/jobs/43"})
+    assert canonical_url(first.url) == canonical_url(repost.url) == "https://acme.com/jobs/42"
+    assert fingerprint(first) == fingerprint(repost) != fingerprint(other)
+    assert dedupe_jobs([first, repost, other]) == [first, other]
+    assert fingerprint({"title": "Café Host", "company": "X", "url": ""}) == fingerprint({"title": "cafe host", "company": "x"})
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "seen_jobs.db")
+
+        # 2. Jobs sent on one run are skipped on the next
+        print("\n2. Testing cross-run memory...")
+        seen = SeenJobs(path=path, ttl_days=7, enabled=True)
+        assert seen.filter_new([first, other]) == [first, other]
+        seen.mark_seen([first])
+        tomorrow = SeenJobs(path=path, ttl_days=7, enabled=True)
+        assert tomorrow.filter_new([repost, other]) == [other]
+
+        # 3. Fingerprints expire after the TTL
+        print("\n3. Testing TTL expiry...")
+        expired = SeenJobs(path=path, ttl_days=1 / 86400, enabled=True)
+        time.sleep(1.1)
+        assert expired.filter_new([first]) == [first]
+        expired.mark_seen([other])
+        assert SeenJobs(path=path, ttl_days=7, enabled=True).filter_new([first, other]) == [first]
+
+        # 4. Disabled store remembers nothing
+        print("\n4. Testing disabled store...")
+        disabled = SeenJobs(path=os.path.join(directory, "off.db"), enabled=False)
+        disabled.mark_seen([first])
+        assert disabled.filter_new([first]) == [first]
+        assert not os.path.exists(os.path.join(directory, "off.db"))
+
+        # 5. A second daily run only sends what the first one didn't
+        print("\n5. Testing consecutive daily runs...")
+        sent = []
+        original_send, original_mode = telegram_jobs.send_telegram_message, telegram_jobs.DELIVERY_MODE
+        telegram_jobs.send_telegram_message = lambda message: sent.append(message)
+        telegram_jobs.DELIVERY_MODE = "individual"  # 25 jobs per run
+        try:
+            runs = []
+            for _ in range(2):
+                sent.clear()
+                scout = JobScout()
+                scout.seen_jobs = SeenJobs(path=os.path.join(directory, "daily.db"), ttl_days=7, enabled=True)
+                scout.job_store = JobStore(path=os.path.join(directory, "jobs.db"))
+                scout.metrics = RunMetrics(directory=os.path.join(directory, "metrics"))
+                scout.build_fetch_tasks = lambda: []
+                scout.run_daily_scout()
+                runs.append((scout.total_jobs, list(sent)))
+        finally:
+            telegram_jobs.send_telegram_message, telegram_jobs.DELIVERY_MODE = original_send, original_mode
+        (first_total, first_sent), (second_total, second_sent) = runs
+        assert second_total == first_total - 25
+        assert not set(first_sent[1:26]) & set(second_sent)
+        print(f"   Run 1: {first_total} new jobs, run 2: {second_total} new jobs")
+
+if __name__ == "__main__":
+    test_job_dedup()
+    print("\n🎉 Job dedup tests passed!")
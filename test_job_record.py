@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Test the shared, read-only job record types
+"""
+
+import dataclasses
+import sys
+
+from job_record import Categorization, Job, as_jobs, intern_categorization
+from telegram_jobs import GENERAL_CATEGORIZATION, JobCategorizer, JobScout
+
+def test_categorization_records():
+    print("🧪 Testing Categorization Records...")
+
+    # 1. Jobs in the same category share one record
+    print("\n1. Testing interned records...")
+    categorizer = JobCategorizer()
+    jobs = [
+        {"title": "Customer Support Agent", "company": "Acme"},
+        {"title": "Customer Support Specialist", "company": "Globex"},
+        {"title": "Zookeeper", "company": "Zoo"},
+    ]
+    organized = categorizer.organize_jobs_by_category(jobs)
+    assert jobs[0]["categorization"] is jobs[1]["categorization"]
+    assert JobCategorizer().categorize_job(jobs[0]) is jobs[0]["categorization"]
+    assert jobs[2]["categorization"] is GENERAL_CATEGORIZATION
+    assert sum(len(level_jobs) for level_jobs in organized.values()) == 3
+
+    # 2. Records still read like the old result dicts
+    print("\n2. Testing dict-style access...")
+    record = jobs[0]["categorization"]
+    assert record["level"] == record.level
+    assert record["category_data"]["salary_range"]
+    assert record.get("missing", "n/a") == "n/a"
+    assert "emoji" in record and set(record) == set(record.to_dict())
+    try:
+        record["missing"]
+        assert False, "missing keys should raise KeyError"
+    except KeyError:
+        pass
+
+    # 3. Records are read-only and carry no per-instance dict
+    print("\n3. Testing immutability...")
+    try:
+        record.level = "expert_level"
+        assert False, "records should be frozen"
+    except dataclasses.FrozenInstanceError:
+        pass
+    assert not hasattr(record, "__dict__")
+    same = intern_categorization(record.level, record.category, {}, "", "", "")
+    assert same is record and isinstance(same, Categorization)
+
+def test_job_records():
+    print("🧪 Testing Job Records...")
+
+    posting = {
+        "title": "Remote Python Developer",
+        "company": "Acme",
+        "location": "Remote - Worldwide",
+        "url": "https://example.com/jobs/1",
+        "source": "Example Board",
+        "salary": "$60-90k/year",
+    }
+
+    # 1. Dict-returning fetchers adapt to Job records
+    print("\n1. Testing dict adapter...")
+    job = Job.from_dict(posting)
+    assert job.title == job["title"] == posting["title"]
+    assert job.to_dict() == posting
+    assert "categorization" not in job and job.get("categorization") is None
+    other = Job.from_dict(dict(posting, title="Data Analyst"))
+    assert other.company is job.company and other.source is job.source  # interned
+    assert as_jobs([job, posting])[0] is job
+
+    # 2. Categorization and formatting run on Job records
+    print("\n2. Testing pipeline on Job records...")
+    scout = JobScout()
+    organized = scout.categorizer.organize_jobs_by_category([job])
+    assert "categorization" in job and job["categorization"]["level"] in organized
+    assert job.title in scout.format_individual_job(job)
+    assert job.to_dict()["categorization"] is job.categorization
+    try:
+        job["unknown"] = 1
+        assert False, "Job has a fixed layout"
+    except KeyError:
+        pass
+
+    # 3. A Job is several times smaller than the dict it replaces
+    print("\n3. Testing memory footprint...")
+    as_dict = dict(posting, categorization=job.categorization)
+    assert not hasattr(job, "__dict__")
+    assert sys.getsizeof(as_dict) >= 3 * sys.getsizeof(job)
+    print(f"   dict: {sys.getsizeof(as_dict)} bytes, Job: {sys.getsizeof(job)} bytes")
+
+if __name__ == "__main__":
+    test_categorization_records()
+    test_job_records()
+    print("\n🎉 Job record tests passed!")
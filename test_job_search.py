@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Test /jobs and /category search over the local job store (no network access required)
+"""
+
+import os
+import sqlite3
+import tempfile
+import time
+
+import telegram_jobs
+from job_record import as_jobs
+from job_search import SEARCH_PAGE_SIZE, handle_search_command
+from job_store import JobStore
+from telegram_jobs import JobCategorizer
+
+def test_job_search():
+    print("🧪 Testing Job Search...")
+
+    categorizer = JobCategorizer()
+    catalog = telegram_jobs.get_catalog()
+    jobs = as_jobs([
+        job
+        for source in ("customer_support_jobs", "beginner_friendly_jobs", "ai_training_jobs",
+                       "technical_writing_jobs", "guaranteed_working_jobs")
+        for job in catalog.jobs_for(source, ("support", "writer", "data", "ai-training", "python"))
+    ])
+    for job in jobs:
+        job["categorization"] = categorizer.categorize_job(job)
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "jobs.db")
+
+        # 1. No store yet: a friendly reply, nothing created
+        print("\n1. Testing an empty index...")
+        store = JobStore(path=path, enabled=True)
+        assert "No jobs indexed" in handle_search_command("/jobs python", store)
+        assert not os.path.exists(path)
+        assert handle_search_command("/start", store) is None
+        assert "/category" in handle_search_command("/jobs", store)
+
+        store.upsert(jobs)
+        store.upsert([{"title": "Ancient Support Role", "company": "Oldco", "location": "Remote",
+                       "url": "https://old/1", "salary": "$1", "source": "Old"}], now=time.time() - 60 * 86400)
+
+        # 2. Keyword search goes through the full-text index
+        print("\n2. Testing keyword search...")
+        assert store.full_text
+        support = [job for job in jobs if "support" in f"{job['title']} {job['company']} "
+                   f"{job['categorization']['category']}".lower().replace("_", " ")]
+        assert store.find_count("support") == len(support) + 1
+        assert store.find_count("support", since_days=14) == len(support)
+        assert store.find_count("SUPP") == store.find_count("support")  # Prefix, any case
+        assert store.find_count("support zzzz") == 0
+        assert store.find("") == [] and store.find_count("!!") == 0
+        reply = handle_search_command("/jobs support", store)
+        assert f"{len(support)} jobs (page 1/" in reply
+        assert reply.count("[Apply]") == min(SEARCH_PAGE_SIZE, len(support))
+        assert "Ancient" not in reply
+        for query in ("/jobs sup`port", "/jobs `_zz*z_", "/jobs support` 2"):
+            reply = handle_search_command(query, store)
+            assert reply.replace("\\`", "").count("`") % 2 == 0, reply  # Code spans stay balanced
+
+        # 3. Paging walks every result once
+        print("\n3. Testing paging...")
+        pages = -(-len(support) // SEARCH_PAGE_SIZE)
+        seen = []
+        for page in range(1, pages + 1):
+            rows = store.find("support", since_days=14, limit=SEARCH_PAGE_SIZE, offset=(page - 1) * SEARCH_PAGE_SIZE)
+            seen.extend(row["fingerprint"] for row in rows)
+        assert len(seen) == len(set(seen)) == len(support)
+        assert f"/jobs support {pages}`" in handle_search_command(f"/jobs support {pages - 1}", store)
+        assert "More" not in handle_search_command(f"/jobs support {pages}", store)
+
+        # 4. /category browses a category or a whole level
+        print("\n4. Testing category browsing...")
+        category = jobs[0]["categorization"]["category"]
+        in_category = sum(job["categorization"]["category"] == category for job in jobs)
+        assert f"{in_category} jobs" in handle_search_command(f"/category {category}", store)
+        entry = sum(job["categorization"]["level"] == "entry_level" for job in jobs)
+        assert f"{entry} jobs" in handle_search_command("/category@Agent21Bot entry", store)
+        unknown = handle_search_command("/category astronaut", store)
+        assert "No recent jobs" in unknown and category in unknown
+
+        # 5. The index follows updates and indexes stores created before it
+        print("\n5. Testing index maintenance...")
+        store.upsert([dict(jobs[0].to_dict(), categorization=None)])
+        assert store.find_count(category.split("_")[0]) >= 1
+        with sqlite3.connect(path) as conn:
+            conn.executescript("DROP TABLE jobs_fts; DROP TRIGGER jobs_fts_insert; "
+                               "DROP TRIGGER jobs_fts_delete; DROP TRIGGER jobs_fts_update;")
+        rebuilt = JobStore(path=path, enabled=True)
+        assert rebuilt.find_count("support") == len(support) + 1
+
+        # 6. Replies come from the index in milliseconds
+        print("\n6. Testing latency...")
+        rebuilt.upsert([
+            {"title": f"Remote Role {number} {'python' if number % 7 else 'support'}", "company": f"Company {number}",
+             "location": "Remote", "url": f"https://jobs/{number}", "salary": "$20/hour", "source": "Bulk"}
+            for number in range(20000)
+        ])
+        start = time.perf_counter()
+        for page in range(1, 21):
+            handle_search_command(f"/jobs python role {page}", rebuilt)
+        elapsed = (time.perf_counter() - start) / 20
+        assert elapsed < 0.1, elapsed
+        print(f"   {elapsed * 1000:.1f}ms per /jobs reply over {rebuilt.count()} stored jobs")
+
+if __name__ == "__main__":
+    test_job_search()
+    print("\n🎉 Job search tests passed!")
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Test the persistent job store (no network access required)
+"""
+
+import os
+import sqlite3
+import tempfile
+
+import telegram_jobs
+from job_dedup import SeenJobs
+from job_record import as_jobs
+from job_store import JobStore, url_hash
+from scout_metrics import RunMetrics
+from telegram_jobs import JobCategorizer, JobScout
+
+def test_job_store():
+    print("🧪 Testing Job Store...")
+
+    categorizer = JobCategorizer()
+    jobs = as_jobs(telegram_jobs.get_catalog().jobs_for("guaranteed_working_jobs"))
+    for job in jobs:
+        job["categorization"] = categorizer.categorize_job(job)
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "jobs.db")
+        store = JobStore(path=path, enabled=True)
+
+        # 1. Bulk upserts keep first_seen and bump last_seen
+        print("\n1. Testing upserts...")
+        assert store.upsert(jobs, now=1000.0) == len(jobs)
+        assert store.upsert(jobs[:5], now=2000.0) == 5
+        rows = store.search(limit=100)
+        assert len(rows) == len(jobs)
+        assert {row["title"] for row in rows[:5]} == {job["title"] for job in jobs[:5]}  # Most recent first
+        assert all(row["first_seen"] == 1000.0 for row in rows)
+        times_seen = {row["title"]: row["times_seen"] for row in rows}
+        assert [times_seen[job["title"]] for job in jobs[:6]] == [2, 2, 2, 2, 2, 1]
+        assert {row["level"] for row in rows} == {job["categorization"]["level"] for job in jobs}
+
+        # 2. Same posting, same URL hash
+        print("\n2. Testing URL hashes...")
+        assert url_hash("https://www.example.com/jobs/1/?utm_source=x") == url_hash("http://example.com/jobs/1")
+        assert url_hash("https://example.com/jobs/1") != url_hash("https://example.com/jobs/2")
+
+        # The cache directory is created on first use (fresh checkout)
+        fresh = JobStore(path=os.path.join(directory, "new", ".scout_cache", "jobs.db"), enabled=True)
+        assert fresh.upsert(jobs[:2], now=1000.0) == 2
+        assert len(fresh.search(limit=10)) == 2
+
+        # 3. Queries are index lookups
+        print("\n3. Testing queries...")
+        level, category = jobs[0]["categorization"]["level"], jobs[0]["categorization"]["category"]
+        matching = [job for job in jobs if job["categorization"]["category"] == category]
+        found = store.search(level=level, category=category, limit=100)
+        assert {row["title"] for row in found} == {job["title"] for job in matching}
+        assert store.search(level=level, category=category, limit=1, offset=1) == found[1:2]
+        assert sum(store.counts("source").values()) == len(jobs)
+        assert store.counts("level", since_days=1) == {}  # Stored with timestamps from 1970
+        assert store.known(jobs[:3] + [{"title": "Nope", "company": "None", "url": ""}]) == {
+            row["fingerprint"] for row in rows if row["title"] in {job["title"] for job in jobs[:3]}
+        }
+        with sqlite3.connect(path) as conn:
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+            plan = " ".join(row[-1] for row in conn.execute(
+                "EXPLAIN QUERY PLAN SELECT * FROM jobs WHERE level = ? AND category = ? "
+                "ORDER BY last_seen DESC", (level, category)))
+            assert "idx_jobs_level_category" in plan, plan
+
+        # 4. A daily run stores every job it found
+        print("\n4. Testing daily run upserts...")
+        original_send = telegram_jobs.send_telegram_message
+        telegram_jobs.send_telegram_message = lambda message: None
+        try:
+            scout = JobScout()
+            scout.seen_jobs = SeenJobs(enabled=False)
+            scout.job_store = JobStore(path=os.path.join(directory, "daily.db"), enabled=True)
+            scout.metrics = RunMetrics(directory=os.path.join(directory, "metrics"))
+            scout.build_fetch_tasks = lambda: []
+            scout.run_daily_scout()
+        finally:
+            telegram_jobs.send_telegram_message = original_send
+        stored = scout.job_store.search(limit=1000)
+        assert len(stored) == scout.total_jobs
+        assert all(row["level"] and row["category"] for row in stored)
+        print(f"   {len(stored)} jobs stored across {len(scout.job_store.counts('source'))} sources")
+
+if __name__ == "__main__":
+    test_job_store()
+    print("\n🎉 Job store tests passed!")
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Test the compiled keyword matcher against the original categorization loops
+"""
+
+import random
+import time
+
+from job_catalog import get_catalog
+from keyword_matcher import KeywordMatcher
+from telegram_jobs import FALLBACK_CATEGORY_RULES, ORGANIZED_JOB_CATEGORIES, JobCategorizer
+
+def legacy_categorize(job_text):
+    """The nested-loop scan categorize_job used before the matcher"""
+    for level_name, level_data in ORGANIZED_JOB_CATEGORIES.items():
+        for category_name, category_data in level_data["categories"].items():
+            for keyword in category_data["keywords"]:
+                if all(part in job_text for part in keyword.lower().split("-")):
+                    return level_name, category_name
+    for words, level_name, category_name in FALLBACK_CATEGORY_RULES:
+        if any(word in job_text for word in words):
+            return level_name, category_name
+    return "entry_level", "general"
+
+def test_keyword_matcher():
+    print("🧪 Testing Keyword Matcher...")
+
+    # 1. Rules resolve by priority, not by position in the text
+    print("\n1. Testing first-match priority...")
+    matcher = KeywordMatcher([["data", "entry"], ["entry"], ["he", "she", "his", "hers"], ["x", ""]])
+    assert matcher.first_match("entry level data role") == 0
+    assert matcher.first_match("entry level") == 1
+    assert matcher.first_match("ushers history") == 2  # overlapping parts
+    assert matcher.first_match("xylophone") == 3       # empty part always matches
+    assert matcher.first_match("nothing here") is None
+    assert KeywordMatcher([[]]).first_match("") == 0
+    assert matcher.all_matches("entry level data role") == [0, 1]
+    assert matcher.all_matches("ushers history, xylophone") == [2, 3]
+    assert matcher.all_matches("nothing here") == []
+
+    # 2. Same results as the old nested loops on every curated job
+    print("\n2. Testing parity with the legacy categorizer...")
+    categorizer = JobCategorizer()
+    catalog = get_catalog()
+    jobs = [job for source in catalog.sources for job in catalog.jobs_for(source, [])]
+    parts = sorted({part for level in ORGANIZED_JOB_CATEGORIES.values()
+                    for category in level["categories"].values()
+                    for keyword in category["keywords"]
+                    for part in keyword.split("-")})
+    parts += [word for words, _, _ in FALLBACK_CATEGORY_RULES for word in words]
+    rng = random.Random(21)
+    for _ in range(3000):
+        title = " ".join(rng.choice(parts) for _ in range(rng.randint(0, 4)))
+        jobs.append({"title": title.title(), "company": rng.choice(["Acme", "Meta", "Appen", ""])})
+
+    for job in jobs:
+        job_text = f"{job.get('title', '').lower()} {job.get('company', '').lower()}"
+        result = categorizer.categorize_job(job)
+        assert (result["level"], result["category"]) == legacy_categorize(job_text), job
+    print(f"   {len(jobs)} jobs categorized identically")
+
+    # 3. Results keep the shape callers rely on
+    print("\n3. Testing result fields...")
+    result = categorizer.categorize_job({"title": "Customer Support Agent", "company": "Acme"})
+    assert set(result) == {"level", "category", "category_data", "level_description", "skill_requirements", "emoji"}
+    assert result["category_data"]["salary_range"]
+    general = categorizer.categorize_job({"title": "Zookeeper", "company": "Zoo"})
+    assert general["category"] == "general" and general["category_data"]["salary_range"] == "Competitive"
+
+    # 4. Throughput
+    print("\n4. Testing throughput...")
+    start = time.time()
+    for job in jobs * 3:
+        categorizer.categorize_job(job)
+    elapsed = time.time() - start
+    print(f"   {len(jobs) * 3 / elapsed:,.0f} jobs/second")
+
+if __name__ == "__main__":
+    test_keyword_matcher()
+    print("\n🎉 Keyword matcher tests passed!")
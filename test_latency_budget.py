@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+Test latency budgets and hedged board downloads (no network access required)
+"""
+
+import os
+import tempfile
+import threading
+import time
+
+from requests.exceptions import Timeout
+
+import latency_budget
+import source_snapshots
+from latency_budget import LatencyBudgets, hedged, percentile
+from source_snapshots import SnapshotError, SourceSnapshots
+
+class FakeResponse:
+    def __init__(self, payload, from_cache=False, revalidated=False):
+        self.status_code = 200
+        self.payload = payload
+        self.from_cache = from_cache
+        if revalidated:
+            self.revalidated = True
+
+    def json(self):
+        return self.payload
+
+def test_latency_budget():
+    print("🧪 Testing Latency Budgets...")
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "latency.db")
+
+        # 1. Budgets come from the recorded p95, once there is enough history
+        print("\n1. Testing learned budgets...")
+        assert percentile([5, 1, 4, 2, 3], 0.95) == 5 and percentile([7], 0.5) == 7
+        budgets = LatencyBudgets(path=path, window=20, min_samples=5, multiplier=3, max_budget=15, enabled=True)
+        for seconds in (0.4, 0.5, 0.6, 0.5):
+            budgets.record("Board", seconds)
+        assert budgets.budget("Board") == (None, None)  # Too little history: default timeout
+        budgets.record("Board", 1.0)
+        assert budgets.p95("Board") == 1.0
+        assert budgets.budget("Board") == (1.0, 3.0)
+        for _ in range(5):
+            budgets.record("Slow", 9.0)
+        assert budgets.budget("Slow") == (9.0, 15)  # Never beyond the client timeout
+        for _ in range(30):
+            budgets.record("Board", 0.1)
+        assert budgets.p95("Board") == 0.1  # Only the newest 20 samples count
+        assert budgets.budget("Board")[1] == 2.0  # Minimum budget
+
+        # 2. History survives a restart
+        print("\n2. Testing persistence...")
+        restarted = LatencyBudgets(path=path, window=20, min_samples=5, multiplier=3, max_budget=15, enabled=True)
+        assert restarted.report()["Board"] == {"samples": 20, "p95": 0.1, "budget": 2.0}
+        assert not LatencyBudgets(path=path, enabled=False).report()
+
+        # 3. A slow first request is hedged; the duplicate answers
+        print("\n3. Testing hedged requests...")
+        calls = []
+        lock = threading.Lock()
+
+        def first_slow():
+            with lock:
+                calls.append(1)
+                number = len(calls)
+            time.sleep(1.0 if number == 1 else 0.05)
+            return number
+
+        start = time.monotonic()
+        result, seconds, copies = hedged(first_slow, 0.1, 2.0)
+        assert result == 2 and copies == 2 and seconds < 0.5
+        assert time.monotonic() - start < 0.5
+        result, seconds, copies = hedged(lambda: "quick", 0.1, 2.0)
+        assert result == "quick" and copies == 1
+
+        # 4. Hopeless requests give up at the budget; fast failures aren't duplicated
+        print("\n4. Testing giving up...")
+        start = time.monotonic()
+        try:
+            hedged(lambda: time.sleep(5), 0.1, 0.3)
+            assert False, "should give up at the deadline"
+        except Timeout:
+            pass
+        assert time.monotonic() - start < 1.0
+        failures = []
+
+        def refused():
+            failures.append(1)
+            raise ConnectionError("refused")
+
+        try:
+            hedged(refused, 0.1, 2.0)
+            assert False, "errors should propagate"
+        except ConnectionError:
+            pass
+        assert len(failures) == 1
+
+        # 5. Board downloads use the budget, learn from network responses only
+        print("\n5. Testing board downloads...")
+        downloads = []
+
+        def fake_get(url, params=None, headers=None, timeout=None, ttl=None):
+            downloads.append(timeout)
+            if "slowco" in url:
+                time.sleep(1.0 if len(downloads) % 2 else 0.02)  # Every other request stalls
+            if "deadco" in url:
+                time.sleep(5)
+            if "cachedco" in url:
+                return FakeResponse({"jobs": []}, from_cache=True)
+            if "revalidco" in url:
+                return FakeResponse({"jobs": []}, from_cache=True, revalidated=True)
+            return FakeResponse({"jobs": [url]})
+
+        original_get = source_snapshots.cached_get
+        original_stored = source_snapshots.stored_response
+        source_snapshots.cached_get = fake_get
+        source_snapshots.stored_response = lambda url, params=None: (
+            FakeResponse({"jobs": ["stale"]}, from_cache=True) if "deadco" in url else None)
+        try:
+            budgets = LatencyBudgets(path=os.path.join(directory, "boards.db"), min_samples=3,
+                                     max_budget=0.5, enabled=True)
+            snapshots = SourceSnapshots(budgets=budgets)
+            board = "https://boards-api.greenhouse.io/v1/boards/{}/jobs"
+            assert snapshots.get_json(board.format("fastco")) == {"jobs": [board.format("fastco")]}
+            assert downloads == [None]  # No history yet: the client's default timeout
+            for _ in range(3):
+                snapshots.clear()
+                snapshots.get_json(board.format("cachedco"))
+                snapshots.get_json(board.format("revalidco"))
+            report = budgets.report()
+            assert "boards-api.greenhouse.io/v1/boards/cachedco/jobs" not in report  # Served from disk
+            assert report["boards-api.greenhouse.io/v1/boards/revalidco/jobs"]["samples"] == 3  # A 304 round trip
+
+            for _ in range(3):
+                budgets.record("boards-api.greenhouse.io/v1/boards/slowco/jobs", 0.02)
+            downloads.clear()
+            start = time.monotonic()
+            assert snapshots.get_json(board.format("slowco")) is not None
+            assert time.monotonic() - start < 0.5 and budgets.hedges == 1
+            assert downloads == [0.5, 0.5]
+
+            for _ in range(3):
+                budgets.record("boards-api.greenhouse.io/v1/boards/deadco/jobs", 0.02)
+            start = time.monotonic()
+            assert snapshots.get_json(board.format("deadco")) == {"jobs": ["stale"]}
+            assert time.monotonic() - start < 1.0 and budgets.gave_up == 1
+            source_snapshots.stored_response = lambda url, params=None: None
+            snapshots.clear()
+            try:
+                snapshots.get_json(board.format("deadco"))
+                assert False, "no stored copy: the timeout should propagate"
+            except SnapshotError as e:
+                assert isinstance(e.error, Timeout)
+            print(f"   {budgets.hedges} hedged and {budgets.gave_up} abandoned downloads")
+        finally:
+            source_snapshots.cached_get = original_get
+            source_snapshots.stored_response = original_stored
+
+        # 6. A source that slows down for good widens its budget instead of dying
+        print("\n6. Testing a permanent slowdown...")
+        original_min_budget = latency_budget.MIN_BUDGET
+        latency_budget.MIN_BUDGET = 0.05
+        try:
+            budgets = LatencyBudgets(path=os.path.join(directory, "slowdown.db"), window=10, min_samples=5,
+                                     multiplier=3, max_budget=0.6, enabled=True)
+            for _ in range(10):
+                budgets.record("Board", 0.02)
+            outcomes = []
+            for _ in range(5):
+                try:
+                    budgets.call("Board", lambda timeout: time.sleep(0.4) or FakeResponse({}))
+                    outcomes.append("ok")
+                except Timeout:
+                    outcomes.append("gave up")
+            assert outcomes[0] == "gave up" and outcomes[-1] == "ok", outcomes
+            assert budgets.p95("Board") >= 0.4
+            print(f"   {outcomes.count('gave up')} give-ups before the budget caught up")
+        finally:
+            latency_budget.MIN_BUDGET = original_min_budget
+
+if __name__ == "__main__":
+    test_latency_budget()
+    print("\n🎉 Latency budget tests passed!")
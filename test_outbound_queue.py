@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Test the persistent outbound message queue and its delivery worker
+"""
+
+import importlib.util
+import os
+import tempfile
+import time
+
+from requests import ConnectionError, Response
+
+import telegram_bot
+from outbound_queue import OutboundQueue, OutboxWorker, PermanentDeliveryError
+
+def load_telegram_bot():
+    """A private copy of telegram_bot (other scripts replace its send function with mocks)"""
+    spec = importlib.util.spec_from_file_location("telegram_bot_under_test", telegram_bot.__file__)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+def test_outbound_queue():
+    print("🧪 Testing Outbound Queue...")
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "outbox.db")
+
+        # 1. Messages come out in order and stay hidden while claimed
+        print("\n1. Testing claim/ack...")
+        queue = OutboundQueue(path=path, visibility_timeout=0.2)
+        queue.enqueue_many([("1", "summary"), ("1", "digest"), ("1", "stats")])
+        first = queue.claim()
+        assert first[2] == "summary" and first[3] == 1
+        assert queue.claim() is None  # a chat's next message waits for the one in flight
+        queue.ack(first[0])
+        assert queue.pending() == 2
+        assert queue.claim()[2] == "digest"
+
+        # 2. A claim that is never acked (crash mid-send) becomes visible again
+        print("\n2. Testing visibility timeout...")
+        assert queue.claim() is None
+        time.sleep(0.25)
+        assert queue.claim()[2] == "digest"
+
+        # 3. After a restart a new worker delivers what was left behind
+        print("\n3. Testing resume after restart...")
+        time.sleep(0.25)
+        delivered = []
+        failures = {"stats": 1}
+
+        def deliver(chat_id, text):
+            if failures.get(text):
+                failures[text] -= 1
+                raise ConnectionError("Telegram unreachable")
+            delivered.append(text)
+
+        restarted = OutboundQueue(path=path)
+        worker = OutboxWorker(restarted, deliver, poll_interval=0.05)
+        worker.start()
+        restarted.enqueue("1", "completion")
+        worker.notify()
+        assert worker.flush(timeout=10)
+        worker.stop()
+        assert delivered == ["digest", "stats", "completion"]  # in order despite the retry
+        print(f"   Delivered {len(delivered)} messages, one after a failed attempt")
+
+        # 4. Messages Telegram will never accept are set aside
+        print("\n4. Testing dead letters...")
+
+        def reject(chat_id, text):
+            raise PermanentDeliveryError("400: can't parse entities")
+
+        restarted.enqueue("1", "*broken markdown")
+        worker = OutboxWorker(restarted, reject, poll_interval=0.05)
+        worker.start()
+        assert worker.flush(timeout=10)
+        worker.stop()
+        assert restarted.pending() == 0 and restarted.dead() == 1
+
+        # 5. send_telegram_message enqueues and returns immediately
+        print("\n5. Testing send_telegram_message...")
+        bot = load_telegram_bot()
+        posts = []
+
+        def slow_post(url, data=None, timeout=None):
+            time.sleep(0.2)
+            posts.append(data["text"])
+            response = Response()
+            response.status_code = 200
+            response._content = b'{"ok": true}'
+            return response
+
+        bot.TOKEN, bot.CHAT_ID, bot.post = "test-token", "12345", slow_post
+        bot.OUTBOX_ENABLED = True
+        bot.OutboundQueue = lambda: OutboundQueue(path=os.path.join(directory, "bot_outbox.db"))
+        start = time.time()
+        results = [bot.send_telegram_message(f"Job {i}") for i in range(5)]
+        assert time.time() - start < 0.5 and all(result["ok"] for result in results)
+        assert bot.flush_outbox(timeout=10)
+        bot._outbox.stop()
+        bot._outbox = None
+        assert posts == [f"Job {i}" for i in range(5)]
+        print("   5 messages queued instantly, delivered in order")
+
+if __name__ == "__main__":
+    test_outbound_queue()
+    print("\n🎉 Outbound queue tests passed!")
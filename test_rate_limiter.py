@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Test the token-bucket rate limiter and 429 handling (no network access required)
+"""
+
+import importlib.util
+
+from requests import Response
+
+import telegram_bot
+from rate_limiter import RateLimiter, TokenBucket
+
+def load_telegram_bot():
+    """A private copy of telegram_bot (other scripts replace its send function with mocks)"""
+    spec = importlib.util.spec_from_file_location("telegram_bot_under_test", telegram_bot.__file__)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+class FakeClock:
+    """Manual clock: sleeping just advances time"""
+
+    def __init__(self):
+        self.now = 0.0
+        self.slept = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+        self.slept += seconds
+
+def make_response(status_code, body):
+    response = Response()
+    response.status_code = status_code
+    response._content = body
+    return response
+
+def test_rate_limiter():
+    print("🧪 Testing Rate Limiter...")
+
+    # 1. A bucket allows its burst, then paces at its rate
+    print("\n1. Testing token bucket...")
+    clock = FakeClock()
+    bucket = TokenBucket(rate=30, clock=clock)
+    assert all(bucket.reserve() == 0 for _ in range(30))
+    assert abs(bucket.reserve() - 1 / 30) < 1e-9
+
+    # 2. Private chats get 1/s, groups 20/min, everything 30/s
+    print("\n2. Testing per-chat limits...")
+    clock = FakeClock()
+    limiter = RateLimiter(clock=clock, sleep=clock.sleep)
+    for _ in range(5):
+        limiter.wait("12345")
+    assert abs(clock.now - 4.0) < 1e-6
+    clock = FakeClock()
+    limiter = RateLimiter(clock=clock, sleep=clock.sleep)
+    for _ in range(21):
+        limiter.wait("-100200300")
+    assert abs(clock.now - 60.0) < 1e-6
+    clock = FakeClock()
+    limiter = RateLimiter(clock=clock, sleep=clock.sleep)
+    for chat in range(60):
+        limiter.wait(str(chat))
+    assert abs(clock.now - 1.0) < 0.05
+    print("   private 1/s, group 20/min, global 30/s")
+
+    # 3. retry_after from a 429 holds every send, then the message goes out
+    print("\n3. Testing 429 retry_after...")
+    clock = FakeClock()
+    limiter = RateLimiter(clock=clock, sleep=clock.sleep)
+    replies = [
+        make_response(429, b'{"ok": false, "error_code": 429, "parameters": {"retry_after": 7}}'),
+        make_response(200, b'{"ok": true, "result": {"message_id": 1}}'),
+    ]
+    posts = []
+
+    def fake_post(url, data=None, timeout=None):
+        posts.append(data["text"])
+        return replies.pop(0)
+
+    bot = load_telegram_bot()
+    bot.TOKEN, bot.CHAT_ID, bot.post = "test-token", "12345", fake_post
+    bot.default_limiter = lambda: limiter
+    result = bot.deliver_message("12345", "Job alert")
+    assert result["ok"] and posts == ["Job alert", "Job alert"]
+    assert 7.0 <= clock.slept < 8.0, clock.slept
+    print(f"   Retried after {clock.slept:.0f}s, message delivered")
+
+if __name__ == "__main__":
+    test_rate_limiter()
+    print("\n🎉 Rate limiter tests passed!")
@@ -54,7 +54,7 @@ def test_scheduler():
         
     except ImportError as e:
         print(f"[ERROR] Missing dependency: {e}")
-        print("[TIP] Run: pip install schedule")
+        print("[TIP] Run: pip install -r requirements.txt")
         return False
     except Exception as e:
         print(f"[CRASH] Scheduler test error: {e}")
@@ -90,7 +90,6 @@ def check_environment():
     # Check dependencies
     try:
         import requests
-        import schedule
         print("[SUCCESS] All dependencies available")
         return True
     except ImportError as e:
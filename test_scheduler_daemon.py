@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Test the in-process scheduler daemon: schedule parsing, precise wakeups
+and warm JobScout reuse (no network access required)
+"""
+
+import os
+import tempfile
+import threading
+import time
+from datetime import datetime
+
+import daily_job_scheduler
+from daily_job_scheduler import ReliableJobScheduler, parse_schedules
+from source_hashes import INCREMENTAL_ENABLED
+
+class FakeScout:
+    def __init__(self, hang=0.0):
+        self.runs = []
+        self.fired_at = []
+        self.hang = hang
+
+    def reset_run(self, incremental=None):
+        self.runs.append("incremental" if incremental else "full")
+
+    def run_daily_scout(self):
+        self.fired_at.append(time.time())
+        time.sleep(self.hang)
+
+def test_scheduler_daemon():
+    print("🧪 Testing Scheduler Daemon...")
+
+    # 1. Schedules: daily, hourly and interval entries
+    print("\n1. Testing schedule parsing...")
+    now = datetime(2026, 3, 10, 6, 20, 15)
+    daily, hourly, half_hourly, seconds = parse_schedules("full@06:00, incremental@:15,incremental@30m,check@5s")
+    assert daily.next_after(now) == datetime(2026, 3, 11, 6, 0)
+    assert daily.next_after(datetime(2026, 3, 10, 5, 59, 59)) == datetime(2026, 3, 10, 6, 0)
+    assert hourly.next_after(now) == datetime(2026, 3, 10, 7, 15)
+    assert half_hourly.next_after(now) == datetime(2026, 3, 10, 6, 30)
+    assert half_hourly.next_after(datetime(2026, 3, 10, 23, 45)) == datetime(2026, 3, 11, 0, 0)
+    assert seconds.next_after(now) == datetime(2026, 3, 10, 6, 20, 20)
+    assert (hourly.mode, seconds.mode) == ("incremental", "check")
+    for bad in ("hourly@06:00", "full@25:00", "full@:75", "full@soon", "full@0m", ""):
+        try:
+            parse_schedules(bad)
+            assert False, f"{bad!r} should be rejected"
+        except ValueError:
+            pass
+    scheduler = ReliableJobScheduler(schedules="full@06:00,incremental@:15", clock=lambda: now)
+    assert scheduler.next_run() == (datetime(2026, 3, 10, 7, 15), scheduler.schedules[1:])
+    scheduler = ReliableJobScheduler(schedules="incremental@:00,full@06:00,check@:00", clock=lambda: now)
+    fired = []
+    scheduler.run_job_bot = fired.append
+    scheduler.check_missed_runs = lambda: fired.append("check")
+    due_at, entries = scheduler.next_run(datetime(2026, 3, 10, 5, 30))
+    assert due_at == datetime(2026, 3, 10, 6, 0) and len(entries) == 3
+    scheduler.fire(entries)
+    assert fired == ["full", "check"]  # The full run covers the incremental one
+
+    with tempfile.TemporaryDirectory() as directory:
+        # 2. Runs fire on timer wakeups, on one warm scout
+        print("\n2. Testing precise wakeups...")
+        scheduler = ReliableJobScheduler(schedules="incremental@1s,full@3s")
+        scheduler.last_run_file = daily_job_scheduler.Path(os.path.join(directory, "last_run.txt"))
+        scout = scheduler._scout = FakeScout()
+        thread = threading.Thread(target=scheduler.start_scheduler, daemon=True)
+        start = time.time()
+        thread.start()
+        time.sleep(3.5 - start % 1)  # Through the next 3 whole seconds
+        scheduler.stop()
+        thread.join(5)
+        assert not thread.is_alive()
+        assert len(scout.runs) == 3 and scout.runs.count("full") == 1
+        lateness = [fired % 1 for fired in scout.fired_at]
+        assert max(lateness) < 0.1, lateness  # Fired right on the second, not up to a minute late
+        assert os.path.exists(scheduler.last_run_file)  # Full runs are recorded
+        print(f"   {len(scout.runs)} runs, at most {max(lateness) * 1000:.0f}ms after their slot")
+
+        # 3. A hung run is reported once; while it is wedged, runs use a fresh process
+        print("\n3. Testing run timeouts...")
+        alerts = []
+        original_timeout = daily_job_scheduler.RUN_TIMEOUT
+        daily_job_scheduler.RUN_TIMEOUT = 0.2
+        try:
+            scheduler = ReliableJobScheduler(schedules="full@06:00")
+            scheduler.last_run_file = daily_job_scheduler.Path(os.path.join(directory, "hung.txt"))
+            scheduler.send_fallback_notification = lambda: alerts.append(1)
+            scheduler._scout = FakeScout(hang=2.0)
+            assert not scheduler.run_job_bot("full")
+            assert alerts == [1] and not os.path.exists(scheduler.last_run_file)
+            child = daily_job_scheduler.Path(os.path.join(directory, "child.py"))
+            child.write_text("print('fresh run')\n", encoding="utf-8")
+            scheduler.job_script = child
+            daily_job_scheduler.RUN_TIMEOUT = 30
+            assert scheduler.run_job_bot("full")  # The wedged thread is bypassed, not waited on
+            assert len(scheduler._scout.runs) == 1 and os.path.exists(scheduler.last_run_file)
+        finally:
+            daily_job_scheduler.RUN_TIMEOUT = original_timeout
+
+        # 4. The real JobScout can be reset between runs
+        print("\n4. Testing warm scout reuse...")
+        from telegram_jobs import JobScout
+        scout = JobScout()
+        scout.jobs_found = [{"title": "Old"}]
+        scout.source_stats = {"Old": {"status": "success", "jobs": 1}}
+        scout.reset_run(incremental=True)
+        assert scout.jobs_found == [] and scout.source_stats == {} and scout.source_hashes.enabled
+        scout.reset_run()
+        assert scout.source_hashes.enabled == INCREMENTAL_ENABLED  # Back to SCOUT_INCREMENTAL
+
+if __name__ == "__main__":
+    test_scheduler_daemon()
+    print("\n🎉 Scheduler daemon tests passed!")
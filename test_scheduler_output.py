@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+Test streaming of a scheduled run's output into rotating JSON logs (no network access required)
+"""
+
+import json
+import logging
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import daily_job_scheduler
+from daily_job_scheduler import ReliableJobScheduler, setup_run_log
+from fetch_engine import FetchEngine, FetchTask
+
+CHILD = '''
+import sys, time
+print("Agent-21 Scout starting")
+for number in range(1, 4):
+    time.sleep(0.3)
+    print(f"[PROGRESS] {number}/3 Source {number} [tech]: {number * 2} jobs in 0.3s")
+print("[PROGRESS] 4/3 Broken [tech]: failed in 0.0s")
+print("[WARNING] something odd", file=sys.stderr)
+for number in range(200):
+    print(f"filler line {number} " + "x" * 40)
+'''
+
+HUNG_CHILD = '''
+import time
+print("Fetching GitLab board...")
+time.sleep(30)
+'''
+
+class PrintingScout:
+    """Stands in for JobScout in in-process runs: prints like a run, optionally hangs"""
+
+    def __init__(self, hang=0.0):
+        self.hang = hang
+
+    def reset_run(self, incremental=None):
+        pass
+
+    def run_daily_scout(self):
+        print("Agent-21 Scout starting")
+        engine = FetchEngine(max_workers=2, per_host_limit=2, deadline=10)
+        engine.run([FetchTask("Board A [tech]", lambda: [{"title": "A"}], host="a.example.com"),
+                    FetchTask("Board B [tech]", lambda: 1 / 0, host="b.example.com")])
+        print("Sending digest...", end="")
+        time.sleep(self.hang)
+
+class Capture(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.records = []
+
+    def emit(self, record):
+        self.records.append((time.monotonic(), record.getMessage()))
+
+def read_run_log(path):
+    """Entries of a rotated log, oldest first (runs.jsonl.N ... runs.jsonl.1, runs.jsonl)"""
+    backups = sorted(path.parent.glob(path.name + ".*"), key=lambda backup: -int(backup.suffix[1:]))
+    lines = []
+    for name in backups + [path]:
+        with open(name, encoding="utf-8") as f:
+            lines.extend(json.loads(line) for line in f)
+    return lines
+
+def test_scheduler_output():
+    print("🧪 Testing Scheduler Output Streaming...")
+
+    # 1. The fetch engine reports each finished source
+    print("\n1. Testing progress lines...")
+    engine = FetchEngine(max_workers=2, per_host_limit=2, deadline=10)
+    engine.run([FetchTask("ok", lambda: [{"title": "A"}], host="a.example.com"),
+                FetchTask("broken", lambda: 1 / 0, host="b.example.com")])
+    assert engine._finished == 2 and engine.failed == ["broken"]
+
+    capture = Capture()
+    root = logging.getLogger()
+    root.addHandler(capture)
+    original_level = root.level
+    root.setLevel(logging.INFO)
+    original_timeout = daily_job_scheduler.RUN_TIMEOUT
+    with tempfile.TemporaryDirectory() as directory:
+        directory = Path(directory)
+        log_path = directory / "runs.jsonl"
+        setup_run_log(log_path, max_bytes=4000, backups=20)
+        script = directory / "child.py"
+        script.write_text(CHILD, encoding="utf-8")
+        try:
+            # 2. Lines are logged as they are printed, with progress events per source
+            print("\n2. Testing streamed output...")
+            scheduler = ReliableJobScheduler(schedules="full@06:00", run_mode="subprocess")
+            scheduler.job_script = script
+            scheduler.last_run_file = directory / "last_run.txt"
+            started = time.monotonic()
+            assert scheduler.run_job_bot("full")
+            finished = time.monotonic()
+            progress = [(at, message) for at, message in capture.records if message.startswith("📦")]
+            assert [message for _, message in progress] == [
+                "📦 [1/3] Source 1 [tech]: 2 jobs in 0.3s", "📦 [2/3] Source 2 [tech]: 4 jobs in 0.3s",
+                "📦 [3/3] Source 3 [tech]: 6 jobs in 0.3s", "📦 [4/3] Broken [tech]: failed in 0.0s"]
+            assert progress[0][0] - started < finished - started - 0.5  # Logged live, not at exit
+            assert not any(message.startswith("Output:") for _, message in capture.records)
+            assert scheduler.last_run_file.exists()
+
+            # 3. The run log is structured and rotates
+            print("\n3. Testing the rotating run log...")
+            entries = read_run_log(log_path)
+            assert len(list(directory.glob("runs.jsonl.*"))) >= 2  # Rotated backups
+            output = [entry for entry in entries if "stream" in entry]
+            assert len(output) == 206 and len({entry["run"] for entry in output}) == 1
+            assert {"stream": "stderr", "level": "WARNING", "message": "[WARNING] something odd"}.items() \
+                <= next(entry for entry in output if entry["stream"] == "stderr").items()
+            events = [entry for entry in entries if entry.get("event") == "source_done"]
+            assert [(event["source"], event["jobs"]) for event in events] == [
+                ("Source 1 [tech]", 2), ("Source 2 [tech]", 4), ("Source 3 [tech]", 6), ("Broken [tech]", None)]
+
+            # 4. A hung run is killed at the timeout, and its output so far is kept
+            print("\n4. Testing a hung run...")
+            script.write_text(HUNG_CHILD, encoding="utf-8")
+            scheduler.last_run_file = directory / "hung_last_run.txt"
+            alerts = []
+            scheduler.send_fallback_notification = lambda: alerts.append(1)
+            daily_job_scheduler.RUN_TIMEOUT = 2
+            started = time.monotonic()
+            assert not scheduler.run_job_bot("full")
+            assert time.monotonic() - started < 10 and alerts == [1]
+            assert not scheduler.last_run_file.exists()
+            assert read_run_log(log_path)[-1]["message"] == "Fetching GitLab board..."
+            timeout_report = next(message for _, message in capture.records if message.startswith("⏰"))
+            assert "[stdout] Fetching GitLab board..." in timeout_report
+            print(f"   {len(entries)} structured log lines across {len(list(directory.glob('runs.jsonl*')))} files")
+
+            # 5. In-process runs (the default mode) stream into the same run log
+            print("\n5. Testing in-process runs...")
+            setup_run_log(directory / "inprocess.jsonl")
+            scheduler = ReliableJobScheduler(schedules="full@06:00", run_mode="inprocess")
+            scheduler.last_run_file = directory / "inprocess_last_run.txt"
+            alerts = []
+            scheduler.send_fallback_notification = lambda: alerts.append(1)
+            scheduler._scout = PrintingScout()
+            original_stdout = sys.stdout
+            assert scheduler.run_job_bot("full")
+            assert sys.stdout is original_stdout
+            entries = read_run_log(directory / "inprocess.jsonl")
+            messages = [entry["message"] for entry in entries if entry.get("stream") == "stdout"]
+            assert messages[0] == "Agent-21 Scout starting" and messages[-1] == "Sending digest..."
+            events = [entry for entry in entries if entry.get("event") == "source_done"]
+            assert sorted((event["source"], event["jobs"]) for event in events) == [
+                ("Board A [tech]", 1), ("Board B [tech]", None)]
+
+            scheduler._scout = PrintingScout(hang=3)
+            scheduler.last_run_file = directory / "inprocess_hung.txt"
+            daily_job_scheduler.RUN_TIMEOUT = 1
+            assert not scheduler.run_job_bot("full")
+            assert alerts == [1]  # Only after the hung run
+            assert any(entry.get("event") == "source_done" and entry["source"] == "Board B [tech]"
+                       for entry in read_run_log(directory / "inprocess.jsonl")[len(entries):])
+            timeout_report = [message for _, message in capture.records if message.startswith("⏰")][-1]
+            assert "[stdout] Agent-21 Scout starting" in timeout_report
+            scheduler._run_thread.join(5)
+            assert sys.stdout is original_stdout  # Restored once the hung run ends
+        finally:
+            daily_job_scheduler.RUN_TIMEOUT = original_timeout
+            root.removeHandler(capture)
+            root.setLevel(original_level)
+            for handler in list(daily_job_scheduler.run_log.handlers):
+                daily_job_scheduler.run_log.removeHandler(handler)
+                handler.close()
+
+if __name__ == "__main__":
+    test_scheduler_output()
+    print("\n🎉 Scheduler output tests passed!")
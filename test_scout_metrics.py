@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+Test per-source run metrics and their JSON lines / Prometheus exports (no network access required)
+"""
+
+import json
+import os
+import tempfile
+import threading
+import time
+import urllib.request
+
+import source_snapshots
+from fetch_engine import FetchEngine, FetchTask
+from scout_metrics import RunMetrics, latest_prometheus, make_server
+from source_health import SourceHealth
+from source_snapshots import SourceSnapshots
+from telegram_jobs import JobScout
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+class FakeResponse:
+    def __init__(self, status_code, payload, from_cache=False):
+        self.status_code = status_code
+        self.payload = payload
+        self.content = json.dumps(payload).encode("utf-8")
+        self.from_cache = from_cache
+
+    def json(self):
+        return self.payload
+
+def test_scout_metrics():
+    print("🧪 Testing Scout Metrics...")
+
+    with tempfile.TemporaryDirectory() as directory:
+        # 1. Measurements inside a source block are attributed to that source
+        print("\n1. Testing per-source attribution...")
+        clock = FakeClock()
+        metrics = RunMetrics(directory=directory, enabled=True, clock=clock)
+        with metrics.source("Board"):
+            clock.now += 2.5
+            metrics.record_response(FakeResponse(200, {"jobs": [1, 2]}))
+            metrics.record_response(FakeResponse(200, {"jobs": []}, from_cache=True))
+            with metrics.parsing():
+                clock.now += 0.25
+            metrics.record_retry(1.5)
+            metrics.record_error()
+        try:
+            with metrics.source("Broken"):
+                raise ValueError("boom")
+        except ValueError:
+            pass
+        metrics.record_response(FakeResponse(200, {}))  # Outside any source: ignored
+        board = metrics.sources["Board"].to_dict()
+        assert board == {"calls": 1, "wall_seconds": 2.75, "bytes": len(b'{"jobs": [1, 2]}'), "retries": 1,
+                         "sleep_seconds": 1.5, "parse_seconds": 0.25, "errors": 0,
+                         "statuses": {"200": 2, "error": 1}}
+        assert metrics.sources["Broken"].errors == 1 and set(metrics.sources) == {"Board", "Broken"}
+
+        # 2. The fetch engine times each task under its source, on every worker thread
+        print("\n2. Testing fetch engine timing...")
+        metrics = RunMetrics(directory=directory, enabled=True)
+
+        def slow_source(seconds):
+            time.sleep(seconds)
+            return [{"title": "Job", "source": "Slow"}]
+
+        tasks = [FetchTask(f"slow [{n}]", slow_source, (0.05,), host="slow.example.com", source="Slow")
+                 for n in range(4)]
+        tasks.append(FetchTask("static", lambda: [{"title": "Static"}], source="Static"))
+        FetchEngine(max_workers=4, per_host_limit=2, metrics=metrics).run(tasks)
+        assert metrics.sources["Slow"].calls == 4 and metrics.sources["Static"].calls == 1
+        assert metrics.sources["Slow"].wall_seconds >= 0.2
+        assert metrics.slowest(1)[0][0] == "Slow"
+
+        # 3. Board downloads report bytes, statuses and parse time
+        print("\n3. Testing board downloads...")
+        payload = {"jobs": [{"id": n, "title": f"Job {n}"} for n in range(50)]}
+
+        def fake_get(url, params=None, headers=None, timeout=None, ttl=None):
+            return FakeResponse(404 if "missing" in url else 200, payload)
+
+        original_get = source_snapshots.cached_get
+        source_snapshots.cached_get = fake_get
+        try:
+            snapshots = SourceSnapshots(metrics=metrics)
+            with metrics.source("GitLab"):
+                assert snapshots.get_json("https://boards.example.com/gitlab") == payload
+                assert snapshots.get_json("https://boards.example.com/gitlab") == payload  # Snapshot hit
+                assert snapshots.get_json("https://boards.example.com/missing") is None
+        finally:
+            source_snapshots.cached_get = original_get
+        gitlab = metrics.sources["GitLab"]
+        assert gitlab.statuses == {"200": 1, "404": 1}
+        assert gitlab.bytes == 2 * len(json.dumps(payload)) and gitlab.parse_seconds > 0
+
+        # 4. Retries and their sleeps are counted by the fetch wrapper
+        print("\n4. Testing retries and sleeps...")
+        slept = []
+        original_sleep = time.sleep
+        time.sleep = slept.append
+        try:
+            scout = JobScout()
+            scout.health = SourceHealth(path=os.path.join(directory, "health.db"), enabled=False)
+            scout.metrics = RunMetrics(directory=directory, enabled=True)
+
+            def failing_source(keywords):
+                raise ValueError("boom")
+
+            scout.fetch_with_comprehensive_error_handling(failing_source, "Zapier", ["support"])
+        finally:
+            time.sleep = original_sleep
+        zapier = scout.metrics.sources["Zapier"]
+        assert zapier.retries == 2 and zapier.sleep_seconds == sum(slept) and zapier.errors == 1
+
+        # 5. Job counts per source before and after dedup, and stage timings
+        print("\n5. Testing job counts and stages...")
+        clock = FakeClock()
+        metrics = RunMetrics(directory=directory, enabled=True, clock=clock)
+        fetched = [{"title": "A", "source": "Remotive"}, {"title": "A", "source": "Remotive"},
+                   {"title": "B", "source": "GitLab"}]
+        metrics.count_jobs("fetched", fetched)
+        metrics.count_jobs("unique", fetched[1:])
+        metrics.count_jobs("new", fetched[2:])
+        clock.now += 3
+        metrics.lap("fetch")
+        clock.now += 1
+        metrics.lap("dedup")
+        assert metrics.jobs == {"Remotive": {"fetched": 2, "unique": 1, "new": 0},
+                                "GitLab": {"fetched": 1, "unique": 1, "new": 1}}
+        assert metrics.stages == {"fetch": 3, "dedup": 1}
+
+        # 6. Exports: one JSON line per record, Prometheus text served at /metrics
+        print("\n6. Testing exports...")
+        with metrics.source('Quote "board"'):
+            metrics.record_response(FakeResponse(503, {}))
+        assert latest_prometheus(directory) is None
+        assert metrics.export() and metrics.export()  # Two runs
+        with open(os.path.join(directory, "runs.jsonl"), encoding="utf-8") as f:
+            records = [json.loads(line) for line in f]
+        assert len(records) == 2 * 4
+        assert {record["kind"] for record in records} == {"source", "jobs", "run"}
+        assert records[3] == {"kind": "run", "run": records[0]["run"], "stages": {"fetch": 3, "dedup": 1},
+                              "seconds": 4}
+        text = latest_prometheus(directory)
+        assert 'scout_jobs{source="Remotive",stage="fetched"} 2' in text
+        assert 'scout_stage_seconds{stage="fetch"} 3' in text
+        assert 'scout_source_responses{source="Quote \\"board\\"",status="503"} 1' in text
+        assert "# TYPE scout_source_wall_seconds gauge" in text
+        assert not RunMetrics(directory=os.path.join(directory, "off"), enabled=False).export()
+
+        rotated = RunMetrics(directory=os.path.join(directory, "rotated"), max_bytes=100, backups=2)
+        for _ in range(10):
+            rotated.export()
+        history = sorted(os.listdir(os.path.join(directory, "rotated")))
+        assert history == ["runs.jsonl", "runs.jsonl.1", "runs.jsonl.2", "scout.prom"], history
+
+        server = make_server(0, directory)
+        assert server.server_address[0] == "127.0.0.1"  # Not published on every interface
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            url = f"http://127.0.0.1:{server.server_port}/metrics"
+            with urllib.request.urlopen(url, timeout=5) as response:
+                assert response.read().decode("utf-8") == text
+                assert response.headers["Content-Type"].startswith("text/plain; version=0.0.4")
+        finally:
+            server.shutdown()
+            server.server_close()
+        print(f"   {len(text.splitlines())} Prometheus lines, {len(records)} JSON lines")
+
+if __name__ == "__main__":
+    test_scout_metrics()
+    print("\n🎉 Scout metrics tests passed!")
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Test incremental runs over source content hashes (no network access required)
+"""
+
+import os
+import tempfile
+
+import telegram_jobs
+from job_dedup import SeenJobs
+from job_store import JobStore
+from scout_metrics import RunMetrics
+from source_hashes import SourceHashes, content_hash, group_by_source
+from telegram_jobs import JobScout
+
+def run_scout(directory, mode, extra_jobs=()):
+    """One offline daily run; returns (jobs categorized, new jobs, messages sent)"""
+    sent = []
+    categorized = []
+    original_send, original_mode = telegram_jobs.send_telegram_message, telegram_jobs.DELIVERY_MODE
+    telegram_jobs.send_telegram_message = lambda message: sent.append(message)
+    telegram_jobs.DELIVERY_MODE = mode
+    try:
+        scout = JobScout()
+        scout.seen_jobs = SeenJobs(path=os.path.join(directory, "seen.db"), ttl_days=7, enabled=True)
+        scout.source_hashes = SourceHashes(path=os.path.join(directory, "hashes.db"), ttl_days=7, enabled=True)
+        scout.job_store = JobStore(path=os.path.join(directory, "jobs.db"))
+        scout.metrics = RunMetrics(directory=os.path.join(directory, "metrics"))
+        scout.build_fetch_tasks = lambda: []
+        guaranteed = scout.get_guaranteed_working_jobs
+        scout.get_guaranteed_working_jobs = lambda: guaranteed() + list(extra_jobs)
+        organize = scout.categorizer.organize_jobs_by_category
+
+        def organize_and_count(jobs):
+            categorized.extend(jobs)
+            return organize(jobs)
+
+        scout.categorizer.organize_jobs_by_category = organize_and_count
+        scout.run_daily_scout()
+    finally:
+        telegram_jobs.send_telegram_message, telegram_jobs.DELIVERY_MODE = original_send, original_mode
+    return len(categorized), scout.total_jobs, sent
+
+def test_source_hashes():
+    print("🧪 Testing Incremental Source Hashes...")
+
+    jobs = [
+        {"title": "Support Agent", "company": "Acme", "location": "Remote", "url": "https://a/1",
+         "salary": "$15/hour", "source": "Acme"},
+        {"title": "Data Entry", "company": "Beta", "location": "Remote", "url": "https://b/1",
+         "salary": "$10/hour", "source": "Beta"},
+    ]
+
+    # 1. Hashes follow the jobs' visible fields
+    print("\n1. Testing content hashes...")
+    assert content_hash(jobs) == content_hash([dict(job) for job in jobs])
+    assert content_hash(jobs) != content_hash(jobs[::-1])
+    assert content_hash(jobs) != content_hash([dict(jobs[0], salary="$16/hour"), jobs[1]])
+    assert content_hash(jobs) == content_hash([dict(jobs[0], posted="today"), jobs[1]])
+    assert list(group_by_source(jobs)) == ["Acme", "Beta"]
+
+    with tempfile.TemporaryDirectory() as directory:
+        # 2. Only sources that changed since their last commit are reported
+        print("\n2. Testing change detection...")
+        hashes = SourceHashes(path=os.path.join(directory, "unit.db"), ttl_days=7, enabled=True)
+        groups = group_by_source(jobs)
+        assert set(hashes.changes(groups)) == {"Acme", "Beta"}
+        hashes.commit(hashes.changes(groups))
+        assert hashes.changes(groups) == {}
+        groups["Beta"] = [dict(jobs[1], title="Data Entry Clerk")]
+        assert set(hashes.changes(groups)) == {"Beta"}
+        expired = SourceHashes(path=os.path.join(directory, "unit.db"), ttl_days=1e-9, enabled=True)
+        assert set(expired.changes(group_by_source(jobs))) == {"Acme", "Beta"}
+        disabled = SourceHashes(path=os.path.join(directory, "unit.db"), enabled=False)
+        assert set(disabled.changes(group_by_source(jobs))) == {"Acme", "Beta"}
+
+    with tempfile.TemporaryDirectory() as directory:
+        # 3. An unchanged day categorizes and sends nothing
+        print("\n3. Testing unchanged daily runs...")
+        first_processed, first_total, _ = run_scout(directory, "digest")
+        second_processed, second_total, second_sent = run_scout(directory, "digest")
+        assert first_total > 0 and first_processed >= first_total
+        assert second_processed == 0 and second_total == 0
+        assert "No new opportunities" in second_sent[0]
+        print(f"   Run 1 processed {first_processed} jobs, run 2 processed {second_processed}")
+
+        # 4. A changed source alone flows through
+        print("\n4. Testing a changed source...")
+        extra = {"title": "Night Shift Moderator", "company": "Gamma", "location": "Remote",
+                 "url": "https://g/1", "salary": "$14/hour", "source": "Gamma Careers"}
+        processed, total, sent = run_scout(directory, "digest", [extra])
+        assert processed == 1 and total == 1
+        assert any("Night Shift Moderator" in message for message in sent)
+
+    with tempfile.TemporaryDirectory() as directory:
+        # 5. Jobs beyond the per-run cap aren't lost to an unchanged hash
+        print("\n5. Testing capped runs...")
+        _, first_total, first_sent = run_scout(directory, "individual")
+        _, second_total, second_sent = run_scout(directory, "individual")
+        assert second_total == first_total - 25
+        assert not set(first_sent[1:26]) & set(second_sent)
+        print(f"   Run 1: {first_total} new jobs, run 2: {second_total} new jobs")
+
+if __name__ == "__main__":
+    test_source_hashes()
+    print("\n🎉 Incremental source hash tests passed!")
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Test per-source circuit breakers (no network access required)
+"""
+
+import os
+import tempfile
+import time
+
+import source_snapshots
+from source_health import CLOSED, HALF_OPEN, OPEN, CircuitOpenError, SourceHealth, endpoint_name
+from source_snapshots import SnapshotError, SourceSnapshots
+from telegram_jobs import JobScout
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000000.0
+
+    def __call__(self):
+        return self.now
+
+class FakeResponse:
+    def __init__(self, status_code, payload=None):
+        self.status_code = status_code
+        self.payload = payload
+
+    def json(self):
+        return self.payload
+
+def test_source_health():
+    print("🧪 Testing Source Health...")
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "health.db")
+        clock = FakeClock()
+        health = SourceHealth(path=path, failure_threshold=3, cooldown=3600, max_cooldown=4 * 3600,
+                              enabled=True, clock=clock)
+
+        # 1. Failures on consecutive runs open the breaker; a success in between resets the count.
+        #    Within one run (every category calling the source) only the first failure counts
+        print("\n1. Testing opening...")
+        for outcome in ("fail", "fail", "success", "fail", "fail"):
+            health.start_run()
+            if outcome == "fail":
+                health.record_failure("Board", "timeout")
+                health.record_failure("Board", "timeout")  # Next category, same run
+            else:
+                health.record_success("Board", latency=0.5)
+        assert health.state("Board") == CLOSED and health.allow("Board")
+        health.start_run()
+        health.record_failure("Board", "timeout", latency=10.0)
+        assert health.state("Board") == OPEN
+        assert not health.allow("Board") and health.skipped == 1
+        report = health.report()["Board"]
+        assert report["failure_rate"] == 5 / 6 and report["last_error"] == "timeout"
+        assert 0.5 < report["latency"] < 10.0
+
+        # 2. The breaker survives a restart once the run saves it
+        print("\n2. Testing persistence...")
+        assert not SourceHealth(path=path, enabled=True, clock=clock).report()  # Nothing written mid-run
+        health.save()
+        restarted = SourceHealth(path=path, failure_threshold=3, cooldown=3600, max_cooldown=4 * 3600,
+                                 enabled=True, clock=clock)
+        assert restarted.state("Board") == OPEN and not restarted.allow("Board")
+
+        # 3. After the cool-down one probe goes through; failing it doubles the cool-down
+        print("\n3. Testing half-open probes...")
+        clock.now += 3600
+        assert restarted.allow("Board") and restarted.state("Board") == HALF_OPEN
+        assert not restarted.allow("Board")  # Only one probe at a time
+        restarted.start_run()
+        restarted.record_failure("Board", "still down")
+        assert restarted.state("Board") == OPEN
+        clock.now += 3600
+        assert not restarted.allow("Board")
+        clock.now += 3600
+        assert restarted.allow("Board")
+        restarted.record_success("Board", latency=0.2)
+        assert restarted.state("Board") == CLOSED and restarted.allow("Board")
+
+        # 4. call() skips open sources without calling them
+        print("\n4. Testing guarded calls...")
+        calls = []
+
+        def broken():
+            calls.append(1)
+            raise ConnectionError("refused")
+
+        for _ in range(3):
+            restarted.start_run()
+            try:
+                restarted.call("Other", broken)
+            except ConnectionError:
+                pass
+        try:
+            restarted.call("Other", broken)
+            assert False, "open breaker should not call the source"
+        except CircuitOpenError:
+            pass
+        assert len(calls) == 3
+        assert restarted.call("Fine", lambda: 42) == 42
+        assert not SourceHealth(path=path, enabled=False, clock=clock).report()
+
+        # 5. Board downloads go through the breaker across runs
+        print("\n5. Testing board downloads...")
+        downloads = []
+
+        def fake_get(url, params=None, headers=None, timeout=None, ttl=None):
+            downloads.append(url)
+            return FakeResponse(503)
+
+        original_get = source_snapshots.cached_get
+        source_snapshots.cached_get = fake_get
+        try:
+            snapshots = SourceSnapshots(restarted)
+            url = "https://boards-api.greenhouse.io/v1/boards/deadco/jobs"
+            for _ in range(3):  # Three daily runs
+                snapshots.clear()
+                restarted.start_run()
+                assert snapshots.get_json(url) is None
+                assert snapshots.get_json(url) is None
+            assert len(downloads) == 3
+            assert restarted.state(endpoint_name(url)) == OPEN
+            snapshots.clear()
+            try:
+                snapshots.get_json(url)
+                assert False, "open board should not be downloaded"
+            except SnapshotError as e:
+                assert isinstance(e.error, CircuitOpenError)
+            assert len(downloads) == 3
+        finally:
+            source_snapshots.cached_get = original_get
+        assert endpoint_name("https://remotive.com/api/remote-jobs?category=data") == "remotive.com/api/remote-jobs"
+
+        # 6. A failing source counts once per run and stops costing retry sleeps once its breaker opens;
+        #    static sources aren't tracked at all
+        print("\n6. Testing retries with an open breaker...")
+        slept = []
+        original_sleep = time.sleep
+        time.sleep = slept.append
+        attempts = []
+
+        def failing_source(keywords):
+            attempts.append(keywords)
+            raise ValueError("boom")
+
+        try:
+            scout = JobScout()
+            scout.health = SourceHealth(path=os.path.join(directory, "scout.db"), failure_threshold=3,
+                                        cooldown=3600, enabled=True)
+            for run in range(3):
+                scout.health.start_run()
+                for category in range(5):
+                    jobs = scout.fetch_with_comprehensive_error_handling(failing_source, "Zapier", [str(category)])
+                    assert jobs == scout._get_comprehensive_fallback_jobs("Zapier")
+                assert scout.health.state("Zapier") == (OPEN if run == 2 else CLOSED)
+            calls, sleeps = len(attempts), len(slept)
+            scout.fetch_with_comprehensive_error_handling(failing_source, "Buffer", ["static"], network=False)
+        finally:
+            time.sleep = original_sleep
+        assert calls == 33 and sleeps == 22  # Run 3: categories 2 to 5 skipped outright
+        assert scout.source_stats["Zapier"] == {"status": "circuit_open", "jobs": 0, "attempts": 0}
+        assert "Buffer" not in scout.health.report()
+        print(f"   {calls} calls and {sleeps} retry sleeps instead of 45 and 30 over three runs")
+
+if __name__ == "__main__":
+    test_source_health()
+    print("\n🎉 Source health tests passed!")
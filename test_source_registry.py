@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Test the job source registry, cost-ordered scheduling and cached source
+results (no network access required)
+"""
+
+import os
+import tempfile
+import threading
+import time
+
+from fetch_engine import FetchEngine, FetchTask, ResultCache
+from source_health import SourceHealth
+from source_registry import NETWORK, SOURCES, STATIC, SourceRegistry, SourceSpec, job_source
+from telegram_jobs import AMAZON_KEYWORDS, CATEGORIES, JobScout
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+def test_source_registry():
+    print("🧪 Testing Source Registry...")
+
+    # 1. Every JobScout source is registered once, with its metadata
+    print("\n1. Testing registered sources...")
+    gitlab = SOURCES.get("GitLab")
+    assert (gitlab.kind, gitlab.host, gitlab.label) == (NETWORK, "boards-api.greenhouse.io", "GitLab")
+    assert gitlab.cost > SOURCES.get("fetch_static_jobs").cost and gitlab.refresh > 0
+    methods = [spec.method for spec in SOURCES if spec.method]
+    assert len(methods) == len(set(methods))
+    assert SOURCES.get("Gaming Platforms").method == "fetch_gaming_platform_jobs"
+    assert "fetch_gaming_platform_jobs" not in SOURCES  # Registered once, under its label
+    assert not SOURCES.get("fetch_wellfound_jobs").enabled
+    assert all(spec.host for spec in SOURCES.of_kind(NETWORK))
+    assert not any(spec.host for spec in SOURCES.of_kind(STATIC))
+
+    # 2. Duplicate or inconsistent declarations are rejected
+    print("\n2. Testing declaration checks...")
+    registry = SourceRegistry()
+    try:
+        class Scout:
+            @job_source(registry=registry)
+            def fetch_board_jobs(self, keywords):
+                return [{"title": "Old"}]
+
+            @job_source(registry=registry)
+            def fetch_board_jobs(self, keywords):
+                return [{"title": "New"}]
+        assert False, "a redefined source should be rejected"
+    except ValueError:
+        pass
+    for bad in (dict(kind=NETWORK), dict(kind=STATIC, host="example.com"), dict(kind="ftp")):
+        try:
+            SourceSpec("Bad", method="fetch_bad_jobs", **bad)
+            assert False, f"{bad} should be rejected"
+        except ValueError:
+            pass
+
+    # 3. Fetch tasks come from the registry, one per source and covered category
+    print("\n3. Testing fetch tasks...")
+    scout = JobScout()
+    tasks = scout.build_fetch_tasks()
+    names = [task.name for task in tasks]
+    assert len(names) == len(set(names))
+    amazon = [name for name in names if name.startswith("Amazon Jobs [")]
+    assert len(amazon) == sum(any(word in keywords for word in AMAZON_KEYWORDS) for keywords in CATEGORIES.values())
+    assert sum(name.startswith("Gaming Platforms [") for name in names) == len(CATEGORIES)
+    assert not any(name.startswith("fetch_wellfound_jobs") for name in names)
+    assert next(task for task in tasks if task.source == "GitLab").host == "boards-api.greenhouse.io"
+
+    # Merge order (which jobs fill the digest and message caps) is the order the sources used to be called in;
+    # the labeled Creator Economy and Gaming Platforms sources sit where their unlabeled calls were
+    assert [spec.name for spec in SOURCES.enabled()] == [
+        "Amazon Jobs", "GitLab", "Automattic", "Zapier", "Buffer", "Doist", "Remote.com", "Deel",
+        "fetch_andela_jobs", "fetch_crypto_jobs", "fetch_wikimedia_jobs",
+        "fetch_customer_support_jobs", "fetch_operations_hr_jobs", "fetch_finance_jobs", "fetch_technical_writing_jobs",
+        "fetch_bpo_outsourcing_jobs", "fetch_ai_training_jobs", "fetch_freelance_gig_jobs", "fetch_va_support_jobs",
+        "fetch_social_media_platform_jobs", "fetch_customer_support_platform_jobs", "fetch_ad_review_specialist_jobs",
+        "fetch_data_labeling_specialist_jobs", "fetch_comprehensive_platform_jobs",
+        "Creator Economy", "Gaming Platforms", "fetch_chat_moderation_jobs", "fetch_social_platform_extended_jobs",
+        "fetch_reliable_jobs", "fetch_static_jobs", "fetch_flexjobs_api", "fetch_sample_specialized_jobs",
+        "Sales & Business Development", "Product Management", "Ecommerce & Online Stores", "Healthcare Remote",
+        "Translation & Localization", "Research & Surveys", "Course Creator & Education", "Social Media Tasks",
+        "Data Labeling & Annotation", "Kraken", "Supabase"]
+    python_tasks = [task.source for task in tasks if task.name.endswith(" [python]")]
+    assert python_tasks == [spec.name for spec in SOURCES.for_keywords(CATEGORIES["python"])]
+    print(f"   {len(SOURCES)} sources ({len(SOURCES.enabled())} enabled), {len(tasks)} fetch tasks")
+
+    # 4. Plugin sources join the run without a JobScout method
+    print("\n4. Testing plugin sources...")
+    registry = SourceRegistry()
+    registry.register("Plugin Board", lambda scout, keywords: [{"title": f"{keywords[0]} job"}],
+                      keywords=["python"])
+    scout.registry = registry
+    tasks = scout.build_fetch_tasks()
+    assert [task.name for task in tasks] == ["Plugin Board [python]"]
+    assert FetchEngine().run(tasks) == [[{"title": "python job"}]]
+
+    # 5. Costlier network sources are started first; results stay in task order
+    print("\n5. Testing cost-ordered scheduling...")
+    started = []
+    lock = threading.Lock()
+
+    def fetch(name):
+        with lock:
+            started.append(name)
+        return [{"title": name}]
+
+    tasks = [FetchTask(name, fetch, (name,), host="boards.example.com", cost=cost)
+             for name, cost in (("cheap", 1), ("pricey", 5), ("middling", 3))]
+    results = FetchEngine(max_workers=1, per_host_limit=1).run(tasks)
+    assert started == ["pricey", "middling", "cheap"]
+    assert [jobs[0]["title"] for jobs in results] == ["cheap", "pricey", "middling"]
+
+    # 6. Results are reused within their refresh interval; failures aren't cached
+    print("\n6. Testing cached source results...")
+    clock = FakeClock()
+    cache = ResultCache(clock=clock)
+    calls = []
+
+    def board(keywords):
+        calls.append(keywords)
+        if len(calls) == 3:
+            raise ConnectionError("board down")
+        return [{"title": f"Job {len(calls)}"}]
+
+    cached = cache.cached(("Board", ("python",)), 60, board)
+    assert cached(["python"]) == [{"title": "Job 1"}]
+    clock.now += 30
+    assert cached(["python"]) == [{"title": "Job 1"}] and len(calls) == 1 and cache.hits == 1
+    clock.now += 31
+    assert cached(["python"]) == [{"title": "Job 2"}] and len(calls) == 2
+    assert cache.cached("Other", 0, board) is board  # No refresh interval: always fetched
+
+    with tempfile.TemporaryDirectory() as directory:
+        scout = JobScout()
+        scout.health = SourceHealth(path=os.path.join(directory, "health.db"), enabled=False)
+        scout.source_results = ResultCache(clock=clock)
+        attempts = []
+
+        def flaky(keywords):
+            attempts.append(1)
+            raise ConnectionError("board down")
+
+        fetcher = scout.source_results.cached(("Flaky", ("python",)), 60, flaky)
+        original_sleep = time.sleep
+        time.sleep = lambda seconds: None
+        try:
+            fallback = scout.fetch_with_comprehensive_error_handling(fetcher, "Flaky", ["python"])
+            assert fallback and len(attempts) == 3
+            scout.fetch_with_comprehensive_error_handling(fetcher, "Flaky", ["python"])
+            assert len(attempts) == 6  # The fallback jobs were not cached
+        finally:
+            time.sleep = original_sleep
+
+if __name__ == "__main__":
+    test_source_registry()
+    print("\n🎉 Source registry tests passed!")
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Test per-run source snapshots: each remote board is downloaded once per run
+"""
+
+import threading
+import time
+
+import source_snapshots
+from source_snapshots import SnapshotError, SourceSnapshots
+from telegram_jobs import CATEGORIES, JobScout
+
+class FakeResponse:
+    def __init__(self, payload, status_code=200):
+        self.payload = payload
+        self.status_code = status_code
+
+    def json(self):
+        return self.payload
+
+def test_source_snapshots():
+    print("🧪 Testing Source Snapshots...")
+
+    calls = []
+    board = {"jobs": [
+        {"id": 1, "title": "Senior Python Developer"},
+        {"id": 2, "title": "Customer Support Engineer"},
+        {"id": 3, "title": "Data Analyst"},
+    ]}
+
+    def fake_get(url, params=None, headers=None, timeout=None, ttl=None):
+        calls.append(url)
+        time.sleep(0.01)
+        return FakeResponse(board)
+
+    original_get = source_snapshots.cached_get
+    source_snapshots.cached_get = fake_get
+    try:
+        # 1. Every category filters the same in-memory GitLab board
+        print("\n1. Testing one download per board per run...")
+        scout = JobScout()
+        scout.snapshots = SourceSnapshots()  # No breaker state from earlier (offline) runs
+        total = 0
+        for keywords in CATEGORIES.values():
+            total += len(scout.fetch_gitlab_jobs(keywords))
+        assert calls.count("https://boards-api.greenhouse.io/v1/boards/gitlab/jobs") == 1
+        assert scout.snapshots.downloads == 1
+        assert scout.snapshots.hits == len(CATEGORIES) - 1
+        print(f"   {len(CATEGORIES)} categories, 1 download, {total} matching jobs")
+
+        # 2. Concurrent callers share the single in-flight download
+        print("\n2. Testing concurrent lookups...")
+        calls.clear()
+        snapshots = SourceSnapshots()
+        threads = [threading.Thread(target=snapshots.get_json, args=("https://example.com/board",)) for _ in range(10)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert calls == ["https://example.com/board"]
+        print("   10 concurrent lookups -> 1 download")
+
+        # 3. Failures are remembered for the rest of the run
+        print("\n3. Testing cached failures...")
+        attempts = []
+
+        def failing_download():
+            attempts.append(1)
+            raise ConnectionError("board down")
+
+        for _ in range(3):
+            try:
+                snapshots.get("dead-board", failing_download)
+                assert False, "a failed board should raise on every lookup"
+            except SnapshotError as e:
+                assert isinstance(e.error, ConnectionError) and str(e) == "board down"
+        assert len(attempts) == 1
+
+        # Sources reading a failed board give up at once instead of retrying with backoff
+        slept = []
+        original_sleep = time.sleep
+        time.sleep = slept.append
+        try:
+            scout = JobScout()
+            scout.snapshots = snapshots
+            for category in ("python", "data"):
+                jobs = scout.fetch_with_comprehensive_error_handling(
+                    lambda keywords: snapshots.get("dead-board", failing_download), "Zapier", [category], network=False)
+                assert jobs == scout._get_comprehensive_fallback_jobs("Zapier")
+        finally:
+            time.sleep = original_sleep
+        assert len(attempts) == 1 and slept == []
+        assert scout.source_stats["Zapier"]["status"] == "function_error"
+        assert scout.source_stats["Zapier"]["attempts"] == 1
+        snapshots.clear()
+        assert snapshots.downloads == 0
+        print("   Dead board tried once, not once per category, and never retried")
+    finally:
+        source_snapshots.cached_get = original_get
+
+if __name__ == "__main__":
+    test_source_snapshots()
+    print("\n🎉 Source snapshot tests passed!")
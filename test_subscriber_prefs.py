@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Test per-subscriber preferences and the recipient index (no network access required)
+"""
+
+import os
+import random
+import tempfile
+import threading
+
+import fanout
+import subscriber_prefs
+import telegram_jobs
+from fanout import FanOutDelivery
+from job_record import as_jobs
+from outbound_queue import OutboundQueue, OutboxPool
+from subscriber_prefs import (
+    LEVEL_ALIASES, PreferenceIndex, PreferenceStore, annual_salary, handle_preference_command,
+)
+from telegram_jobs import JobCategorizer, JobScout
+
+def accepts(prefs, job):
+    """Reference check of one subscriber against one job"""
+    categorization = job["categorization"]
+    if prefs.get("levels") and categorization["level"] not in prefs["levels"]:
+        return False
+    if prefs.get("categories") and categorization["category"] not in prefs["categories"]:
+        return False
+    text = f"{job['title']} {job['company']}".lower()
+    if prefs.get("keywords") and not any(keyword in text for keyword in prefs["keywords"]):
+        return False
+    salary = annual_salary(job["salary"])
+    if prefs.get("min_salary") and salary is not None and salary < prefs["min_salary"]:
+        return False
+    return True
+
+def test_subscriber_prefs():
+    print("🧪 Testing Subscriber Preferences...")
+
+    # 1. Salary strings become yearly amounts
+    print("\n1. Testing salary parsing...")
+    assert annual_salary("$12-24/hour") == 24 * 2080
+    assert annual_salary("$60k-$90k") == 90000
+    assert annual_salary("$4,000/month") == 48000
+    assert annual_salary("$70,000 - $120,000") == 120000
+    assert annual_salary("Competitive") is None
+    assert annual_salary("") is None
+
+    with tempfile.TemporaryDirectory() as directory:
+        store = PreferenceStore(os.path.join(directory, "prefs.db"))
+
+        # 2. Bot commands update one field at a time
+        print("\n2. Testing preference commands...")
+        assert handle_preference_command("42", "/start", store) is None
+        assert handle_preference_command("42", "hello", store) is None
+        assert "✅" in handle_preference_command("42", "/levels entry, expert", store)
+        assert "✅" in handle_preference_command("42", "/keywords Python, data entry", store)
+        assert "✅" in handle_preference_command("42", "/salary 15/hour", store)
+        assert "✅" in handle_preference_command("42", "/categories basic_data_entry", store)
+        assert "❌" in handle_preference_command("42", "/levels wizard", store)
+        assert "❌" in handle_preference_command("42", "/categories astronaut", store)
+        assert "❌" in handle_preference_command("42", "/salary plenty", store)
+        assert store.get("42") == {
+            "levels": ["entry_level", "expert_level"],
+            "categories": ["basic_data_entry"],
+            "keywords": ["python", "data entry"],
+            "min_salary": 15 * 2080,
+        }
+        assert "basic_data_entry" in handle_preference_command("42", "/prefs@Agent21Bot", store)
+        assert set(store.load_all(["42", "7"])) == {"42"}
+        handle_preference_command("42", "/resetprefs", store)
+        assert store.load_all() == {}
+
+        # 3. The index picks exactly the subscribers a full scan would
+        print("\n3. Testing recipient index against a full scan...")
+        rng = random.Random(14)
+        categorizer = JobCategorizer()
+        categories = [
+            category
+            for level_data in telegram_jobs.ORGANIZED_JOB_CATEGORIES.values()
+            for category in level_data["categories"]
+        ]
+        keywords = ["python", "support", "data", "writer", "remote", "designer", "sales", "analyst"]
+        preferences = {}
+        subscribers = [str(chat_id) for chat_id in range(500)]
+        for chat_id in subscribers:
+            prefs = {
+                "levels": rng.sample(list(LEVEL_ALIASES.values()), rng.randint(0, 2)),
+                "categories": rng.sample(categories, rng.choice([0, 0, 1, 3])),
+                "keywords": rng.sample(keywords, rng.choice([0, 0, 1, 2])),
+                "min_salary": rng.choice([None, None, 20000, 40000, 80000]),
+            }
+            if rng.random() < 0.8:
+                preferences[chat_id] = prefs
+
+        catalog = telegram_jobs.get_catalog()
+        jobs = as_jobs([
+            job
+            for source in ("customer_support_jobs", "beginner_friendly_jobs", "ai_training_jobs",
+                           "finance_jobs", "sales_bizdev_jobs", "guaranteed_working_jobs")
+            for job in catalog.jobs_for(source, tuple(keywords))
+        ])
+        for job in jobs:
+            job["categorization"] = categorizer.categorize_job(job)
+
+        index = PreferenceIndex(subscribers, preferences)
+        matches = 0
+        for job in jobs:
+            expected = {chat_id for chat_id in subscribers if accepts(preferences.get(chat_id, {}), job)}
+            assert index.recipients(job) == expected, job["title"]
+            matches += len(expected)
+        unconstrained = len(subscribers) - len(preferences)
+        assert matches > unconstrained * len(jobs)
+        print(f"   {len(jobs)} jobs x {len(subscribers)} subscribers: {matches} deliveries")
+
+        # 4. Fan-out sends each subscriber only their matching jobs
+        print("\n4. Testing fan-out by preference...")
+        store.update("1", keywords=["zzz-no-such-job"])
+        store.update("2", levels=[jobs[0]["categorization"]["level"]])
+        received = {}
+        lock = threading.Lock()
+
+        def deliver(chat_id, text):
+            with lock:
+                received.setdefault(chat_id, []).append(text)
+
+        pool = OutboxPool(OutboundQueue(path=os.path.join(directory, "outbox.db")), deliver,
+                          workers=4, poll_interval=0.05)
+        originals = (fanout.load_subscribers, subscriber_prefs.PreferenceStore, fanout.FanOutDelivery)
+        fanout.load_subscribers = lambda: ["1", "2", "3"]
+        subscriber_prefs.PreferenceStore = lambda: store
+        fanout.FanOutDelivery = lambda: FanOutDelivery(pool)
+        try:
+            scout = JobScout()
+            plain = as_jobs(telegram_jobs.get_catalog().jobs_for("guaranteed_working_jobs"))  # Not categorized yet
+            texts = [scout.format_individual_job(job) for job in plain]
+            scout.fan_out("summary", plain, texts)
+            assert pool.flush(timeout=30)
+        finally:
+            pool.stop()
+            fanout.load_subscribers, subscriber_prefs.PreferenceStore, fanout.FanOutDelivery = originals
+
+        assert "1" not in received
+        level = jobs[0]["categorization"]["level"]
+        wanted = [text for job, text in zip(plain, texts) if job["categorization"]["level"] == level]
+        assert received["2"][0].startswith("summary") and f"{len(wanted)} jobs" in received["2"][0]
+        assert f"{len(plain)} jobs" in received["3"][0]
+        assert all(text in "".join(received["3"][1:]) for text in texts)
+        assert all(text in "".join(received["2"][1:]) for text in wanted)
+        print(f"   Subscriber 2 got {len(wanted)} of {len(plain)} jobs, subscriber 1 none")
+
+if __name__ == "__main__":
+    test_subscriber_prefs()
+    print("\n🎉 Subscriber preference tests passed!")
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Test digest packing of job notifications into Telegram-sized messages
+"""
+
+import os
+import tempfile
+
+from job_dedup import SeenJobs
+from job_store import JobStore
+from scout_metrics import RunMetrics
+from telegram_bot import MAX_MESSAGE_LENGTH, message_length, pack_messages
+import telegram_jobs
+from telegram_jobs import JobScout
+
+def test_pack_messages():
+    print("🧪 Testing Digest Packing...")
+
+    # 1. Whole parts are packed in order without crossing the limit
+    print("\n1. Testing packing...")
+    parts = [f"🏢 **Company {i}**\n💼 *Role {i}*\n🔗 [Click Here](https://example.com/{i})" for i in range(200)]
+    messages = pack_messages(parts)
+    assert all(message_length(message) <= MAX_MESSAGE_LENGTH for message in messages)
+    assert [part for message in messages for part in message.split("\n\n➖➖➖➖➖➖➖➖\n\n")] == parts
+    assert len(messages) < len(parts) / 10
+    print(f"   {len(parts)} jobs -> {len(messages)} messages")
+
+    # 2. Length is measured the way Telegram counts it (UTF-16 units)
+    print("\n2. Testing UTF-16 length...")
+    assert message_length("🏢") == 2 and message_length("abc") == 3
+    emoji_parts = ["🚀" * 1000] * 3
+    assert all(message_length(message) <= MAX_MESSAGE_LENGTH for message in pack_messages(emoji_parts))
+    assert len(pack_messages(emoji_parts)) == 2
+
+    # 3. An oversized part is split on lines rather than dropped
+    print("\n3. Testing oversized parts...")
+    long_part = "\n".join(f"line {i} " + "x" * 90 for i in range(100))
+    chunks = pack_messages(["short", long_part, "tail"], limit=1000)
+    assert chunks[0] == "short" and chunks[-1] == "tail"
+    assert "\n".join(chunks[1:-1]) == long_part
+    assert all(message_length(chunk) <= 1000 for chunk in chunks)
+
+def test_digest_delivery():
+    print("🧪 Testing Digest Delivery...")
+
+    sent = []
+    original_send, original_mode = telegram_jobs.send_telegram_message, telegram_jobs.DELIVERY_MODE
+    telegram_jobs.send_telegram_message = lambda message: sent.append(message)
+    telegram_jobs.DELIVERY_MODE = "digest"
+    try:
+        with tempfile.TemporaryDirectory() as directory:
+            scout = JobScout()
+            scout.seen_jobs = SeenJobs(path=os.path.join(directory, "seen.db"), enabled=True)
+            scout.job_store = JobStore(path=os.path.join(directory, "jobs.db"))
+            scout.metrics = RunMetrics(directory=os.path.join(directory, "metrics"))
+            scout.build_fetch_tasks = lambda: []
+            scout.run_daily_scout()
+    finally:
+        telegram_jobs.send_telegram_message, telegram_jobs.DELIVERY_MODE = original_send, original_mode
+
+    # Summary + digests + stats + completion; every job goes out intact
+    digests = sent[1:-2]
+    assert all(message_length(message) <= MAX_MESSAGE_LENGTH for message in sent)
+    assert sum(digest.count("🚀 *Ready to apply?") for digest in digests) == scout.total_jobs
+    assert len(digests) < scout.total_jobs / 5
+    print(f"   {scout.total_jobs} jobs delivered in {len(digests)} digest messages")
+
+if __name__ == "__main__":
+    test_pack_messages()
+    test_digest_delivery()
+    print("\n🎉 Digest tests passed!")
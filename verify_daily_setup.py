@@ -105,7 +105,6 @@ def check_environment():
         
         # Check dependencies
         import requests
-        import schedule
         print("[SUCCESS] All dependencies available")
         return True
         